@@ -0,0 +1,240 @@
+"""
+LLM backends for the conversation engine
+
+OpenAIBackend makes the real API calls through the shared runtime: pooled
+client, retry policy, response cache and image store. ScriptedBackend answers
+in-process with fake_openai.py's rules, so thousands of sessions can run
+without a server or a socket; its delays come from the same latency specs
+and only the error rate of the fake server's failure modes is kept, since
+there is no HTTP layer for a 429 to go through.
+
+Both have the same four methods, chatgpt(), chatgpt_tool(), chatgpt_stream()
+and dalle(), with the signatures app.py always used.
+"""
+import base64
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from typing import Iterator, Optional
+
+import fake_openai
+import llm_cache
+import telemetry
+import tokens
+
+
+def chat_messages(context: str, prompt: str, history: Optional[list] = None) -> list:
+    """
+    System context, the prior turns if any, then the prompt
+    """
+    return [
+        {
+            "role": "system",
+            "content": context,
+        },
+        *(history or []),
+        {
+            "role": "user",
+            "content": prompt,
+        },
+    ]
+
+
+### OPENAI ###
+class OpenAIBackend:
+    """
+    ChatGPT and DALL-E through the runtime's client
+    """
+
+    def __init__(self, runtime):
+        self.runtime = runtime
+
+    @telemetry.timed("chatgpt")
+    def chatgpt(
+            self,
+            prompt: str,
+            context: str = "You are a helpful assistant.",
+            model: str = "gpt-3.5-turbo",
+            call_type: str = "default",
+            cache: bool = True,
+            history: Optional[list] = None,
+        ) -> str:
+        """
+        Single chat completion, answers are cached per call_type unless cache is False.
+        history is a list of prior chat messages, see tokens.fit_history().
+        """
+        telemetry.annotate(call_type=call_type)
+        if cache:
+            response_cache = self.runtime.response_cache
+            key = llm_cache.make_key(model, context + (json.dumps(history) if history else ""), prompt)
+            cached = response_cache.get(key)
+            if cached is not None:
+                telemetry.annotate(cached=True)
+                return cached
+
+        response = self.runtime.retry_policy.call(
+            self.runtime.openai_client.chat.completions.create,
+            messages=chat_messages(context, prompt, history),
+            model=model,
+            max_tokens=tokens.budget(call_type).completion,
+        )
+        telemetry.record_usage(call_type, response.usage)
+        result = response.choices[0].message.content
+        if cache:
+            response_cache.set(key, result, call_type)
+        return result
+
+    @telemetry.timed("chatgpt_tool")
+    def chatgpt_tool(
+            self,
+            prompt: str,
+            context: str,
+            tool: dict,
+            model: str = "gpt-3.5-turbo",
+            call_type: str = "default",
+            cache: bool = True,
+        ) -> dict:
+        """
+        Chat completion forced to call the given function tool, returns the parsed arguments.
+        Cached like chatgpt(), with the tool schema as part of the key.
+        """
+        telemetry.annotate(call_type=call_type)
+        if cache:
+            response_cache = self.runtime.response_cache
+            key = llm_cache.make_key(model, context + json.dumps(tool, sort_keys=True), prompt)
+            cached = response_cache.get(key)
+            if cached is not None:
+                telemetry.annotate(cached=True)
+                return json.loads(cached)
+
+        response = self.runtime.retry_policy.call(
+            self.runtime.openai_client.chat.completions.create,
+            messages=chat_messages(context, prompt),
+            model=model,
+            max_tokens=tokens.budget(call_type).completion,
+            tools=[tool],
+            tool_choice={"type": "function", "function": {"name": tool["function"]["name"]}},
+        )
+        telemetry.record_usage(call_type, response.usage)
+        arguments = response.choices[0].message.tool_calls[0].function.arguments
+        result = json.loads(arguments)
+        if cache:
+            response_cache.set(key, arguments, call_type)
+        return result
+
+    @telemetry.timed("chatgpt_stream")
+    def chatgpt_stream(
+            self,
+            prompt: str,
+            context: str = "You are a helpful assistant.",
+            model: str = "gpt-3.5-turbo",
+            call_type: str = "default",
+            history: Optional[list] = None,
+        ) -> Iterator[str]:
+        """
+        Streaming variant of chatgpt(), yields the answer as it is generated. Never cached.
+        """
+        telemetry.annotate(call_type=call_type)
+        stream = self.runtime.retry_policy.call(
+            self.runtime.openai_client.chat.completions.create,
+            messages=chat_messages(context, prompt, history),
+            model=model,
+            max_tokens=tokens.budget(call_type).completion,
+            stream=True,
+            # the usage comes in a last chunk without choices
+            stream_options={"include_usage": True},
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            elif chunk.usage:
+                telemetry.record_usage(call_type, chunk.usage)
+
+    @telemetry.timed("dalle")
+    def dalle(self, prompt: str) -> str:
+        """
+        Generates an image for the prompt and returns its local path.
+        Repeated prompts are served from the image store without an API call.
+        """
+        store = self.runtime.image_store
+        path = store.get(prompt)
+        if path:
+            telemetry.annotate(cached=True)
+            return path
+
+        response = self.runtime.retry_policy.call(
+            self.runtime.openai_client.images.generate,
+            model="dall-e-2",
+            prompt=prompt,
+            size="256x256",
+            quality="standard",
+            response_format="b64_json",
+            n=1,
+        )
+        return store.put(prompt, base64.b64decode(response.data[0].b64_json))
+
+
+### SCRIPTED ###
+class ScriptedError(RuntimeError):
+    pass
+
+
+class ScriptedBackend:
+    """
+    fake_openai.py's answers without the server, nothing is cached.
+    Images go to image_store when one is given, otherwise every image is the
+    same 1x1 PNG in a temporary file.
+    """
+
+    def __init__(self, config: fake_openai.Config = fake_openai.Config(), image_store=None):
+        self.config = config
+        self.image_store = image_store
+        self._rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._image_path = None
+
+    def _delay(self, latency: fake_openai.Latency, may_fail: bool = True) -> None:
+        with self._lock:
+            seconds = latency.sample(self._rng)
+            failed = may_fail and self._rng.random() < self.config.error_rate
+        if seconds:
+            time.sleep(seconds)
+        if failed:
+            raise ScriptedError("Scripted server error")
+
+    @telemetry.timed("chatgpt")
+    def chatgpt(self, prompt: str, context: str = "You are a helpful assistant.", call_type: str = "default", history: Optional[list] = None, **kwargs) -> str:
+        telemetry.annotate(call_type=call_type)
+        self._delay(self.config.chat_latency)
+        return fake_openai.chat_answer(self.config, chat_messages(context, prompt, history))
+
+    @telemetry.timed("chatgpt_tool")
+    def chatgpt_tool(self, prompt: str, context: str, tool: dict, call_type: str = "default", **kwargs) -> dict:
+        telemetry.annotate(call_type=call_type)
+        self._delay(self.config.chat_latency)
+        return fake_openai.tool_arguments(self.config, tool, chat_messages(context, prompt))
+
+    @telemetry.timed("chatgpt_stream")
+    def chatgpt_stream(self, prompt: str, context: str = "You are a helpful assistant.", call_type: str = "default", history: Optional[list] = None, **kwargs) -> Iterator[str]:
+        telemetry.annotate(call_type=call_type)
+        self._delay(self.config.chat_latency)
+        words = fake_openai.chat_answer(self.config, chat_messages(context, prompt, history)).split(" ")
+        for i, word in enumerate(words):
+            if i:
+                self._delay(self.config.chunk_latency, may_fail=False)
+            yield word if i == 0 else " " + word
+
+    @telemetry.timed("dalle")
+    def dalle(self, prompt: str) -> str:
+        self._delay(self.config.image_latency)
+        if self.image_store is not None:
+            return self.image_store.get(prompt) or self.image_store.put(prompt, fake_openai.PNG)
+        with self._lock:
+            if self._image_path is None:
+                fd, self._image_path = tempfile.mkstemp(prefix="scripted-", suffix=".png")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(fake_openai.PNG)
+        return self._image_path
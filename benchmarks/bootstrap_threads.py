@@ -0,0 +1,66 @@
+"""
+Checks that the process-wide runtime is safe to share between sessions
+
+Many threads (standing in for concurrent Streamlit sessions) race to build the
+runtime at the same moment and then hammer the shared response cache. Every
+thread must end up with the same runtime, settings and OpenAI client, and no
+thread may fail.
+
+Usage (from the repository root):
+    python benchmarks/bootstrap_threads.py --threads 64
+"""
+import argparse
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# building the client needs a key, no request is authenticated here
+os.environ.setdefault("OPENAI_API_KEY", "sk-bootstrap-check")
+
+import bootstrap
+import llm_cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--operations", type=int, default=200, help="cache operations per thread")
+    args = parser.parse_args()
+
+    barrier = threading.Barrier(args.threads)
+    runtimes, errors = [], []
+
+    def session(i: int):
+        try:
+            barrier.wait()
+            runtime = bootstrap.get_runtime()
+            runtimes.append(runtime)
+            for j in range(args.operations):
+                key = llm_cache.make_key("check", "context", f"prompt {j % 50}")
+                runtime.response_cache.set(key, f"answer {j % 50}")
+                assert runtime.response_cache.get(key) == f"answer {j % 50}"
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(args.threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    print(f"threads:          {args.threads}")
+    print(f"errors:           {len(errors)}")
+    print(f"runtimes:         {len({id(r) for r in runtimes})}")
+    print(f"settings objects: {len({id(r.settings) for r in runtimes})}")
+    print(f"openai clients:   {len({id(r.openai_client) for r in runtimes})}")
+    print(f"http clients:     {len({id(r.http_client) for r in runtimes})}")
+    ok = not errors and len({id(r) for r in runtimes}) == 1 and len(runtimes) == args.threads
+    print("OK" if ok else "FAILED")
+    if errors:
+        print(repr(errors[0]))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Import-time and memory cost of the travel data
+
+Compares importing the raw Python literal (travel_data_raw, both with a cold
+bytecode cache and with its .pyc already compiled) against the lazy
+travel_data module, reading one or every (country, category) slice from the
+compiled SQLite artifact, and dataset.load() of the whole artifact. Each case runs in a fresh
+interpreter and reports the median wall time and how much resident memory
+it added (Linux only, read from /proc).
+
+Usage (from the repository root):
+    python benchmarks/dataset_load.py --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# runs inside the child interpreter, prints {"seconds": ..., "rss_kb": ...}
+PROBE = """
+import json, time
+
+def rss_kb():
+    # current resident set size from /proc (Linux)
+    with open("/proc/self/status") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith("VmRSS:"))
+
+before = rss_kb()
+start = time.perf_counter()
+{statement}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "rss_kb": rss_kb() - before}}))
+"""
+
+CASES = {
+    "import travel_data_raw (cold .pyc)": ("import travel_data_raw", True),
+    "import travel_data_raw (warm .pyc)": ("import travel_data_raw", False),
+    "import travel_data (lazy)": ("import travel_data", False),
+    "travel_data, one slice": ("import travel_data; travel_data.list_of_hotels['italy']", False),
+    "travel_data, all slices": (
+        "import travel_data\n"
+        "for c in (travel_data.list_of_places, travel_data.list_of_hotels, travel_data.list_of_restaurants):\n"
+        "    for country in c: c[country]",
+        False,
+    ),
+    "dataset.load()": ("import dataset; dataset.load()", False),
+}
+
+
+def measure(statement: str, cold: bool, runs: int) -> tuple:
+    seconds, rss = [], []
+    for _ in range(runs):
+        env = dict(os.environ)
+        if cold:
+            # a fresh bytecode cache forces the literal to be compiled again
+            env["PYTHONPYCACHEPREFIX"] = tempfile.mkdtemp(prefix="pycache-")
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement)],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        seconds.append(result["seconds"])
+        rss.append(result["rss_kb"])
+    return statistics.median(seconds), statistics.median(rss)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    import dataset
+    dataset.build()
+    # compile the .pyc files once for the warm cases
+    subprocess.run([sys.executable, "-c", "import travel_data_raw, travel_data, dataset"], cwd=ROOT, check=True)
+
+    print(f"artifact: {dataset.DEFAULT_PATH} ({os.path.getsize(dataset.DEFAULT_PATH) / 1024:.0f} KB), "
+          f"source: travel_data_raw.py ({os.path.getsize(dataset.SOURCE_PATHS[0]) / 1024:.0f} KB)")
+    print(f"{'case':<38}{'median ms':>12}{'RSS +KB':>15}")
+    for name, (statement, cold) in CASES.items():
+        seconds, rss = measure(statement, cold, args.runs)
+        print(f"{name:<38}{seconds * 1000:>12.2f}{rss:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
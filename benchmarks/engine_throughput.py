@@ -0,0 +1,101 @@
+"""
+Turn throughput of the conversation engine, in-process
+
+Plays turn_latency.py's scripted conversations through engine.py with the
+ScriptedBackend: no Streamlit, no server and no sockets, so thousands of
+sessions run in seconds and what is left is the engine itself. Reports
+sessions and turns per second, p50/p95/p99 per turn type and failed turns.
+The LLM latency and error options are fake_openai.py's, with no delay by
+default; --threads runs that many sessions at once.
+
+Usage (from the repository root):
+    python benchmarks/engine_throughput.py --sessions 5000
+    python benchmarks/engine_throughput.py --sessions 500 --threads 32 --chat-latency lognormal:300,0.4
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backends
+import bootstrap
+import engine
+import fake_openai
+import telemetry
+from turn_latency import CONVERSATIONS, NAMES, percentile
+
+
+def run_session(conversation_engine: engine.ConversationEngine, i: int) -> tuple:
+    """
+    [(turn type, seconds)] and [failed turn types] of session i
+    """
+    conversation = CONVERSATIONS[i % len(CONVERSATIONS)]
+    name = NAMES[i % len(NAMES)]
+    state = conversation_engine.new_session(session_id=f"benchmark-{i}", seed=i)
+    timings = []
+    failures = []
+    for turn_type, prompt in conversation:
+        show_more = prompt is None
+        if show_more and state.last_intent is None:
+            failures.append(turn_type)
+            continue
+        start = time.perf_counter()
+        try:
+            conversation_engine.handle(state, prompt.format(name=name) if prompt else None, show_more=show_more)
+        except Exception:
+            failures.append(turn_type)
+        timings.append((turn_type, time.perf_counter() - start))
+    return timings, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=1, help="sessions running at once")
+    parser.add_argument("--telemetry", action="store_true", help="trace the turns into a temporary directory")
+    fake_openai.add_arguments(parser)
+    no_delay = fake_openai.Latency()
+    parser.set_defaults(chat_latency=no_delay, image_latency=no_delay, chunk_latency=no_delay)
+    args = parser.parse_args()
+
+    settings = bootstrap.load_settings()
+    if args.telemetry:
+        traces = tempfile.mkdtemp(prefix="engine-throughput-")
+        telemetry.configure(True, os.path.join(traces, "trace.jsonl"), os.path.join(traces, "metrics.prom"))
+    executor = ThreadPoolExecutor(max_workers=settings.llm_thread_pool_workers, thread_name_prefix="llm")
+    conversation_engine = engine.ConversationEngine(backends.ScriptedBackend(fake_openai.config_from(args)), settings, executor)
+
+    # loads the dataset, indexes and extractors outside the measurement
+    run_session(conversation_engine, 0)
+
+    timings = defaultdict(list)
+    failures = defaultdict(int)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads, thread_name_prefix="session") as sessions:
+        for session_timings, session_failures in sessions.map(lambda i: run_session(conversation_engine, i), range(args.sessions)):
+            for turn_type, seconds in session_timings:
+                timings[turn_type].append(seconds)
+            for turn_type in session_failures:
+                failures[turn_type] += 1
+    elapsed = time.perf_counter() - started
+    executor.shutdown()
+
+    print(f"{'turn type':28} {'turns':>7} {'failed':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for turn_type, values in timings.items():
+        p50, p95, p99 = (percentile(values, p) * 1000 for p in (50, 95, 99))
+        print(f"{turn_type:28} {len(values):>7} {failures[turn_type]:>7} {p50:9.2f} {p95:9.2f} {p99:9.2f}")
+    turns = sum(len(values) for values in timings.values())
+    print(f"\n{args.sessions} sessions, {turns} turns in {elapsed:.2f}s: "
+          f"{args.sessions / elapsed:.0f} sessions/s, {turns / elapsed:.0f} turns/s")
+    if args.telemetry:
+        print(f"trace and metrics in {traces}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Rerun time of app.py against the length of the chat history
+
+Loads app.py in Streamlit's AppTest with a conversation of 10, 100 and 500
+turns already in the session, then times plain reruns (what every click and
+keystroke costs) and counts the elements they emit. Each length is measured
+with the windowed history and with every message rendered, the behaviour
+before history_window_messages. No API calls are made.
+
+Usage (from the repository root):
+    python benchmarks/history_render.py
+    python benchmarks/history_render.py --turns 10 100 500 1000 --reruns 10
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# bootstrap needs a key, and the pre-warm has nowhere to go
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("OPENAI_BASE_URL", "http://127.0.0.1:9/v1")
+
+from streamlit.testing.v1 import AppTest
+
+import engine
+import pagination
+import snippets
+import travel_data
+
+APP_PATH = os.path.abspath("app.py")
+
+
+def conversation(turns: int) -> list:
+    entries = travel_data.load_slice("hotels", "italy")
+    reply = snippets.reply("hotels", "italy", entries[:5], "Anna")
+    messages = [{"role": "assistant", "images": [], "content": "Hello, I'm GPTour. What is your name?"}]
+    for _ in range(turns):
+        messages.append({"role": "user", "images": [], "content": "more hotels please"})
+        messages.append({"role": "assistant", "images": [], "content": reply})
+    return messages
+
+
+def measure(turns: int, window: int, reruns: int) -> tuple:
+    """
+    (median rerun seconds, elements in the main container)
+    """
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.session_state["session"] = engine.SessionState(
+        messages=conversation(turns), pages=pagination.Pages(), user_name="Anna", country="italy",
+    )
+    if window:
+        at.session_state["history_window"] = window
+    at.run()
+    timings = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), len(list(at.main))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--turns", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--reruns", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'turns':>6} {'full ms':>9} {'windowed ms':>12} {'full elements':>14} {'windowed elements':>18}")
+    for turns in args.turns:
+        full, full_elements = measure(turns, 10 ** 9, args.reruns)
+        windowed, windowed_elements = measure(turns, None, args.reruns)
+        print(f"{turns:>6} {full * 1000:9.1f} {windowed * 1000:12.1f} {full_elements:>14} {windowed_elements:>18}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Per-turn hot path of the assistant, step by step
+
+Times every local step a turn can go through once its data is warm: the
+extractors, retrieval, paging and reply formatting, with the old string
+concatenation kept as a baseline for the formatting. LLM calls are out of
+scope here.
+
+Usage (from the repository root):
+    python benchmarks/hot_path.py
+    python benchmarks/hot_path.py --rounds 2000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import country_resolver
+import intent
+import llm_cache
+import name_extractor
+import pagination
+import search
+import snippets
+import telemetry
+import travel_data
+import vectors
+
+COUNTRY = "italy"
+CATEGORY = "hotels"
+PROMPT = "any beachfront hotels with a spa near rome?"
+
+
+def concatenated_reply(category: str, country: str, entries: list, user_name: str) -> str:
+    # the reply formatting before snippets.py
+    response = snippets.headers[category]
+    for entry in entries:
+        response += f"\n\n1. **{entry.name}**: {entry.description}. The address is {entry.address}"
+    response += f"\n\nLet me know if you need more recommendations for {travel_data.countries_to_proper[country]}! I'm happy to help {user_name}!"
+    return response
+
+
+def span():
+    with telemetry.span("step"):
+        pass
+
+
+def cases() -> dict:
+    pages = pagination.Pages(seed=0)
+    entries = list(travel_data.load_slice(CATEGORY, COUNTRY)[:5])
+    size = len(travel_data.load_slice(CATEGORY, COUNTRY))
+    return {
+        "intent.classify": lambda: intent.classify(PROMPT),
+        "country_resolver.resolve": lambda: country_resolver.resolve("I'd love to see Florence and Venice"),
+        "name_extractor.extract": lambda: name_extractor.extract("Hi, my name is Anna"),
+        "llm_cache.make_key": lambda: llm_cache.make_key("gpt-3.5-turbo", "You are a helpful assistant.", PROMPT),
+        "search.search": lambda: search.search(CATEGORY, COUNTRY, PROMPT, size),
+        "pages.next": lambda: pages.next(CATEGORY, COUNTRY, 5),
+        "vectors.top_k": lambda: vectors.top_k(COUNTRY, PROMPT),
+        "reply (concatenation)": lambda: concatenated_reply(CATEGORY, COUNTRY, entries, "Anna"),
+        "reply (snippets)": lambda: snippets.reply(CATEGORY, COUNTRY, entries, "Anna"),
+        "telemetry span (disabled)": span,
+    }
+
+
+
+def measure(fn, rounds: int) -> list:
+    fn()
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'step':28} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9}")
+    for name, fn in cases().items():
+        timings = measure(fn, args.rounds)
+        p50, p95, p99 = (timings[len(timings) * p // 100] * 1e6 for p in (50, 95, 99))
+        print(f"{name:28} {p50:9.1f} {p95:9.1f} {p99:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Memory used by the travel entries, before and after the compact records
+
+Materializes every (country, category) slice from the compiled artifact twice
+and measures the allocations with tracemalloc: once as the original mutable
+[name, description, address] lists, once as the Entry tuples, with the
+short addresses interned, that travel_data now returns.
+
+Usage (from the repository root):
+    python benchmarks/record_memory.py
+"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import travel_data
+
+CATEGORIES = ("places", "hotels", "restaurants")
+
+
+def query(category: str, country: str) -> list:
+    return travel_data._query(
+        "SELECT name, description, address FROM entries WHERE category = ? AND country = ? ORDER BY position",
+        (category, country),
+    )
+
+
+def measure(build) -> tuple:
+    """
+    Bytes still allocated once every slice is built, and the number of entries
+    """
+    gc.collect()
+    tracemalloc.start()
+    data = {
+        (category, country): build(query(category, country))
+        for category in CATEGORIES for country in travel_data.countries
+    }
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, sum(len(entries) for entries in data.values())
+
+
+def as_lists(rows: list) -> list:
+    return [list(row) for row in rows]
+
+
+def as_entries(rows: list) -> tuple:
+    return travel_data._entries(rows)
+
+
+def main():
+    # open the artifact and warm sqlite's statement cache outside the measurements
+    measure(as_lists)
+    before, count = measure(as_lists)
+    after, _ = measure(as_entries)
+    print(f"entries:                {count}")
+    print(f"lists of strings:       {before / 1024:8.0f} KB  ({before / count:.0f} B/entry)")
+    print(f"Entry tuples:           {after / 1024:8.0f} KB  ({after / count:.0f} B/entry)")
+    print(f"saved:                  {(before - after) / 1024:8.0f} KB  ({1 - after / before:.0%})")
+
+
+if __name__ == "__main__":
+    main()
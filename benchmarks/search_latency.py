@@ -0,0 +1,55 @@
+"""
+Latency of the BM25 search in search.py
+
+Builds the index of every (country, category) slice once, then times top-5
+queries against each of them and reports the build time and the query
+latency percentiles.
+
+Usage (from the repository root):
+    python benchmarks/search_latency.py
+"""
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import search
+import travel_data
+
+CATEGORIES = ("places", "hotels", "restaurants")
+QUERIES = (
+    "beachfront hotels", "vegetarian restaurants", "spa resort with a view", "old town museums",
+    "seafood by the harbour", "family friendly parks", "rooftop bar", "hotels", "castle",
+)
+ROUNDS = 20
+
+
+def main():
+    # open the artifact outside the measurements
+    travel_data.load_slice(CATEGORIES[0], travel_data.countries[0])
+
+    builds = []
+    timings = []
+    for country in travel_data.countries:
+        for category in CATEGORIES:
+            start = time.perf_counter()
+            search.index(category, country)
+            builds.append(time.perf_counter() - start)
+            for _ in range(ROUNDS):
+                for query in QUERIES:
+                    start = time.perf_counter()
+                    search.search(category, country, query)
+                    timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    print(f"index build per slice:  {statistics.mean(builds) * 1000:6.2f} ms mean, {max(builds) * 1000:6.2f} ms max")
+    print(f"queries:                {len(timings)}")
+    for p in (50, 95, 99):
+        print(f"p{p}:                    {timings[len(timings) * p // 100] * 1e6:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+End-to-end turn latency of app.py against the local fake OpenAI API
+
+Starts fake_openai.py in-process, points the app at it and plays scripted
+conversations through Streamlit's AppTest, covering every branch of the
+state machine: name, country (supported or not), onboarding that asks for
+recommendations straight away, recommendations, "Show more" and free-form
+questions. Reports p50/p95/p99 per turn type, failed turns, and what the
+fake server saw. The server options (latency distributions, error and 429
+rates) are the same as fake_openai.py's.
+
+The LLM cache and image store go to a temporary directory, so every run
+starts cold. With --telemetry the JSONL trace and Prometheus file go there too.
+
+Usage (from the repository root):
+    python benchmarks/turn_latency.py --sessions 10
+    python benchmarks/turn_latency.py --sessions 20 --chat-latency lognormal:600,0.6 --rate-limit-rate 0.1
+"""
+import argparse
+import dataclasses
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fake_openai
+
+APP_PATH = os.path.abspath("app.py")
+NAMES = ("Anna", "Omar", "Lucia", "Kenji", "Maya", "Tom", "Sofia", "Arman")
+
+# (turn type, prompt), None as the prompt clicks "Show more"
+CONVERSATIONS = (
+    (
+        ("name", "Hi, I'm {name}"),
+        ("country", "Italy"),
+        ("recommendation", "hotels"),
+        ("show_more", None),
+        ("other", "what about the second one?"),
+        ("recommendation", "restaurants with a view in rome"),
+    ),
+    (
+        ("name", "{name}"),
+        ("country_not_supported", "Japan"),
+        ("country", "I think Greece"),
+        ("recommendation", "sightseeing"),
+        ("other", "is it safe to travel there in winter?"),
+    ),
+    (
+        ("onboarding_recommendation", "I'm {name}, show me hotels in Spain"),
+        ("recommendation", "any vegetarian restaurants?"),
+        ("show_more", None),
+        ("other", "how do I get from the airport to the city?"),
+    ),
+)
+
+
+def percentile(timings: list, p: int) -> float:
+    ordered = sorted(timings)
+    return ordered[min(len(ordered) - 1, len(ordered) * p // 100)]
+
+
+def run_sessions(sessions: int) -> tuple:
+    """
+    {turn type: [seconds]} and {turn type: failures}
+    """
+    from streamlit.testing.v1 import AppTest
+
+    timings = defaultdict(list)
+    failures = defaultdict(int)
+    for i in range(sessions):
+        conversation = CONVERSATIONS[i % len(CONVERSATIONS)]
+        name = NAMES[i % len(NAMES)]
+        at = AppTest.from_file(APP_PATH, default_timeout=120)
+        at.run()
+        for turn_type, prompt in conversation:
+            start = time.perf_counter()
+            if prompt is None:
+                buttons = [button for button in at.button if button.label == "Show more"]
+                if not buttons:
+                    failures[turn_type] += 1
+                    continue
+                buttons[0].click().run()
+            else:
+                at.chat_input[0].set_value(prompt.format(name=name)).run()
+            timings[turn_type].append(time.perf_counter() - start)
+            if at.exception:
+                failures[turn_type] += 1
+    return timings, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", type=int, default=6)
+    parser.add_argument("--telemetry", action="store_true", help="trace the turns into the temporary directory")
+    fake_openai.add_arguments(parser)
+    args = parser.parse_args()
+
+    server = fake_openai.serve(fake_openai.config_from(args))
+    os.environ["OPENAI_API_KEY"] = "fake"
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+
+    # a cold cache for this run only, installed before app.py asks for the runtime
+    import bootstrap
+    cache = tempfile.mkdtemp(prefix="turn-latency-")
+    settings = dataclasses.replace(
+        bootstrap.load_settings(),
+        llm_cache_path=os.path.join(cache, "llm_responses.sqlite3"),
+        image_store_path=os.path.join(cache, "images"),
+        telemetry_enabled=args.telemetry,
+        telemetry_trace_path=os.path.join(cache, "trace.jsonl"),
+        telemetry_prometheus_path=os.path.join(cache, "metrics.prom"),
+    )
+    bootstrap._runtime = bootstrap.Runtime(settings)
+
+    started = time.perf_counter()
+    timings, failures = run_sessions(args.sessions)
+    elapsed = time.perf_counter() - started
+
+    print(f"{'turn type':28} {'turns':>6} {'failed':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for turn_type, values in timings.items():
+        p50, p95, p99 = (percentile(values, p) * 1000 for p in (50, 95, 99))
+        print(f"{turn_type:28} {len(values):>6} {failures[turn_type]:>7} {p50:9.0f} {p95:9.0f} {p99:9.0f}")
+    print(f"\n{args.sessions} sessions in {elapsed:.1f}s, fake server: {server.snapshot()}")
+    if args.telemetry:
+        print(f"trace and metrics in {cache}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
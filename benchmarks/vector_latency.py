@@ -0,0 +1,51 @@
+"""
+Latency of the vector retrieval in vectors.py
+
+Times top-4 cosine searches for a set of free-form questions against every
+country, with the index already built and memory-mapped, and prints the
+size of the index on disk.
+
+Usage (from the repository root):
+    python benchmarks/vector_latency.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import travel_data
+import vectors
+
+QUESTIONS = (
+    "is it worth visiting the old town with kids", "what is the history of the capital",
+    "romantic dinner with a view", "what currency do they use", "best beaches for a quiet week",
+    "where can i see modern art", "tell me about the local wine",
+)
+ROUNDS = 20
+
+
+def main():
+    # build or open the index and map every country outside the measurements
+    for country in travel_data.countries:
+        vectors.top_k(country, QUESTIONS[0])
+
+    timings = []
+    for _ in range(ROUNDS):
+        for country in travel_data.countries:
+            for question in QUESTIONS:
+                start = time.perf_counter()
+                vectors.top_k(country, question)
+                timings.append(time.perf_counter() - start)
+
+    size = sum(os.path.getsize(os.path.join(vectors.DEFAULT_ROOT, name)) for name in os.listdir(vectors.DEFAULT_ROOT))
+    timings.sort()
+    print(f"index on disk:          {size / 1024:8.0f} KB")
+    print(f"queries:                {len(timings)}")
+    for p in (50, 95, 99):
+        print(f"p{p}:                    {timings[len(timings) * p // 100] * 1e6:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
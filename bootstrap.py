@@ -0,0 +1,187 @@
+"""
+Process-wide runtime for the app
+
+Streamlit re-executes app.py on every interaction, but imported modules live
+for the whole process. Everything that should survive reruns is built once
+here behind a lock: the typed settings from .streamlit/config.toml, a single
+OpenAI client on a tuned httpx connection pool (pre-warmed at startup), the
+retry policy, the response cache, the image store, the thread pool and the
+telemetry and dataset configuration.
+"""
+import dataclasses
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import httpx
+import openai
+import toml
+
+import dataset
+import image_store
+import llm_cache
+import retry
+import telemetry
+
+log = logging.getLogger(__name__)
+
+CONFIG_PATH = os.path.join(".streamlit", "config.toml")
+
+
+### SETTINGS ###
+@dataclasses.dataclass(frozen=True)
+class Settings:
+    """
+    The [custom] section of config.toml, with defaults for anything left out
+    """
+    assistant_avatar: str = ""
+    user_avatar: str = ""
+
+    intent_confidence_threshold: float = 0.65
+    name_confidence_threshold: float = 0.7
+
+    llm_cache_path: str = os.path.join(".cache", "llm_responses.sqlite3")
+    llm_cache_memory_entries: int = 1024
+    llm_cache_disk_entries: int = 100_000
+    image_store_path: str = os.path.join(".cache", "images")
+    image_store_max_bytes: int = 256 * 1024 * 1024
+    hero_images_path: str = os.path.join("images", "heroes")
+
+    llm_thread_pool_workers: int = 8
+    chat_timeout_seconds: float = 30.0
+    image_timeout_seconds: float = 60.0
+    stream_answers: bool = True
+
+    recommendations_page_size: int = 5
+    history_window_messages: int = 20
+    session_max_messages: int = 200
+    session_max_bytes: int = 512 * 1024
+    session_summary_lines: int = 50
+    grounding_entries: int = 4
+    grounding_token_budget: int = 250
+
+    retry_attempts: int = 4
+    retry_base_delay_seconds: float = 0.5
+    retry_max_delay_seconds: float = 8.0
+    retry_deadline_seconds: float = 30.0
+
+    http_max_connections: int = 32
+    http_max_keepalive_connections: int = 16
+    http_keepalive_expiry_seconds: float = 120.0
+    http_connect_timeout_seconds: float = 5.0
+    http_read_timeout_seconds: float = 60.0
+    http_prewarm_connections: int = 2
+
+    # the dataset and vector index are built at deploy time (python data_extract.py),
+    # rebuilding them on first use instead holds up that request for seconds
+    rebuild_stale_data: bool = False
+
+    telemetry_enabled: bool = False
+    telemetry_trace_path: str = os.path.join(".cache", "trace.jsonl")
+    telemetry_prometheus_path: str = os.path.join(".cache", "metrics.prom")
+
+
+@functools.lru_cache(maxsize=None)
+def load_settings(path: str = CONFIG_PATH) -> Settings:
+    """
+    Parses the config once per process, casting values to the field types
+    """
+    custom = toml.load(path).get("custom", {})
+    values = {}
+    for field in dataclasses.fields(Settings):
+        if field.name not in custom:
+            continue
+        value = custom[field.name]
+        values[field.name] = field.type(value) if field.type in (int, float, bool, str) else value
+    unknown = set(custom) - set(values)
+    if unknown:
+        log.warning(f"Ignoring unknown config options: {sorted(unknown)}")
+    return Settings(**values)
+
+
+### RUNTIME ###
+class Runtime:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        telemetry.configure(
+            settings.telemetry_enabled,
+            trace_path=settings.telemetry_trace_path or None,
+            prometheus_path=settings.telemetry_prometheus_path or None,
+        )
+        dataset.configure(rebuild_stale=settings.rebuild_stale_data)
+
+        self.http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry_seconds,
+            ),
+            timeout=httpx.Timeout(settings.http_read_timeout_seconds, connect=settings.http_connect_timeout_seconds),
+        )
+        self.openai_client = openai.OpenAI(
+            api_key=os.environ["OPENAI_API_KEY"],
+            http_client=self.http_client,
+            # retries are owned by retry_policy
+            max_retries=0,
+        )
+        # one backoff policy for every API call
+        self.retry_policy = retry.RetryPolicy(
+            attempts=settings.retry_attempts,
+            base_delay=settings.retry_base_delay_seconds,
+            max_delay=settings.retry_max_delay_seconds,
+            deadline=settings.retry_deadline_seconds,
+            retry_on=(
+                openai.APIConnectionError, # includes timeouts
+                openai.RateLimitError,
+                openai.InternalServerError,
+            ),
+        )
+
+        self.response_cache = llm_cache.ResponseCache(
+            settings.llm_cache_path,
+            max_memory_entries=settings.llm_cache_memory_entries,
+            max_disk_entries=settings.llm_cache_disk_entries,
+        )
+        self.image_store = image_store.ImageStore(
+            settings.image_store_path,
+            max_bytes=settings.image_store_max_bytes,
+            namespace="dall-e-2|256x256",
+        )
+        self.executor = ThreadPoolExecutor(max_workers=settings.llm_thread_pool_workers, thread_name_prefix="llm")
+
+    def prewarm(self) -> None:
+        """
+        Opens pooled connections to the API host in the background, so the
+        first user request doesn't pay for the TCP and TLS handshakes
+        """
+        url = str(self.openai_client.base_url)
+
+        def connect():
+            try:
+                self.http_client.head(url)
+            except httpx.HTTPError as e:
+                log.info(f"Couldn't pre-warm a connection to {url}: {e}")
+
+        for _ in range(self.settings.http_prewarm_connections):
+            threading.Thread(target=connect, name="prewarm", daemon=True).start()
+
+
+_lock = threading.Lock()
+_runtime: Optional[Runtime] = None
+
+
+def get_runtime(path: str = CONFIG_PATH) -> Runtime:
+    """
+    The process-wide runtime, built by whichever session gets here first
+    """
+    global _runtime
+    if _runtime is None:
+        with _lock:
+            if _runtime is None:
+                runtime = Runtime(load_settings(path))
+                runtime.prewarm()
+                _runtime = runtime
+    return _runtime
@@ -0,0 +1,276 @@
+"""
+Offline country resolver
+
+Finds the country a prompt is about without calling the LLM. Country names,
+demonyms, common aliases, unsupported countries and the city names found in
+the travel data addresses are loaded into one word-level trie, and the prompt
+is scanned once for the leftmost-longest matches. Misspelled single words get
+a fuzzy second pass. Anything still unresolved is left to the LLM.
+
+Matches are weighted: a country name or alias outweighs a city, and a city
+outweighs a nationality or language, which often isn't the destination.
+"""
+import difflib
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Optional
+
+import travel_data
+
+NOT_SUPPORTED = "not supported"
+
+### ALIASES ###
+aliases = {
+    "armenia": ("hayastan",),
+    "france": ("la france",),
+    "italy": ("italia",),
+    "spain": ("espana", "españa"),
+    "germany": ("deutschland",),
+    "usa": (
+        "us", "u s", "u s a", "america", "united states",
+        "united states of america", "the states", "new mexico",
+    ),
+    "uk": (
+        "u k", "united kingdom", "britain", "great britain", "england",
+        "scotland", "wales", "northern ireland",
+    ),
+    "brazil": ("brasil",),
+    "greece": ("hellas",),
+    "singapore": (),
+    "australia": ("aussie",),
+    "china": ("prc", "people's republic of china"),
+    "uae": (
+        "u a e", "emirates", "the emirates", "united arab emirates",
+        "dubai", "abu dhabi",
+    ),
+    "canada": (),
+}
+
+# nationalities and languages, weaker than a country name: "I speak Spanish,
+# can I visit France?" is about France
+demonyms = {
+    "armenia": ("armenian", "armenians"),
+    "france": ("french",),
+    "italy": ("italian", "italians"),
+    "spain": ("spanish",),
+    "germany": ("german", "germans"),
+    "usa": ("american", "americans"),
+    "uk": ("british", "english", "scottish", "welsh"),
+    "brazil": ("brazilian",),
+    "greece": ("greek",),
+    "singapore": ("singaporean",),
+    "australia": ("australian",),
+    "china": ("chinese",),
+    "uae": ("emirati",),
+    "canada": ("canadian", "canadians"),
+}
+
+# aliases that are also everyday words, only trusted when written in capitals
+case_sensitive_aliases = {"us"}
+
+unsupported_countries = (
+    "afghanistan", "albania", "algeria", "andorra", "angola", "antigua and barbuda",
+    "argentina", "austria", "azerbaijan", "bahamas", "bahrain", "bangladesh",
+    "barbados", "belarus", "belgium", "belize", "benin", "bhutan", "bolivia",
+    "bosnia and herzegovina", "botswana", "brunei", "bulgaria", "burkina faso",
+    "burundi", "cabo verde", "cape verde", "cambodia", "cameroon",
+    "central african republic", "chad", "chile", "colombia", "comoros", "congo",
+    "costa rica", "croatia", "cuba", "cyprus", "czech republic", "czechia",
+    "denmark", "djibouti", "dominica", "dominican republic", "ecuador", "egypt",
+    "el salvador", "equatorial guinea", "eritrea", "estonia", "eswatini",
+    "ethiopia", "fiji", "finland", "gabon", "gambia", "georgia", "ghana",
+    "grenada", "guatemala", "guinea", "guinea-bissau", "guyana", "haiti",
+    "honduras", "hungary", "iceland", "india", "indonesia", "iran", "iraq",
+    "ireland", "israel", "ivory coast", "jamaica", "japan", "jordan",
+    "kazakhstan", "kenya", "kiribati", "kosovo", "kuwait", "kyrgyzstan", "laos",
+    "latvia", "lebanon", "lesotho", "liberia", "libya", "liechtenstein",
+    "lithuania", "luxembourg", "madagascar", "malawi", "malaysia", "maldives",
+    "mali", "malta", "marshall islands", "mauritania", "mauritius", "mexico",
+    "micronesia", "moldova", "monaco", "mongolia", "montenegro", "morocco",
+    "mozambique", "myanmar", "namibia", "nauru", "nepal", "netherlands",
+    "holland", "new zealand", "nicaragua", "niger", "nigeria", "north korea",
+    "north macedonia", "norway", "oman", "pakistan", "palau", "palestine",
+    "panama", "papua new guinea", "paraguay", "peru", "philippines", "poland",
+    "portugal", "qatar", "romania", "russia", "rwanda", "saint lucia", "samoa",
+    "san marino", "saudi arabia", "senegal", "serbia", "seychelles",
+    "sierra leone", "slovakia", "slovenia", "solomon islands", "somalia",
+    "south africa", "south korea", "korea", "south sudan", "sri lanka", "sudan",
+    "suriname", "sweden", "switzerland", "syria", "taiwan", "tajikistan",
+    "tanzania", "thailand", "timor-leste", "togo", "tonga",
+    "trinidad and tobago", "tunisia", "turkey", "turkiye", "turkmenistan",
+    "tuvalu", "uganda", "ukraine", "uruguay", "uzbekistan", "vanuatu",
+    "vatican", "venezuela", "vietnam", "yemen", "zambia", "zimbabwe",
+)
+
+### CITIES FROM THE TRAVEL DATA ###
+_street_words = {
+    "st", "st.", "street", "rd", "road", "ave", "ave.", "av", "av.", "avenue", "dr",
+    "blvd", "rue", "bd", "pl", "pl.", "prom.", "str.", "dom.", "p.za", "piazza",
+    "poghota", "pokhoc", "pokhots", "poxoc", "platz", "way", "lane", "ln",
+}
+_region_prefixes = ("state of ", "municipality of ", "metropolitan city of ", "province of ")
+# city names that are also common words in prompts
+_city_stoplist = {"nice", "bath", "centro", "plaka", "admiralty", "jasper", "china", "domplatz"}
+
+
+def _city_candidates(address: str) -> list:
+    """
+    The locality parts of an address: the one or two parts before the country,
+    without postcodes, state codes or street names
+    """
+    parts = [p.strip() for p in address.split(",")]
+    candidates = []
+    for part in parts[-3:-1]:
+        words = [
+            w for w in part.replace(" -", " ").split()
+            if not any(ch.isdigit() for ch in w) and not (w.isupper() and len(w) <= 3)
+        ]
+        if not words or any(w.lower() in _street_words or w.lower().endswith("straße") for w in words):
+            continue
+        candidate = " ".join(words)
+        for prefix in _region_prefixes:
+            if candidate.lower().startswith(prefix):
+                candidate = candidate[len(prefix):]
+        if len(candidate) >= 4 and candidate.lower() not in _city_stoplist:
+            candidates.append(candidate)
+    return candidates
+
+
+def _cities() -> dict:
+    """
+    Maps city name -> country for localities seen at least twice and in a single country
+    """
+    seen = defaultdict(set)
+    counts = Counter()
+    for country, address in travel_data.addresses():
+        for city in _city_candidates(address):
+            seen[city].add(country)
+            counts[city] += 1
+    return {city: countries.pop() for city, countries in seen.items() if len(countries) == 1 and counts[city] >= 2}
+
+
+### TRIE ###
+_word_pattern = re.compile(r"[\w'-]+")
+
+
+def _fold(text: str) -> str:
+    """
+    Lowercase and strip accents so 'Córdoba' and 'cordoba' match
+    """
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def _words(text: str) -> list:
+    return _word_pattern.findall(_fold(text).replace(".", " "))
+
+
+# weight of each kind of match, names and aliases beat cities, which beat demonyms
+COUNTRY_WEIGHT = 6
+CITY_WEIGHT = 2
+DEMONYM_WEIGHT = 1
+
+_END = object()
+
+
+def _build():
+    trie = {}
+
+    def add(phrase: str, target: str, weight: int):
+        node = trie
+        for word in _words(phrase):
+            node = node.setdefault(word, {})
+        # keep the strongest target when a phrase is added twice
+        if _END not in node or node[_END][1] < weight:
+            node[_END] = (target, weight)
+
+    for city, country in _cities().items():
+        add(city, country, CITY_WEIGHT)
+    for name in unsupported_countries:
+        add(name, NOT_SUPPORTED, COUNTRY_WEIGHT)
+    for country in travel_data.countries:
+        add(country, country, COUNTRY_WEIGHT)
+        for alias in aliases[country]:
+            if alias not in case_sensitive_aliases:
+                add(alias, country, COUNTRY_WEIGHT)
+        for demonym in demonyms[country]:
+            add(demonym, country, DEMONYM_WEIGHT)
+
+    # single-word keys for the fuzzy pass, only long enough to be safe,
+    # bucketed by first letter since typos rarely hit the first one
+    fuzzy_keys = defaultdict(dict)
+    for word, node in trie.items():
+        if _END in node and len(word) >= 5:
+            fuzzy_keys[word[0]][word] = node[_END]
+    return trie, fuzzy_keys
+
+
+_trie, _fuzzy_keys = _build()
+_case_sensitive = {
+    alias.upper(): country
+    for country, names in aliases.items() for alias in names if alias in case_sensitive_aliases
+}
+
+
+def _scan(words: list) -> list:
+    """
+    Leftmost-longest matches of the trie over the prompt words, as (target, weight)
+    """
+    matches = []
+    i = 0
+    while i < len(words):
+        node, found, length = _trie, None, 0
+        for j in range(i, len(words)):
+            node = node.get(words[j])
+            if node is None:
+                break
+            if _END in node:
+                found, length = node[_END], j - i + 1
+        if found:
+            matches.append(found)
+            i += length
+        else:
+            i += 1
+    return matches
+
+
+def _pick(matches: list) -> Optional[str]:
+    """
+    Supported countries win over 'not supported', ties go to the first mention
+    """
+    scores = Counter()
+    for target, weight in matches:
+        scores[target] += weight
+    supported = [target for target, _ in matches if target != NOT_SUPPORTED]
+    if supported:
+        return max(dict.fromkeys(supported), key=lambda target: scores[target])
+    if scores:
+        return NOT_SUPPORTED
+    return None
+
+
+def resolve(prompt: str) -> Optional[str]:
+    """
+    Returns the supported country key, 'not supported', or None when the prompt
+    can't be resolved locally
+    """
+    matches = _scan(_words(prompt))
+    matches += [
+        (country, COUNTRY_WEIGHT) for word in re.findall(r"\b[A-Z]{2}\b", prompt)
+        if (country := _case_sensitive.get(word))
+    ]
+    country = _pick(matches)
+    if country:
+        return country
+
+    # fuzzy pass for misspellings such as 'Itlay' or 'Germny'
+    fuzzy_matches = []
+    for word in _words(prompt):
+        if len(word) < 4:
+            continue
+        bucket = _fuzzy_keys.get(word[0], {})
+        close = difflib.get_close_matches(word, bucket, n=1, cutoff=0.8)
+        if close:
+            fuzzy_matches.append(bucket[close[0]])
+    return _pick(fuzzy_matches)
@@ -1,5 +1,235 @@
 """
 A series of functions to extract, format, and consume the travel data
+
+This is the dataset build pipeline. It reads the raw entries in
+travel_data_raw.py and the country metadata in travel_data.py, validates
+them, normalizes each country in a process pool and emits the artifacts:
+
+    data/build/<country>.json   normalized entries of one country
+    data/build/manifest.json    per-country source and artifact checksums
+    data/travel_data.sqlite3    indexed artifact the app reads (see dataset.py)
+    data/vectors/               entry embeddings for retrieval (see vectors.py)
+
+Rebuilds are incremental: only countries whose raw data changed since the
+last manifest are normalized and rewritten. Run it at deploy time, before the
+app starts, which serves the artifacts as they are (see dataset.py).
+
+Usage:
+    python data_extract.py                 # validate and build what changed
+    python data_extract.py --check         # only validate
+    python data_extract.py --force         # rebuild every country
 """
-import travel_data
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import dataset
+
+log = logging.getLogger(__name__)
+
+BUILD_DIR = os.path.join("data", "build")
+MANIFEST_PATH = os.path.join(BUILD_DIR, "manifest.json")
+
+
+### EXTRACT ###
+def extract() -> tuple:
+    """
+    (metadata, raw) where raw maps category -> the raw {country: entries} dict
+    """
+    import travel_data
+    import travel_data_raw
+
+    metadata = {
+        "countries": list(travel_data.countries),
+        "countries_to_proper": dict(travel_data.countries_to_proper),
+        "countries_to_emoji": dict(travel_data.countries_to_emoji),
+    }
+    raw = {category: getattr(travel_data_raw, attribute) for category, attribute in dataset.CATEGORIES.items()}
+    return metadata, raw
+
+
+### VALIDATE ###
+def validate(metadata: dict, raw: dict) -> list:
+    """
+    Human-readable problems found in the data, empty when everything checks out
+    """
+    problems = []
+    countries = metadata["countries"]
+
+    for mapping in ("countries_to_proper", "countries_to_emoji"):
+        keys = set(metadata[mapping])
+        for country in countries:
+            if country not in keys:
+                problems.append(f"{mapping}: missing '{country}'")
+        for country in sorted(keys - set(countries)):
+            problems.append(f"{mapping}: unknown country '{country}'")
+
+    for category, data in raw.items():
+        for country in countries:
+            if not data.get(country):
+                problems.append(f"{category}: missing country '{country}'")
+        for country in sorted(set(data) - set(countries)):
+            problems.append(f"{category}: unknown country '{country}'")
+
+        for country, entries in data.items():
+            names = Counter()
+            for i, entry in enumerate(entries):
+                if len(entry) != 3:
+                    problems.append(f"{category}/{country}: entry {i} has {len(entry)} fields instead of 3")
+                    continue
+                for field, value in zip(("name", "description", "address"), entry):
+                    if not isinstance(value, str) or not value.strip():
+                        problems.append(f"{category}/{country}: entry {i} has an empty {field}")
+                names[_clean(entry[0]).lower()] += 1
+            for name, count in names.items():
+                if count > 1:
+                    problems.append(f"{category}/{country}: duplicate name '{name}' ({count} times)")
+    return problems
+
+
+### NORMALIZE ###
+_invisible = re.compile("[\u200b-\u200f\u202a-\u202e\ufeff]")
+
+
+def _clean(value: str) -> str:
+    """
+    Drops invisible characters and collapses whitespace
+    """
+    return " ".join(_invisible.sub("", value).split())
+
+
+def normalize_country(country: str, slices: dict) -> dict:
+    """
+    Normalized {category: [[name, description, address]]} of one country.
+    Runs in a worker process.
+    """
+    normalized = {}
+    for category, entries in slices.items():
+        seen = set()
+        normalized[category] = []
+        for entry in entries or []:
+            if len(entry) != 3:
+                continue
+            name, description, address = (_clean(value) for value in entry)
+            # the reply template adds its own full stop after the description
+            description = description.rstrip(".")
+            if not name or name.lower() in seen:
+                continue
+            seen.add(name.lower())
+            normalized[category].append([name, description, address])
+    return normalized
+
+
+### LOAD ###
+def _checksum(payload) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _read_manifest() -> dict:
+    try:
+        with open(MANIFEST_PATH) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"countries": {}}
+
+
+def run(workers: int = None, force: bool = False, db_path: str = dataset.DEFAULT_PATH) -> dict:
+    """
+    Builds the artifacts for every country whose raw data changed, returns the manifest
+    """
+    metadata, raw = extract()
+    problems = validate(metadata, raw)
+    if problems:
+        log.warning(f"{len(problems)} data problems, see python data_extract.py --check")
+
+    manifest = _read_manifest()
+    # a change to the normalization rules invalidates every country
+    pipeline = dataset.source_checksum((os.path.abspath(__file__),))
+    if (not os.path.exists(db_path)
+            or manifest.get("pipeline_sha256") != pipeline
+            or manifest.get("database") != db_path):
+        force = True
+
+    slices = {
+        country: {category: data.get(country, []) for category, data in raw.items()}
+        for country in metadata["countries"]
+    }
+    sources = {
+        country: _checksum([slices[country], metadata["countries_to_proper"].get(country), metadata["countries_to_emoji"].get(country)])
+        for country in metadata["countries"]
+    }
+    changed = [
+        country for country in metadata["countries"]
+        if force
+        or manifest["countries"].get(country, {}).get("source_sha256") != sources[country]
+        or not os.path.exists(os.path.join(BUILD_DIR, f"{country}.json"))
+    ]
+
+    normalized = {}
+    if changed:
+        if workers == 1:
+            results = [normalize_country(country, slices[country]) for country in changed]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(normalize_country, changed, [slices[country] for country in changed]))
+        normalized = dict(zip(changed, results))
+
+        os.makedirs(BUILD_DIR, exist_ok=True)
+        for country, entries in normalized.items():
+            payload = json.dumps(entries, ensure_ascii=False, indent=1, sort_keys=True)
+            with open(os.path.join(BUILD_DIR, f"{country}.json"), "w", encoding="utf-8") as f:
+                f.write(payload)
+            manifest["countries"][country] = {
+                "source_sha256": sources[country],
+                "artifact_sha256": hashlib.sha256(payload.encode("utf-8")).hexdigest(),
+                "entries": {category: len(rows) for category, rows in entries.items()},
+            }
+
+    # even with no country changed, so the artifact's source checksum follows
+    # edits that don't touch the data and it stops reading as stale
+    dataset.write_countries(db_path, metadata, normalized)
+    if db_path == dataset.DEFAULT_PATH:
+        # the vector index is global (idf), rebuild it whole
+        import vectors
+        if changed or vectors.is_stale():
+            vectors.build()
+
+    # countries that were dropped from the metadata
+    for country in set(manifest["countries"]) - set(metadata["countries"]):
+        del manifest["countries"][country]
+    manifest["pipeline_sha256"] = pipeline
+    manifest["database"] = db_path
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+    log.info(f"Rebuilt {len(changed)} of {len(metadata['countries'])} countries" + (f": {', '.join(changed)}" if changed else ""))
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate the travel data and build its artifacts")
+    parser.add_argument("--check", action="store_true", help="only validate, exit 1 on problems")
+    parser.add_argument("--force", action="store_true", help="rebuild every country")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--db", default=dataset.DEFAULT_PATH, help="SQLite artifact path")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.check:
+        problems = validate(*extract())
+        for problem in problems:
+            print(problem)
+        print(f"{len(problems)} problems found")
+        sys.exit(1 if problems else 0)
+
+    run(args.workers, args.force, args.db)
+
 
+if __name__ == "__main__":
+    main()
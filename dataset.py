@@ -0,0 +1,249 @@
+"""
+Compiled travel dataset
+
+travel_data_raw.py is a large Python literal that every worker would have to
+parse and materialize on import. build() runs the data_extract.py pipeline,
+which validates and normalizes it together with the country metadata in
+travel_data.py and writes it into an indexed SQLite file. load() reads
+the whole artifact back with the same dict-like API as the travel_data module
+(countries, countries_to_proper, countries_to_emoji, list_of_places,
+list_of_hotels and list_of_restaurants), while travel_data itself reads it
+one (country, category) slice at a time.
+
+The artifact is built at deploy time, with python data_extract.py, before
+the app starts. Whether it is stale is decided from the size and mtime of
+each source, recorded next to it in <artifact>.sources.json, so processes
+don't hash the sources unless one of them was touched. A stale or missing
+artifact is only rebuilt on first use when configure(rebuild_stale=True),
+the default outside the app; the app turns it off unless the
+rebuild_stale_data setting asks for it.
+
+Usage:
+    python dataset.py            # bring data/travel_data.sqlite3 up to date
+    python data_extract.py -h    # the full pipeline, with validation options
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from types import SimpleNamespace
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+DEFAULT_PATH = os.path.join("data", "travel_data.sqlite3")
+_here = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATHS = tuple(os.path.join(_here, name) for name in ("travel_data_raw.py", "travel_data.py", "data_extract.py"))
+
+# dataset attribute for each category stored in the artifact
+CATEGORIES = {
+    "places": "list_of_places",
+    "hotels": "list_of_hotels",
+    "restaurants": "list_of_restaurants",
+}
+
+SCHEMA = """
+CREATE TABLE countries (
+    position INTEGER PRIMARY KEY,
+    country TEXT NOT NULL UNIQUE,
+    proper TEXT NOT NULL,
+    emoji TEXT NOT NULL
+);
+CREATE TABLE entries (
+    category TEXT NOT NULL,
+    country TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    address TEXT NOT NULL,
+    PRIMARY KEY (category, country, position)
+) WITHOUT ROWID;
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+# whether connect() may build a stale or missing artifact itself
+_rebuild_stale = True
+
+
+def configure(rebuild_stale: bool) -> None:
+    global _rebuild_stale
+    _rebuild_stale = rebuild_stale
+
+
+def rebuilds_stale() -> bool:
+    return _rebuild_stale
+
+
+def source_checksum(paths: tuple = SOURCE_PATHS) -> str:
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def source_stamp(paths: tuple = SOURCE_PATHS) -> list:
+    """
+    [name, size, mtime_ns] of each source, which is enough to tell they weren't touched
+    """
+    stamp = []
+    for path in paths:
+        stat = os.stat(path)
+        stamp.append([os.path.basename(path), stat.st_size, stat.st_mtime_ns])
+    return stamp
+
+
+def _stamp_path(path: str) -> str:
+    return f"{path}.sources.json"
+
+
+def _write_stamp(path: str) -> None:
+    tmp_path = f"{_stamp_path(path)}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(source_stamp(), f)
+    os.replace(tmp_path, _stamp_path(path))
+
+
+def build(path: str = DEFAULT_PATH) -> str:
+    """
+    Brings the SQLite artifact at path up to date and returns the path
+    """
+    import data_extract
+
+    # inline, a process pool is not worth forking from inside the app server
+    data_extract.run(workers=1, db_path=path)
+    return path
+
+
+def _write(conn: sqlite3.Connection, metadata: dict, normalized: dict) -> None:
+    conn.execute("DELETE FROM countries")
+    conn.executemany(
+        "INSERT INTO countries VALUES (?, ?, ?, ?)",
+        [
+            (i, country, metadata["countries_to_proper"][country], metadata["countries_to_emoji"][country])
+            for i, country in enumerate(metadata["countries"])
+        ],
+    )
+    conn.execute(
+        f"DELETE FROM entries WHERE country NOT IN ({', '.join('?' * len(metadata['countries']))})",
+        metadata["countries"],
+    )
+    for country, categories in normalized.items():
+        conn.execute("DELETE FROM entries WHERE country = ?", (country,))
+        conn.executemany(
+            "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (category, country, i, name, description, address)
+                for category, entries in categories.items()
+                for i, (name, description, address) in enumerate(entries)
+            ],
+        )
+    conn.execute("INSERT OR REPLACE INTO meta VALUES ('source_sha256', ?)", (source_checksum(),))
+
+
+def write_countries(path: str, metadata: dict, normalized: dict) -> None:
+    """
+    Replaces the entries of the given countries in the artifact, creating it if
+    needed. normalized is {country: {category: [[name, description, address]]}}.
+    """
+    if os.path.exists(path):
+        # one transaction, readers see either the old or the new rows
+        conn = sqlite3.connect(path)
+        with conn:
+            _write(conn, metadata, normalized)
+        conn.close()
+        _write_stamp(path)
+        return
+
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    # build next to the target then swap it in, readers never see a partial file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    with conn:
+        conn.executescript(SCHEMA)
+        _write(conn, metadata, normalized)
+    conn.execute("VACUUM")
+    conn.close()
+    os.replace(tmp_path, path)
+    _write_stamp(path)
+
+
+def stored_checksum(path: str = DEFAULT_PATH) -> Optional[str]:
+    """
+    Checksum of the sources the artifact was built from, None if there is no artifact
+    """
+    if not os.path.exists(path):
+        return None
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'source_sha256'").fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+
+def is_stale(path: str = DEFAULT_PATH) -> bool:
+    """
+    True when the artifact is missing or was built from different sources
+    """
+    if not os.path.exists(path):
+        return True
+    try:
+        with open(_stamp_path(path)) as f:
+            if json.load(f) == source_stamp():
+                return False
+    except (FileNotFoundError, ValueError):
+        pass
+    # a source was touched, only its content says whether it changed
+    stale = stored_checksum(path) != source_checksum()
+    if not stale:
+        _write_stamp(path)
+    return stale
+
+
+def connect(path: str = DEFAULT_PATH) -> sqlite3.Connection:
+    """
+    Read-only connection to the artifact. A stale one is rebuilt first when
+    configured to, otherwise it is served as it is with a warning.
+    """
+    if is_stale(path):
+        if _rebuild_stale:
+            log.info(f"Building {path}, it is missing or older than its sources")
+            build(path)
+        elif os.path.exists(path):
+            log.warning(f"{path} is older than its sources, rebuild it with python data_extract.py")
+        else:
+            raise FileNotFoundError(f"{path} is missing, build it with python data_extract.py before starting the app")
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+
+
+def load(path: str = DEFAULT_PATH) -> SimpleNamespace:
+    """
+    Reads the whole artifact into the same shape as the travel_data module
+    """
+    conn = connect(path)
+    rows = conn.execute("SELECT country, proper, emoji FROM countries ORDER BY position").fetchall()
+    data = SimpleNamespace(
+        countries=[country for country, _, _ in rows],
+        countries_proper=[proper for _, proper, _ in rows],
+        countries_to_proper={country: proper for country, proper, _ in rows},
+        countries_to_emoji={country: emoji for country, _, emoji in rows},
+    )
+    for category, attribute in CATEGORIES.items():
+        entries = {country: [] for country in data.countries}
+        for country, name, description, address in conn.execute(
+                "SELECT country, name, description, address FROM entries WHERE category = ? ORDER BY country, position",
+                (category,)):
+            entries[country].append([name, description, address])
+        setattr(data, attribute, entries)
+    conn.close()
+    return data
+
+
+if __name__ == "__main__":
+    print(f"Built {build()}")
@@ -0,0 +1,410 @@
+"""
+The conversation state machine, without Streamlit
+
+A ConversationEngine takes a SessionState and a prompt and returns a
+Response: onboarding (name, then country), recommendations, "Show more" and
+free-form answers. All LLM calls go through its backend (see backends.py),
+so the same engine serves the Streamlit page with OpenAIBackend and runs
+thousands of in-process sessions with ScriptedBackend.
+
+A turn has two halves so a UI can render while work is still in flight:
+respond() returns the answer possibly as a stream and images possibly as
+futures, and record() stores what was finally shown in the session's
+history. handle() does both in one go, for headless callers.
+"""
+import dataclasses
+import logging
+import random
+import re
+from concurrent.futures import Executor, Future, TimeoutError
+from typing import Iterator, Optional, Union
+
+import country_resolver
+import hero_images
+import intent
+import metrics
+import name_extractor
+import pagination
+import search
+import session_memory
+import snippets
+import telemetry
+import tokens
+import travel_data
+import vectors
+
+log = logging.getLogger(__name__)
+
+GREETING = (
+    "Hello, I'm GPTour and I'm here to help with your travels. "
+    "Before we begin, what is your name?"
+)
+SHOW_MORE = "Show more"
+ANSWER_APOLOGY = "I'm sorry, that took too long to answer - could you ask me again?"
+SUPPORTED_COUNTRIES = "The countries I can provide information are: Armenia, France, Italy, Spain, Germany, USA, UK, Brazil, Greece, Singapore, Australia, China, UAE, and Canada."
+NAME_FOLLOW_UPS = (
+    "I'm sorry but I couldn't catch your name - could you please share with me?",
+    "I couldn't catch your name - I'd love to know how to refer to you doing our conversation.",
+    "Before we begin, it would be helpful to have your name."
+    "I'm excited to help you with your travels! Before we start, it would be helpful for me to have your name!",
+)
+
+# dataset category behind each recommendation intent
+intent_categories = {"hotels": "hotels", "restaurants": "restaurants", "sightseeing": "places"}
+
+# an introduction that also asks something, "I'm Sam, what's the history of Italy?"
+_question = re.compile(r"\?|\b(what|how|when|where|why|which|who|tell me|can you|could you)\b", re.IGNORECASE)
+
+turn_extraction_tool = {
+    "type": "function",
+    "function": {
+        "name": "record_turn",
+        "description": "Record what the user's message says about them and their trip.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": ["string", "null"],
+                    "description": "The user's first name if they give it, otherwise null.",
+                },
+                "country": {
+                    "type": ["string", "null"],
+                    "enum": [*travel_data.countries, "not supported", None],
+                    "description": "The country the user wants to travel to or asks about, 'not supported' for any other country, null if none is mentioned.",
+                },
+                "intent": {
+                    "type": ["string", "null"],
+                    "enum": [*intent.LABELS, None],
+                    "description": "Whether the user wants hotels, restaurants or sightseeing, 'other' for any other question, null for no request.",
+                },
+            },
+            "required": ["name", "country", "intent"],
+        },
+    },
+}
+
+
+### STATE ###
+@dataclasses.dataclass
+class SessionState:
+    """
+    Everything one conversation remembers between turns
+    """
+    messages: session_memory.History
+    pages: pagination.Pages
+    user_name: Optional[str] = None
+    country: Optional[str] = None
+    # what "Show more" pages through next
+    last_intent: Optional[str] = None
+
+
+@dataclasses.dataclass
+class Response:
+    """
+    The assistant's reply to one turn. content is a stream of text chunks for
+    streamed answers, images are local paths or futures still being drawn.
+    """
+    content: Union[str, Iterator[str]]
+    images: list = dataclasses.field(default_factory=list)
+    intent: Optional[str] = None
+
+    def resolve(self, timeout: Optional[float] = None) -> "Response":
+        """
+        Reads the stream to the end and waits for the images, failed or late
+        images are dropped
+        """
+        if not isinstance(self.content, str):
+            self.content = "".join(self.content)
+        images = []
+        for image in self.images:
+            if isinstance(image, Future):
+                try:
+                    image = image.result(timeout=timeout)
+                except Exception as e:
+                    log.info(f"Image generation failed with error: {e}")
+                    continue
+            images.append(image)
+        self.images = images
+        return self
+
+
+### ENGINE ###
+class ConversationEngine:
+    def __init__(self, backend, settings, executor: Executor):
+        self.backend = backend
+        self.settings = settings
+        # answers and images of one turn run side by side here
+        self.executor = executor
+
+        # below these confidences the local extractors defer to the LLM
+        self.intent_confidence_threshold = settings.intent_confidence_threshold
+        self.name_confidence_threshold = settings.name_confidence_threshold
+        # entries per recommendation reply
+        self.recommendations = settings.recommendations_page_size
+        # dataset entries injected into 'other' answers, and their token budget
+        self.grounding_entries = settings.grounding_entries
+        self.grounding_token_budget = settings.grounding_token_budget
+
+    def new_session(self, session_id: Optional[str] = None, seed: Optional[int] = None) -> SessionState:
+        """
+        A fresh session, greeted and waiting for the user's name
+        """
+        messages = session_memory.History(
+            max_messages=self.settings.session_max_messages,
+            max_bytes=self.settings.session_max_bytes,
+            summary_lines=self.settings.session_summary_lines,
+            session_id=session_id,
+        )
+        messages.append({"role": "assistant", "images": [], "content": GREETING})
+        return SessionState(messages=messages, pages=pagination.Pages(seed))
+
+    def handle(self, state: SessionState, prompt: str, show_more: bool = False) -> Response:
+        """
+        One whole turn for headless callers: respond, wait for everything, record
+        """
+        with telemetry.turn(show_more=show_more):
+            response = self.respond(state, prompt, show_more).resolve(self.settings.image_timeout_seconds)
+            self.record(state, response)
+        return response
+
+    def record(self, state: SessionState, response: Response) -> None:
+        """
+        Stores the reply as it was shown, after respond()
+        """
+        state.messages.append({"role": "assistant", "images": list(response.images), "content": response.content})
+
+    @telemetry.timed("respond")
+    def respond(self, state: SessionState, prompt: str, show_more: bool = False) -> Response:
+        """
+        Adds the prompt to the history and works out the reply. "Show more" needs
+        no classification, it pages through the last recommendations again.
+        """
+        show_more = show_more and state.last_intent is not None
+        if show_more:
+            prompt = SHOW_MORE
+            metrics.increment("show_more_clicks")
+        state.messages.append({"role": "user", "images": [], "content": prompt})
+
+        images = []
+        if show_more:
+            turn = {"name": None, "country": None, "intent": state.last_intent}
+        else:
+            turn = self.identify_turn(state, prompt)
+
+        # consume whichever fields the turn provided
+        new_name = bool(turn["name"]) and not state.user_name
+        if new_name:
+            state.user_name = turn["name"]
+        new_country = turn["country"] not in (None, "not supported") and not state.country
+        if new_country:
+            state.country = turn["country"]
+        # a country given before the name was kept quietly, it is introduced with the welcome
+        introduce_country = new_country or (new_name and bool(state.country))
+
+        responses = []
+        if not state.user_name:
+            responses.append(random.choice(NAME_FOLLOW_UPS))
+        else:
+            if new_name:
+                welcome = f"Welcome {state.user_name}! I'm here to help you with your travels! ✈️ 🏨 🧳"
+                if not state.country and turn["country"] != "not supported":
+                    welcome += (
+                        "\n\nWhat country would be interested in learning more about? "
+                        "If you're unsure or curious, I can recommend a country for your travels! "
+                    )
+                responses.append(welcome)
+
+            if introduce_country:
+                proper = travel_data.countries_to_proper[state.country]
+                responses.append(
+                    f"I would love give more information on {proper} {travel_data.countries_to_emoji[state.country]}! "
+                    f"\n\nI can give recommendations for sightseeing, hotels, and restaurants!"
+                    f"\n\nHere's a picture of what traveling to {proper} might entail:"
+                )
+                # serve a pre-generated hero image, only generate one if the country has no pool,
+                # in the background like the 'other' images so the welcome text isn't held up
+                hero_image = hero_images.pick(state.country, self.settings.hero_images_path)
+                if hero_image is None:
+                    hero_image = self.executor.submit(telemetry.bind(self.backend.dalle), hero_images.hero_prompt(state.country))
+                images.append(hero_image)
+            elif not state.country:
+                if turn["country"] == "not supported":
+                    responses.append(f"I'm sorry, but at the moment, I don't support or provide information on this country! {SUPPORTED_COUNTRIES}")
+                elif not new_name:
+                    responses.append(f"I couldn't catch which country you'd be interested in - could you share a country you are interest in? {SUPPORTED_COUNTRIES}")
+
+            # answer right away on regular turns, and on onboarding turns that already
+            # ask for recommendations or a question of their own
+            onboarding = new_name or new_country
+            asks = turn["intent"] in intent_categories or (turn["intent"] == "other" and bool(_question.search(prompt)))
+            if state.country and (not onboarding or asks):
+                # a streamed answer can't be joined to the welcome, it is read in full then
+                answer, image = self.assistant(state, prompt, turn["intent"], stream=not responses)
+                responses.append(answer)
+                if image:
+                    images.append(image)
+
+        # a streamed answer is only ever alone in a turn
+        content = responses[0] if len(responses) == 1 else "\n\n".join(responses)
+        return Response(content=content, images=images, intent=turn["intent"])
+
+    ### TURN EXTRACTION ###
+    @telemetry.timed("extract_turn")
+    def extract_turn(self, prompt: str) -> dict:
+        """
+        Name, country and intent of the prompt in one structured LLM call, missing fields are None
+        """
+        context = (
+            "Instruction: given the prompt, extract the first name of the user, the country they are asking about, "
+            "and whether they want to learn about hotels, restaurants, sightseeing, or something else. "
+            "Use null for anything the prompt doesn't mention. "
+            "Example: if the prompt is 'my friends call me jake', the name is 'Jake' and the country and intent are null. "
+            "Example: if the prompt is 'I'm Sam, show me hotels in Italy', the name is 'Sam', the country is 'italy' and the intent is 'hotels'. "
+            "Example: if the prompt is 'tell me some history of japan', the name is null, the country is 'not supported' and the intent is 'other'."
+        )
+        turn = {"name": None, "country": None, "intent": None}
+        try:
+            result = self.backend.chatgpt_tool(prompt, context, turn_extraction_tool, call_type="extract")
+        except Exception as e:
+            log.info(f"Couldn't extract prompt = {prompt}. Found error: {e}")
+            return turn
+
+        user_name = (result.get("name") or "").strip()
+        if user_name and user_name.lower() not in ("undetermined", "null", "none"):
+            turn["name"] = user_name[0].upper() + user_name[1:] # capitalize first letter
+
+        # tolerate answers like "Italy." or "Hotels" that miss the enum
+        country = (result.get("country") or "").strip().lower()
+        if country and country not in ("none", "null"):
+            turn["country"] = country if country in travel_data.countries else (country_resolver.resolve(country) or "not supported")
+
+        turn["intent"] = intent.normalize_label(result.get("intent") or "")
+        return turn
+
+    @telemetry.timed("identify_turn")
+    def identify_turn(self, state: SessionState, prompt: str) -> dict:
+        """
+        Identifies the user's name, the country and the intent of the prompt.
+        The local extractors run first and a single extract_turn() call fills in
+        whatever the session still needs.
+        """
+        turn = {"name": None, "country": None, "intent": None}
+        needs_llm = False
+        # what is left for the country once the name is taken out
+        country_text = prompt
+
+        if not state.user_name:
+            with telemetry.span("extract_name"):
+                user_name, confidence = name_extractor.extract(prompt)
+            if user_name:
+                country_text = name_extractor.without_name(prompt, user_name)
+            metrics.increment("name_extractions")
+            if user_name and confidence >= self.name_confidence_threshold:
+                turn["name"] = user_name
+            else:
+                metrics.increment("name_llm_fallbacks")
+                needs_llm = True
+
+        if not state.country:
+            with telemetry.span("resolve_country"):
+                turn["country"] = country_resolver.resolve(country_text)
+            metrics.increment("country_resolutions")
+            # a missing country only matters once we know who we're talking to,
+            # a name found in this very turn is welcomed first and asked for one
+            if turn["country"] is None and state.user_name:
+                metrics.increment("country_llm_fallbacks")
+                needs_llm = True
+
+        with telemetry.span("classify_intent"):
+            label, confidence = intent.classify(prompt)
+        metrics.increment("intent_classifications")
+        if confidence >= self.intent_confidence_threshold:
+            turn["intent"] = label
+        elif state.user_name and state.country:
+            metrics.increment("intent_llm_fallbacks")
+            needs_llm = True
+
+        if needs_llm:
+            log.info(
+                f"Asking the LLM about prompt = {prompt}. "
+                f"Intent fallback rate is {metrics.ratio('intent_llm_fallbacks', 'intent_classifications'):.1%}"
+            )
+            for field, value in self.extract_turn(prompt).items():
+                if turn[field] is None:
+                    turn[field] = value
+        return turn
+
+    ### ANSWERS ###
+    @telemetry.timed("assistant")
+    def assistant(self, state: SessionState, prompt: str, results: Optional[str], stream: bool = True) -> tuple:
+        """
+        Personalized response based on the prompt and its intent, and the
+        image that goes with it if any. 'other' answers are streamed when the
+        settings and stream allow it.
+        """
+        if results not in intent.LABELS:
+            results = "other"
+
+        state.last_intent = None if results == "other" else results
+
+        if results == "other":
+            context = (
+                f"You're a friendly travel agent working with a person named {state.user_name}. "
+                f"Answer the user's question. They are planning to travel to {state.country}. "
+                f"Keep the answer conversational and informal in style and avoid very long answers (max 200 words)."
+                f"Make sure to refer to the person by their name, {state.user_name}, and related your answer to {state.country}. "
+                "For non-travel or related questions, please don't answer. Respond with 'I can only answer travel-related questions'"
+                "Thank you!"
+            )
+            # ground the answer in our own entries closest to the question
+            with telemetry.span("grounding"):
+                matches = vectors.top_k(state.country, prompt, self.grounding_entries)
+                grounding = tokens.truncate(
+                    [f"- {m.entry.name} ({m.category}): {m.entry.description}. {m.entry.address}" for m in matches],
+                    self.grounding_token_budget,
+                )
+            metrics.increment("grounding_entries", len(grounding))
+            if grounding:
+                context += "\nIf they fit the question, suggest these from our own travel guide:\n" + "\n".join(grounding)
+            # the answer and the image are independent, run them side by side
+            # and hand back the image still pending so the text can render first
+            image = self.executor.submit(telemetry.bind(self.backend.dalle), f"give an image of {state.country} related to {prompt}")
+            # earlier turns, so follow-ups like "what about the second one?" work,
+            # without the question itself which is the last message
+            history = tokens.fit_history(state.messages[:-1], tokens.budget("answer").history)
+            if self.settings.stream_answers and stream:
+                return self._guarded_stream(prompt, self.backend.chatgpt_stream(prompt, context, call_type="answer", history=history)), image
+            text = self.executor.submit(telemetry.bind(self.backend.chatgpt), prompt, context, call_type="answer", cache=False, history=history)
+            try:
+                return text.result(timeout=self.settings.chat_timeout_seconds), image
+            except TimeoutError:
+                log.info(f"Answer for prompt = {prompt} timed out after {self.settings.chat_timeout_seconds}s")
+            except Exception as e:
+                log.info(f"Answer for prompt = {prompt} failed with error: {e}")
+            return ANSWER_APOLOGY, image
+
+        category = intent_categories[results]
+        with telemetry.span("recommendations", category=category):
+            # best matches for the prompt first, then the session's next unseen entries
+            matches = search.search(category, state.country, prompt, len(travel_data.load_slice(category, state.country)))
+            metrics.increment("search_queries")
+            if matches:
+                metrics.increment("search_hits")
+            telemetry.annotate(search_hits=len(matches))
+            entries = state.pages.next(category, state.country, self.recommendations, tuple(matches))
+            response = snippets.reply(category, state.country, entries, state.user_name)
+
+        return response, None
+
+    def _guarded_stream(self, prompt: str, stream: Iterator[str]) -> Iterator[str]:
+        """
+        The stream, ending in the apology instead of an error when the API fails
+        """
+        started = False
+        try:
+            for chunk in stream:
+                started = True
+                yield chunk
+        except Exception as e:
+            log.info(f"Answer for prompt = {prompt} failed with error: {e}")
+            yield ("\n\n" if started else "") + ANSWER_APOLOGY
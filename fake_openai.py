@@ -0,0 +1,352 @@
+"""
+Local stand-in for the OpenAI API, for development and benchmarks
+
+Speaks just enough of the API for this app: chat completions (plain, forced
+tool calls and streamed) and image generations. Answers are scripted or
+rule-based, no key or network is needed, and every response can be delayed,
+failed or rate-limited on purpose:
+
+    latency specs     fixed:MS, uniform:MIN_MS,MAX_MS or lognormal:MEDIAN_MS,SIGMA
+    --error-rate      share of requests answered with a 500
+    --rate-limit-rate share of requests answered with a 429 and a Retry-After
+
+Tool calls to record_turn are answered with the app's own local extractors,
+other chat answers come from the --script file (a JSON list of
+{"match": regex, "content": text}, first match wins) or a canned reply.
+
+Usage:
+    python fake_openai.py --port 8765 --chat-latency lognormal:400,0.5 --rate-limit-rate 0.05
+    OPENAI_API_KEY=fake OPENAI_BASE_URL=http://127.0.0.1:8765/v1 streamlit run app.py
+"""
+import argparse
+import base64
+import dataclasses
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import tokens
+
+# a 1x1 PNG, enough for st.image
+PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAIAAACQd1PeAAAADElEQVR4nGP49vk1AAW3AtUDHATAAAAAAElFTkSuQmCC"
+)
+
+
+### CONFIG ###
+@dataclasses.dataclass(frozen=True)
+class Latency:
+    """
+    A delay distribution in milliseconds
+    """
+    kind: str = "fixed"
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        kind, _, values = spec.partition(":")
+        numbers = [float(v) for v in values.split(",") if v] or [0.0]
+        if kind not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {spec}")
+        return cls(kind, numbers[0], numbers[1] if len(numbers) > 1 else 0.0)
+
+    def sample(self, rng: random.Random) -> float:
+        """
+        One delay, in seconds
+        """
+        if self.kind == "uniform":
+            ms = rng.uniform(self.a, self.b)
+        elif self.kind == "lognormal":
+            ms = rng.lognormvariate(math.log(self.a), self.b) if self.a > 0 else 0.0
+        else:
+            ms = self.a
+        return ms / 1000
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    chat_latency: Latency = Latency()
+    image_latency: Latency = Latency()
+    # between two streamed chunks
+    chunk_latency: Latency = Latency()
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_seconds: float = 0.1
+    answer_words: int = 120
+    script: tuple = ()
+    seed: Optional[int] = None
+    # below this the extracted name is left out, the app's own default
+    name_confidence_threshold: float = 0.7
+
+
+def load_script(path: str) -> tuple:
+    with open(path) as f:
+        return tuple((re.compile(rule["match"], re.IGNORECASE), rule["content"]) for rule in json.load(f))
+
+
+### ANSWERS ###
+_filler = (
+    "It's a wonderful place to explore, with friendly locals, great food and plenty of history around every corner. "
+    "Spring and autumn are usually the most pleasant seasons, and public transport makes it easy to get around. "
+    "Try to leave some time unplanned, the small discoveries are often the best part of the trip. "
+)
+
+
+def chat_answer(config: Config, messages: list) -> str:
+    prompt = messages[-1]["content"] if messages else ""
+    for pattern, content in config.script:
+        if pattern.search(prompt):
+            return content
+    words = (f"Great question! About '{prompt}': " + _filler * (1 + config.answer_words // 40)).split()
+    return " ".join(words[:config.answer_words])
+
+
+def tool_arguments(config: Config, tool: dict, messages: list) -> dict:
+    """
+    Rule-based arguments for the forced tool call. Like a model would, it only
+    gives a name it is sure of, and never one that is a place or a request
+    ("Italy", "Hotels").
+    """
+    # deferred, the extractors load the dataset
+    import country_resolver
+    import intent
+    import name_extractor
+
+    prompt = messages[-1]["content"] if messages else ""
+    function = tool["function"]
+    if function["name"] == "record_turn":
+        name, confidence = name_extractor.extract(prompt)
+        if name and (confidence < config.name_confidence_threshold or country_resolver.resolve(name) or intent.normalize_label(name)):
+            name = None
+        label, confidence = intent.classify(prompt)
+        return {
+            "name": name,
+            "country": country_resolver.resolve(name_extractor.without_name(prompt, name) if name else prompt),
+            "intent": label if confidence > 0 else None,
+        }
+    return {field: None for field in function.get("parameters", {}).get("required", [])}
+
+
+### SERVER ###
+class Handler(BaseHTTPRequestHandler):
+    server: "FakeOpenAI"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: dict, headers: dict = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        # connection pre-warming
+        self.send_response(200)
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/stats"):
+            self._send_json(200, self.server.snapshot())
+        else:
+            self._send_json(200, {"object": "list", "data": [{"id": "gpt-3.5-turbo", "object": "model"}]})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("content-length", 0))) or b"{}")
+        server = self.server
+        endpoint = "images" if self.path.endswith("/images/generations") else "chat"
+        server.count(f"{endpoint}_requests")
+
+        failure = server.rng_random()
+        if failure < server.config.rate_limit_rate:
+            server.count("rate_limited")
+            self._send_json(
+                429,
+                {"error": {"message": "Rate limit reached (simulated)", "type": "requests", "code": "rate_limit_exceeded"}},
+                {"retry-after": str(server.config.retry_after_seconds)},
+            )
+            return
+        if failure < server.config.rate_limit_rate + server.config.error_rate:
+            server.count("errors")
+            self._send_json(500, {"error": {"message": "Internal error (simulated)", "type": "server_error"}})
+            return
+
+        if endpoint == "images":
+            time.sleep(server.sample(server.config.image_latency))
+            image = base64.b64encode(PNG).decode("ascii")
+            data = {"b64_json": image} if body.get("response_format") == "b64_json" else {"url": f"data:image/png;base64,{image}"}
+            self._send_json(200, {"created": int(time.time()), "data": [data] * body.get("n", 1)})
+            return
+
+        messages = body.get("messages", [])
+        prompt_tokens = sum(tokens.count(m.get("content") or "") for m in messages)
+        time.sleep(server.sample(server.config.chat_latency))
+
+        if body.get("tools"):
+            tool = body["tools"][0]
+            arguments = json.dumps(tool_arguments(server.config, tool, messages))
+            message = {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [{
+                    "id": f"call_{uuid.uuid4().hex[:12]}",
+                    "type": "function",
+                    "function": {"name": tool["function"]["name"], "arguments": arguments},
+                }],
+            }
+            completion_tokens = tokens.count(arguments)
+        else:
+            content = chat_answer(server.config, messages)
+            if body.get("stream"):
+                self._stream(body, content)
+                return
+            message = {"role": "assistant", "content": content}
+            completion_tokens = tokens.count(content)
+
+        server.count("prompt_tokens", prompt_tokens)
+        server.count("completion_tokens", completion_tokens)
+        self._send_json(200, {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "gpt-3.5-turbo"),
+            "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        })
+
+    def _stream(self, body: dict, content: str) -> None:
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.end_headers()
+        chunk_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        words = content.split(" ")
+        for i, word in enumerate(words):
+            delta = {"content": word if i == 0 else " " + word}
+            self._event({"id": chunk_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                         "model": body.get("model", "gpt-3.5-turbo"),
+                         "choices": [{"index": 0, "delta": delta, "finish_reason": None}]})
+            time.sleep(self.server.sample(self.server.config.chunk_latency))
+        self._event({"id": chunk_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                     "model": body.get("model", "gpt-3.5-turbo"),
+                     "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+        prompt_tokens = sum(tokens.count(m.get("content") or "") for m in body.get("messages", []))
+        completion_tokens = tokens.count(content)
+        if (body.get("stream_options") or {}).get("include_usage"):
+            self._event({"id": chunk_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                         "model": body.get("model", "gpt-3.5-turbo"), "choices": [],
+                         "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                                   "total_tokens": prompt_tokens + completion_tokens}})
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.server.count("prompt_tokens", prompt_tokens)
+        self.server.count("completion_tokens", completion_tokens)
+
+    def _event(self, payload: dict) -> None:
+        self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+
+class FakeOpenAI(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, config: Config, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), Handler)
+        self.config = config
+        self._rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._stats = Counter()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def rng_random(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+    def sample(self, latency: Latency) -> float:
+        with self._lock:
+            return latency.sample(self._rng)
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+
+def serve(config: Config = Config(), host: str = "127.0.0.1", port: int = 0) -> FakeOpenAI:
+    """
+    Starts the server on a background thread, port 0 picks a free port
+    """
+    server = FakeOpenAI(config, host, port)
+    threading.Thread(target=server.serve_forever, name="fake-openai", daemon=True).start()
+    return server
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    The server's options, shared with the benchmark runner
+    """
+    parser.add_argument("--chat-latency", type=Latency.parse, default=Latency.parse("lognormal:300,0.4"))
+    parser.add_argument("--image-latency", type=Latency.parse, default=Latency.parse("lognormal:1500,0.3"))
+    parser.add_argument("--chunk-latency", type=Latency.parse, default=Latency.parse("fixed:10"))
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=0.1, help="seconds, sent with every 429")
+    parser.add_argument("--answer-words", type=int, default=120)
+    parser.add_argument("--script", type=load_script, default=(), help="JSON list of {match, content} rules")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--name-confidence-threshold", type=float, default=0.7, help="names extracted below it are left out")
+
+
+def config_from(args: argparse.Namespace) -> Config:
+    return Config(
+        chat_latency=args.chat_latency,
+        image_latency=args.image_latency,
+        chunk_latency=args.chunk_latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after_seconds=args.retry_after,
+        answer_words=args.answer_words,
+        script=args.script,
+        seed=args.seed,
+        name_confidence_threshold=args.name_confidence_threshold,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the OpenAI API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakeOpenAI(config_from(args), args.host, args.port)
+    print(f"Serving a fake OpenAI API at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Pre-generated hero image pool per supported country
+
+The welcome message for a country shows a hero image. Instead of generating
+it while the user waits, this module's batch command fills
+images/heroes/<country>/ ahead of time and the app picks a random image from
+the pool with no API call.
+
+Usage:
+    python hero_images.py --per-country 4
+    python hero_images.py --per-country 2 --countries italy france
+"""
+import argparse
+import base64
+import functools
+import os
+import random
+from typing import Optional
+
+import travel_data
+
+DEFAULT_ROOT = os.path.join("images", "heroes")
+
+
+def hero_prompt(country: str) -> str:
+    return f"A beautiful, travel picture for {country}. Make it sunny and gorgeous please and feature an iconic landmark!"
+
+
+@functools.lru_cache(maxsize=None)
+def pool(country: str, root: str = DEFAULT_ROOT) -> tuple:
+    """
+    Paths of the pre-generated images for the country, listed once per process
+    """
+    directory = os.path.join(root, country)
+    if not os.path.isdir(directory):
+        return ()
+    return tuple(sorted(
+        os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".png")
+    ))
+
+
+def pick(country: str, root: str = DEFAULT_ROOT) -> Optional[str]:
+    """
+    A random image from the country's pool, or None if there is no pool
+    """
+    images = pool(country, root)
+    return random.choice(images) if images else None
+
+
+### BATCH GENERATION ###
+def generate(countries: list, per_country: int, root: str = DEFAULT_ROOT) -> None:
+    import openai
+
+    client = openai.OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+    for country in countries:
+        directory = os.path.join(root, country)
+        os.makedirs(directory, exist_ok=True)
+        existing = len([name for name in os.listdir(directory) if name.endswith(".png")])
+        for i in range(existing, per_country):
+            response = client.images.generate(
+                model="dall-e-2",
+                prompt=hero_prompt(country),
+                size="256x256",
+                quality="standard",
+                response_format="b64_json",
+                n=1,
+            )
+            path = os.path.join(directory, f"{i:02d}.png")
+            with open(path, "wb") as f:
+                f.write(base64.b64decode(response.data[0].b64_json))
+            print(f"{country}: wrote {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-generate hero images for the supported countries")
+    parser.add_argument("--per-country", type=int, default=4, help="pool size to fill each country up to")
+    parser.add_argument("--countries", nargs="*", default=travel_data.countries, choices=travel_data.countries)
+    parser.add_argument("--root", default=DEFAULT_ROOT, help="asset directory")
+    args = parser.parse_args()
+    generate(args.countries, args.per_country, args.root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Content-addressed local store for the generated images
+
+Image bytes are saved once under their SHA-256 digest and a small SQLite index
+maps normalized prompts to digests, so a repeated prompt is served from disk
+without another generation call or remote fetch. The total size on disk is
+capped, evicting the least recently used images first.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+import metrics
+from llm_cache import normalize_prompt
+
+
+class ImageStore:
+    """
+    Images under root/objects/<digest[:2]>/<digest>.png with an LRU byte cap
+    """
+
+    def __init__(self, root: str, max_bytes: int = 256 * 1024 * 1024, namespace: str = ""):
+        self.root = root
+        self.max_bytes = max_bytes
+        # separates prompts made for different models or sizes
+        self.namespace = namespace
+        self._local = threading.local()
+
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS objects ("
+            "digest TEXT PRIMARY KEY, size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS objects_accessed ON objects (accessed_at)")
+        conn.execute("CREATE TABLE IF NOT EXISTS prompts (prompt_key TEXT PRIMARY KEY, digest TEXT NOT NULL)")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(os.path.join(self.root, "index.sqlite3"), timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _prompt_key(self, prompt: str) -> str:
+        return hashlib.sha256(f"{self.namespace}|{normalize_prompt(prompt)}".encode("utf-8")).hexdigest()
+
+    def path_for(self, digest: str) -> str:
+        return os.path.join(self.root, "objects", digest[:2], f"{digest}.png")
+
+    def get(self, prompt: str) -> Optional[str]:
+        """
+        Local path of the image stored for the prompt, or None
+        """
+        conn = self._connection()
+        row = conn.execute("SELECT digest FROM prompts WHERE prompt_key = ?", (self._prompt_key(prompt),)).fetchone()
+        if row is None or not os.path.exists(self.path_for(row[0])):
+            metrics.increment("image_store_misses")
+            return None
+        conn.execute("UPDATE objects SET accessed_at = ? WHERE digest = ?", (time.time(), row[0]))
+        metrics.increment("image_store_hits")
+        return self.path_for(row[0])
+
+    def put(self, prompt: str, data: bytes) -> str:
+        """
+        Saves the image bytes for the prompt and returns their local path
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path_for(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # write then rename so other processes never read a partial file
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO objects (digest, size, accessed_at) VALUES (?, ?, ?)",
+            (digest, len(data), time.time()),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO prompts (prompt_key, digest) VALUES (?, ?)",
+            (self._prompt_key(prompt), digest),
+        )
+        self.evict()
+        return path
+
+    def read(self, digest: str) -> bytes:
+        with open(self.path_for(digest), "rb") as f:
+            return f.read()
+
+    def total_bytes(self) -> int:
+        return self._connection().execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+
+    def evict(self) -> None:
+        """
+        Removes least recently used images until the store fits in max_bytes
+        """
+        conn = self._connection()
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return
+        for digest, size in conn.execute("SELECT digest, size FROM objects ORDER BY accessed_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM prompts WHERE digest = ?", (digest,))
+            conn.execute("DELETE FROM objects WHERE digest = ?", (digest,))
+            try:
+                os.remove(self.path_for(digest))
+            except FileNotFoundError:
+                pass
+            total -= size
+            metrics.increment("image_store_evictions")
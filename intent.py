@@ -0,0 +1,187 @@
+"""
+Local intent classifier for the assistant
+
+A small multinomial naive-Bayes model trained at import time on the bundled
+corpus below. It sorts a prompt into 'hotels', 'restaurants', 'sightseeing'
+or 'other' and returns a confidence score, so the LLM only has to be asked
+when the local model is unsure.
+
+Question and filler words are dropped before scoring. The one-word examples
+of the corpus ("museums", "dinner", "currency") are also keywords: a prompt
+naming a keyword of a single recommendation label always gets that label, at
+least at KEYWORD_CONFIDENCE, so "what is the best hotel" is about hotels
+whatever the rest of it looks like. 'other' keywords only win when the model
+is unsure. SMOOTHING and TEMPERATURE are set so that both the corpus and the
+held-out prompts of tests/test_intent.py clear the configured threshold.
+"""
+import math
+import re
+from typing import Optional, Tuple
+
+LABELS = ("hotels", "restaurants", "sightseeing", "other")
+
+# additive smoothing, 1 flattens the short examples below any usable threshold
+SMOOTHING = 0.2
+KEYWORD_CONFIDENCE = 0.95
+# scales the log-likelihoods before the softmax, the scores of two or three
+# tokens are otherwise too flat to be compared with a threshold
+TEMPERATURE = 2.0
+
+### TRAINING CORPUS ###
+corpus = {
+    "hotels": (
+        "hotels", "hotel", "what are some hotels", "show me hotels",
+        "where should i stay", "where can i stay", "places to stay",
+        "recommend a hotel", "good hotels please", "cheap hotels",
+        "luxury hotels", "accommodation", "accommodations", "lodging",
+        "i need a place to sleep", "book a room", "a room for the night",
+        "resorts", "a nice resort", "hostels", "a hostel", "guesthouse",
+        "bed and breakfast", "inn", "more hotels", "any other hotels",
+        "hotels near the beach", "boutique hotel", "suite with a view",
+        "where to spend the night", "motel", "stay overnight",
+    ),
+    "restaurants": (
+        "restaurants", "restaurant", "what are some restaurants",
+        "show me restaurants", "where should i eat", "where can i eat",
+        "places to eat", "recommend a restaurant", "good food",
+        "food", "local food", "local cuisine", "cuisine", "dinner",
+        "lunch", "breakfast spots", "brunch", "cafes", "a cafe",
+        "coffee shops", "coffee", "bars", "a nice bar", "street food",
+        "i am hungry", "something to eat", "vegetarian restaurants",
+        "seafood", "dining", "fine dining", "more restaurants",
+        "where to grab a bite", "pizza", "eateries", "bistro",
+    ),
+    "sightseeing": (
+        "sightseeing", "sights", "what are some sights", "show me sights",
+        "what should i see", "what can i see", "places to visit",
+        "what to visit", "things to do", "attractions",
+        "tourist attractions", "landmarks", "famous landmarks",
+        "monuments", "museums", "a museum", "tourist spots",
+        "what should i visit", "must see places", "tour",
+        "sightseeing spots", "parks", "national parks", "beaches",
+        "castles", "churches", "temples", "more sights",
+        "places to explore", "explore the city", "viewpoints",
+        "day trips", "hiking", "cathedrals", "what to do", "stuff to do",
+    ),
+    "other": (
+        "tell me some history", "what is the history", "tell me about the culture",
+        "what language do they speak", "what is the weather like",
+        "when is the best time to go", "do i need a visa", "visa requirements",
+        "what currency do they use", "currency", "exchange rate",
+        "is it safe", "safety tips", "how do i get around",
+        "public transport", "how much does it cost", "budget",
+        "what should i pack", "packing list", "tipping customs",
+        "local customs", "etiquette", "what is the population",
+        "how do i say hello", "phrases", "festivals", "holidays",
+        "what time zone", "electricity plugs", "flights",
+        "how long is the flight", "tell me a joke", "thank you",
+        "thanks", "what about the weather", "who are you",
+        "pack", "luggage", "best time to travel", "when to visit", "is it safe to travel alone",
+        "hi", "hello", "hi there", "my name is", "i am new here",
+    ),
+}
+
+### MODEL ###
+_token_pattern = re.compile(r"[a-z]+")
+
+# question and filler words, which the 'other' examples are full of and would
+# otherwise outvote the one word that says what the prompt is about
+stopwords = frozenset((
+    "a", "an", "and", "any", "are", "best", "can", "could", "give", "good", "i", "in", "is", "it",
+    "me", "my", "of", "on", "or", "please", "show", "some", "tell", "that", "the", "there", "this",
+    "top", "we", "what", "where", "which", "with", "you",
+))
+
+
+def _tokens(text: str) -> list:
+    """
+    Lowercase word tokens without stopwords, with a crude plural strip, plus adjacent bigrams
+    """
+    words = [w[:-1] if len(w) > 3 and w.endswith("s") and not w.endswith("ss") else w
+             for w in _token_pattern.findall(text.lower()) if w not in stopwords]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def _train(corpus: dict) -> Tuple[dict, set]:
+    counts = {label: {} for label in LABELS}
+    totals = {label: 0 for label in LABELS}
+    for label, examples in corpus.items():
+        for example in examples:
+            for token in _tokens(example):
+                counts[label][token] = counts[label].get(token, 0) + 1
+                totals[label] += 1
+    vocabulary = {token for label in LABELS for token in counts[label]}
+    log_likelihoods = {}
+    for label in LABELS:
+        denominator = totals[label] + SMOOTHING * len(vocabulary)
+        log_likelihoods[label] = {
+            token: math.log((counts[label].get(token, 0) + SMOOTHING) / denominator)
+            for token in vocabulary
+        }
+    return log_likelihoods, vocabulary
+
+
+def _keywords(corpus: dict) -> dict:
+    """
+    token -> labels, for the examples that are a single word
+    """
+    keywords = {}
+    for label, examples in corpus.items():
+        for example in examples:
+            tokens = _tokens(example)
+            if len(example.split()) == 1 and tokens:
+                keywords.setdefault(tokens[0], set()).add(label)
+    return keywords
+
+
+_log_likelihoods, _vocabulary = _train(corpus)
+_keywords_by_token = _keywords(corpus)
+
+
+def classify(prompt: str) -> Tuple[str, float]:
+    """
+    Returns (label, confidence) for the prompt, confidence is in [0, 1].
+    Prompts with no known vocabulary come back as ('other', 0.0).
+    """
+    tokens = [t for t in _tokens(prompt) if t in _vocabulary]
+    if not tokens:
+        return "other", 0.0
+
+    # uniform prior, so only the likelihoods matter
+    scores = {label: TEMPERATURE * sum(_log_likelihoods[label][t] for t in tokens) for label in LABELS}
+    best = max(scores, key=scores.get)
+    confidence = 1.0 / sum(math.exp(s - scores[best]) for s in scores.values())
+
+    keyword_labels = {label for t in tokens for label in _keywords_by_token.get(t, ())}
+    # a recommendation keyword ("hotel", "museum") settles the prompt on its own,
+    # whatever else it asks; 'other' keywords only when the model is unsure
+    if len(keyword_labels - {"other"}) == 1:
+        keyword_label = (keyword_labels - {"other"}).pop()
+        return keyword_label, max(confidence, KEYWORD_CONFIDENCE) if keyword_label == best else KEYWORD_CONFIDENCE
+    if keyword_labels == {"other"} and (best == "other" or confidence < KEYWORD_CONFIDENCE):
+        return "other", max(confidence if best == "other" else 0.0, KEYWORD_CONFIDENCE)
+    return best, confidence
+
+
+### LABEL NORMALIZATION ###
+# loose spellings an LLM answers with, mapped to the canonical label
+label_aliases = {
+    "hotel": "hotels", "accommodation": "hotels", "accommodations": "hotels", "lodging": "hotels",
+    "restaurant": "restaurants", "food": "restaurants", "dining": "restaurants",
+    "sight": "sightseeing", "sights": "sightseeing", "sightsee": "sightseeing",
+    "attractions": "sightseeing", "places": "sightseeing",
+    "others": "other",
+}
+
+
+def normalize_label(answer: str) -> Optional[str]:
+    """
+    Maps an answer such as "Hotels." or "'hotel'" to one of LABELS, or None
+    """
+    words = _token_pattern.findall(answer.lower())
+    if len(words) != 1:
+        # only trust longer answers that name exactly one label
+        found = {label_aliases.get(w, w) for w in words} & set(LABELS)
+        return found.pop() if len(found) == 1 else None
+    word = words[0]
+    return word if word in LABELS else label_aliases.get(word)
@@ -0,0 +1,132 @@
+"""
+Two-tier response cache for the chatgpt() calls
+
+An in-process LRU in front of an SQLite file in WAL mode, so every Streamlit
+worker process on the machine shares the same answers. Entries are keyed on
+model, system context and the normalized prompt and expire after a per call
+type TTL.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import metrics
+
+DAY = 24 * 60 * 60
+
+# seconds an answer stays valid for each kind of call
+default_ttls = {
+    "extract": 7 * DAY,
+    "default": DAY,
+}
+
+
+def normalize_prompt(prompt: str) -> str:
+    return " ".join(prompt.lower().split())
+
+
+def make_key(model: str, context: str, prompt: str) -> str:
+    payload = json.dumps([model, context, normalize_prompt(prompt)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    LRU memory tier plus a size-bounded SQLite tier shared across processes
+    """
+
+    def __init__(self, path: str, max_memory_entries: int = 1024, max_disk_entries: int = 100_000, ttls: Optional[dict] = None):
+        self.path = path
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttls = {**default_ttls, **(ttls or {})}
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writes = 0
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite connections can't be shared between threads, keep one per thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def ttl(self, call_type: str) -> float:
+        return self.ttls.get(call_type, self.ttls["default"])
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    metrics.increment("llm_cache_memory_hits")
+                    return value
+                del self._memory[key]
+
+        conn = self._connection()
+        row = conn.execute("SELECT value, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None or row[1] <= now:
+            metrics.increment("llm_cache_misses")
+            return None
+        conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        self._remember(key, row[0], row[1])
+        metrics.increment("llm_cache_disk_hits")
+        return row[0]
+
+    def set(self, key: str, value: str, call_type: str = "default") -> None:
+        now = time.time()
+        expires_at = now + self.ttl(call_type)
+        self._remember(key, value, expires_at)
+
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, value, expires_at, now),
+        )
+        with self._lock:
+            self._writes += 1
+            evict = self._writes % 100 == 0
+        if evict:
+            self.evict()
+
+    def _remember(self, key: str, value: str, expires_at: float) -> None:
+        with self._lock:
+            self._memory[key] = (value, expires_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def evict(self) -> None:
+        """
+        Drops expired rows, then the least recently used ones over the size cap
+        """
+        conn = self._connection()
+        conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        conn.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,),
+        )
@@ -0,0 +1,77 @@
+"""
+Process-wide counters shared by every Streamlit session in the worker, plus
+gauges that are read when a snapshot is taken. A labelled gauge reads one
+value per label value, such as one per live session.
+"""
+import threading
+from collections import Counter
+
+_lock = threading.Lock()
+_counters = Counter()
+_gauges = {}
+_labelled_gauges = {}
+
+
+def increment(name: str, value: int = 1) -> None:
+    """
+    Adds value to the named counter
+    """
+    with _lock:
+        _counters[name] += value
+
+
+def get(name: str) -> int:
+    with _lock:
+        return _counters[name]
+
+
+def ratio(numerator: str, denominator: str) -> float:
+    """
+    Returns numerator / denominator, or 0.0 if nothing was counted yet
+    """
+    with _lock:
+        total = _counters[denominator]
+        return _counters[numerator] / total if total else 0.0
+
+
+def register_gauge(name: str, read) -> None:
+    """
+    Reports read() under name in every snapshot
+    """
+    with _lock:
+        _gauges[name] = read
+
+
+def register_labelled_gauge(name: str, label: str, read) -> None:
+    """
+    Reports read(), a {label value: value} dict, under name with one series per label value
+    """
+    with _lock:
+        _labelled_gauges[name] = (label, read)
+
+
+def counters() -> dict:
+    with _lock:
+        return dict(_counters)
+
+
+def gauges() -> dict:
+    with _lock:
+        readers = dict(_gauges)
+    return {name: read() for name, read in readers.items()}
+
+
+def labelled_gauges() -> dict:
+    """
+    name -> (label, {label value: value})
+    """
+    with _lock:
+        readers = dict(_labelled_gauges)
+    return {name: (label, read()) for name, (label, read) in readers.items()}
+
+
+def snapshot() -> dict:
+    """
+    Every counter and gauge by name, labelled gauges as {label value: value}
+    """
+    return {**counters(), **gauges(), **{name: values for name, (_, values) in labelled_gauges().items()}}
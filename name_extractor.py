@@ -0,0 +1,141 @@
+"""
+Local first-name extraction for the onboarding turn
+
+Compiled introduction patterns in several languages plus a bundled list of
+first names. extract() returns the name and a confidence score, so the LLM is
+only needed for prompts the patterns can't settle.
+"""
+import re
+from typing import Optional, Tuple
+
+### FIRST NAMES ###
+first_names = frozenset("""
+aaron abdul abigail adam adrian ahmed aisha alan albert alejandro alex alexander
+alexandra alexis ali alice alicia alina amanda amelia amir amy ana anahit andrea
+andrei andrew angela angelo ani anna anne anthony antonio anush aram ararat
+arman armen arsen artur arthur ashley astrid aurora ava axel barbara beatriz ben
+benjamin bernard beth blake bob boris brandon brian bruno camila carl carla carlos
+carmen caroline catherine cecilia charles charlie charlotte chen chloe chris
+christian christina christopher claire clara daniel daniela david davit diana
+diego dimitri dmitri dominic dylan edgar eduardo elena eli elias elif elizabeth
+ella emily emma eric erik ethan eva evelyn fatima felix fernando filip finn
+francesca francesco francisco frank gabriel gabriela gayane george georgia
+gevorg giorgio giovanni giulia grace gregory guillaume hakob hamid hana hannah
+harry hasmik hector helen henry hiroshi hugo ian igor isabel isabella isaac ivan
+jack jacob jake james jan jane jasmine jason javier jean jennifer jessica jim joan
+joe john jonathan jorge jose joseph josh joshua juan julia julian julie justin
+kai karen karim karina kate katherine kevin kim laura lea leah leo leon lena
+levon liam lilit lily linda lisa liu lucas lucia luca luis luka lukas maria mariam
+marie mario mark marco martin mary mateo matteo matthew max maya mehmet mia
+michael michelle miguel mika mila mohamed mohammed narek nare natalia nathan
+nicolas nicole nikita nina noah nora olga oliver olivia omar oscar pablo paolo
+patricia patrick paul paula pedro peter philip pierre rachel rafael raj ravi
+rebecca ricardo richard robert roberto rosa ruben ryan sam samuel sara sarah
+sebastian sergei sergey shant simon sofia sophia sophie stefan stephanie steven
+susan suren taron tatevik thomas tigran tim tom tony valentina vardan vera victor
+victoria vincent wei william xavier yana yasmin yuki yusuf zara zoe
+""".split())
+
+# words that follow "I'm" or "soy" without being a name
+not_names = frozenset("""
+a an the not just so very really here there from in on at going looking trying
+planning interested excited happy fine good ok okay well new back ready sure
+thinking travelling traveling visiting hungry tired curious bored sorry glad
+undetermined hello hi hey thanks thank yes no nothing nobody someone anyone
+muy bien de en aqui un una le la très bien ici ein eine hier gut nicht
+""".split())
+
+### PATTERNS ###
+_name = r"([^\W\d_][^\W\d_'-]*(?:[-'][^\W\d_]+)?)"
+
+# introductions that always carry a name
+strong_patterns = [re.compile(p + _name, re.IGNORECASE) for p in (
+    r"\bmy name(?:'s| is)\s+",
+    r"\bname\s*[:=-]\s*",
+    r"\b(?:you can |please )?call me\s+",
+    r"\bmy friends call me\s+",
+    r"\bthey call me\s+",
+    r"\bme llamo\s+",
+    r"\bmi nombre es\s+",
+    r"\bje m'appelle\s+",
+    r"\bje m’appelle\s+",
+    r"\bmon nom est\s+",
+    r"\bmoi c'est\s+",
+    r"\bmi chiamo\s+",
+    r"\bil mio nome è\s+",
+    r"\bich hei(?:ß|ss)e\s+",
+    r"\bmein name ist\s+",
+    r"\bmeu nome é\s+",
+    r"\bme chamo\s+",
+    r"меня зовут\s+",
+    r"իմ անունը\s+",
+    r"\bim anun[sy]?\s+",
+)]
+
+# introductions that may just be a description ("I'm excited")
+weak_patterns = [re.compile(p + _name, re.IGNORECASE) for p in (
+    r"\bi(?:'m| am|’m)\s+",
+    r"\bit(?:'s| is)\s+",
+    r"\bthis is\s+",
+    r"\bsoy\s+",
+    r"\bje suis\s+",
+    r"\bsono\s+",
+    r"\bich bin\s+",
+    r"\beu sou\s+",
+    r"\bя\s+",
+    r"\bես\s+",
+)]
+
+_here_pattern = re.compile(_name + r"\s+here\b", re.IGNORECASE)
+_single_word = re.compile(r"^\W*" + _name + r"\W*$")
+
+
+def _capitalize(name: str) -> str:
+    return name[0].upper() + name[1:]
+
+
+def _score_candidate(candidate: str, base: float) -> Tuple[Optional[str], float]:
+    lowered = candidate.lower()
+    if lowered in not_names:
+        return None, 0.0
+    if lowered in first_names:
+        return _capitalize(candidate), max(base, 0.95)
+    if candidate[0].isupper():
+        return _capitalize(candidate), base
+    return _capitalize(candidate), base - 0.3
+
+
+def extract(prompt: str) -> Tuple[Optional[str], float]:
+    """
+    Returns (name, confidence) with confidence in [0, 1], or (None, 0.0) when
+    nothing that looks like a name was found
+    """
+    text = prompt.strip()
+
+    for pattern in strong_patterns:
+        if match := pattern.search(text):
+            return _score_candidate(match.group(1), 0.9)
+
+    # single-word replies such as "Ana" or "jake!"
+    if match := _single_word.match(text):
+        return _score_candidate(match.group(1), 0.6)
+
+    best = (None, 0.0)
+    for pattern in weak_patterns:
+        for match in pattern.finditer(text):
+            candidate = _score_candidate(match.group(1), 0.6)
+            if candidate[1] > best[1]:
+                best = candidate
+    if match := _here_pattern.search(text):
+        candidate = _score_candidate(match.group(1), 0.6)
+        if candidate[1] > best[1]:
+            best = candidate
+    return best
+
+
+def without_name(prompt: str, name: str) -> str:
+    """
+    The prompt with the first mention of name taken out, so words already
+    read as a name ("Jordan", "Georgia") aren't read again as something else
+    """
+    return re.sub(rf"(?<!\w){re.escape(name)}(?!\w)", " ", prompt, count=1, flags=re.IGNORECASE)
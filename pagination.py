@@ -0,0 +1,79 @@
+"""
+Non-repeating recommendation pages per session
+
+Each session walks every (category, country) slice in its own seeded random
+order. The order is computed once and the cursor only moves forward, so the
+next page is a slice of the permutation and nothing repeats until the whole
+list has been shown; then a new round starts in a fresh order.
+"""
+import random
+import zlib
+
+import travel_data
+
+
+def permutation(size: int, seed: int) -> tuple:
+    """
+    The positions 0..size-1 in a random order fixed by seed
+    """
+    order = list(range(size))
+    random.Random(seed).shuffle(order)
+    return tuple(order)
+
+
+class Cursor:
+    """
+    Position in one slice's permutation, plus the positions shown this round
+    """
+    __slots__ = ("seed", "order", "position", "shown")
+
+    def __init__(self, size: int, seed: int):
+        self.seed = seed
+        self.order = permutation(size, seed)
+        self.position = 0
+        self.shown = set()
+
+    def _new_round(self) -> None:
+        self.seed += 1
+        self.order = permutation(len(self.order), self.seed)
+        self.position = 0
+        self.shown.clear()
+
+    def take(self, count: int, preferred: tuple = ()) -> list:
+        """
+        Up to count positions not shown this round, the preferred ones first
+        """
+        if len(self.shown) >= len(self.order):
+            self._new_round()
+        page = [i for i in preferred if i not in self.shown][:count]
+        self.shown.update(page)
+        while len(page) < count and self.position < len(self.order):
+            i = self.order[self.position]
+            self.position += 1
+            if i not in self.shown:
+                self.shown.add(i)
+                page.append(i)
+        return page
+
+
+class Pages:
+    """
+    The cursors of one session, created the first time a slice is paged
+    """
+
+    def __init__(self, seed: int = None):
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.cursors = {}
+
+    def next(self, category: str, country: str, count: int, preferred: tuple = ()) -> list:
+        """
+        The next count entries of the slice, starting with the preferred
+        entries (e.g. search results) that weren't shown yet
+        """
+        entries = travel_data.load_slice(category, country)
+        cursor = self.cursors.get((category, country))
+        if cursor is None:
+            cursor = self.cursors[(category, country)] = Cursor(
+                len(entries), self.seed ^ zlib.crc32(f"{category}|{country}".encode("utf-8")))
+        positions = {entry: i for i, entry in enumerate(entries)} if preferred else {}
+        return [entries[i] for i in cursor.take(count, tuple(positions[entry] for entry in preferred))]
@@ -0,0 +1,55 @@
+"""
+Shared retry policy for the OpenAI calls
+
+Exponential backoff with full jitter, capped per sleep and bounded by a total
+deadline, for errors that are worth trying again (timeouts, dropped
+connections, rate limits and server errors).
+"""
+import random
+import time
+from typing import Callable
+
+import metrics
+
+
+class RetryPolicy:
+    def __init__(
+            self,
+            attempts: int = 4,
+            base_delay: float = 0.5,
+            max_delay: float = 8.0,
+            deadline: float = 30.0,
+            retry_on: tuple = (Exception,),
+        ):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_on = retry_on
+
+    def delay(self, attempt: int, error: Exception) -> float:
+        """
+        Seconds to wait before the next attempt, at least what a 429 asked for
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        try:
+            return max(delay, float(retry_after)) if retry_after else delay
+        except ValueError:
+            return delay
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """
+        Calls fn until it succeeds, the attempts run out or the deadline would pass
+        """
+        give_up_at = time.monotonic() + self.deadline
+        for attempt in range(self.attempts):
+            try:
+                return fn(*args, **kwargs)
+            except self.retry_on as e:
+                delay = self.delay(attempt, e)
+                if attempt + 1 == self.attempts or time.monotonic() + delay > give_up_at:
+                    raise
+                metrics.increment("llm_retries")
+                time.sleep(delay)
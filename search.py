@@ -0,0 +1,108 @@
+"""
+Full-text search over the travel entries
+
+An inverted index over the name, description and address of every entry,
+built per (category, country) the first time that slice is searched, and
+ranked with Okapi BM25. A query only touches the postings of its own terms
+in one country, so top-k retrieval stays well under a millisecond.
+
+Terms that appear in most entries of a slice ("hotel" among hotels, the
+country name in the addresses) can't tell entries apart and are ignored, so
+a prompt with nothing specific in it returns no matches and the caller falls
+back to sampling.
+"""
+import functools
+import heapq
+import math
+import re
+import unicodedata
+from typing import NamedTuple
+
+import travel_data
+
+# BM25 parameters, the usual defaults
+K1 = 1.2
+B = 0.75
+
+# query terms found in more than this share of a slice's entries are skipped
+MAX_DOCUMENT_FREQUENCY = 0.5
+
+stopwords = frozenset((
+    "a", "an", "and", "any", "are", "at", "be", "best", "can", "do", "for", "from", "give", "good", "i",
+    "in", "is", "it", "me", "more", "my", "near", "of", "on", "or", "please", "recommend", "show", "some",
+    "that", "the", "there", "to", "want", "what", "where", "which", "with", "you",
+))
+
+_token_pattern = re.compile(r"\w+")
+
+
+def _fold(text: str) -> str:
+    """
+    Lowercase without accents, so "Montréal" and "montreal" match
+    """
+    return "".join(c for c in unicodedata.normalize("NFKD", text.lower()) if not unicodedata.combining(c))
+
+
+def tokens(text: str) -> list:
+    """
+    Folded word tokens without stopwords, with the same crude plural strip as intent.py
+    """
+    return [
+        w[:-1] if len(w) > 3 and w.endswith("s") and not w.endswith("ss") else w
+        for w in _token_pattern.findall(_fold(text))
+        if w not in stopwords
+    ]
+
+
+### INDEX ###
+class Index(NamedTuple):
+    entries: tuple
+    # term -> ((entry position, term frequency), ...)
+    postings: dict
+    lengths: tuple
+    average_length: float
+
+
+@functools.lru_cache(maxsize=travel_data.SLICE_CACHE_SIZE)
+def index(category: str, country: str) -> Index:
+    """
+    The inverted index of one (category, country) slice
+    """
+    entries = travel_data.load_slice(category, country)
+    postings = {}
+    lengths = []
+    for i, entry in enumerate(entries):
+        terms = tokens(" ".join(entry))
+        lengths.append(len(terms))
+        counts = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+        for term, count in counts.items():
+            postings.setdefault(term, []).append((i, count))
+    return Index(
+        entries,
+        {term: tuple(posting) for term, posting in postings.items()},
+        tuple(lengths),
+        sum(lengths) / len(lengths) if lengths else 0.0,
+    )
+
+
+### SEARCH ###
+def search(category: str, country: str, query: str, k: int = 5) -> list:
+    """
+    Up to k entries of the slice ranked by BM25 against the query, best first.
+    Empty when no discriminating query term occurs in the slice.
+    """
+    idx = index(category, country)
+    n = len(idx.entries)
+    scores = {}
+    for term in set(tokens(query)):
+        posting = idx.postings.get(term)
+        if not posting or len(posting) > MAX_DOCUMENT_FREQUENCY * n:
+            continue
+        idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+        for i, tf in posting:
+            norm = K1 * (1 - B + B * idx.lengths[i] / idx.average_length)
+            scores[i] = scores.get(i, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+    best = heapq.nlargest(k, scores, key=scores.get)
+    return [idx.entries[i] for i in best]
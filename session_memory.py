@@ -0,0 +1,133 @@
+"""
+Bounded chat history per session
+
+A History keeps the latest messages in a ring buffer under both a message
+and a byte limit. Messages pushed out of it are compacted into a short local
+summary (what the user asked, which entries were suggested) that is itself
+bounded, and their image references are dropped: the images stay in the
+disk store and the hero image pool, only the session stops pointing at them.
+
+Every live History is tracked weakly, so the per-session byte and message
+counts show up in metrics, labelled by session id, and disappear with the
+session.
+"""
+import re
+import sys
+import threading
+import weakref
+from collections import deque
+
+import metrics
+
+# characters kept of a compacted message
+SUMMARY_CHARS = 100
+
+_bold_pattern = re.compile(r"\*\*(.+?)\*\*")
+
+
+def message_bytes(message: dict) -> int:
+    """
+    Approximate memory held by one message
+    """
+    return (
+        sys.getsizeof(message)
+        + sys.getsizeof(message["content"])
+        + sys.getsizeof(message["images"])
+        + sum(sys.getsizeof(image) for image in message["images"])
+    )
+
+
+def _shorten(text: str) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= SUMMARY_CHARS else text[:SUMMARY_CHARS - 1].rstrip() + "…"
+
+
+def summarize(message: dict) -> str:
+    """
+    One line standing in for a compacted message
+    """
+    content = message["content"] if isinstance(message["content"], str) else str(message["content"])
+    if message["role"] == "user":
+        return f"You asked: {_shorten(content)}"
+    names = _bold_pattern.findall(content)
+    if names:
+        return f"I suggested {_shorten(', '.join(names))}"
+    return f"I said: {_shorten(content)}"
+
+
+class History:
+    """
+    List-like chat history that compacts its oldest messages when over budget
+    """
+
+    def __init__(self, max_messages: int, max_bytes: int, summary_lines: int, session_id: str = None):
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.session_id = session_id
+        self.messages = deque()
+        self.summary = deque(maxlen=summary_lines)
+        self.nbytes = 0
+        self.compacted = 0
+        _register(self)
+
+    def append(self, message: dict) -> None:
+        self.messages.append(message)
+        self.nbytes += message_bytes(message)
+        # always keep the latest message, whatever its size
+        while len(self.messages) > 1 and (len(self.messages) > self.max_messages or self.nbytes > self.max_bytes):
+            self._compact()
+
+    def _compact(self) -> None:
+        message = self.messages.popleft()
+        self.nbytes -= message_bytes(message)
+        self.summary.append(summarize(message))
+        self.compacted += 1
+        metrics.increment("history_compactions")
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def __iter__(self):
+        return iter(self.messages)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self.messages)[index]
+        return self.messages[index]
+
+
+### ACCOUNTING ###
+_lock = threading.Lock()
+_histories = weakref.WeakSet()
+
+
+def _register(history: History) -> None:
+    with _lock:
+        _histories.add(history)
+
+
+def _live() -> dict:
+    with _lock:
+        histories = list(_histories)
+    return {history.session_id or str(id(history)): history for history in histories}
+
+
+def usage() -> dict:
+    """
+    Bytes held by each live session's history, keyed by session id
+    """
+    return {session_id: history.nbytes for session_id, history in _live().items()}
+
+
+def message_counts() -> dict:
+    """
+    Messages kept by each live session's history, keyed by session id
+    """
+    return {session_id: len(history) for session_id, history in _live().items()}
+
+
+metrics.register_gauge("sessions_live", lambda: len(usage()))
+metrics.register_gauge("session_history_bytes_total", lambda: sum(usage().values()))
+metrics.register_gauge("session_history_bytes_max", lambda: max(usage().values(), default=0))
+metrics.register_labelled_gauge("session_history_bytes", "session", usage)
+metrics.register_labelled_gauge("session_history_messages", "session", message_counts)
@@ -0,0 +1,55 @@
+"""
+Precomputed markdown for recommendation replies
+
+Every entry of a (category, country) slice is formatted once, the first time
+the slice is shown, and kept next to travel_data's slice cache. Headers,
+list numbers and the per-country footer are fixed strings too, so a reply is
+a single join over cached fragments.
+"""
+import functools
+
+import travel_data
+
+headers = {
+    "hotels": "Here are some popular hotels 🏨: ",
+    "restaurants": "Here are some popular restaurants 🍜 🍝 🍮: ",
+    "places": "Here are some popular sights to see 🗺: ",
+}
+
+@functools.lru_cache(maxsize=256)
+def number(i: int) -> str:
+    """
+    The list item prefix of the i-th entry, counting from 1
+    """
+    return f"\n\n{i}. "
+
+
+@functools.lru_cache(maxsize=travel_data.SLICE_CACHE_SIZE)
+def slice_snippets(category: str, country: str) -> dict:
+    """
+    Entry -> its markdown line, for every entry of the slice
+    """
+    return {
+        entry: f"**{entry.name}**: {entry.description}. The address is {entry.address}"
+        for entry in travel_data.load_slice(category, country)
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def footer(country: str) -> str:
+    """
+    The closing line up to the user's name
+    """
+    return f"\n\nLet me know if you need more recommendations for {travel_data.countries_to_proper[country]}! I'm happy to help "
+
+
+def reply(category: str, country: str, entries: list, user_name: str) -> str:
+    """
+    The numbered recommendation reply for entries of the slice
+    """
+    table = slice_snippets(category, country)
+    fragments = [headers[category]]
+    for i, entry in enumerate(entries, 1):
+        fragments += (number(i), table[entry])
+    fragments += (footer(country), user_name, "!")
+    return "".join(fragments)
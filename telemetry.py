@@ -0,0 +1,271 @@
+"""
+Per-turn tracing and metrics export
+
+Every turn gets a correlation ID held in a context variable, and the steps
+of the turn run inside timed spans. Spans are aggregated into per-name
+latency histograms and, with a trace path set, appended to a JSONL trace
+one record per span. Work handed to the thread pool keeps the turn's ID when
+it is submitted through bind().
+
+export_prometheus() writes the histograms together with every counter and
+gauge in metrics.py in the Prometheus text format, for a node_exporter
+textfile collector or anything else that scrapes files.
+
+While disabled, span() hands back one shared no-op context manager and the
+other entry points return straight away, so instrumented code costs a
+function call and a flag check.
+"""
+import contextlib
+import contextvars
+import functools
+import inspect
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from typing import Callable, Optional
+
+import metrics
+
+# histogram buckets for span durations, in seconds
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PREFIX = "gptour"
+
+_enabled = False
+_trace_path: Optional[str] = None
+_prometheus_path: Optional[str] = None
+
+_turn_id = contextvars.ContextVar("turn_id", default=None)
+_current = contextvars.ContextVar("span", default=None)
+
+_lock = threading.Lock()
+_trace_file = None
+# span name -> [bucket counts..., count, sum]
+_histograms = {}
+
+_NOOP = contextlib.nullcontext()
+
+
+def configure(enabled: bool, trace_path: Optional[str] = None, prometheus_path: Optional[str] = None) -> None:
+    global _enabled, _trace_path, _prometheus_path, _trace_file
+    with _lock:
+        if _trace_file is not None:
+            _trace_file.close()
+            _trace_file = None
+        _enabled = enabled
+        _trace_path = trace_path
+        _prometheus_path = prometheus_path
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def turn_id() -> Optional[str]:
+    """
+    The correlation ID of the turn being handled, if any
+    """
+    return _turn_id.get()
+
+
+### SPANS ###
+class Span:
+    __slots__ = ("name", "span_id", "parent_id", "attributes", "start", "wall_start", "token")
+
+    def __init__(self, name: str, attributes: dict):
+        self.name = name
+        self.span_id = uuid.uuid4().hex[:16]
+        self.attributes = attributes
+
+    def __enter__(self) -> "Span":
+        parent = _current.get()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.token = _current.set(self)
+        self.wall_start = time.time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, error_type, error, traceback) -> None:
+        duration = time.perf_counter() - self.start
+        _current.reset(self.token)
+        if error_type is not None:
+            self.attributes["error"] = error_type.__name__
+        _record(self, duration)
+
+
+def span(name: str, **attributes):
+    """
+    Context manager timing the block as a span of the current turn
+    """
+    if not _enabled:
+        return _NOOP
+    return Span(name, attributes)
+
+
+def annotate(**attributes) -> None:
+    """
+    Adds attributes to the innermost open span
+    """
+    if not _enabled:
+        return
+    current = _current.get()
+    if current is not None:
+        current.attributes.update(attributes)
+
+
+@contextlib.contextmanager
+def turn(**attributes):
+    """
+    Opens a new turn: a fresh correlation ID and a root 'turn' span
+    """
+    if not _enabled:
+        yield None
+        return
+    token = _turn_id.set(uuid.uuid4().hex[:16])
+    try:
+        with Span("turn", attributes):
+            yield _turn_id.get()
+    finally:
+        _turn_id.reset(token)
+        flush()
+
+
+def timed(name: str) -> Callable:
+    """
+    Decorator running every call of the function in a span, generators span
+    from their first item to exhaustion
+    """
+    def decorate(fn: Callable) -> Callable:
+        if inspect.isgeneratorfunction(fn):
+            def generate(*args, **kwargs):
+                with Span(name, {}):
+                    yield from fn(*args, **kwargs)
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                return generate(*args, **kwargs) if _enabled else fn(*args, **kwargs)
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not _enabled:
+                    return fn(*args, **kwargs)
+                with Span(name, {}):
+                    return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def bind(fn: Callable) -> Callable:
+    """
+    fn bound to a copy of the current context, for running on another thread
+    """
+    if not _enabled:
+        return fn
+    return functools.partial(contextvars.copy_context().run, fn)
+
+
+def record_usage(call_type: str, usage) -> None:
+    """
+    Token counts from an API response's usage field
+    """
+    if usage is None:
+        return
+    metrics.increment(f"llm_prompt_tokens_{call_type}", usage.prompt_tokens)
+    metrics.increment(f"llm_completion_tokens_{call_type}", usage.completion_tokens)
+    annotate(prompt_tokens=usage.prompt_tokens, completion_tokens=usage.completion_tokens)
+
+
+def _record(span: Span, duration: float) -> None:
+    global _trace_file
+    with _lock:
+        histogram = _histograms.get(span.name)
+        if histogram is None:
+            histogram = _histograms[span.name] = [0] * (len(BUCKETS) + 2)
+        for i, bound in enumerate(BUCKETS):
+            if duration <= bound:
+                histogram[i] += 1
+        histogram[-2] += 1
+        histogram[-1] += duration
+
+        if _trace_path is None:
+            return
+        if _trace_file is None:
+            if os.path.dirname(_trace_path):
+                os.makedirs(os.path.dirname(_trace_path), exist_ok=True)
+            _trace_file = open(_trace_path, "a", encoding="utf-8")
+        _trace_file.write(json.dumps({
+            "turn": _turn_id.get(),
+            "span": span.name,
+            "span_id": span.span_id,
+            "parent_id": span.parent_id,
+            "start": round(span.wall_start, 6),
+            "duration_ms": round(duration * 1000, 3),
+            "thread": threading.current_thread().name,
+            **span.attributes,
+        }, default=str) + "\n")
+
+
+def flush() -> None:
+    """
+    Pushes the trace to disk and rewrites the Prometheus file
+    """
+    with _lock:
+        if _trace_file is not None:
+            _trace_file.flush()
+    if _prometheus_path:
+        export_prometheus(_prometheus_path)
+
+
+### PROMETHEUS ###
+_invalid_name = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus() -> str:
+    """
+    Span histograms, counters and gauges in the Prometheus text format
+    """
+    lines = []
+    for name, value in sorted(metrics.counters().items()):
+        metric = f"{PREFIX}_{_invalid_name.sub('_', name)}_total"
+        lines += (f"# TYPE {metric} counter", f"{metric} {value}")
+    for name, value in sorted(metrics.gauges().items()):
+        metric = f"{PREFIX}_{_invalid_name.sub('_', name)}"
+        lines += (f"# TYPE {metric} gauge", f"{metric} {value}")
+    for name, (label, values) in sorted(metrics.labelled_gauges().items()):
+        metric = f"{PREFIX}_{_invalid_name.sub('_', name)}"
+        label = _invalid_name.sub("_", label)
+        lines.append(f"# TYPE {metric} gauge")
+        lines += (f'{metric}{{{label}="{_label_value(key)}"}} {value}' for key, value in sorted(values.items()))
+
+    with _lock:
+        histograms = {name: list(values) for name, values in _histograms.items()}
+    metric = f"{PREFIX}_span_duration_seconds"
+    if histograms:
+        lines.append(f"# TYPE {metric} histogram")
+    for name, values in sorted(histograms.items()):
+        for bound, count in zip(BUCKETS, values):
+            lines.append(f'{metric}_bucket{{span="{name}",le="{bound}"}} {count}')
+        lines += (
+            f'{metric}_bucket{{span="{name}",le="+Inf"}} {values[-2]}',
+            f'{metric}_count{{span="{name}"}} {values[-2]}',
+            f'{metric}_sum{{span="{name}"}} {values[-1]:.6f}',
+        )
+    return "\n".join(lines) + "\n"
+
+
+def export_prometheus(path: str) -> None:
+    """
+    Atomically rewrites path with prometheus()
+    """
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(prometheus())
+    os.replace(tmp_path, path)
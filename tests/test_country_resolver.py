@@ -0,0 +1,38 @@
+import pytest
+
+import country_resolver
+
+
+@pytest.mark.parametrize("prompt, country", [
+    ("Italy", "italy"),
+    ("I think Greece", "greece"),
+    ("I want to go to the UK", "uk"),
+    ("the States", "usa"),
+    ("visiting the US next year", "usa"),
+    ("Dubai", "uae"),
+    ("Rome", "italy"),
+    ("Itlay", "italy"),
+    ("I love Italian food", "italy"),
+    # a country name outweighs a nationality or language
+    ("I only speak Spanish, can I visit France?", "france"),
+    ("Is there good Italian food in Germany?", "germany"),
+    ("my wife is French and we want to see Greece", "greece"),
+    # and a city outweighs a nationality
+    ("I am American and want to see Rome", "italy"),
+])
+def test_resolve(prompt, country):
+    assert country_resolver.resolve(prompt) == country
+
+
+@pytest.mark.parametrize("prompt", ["Japan", "tell me some history of japan", "I'm going to Jordan"])
+def test_unsupported(prompt):
+    assert country_resolver.resolve(prompt) == country_resolver.NOT_SUPPORTED
+
+
+def test_supported_wins_over_unsupported():
+    assert country_resolver.resolve("Japan or Spain?") == "spain"
+
+
+@pytest.mark.parametrize("prompt", ["hotels", "what about the second one?", "let us go"])
+def test_nothing_found(prompt):
+    assert country_resolver.resolve(prompt) is None
@@ -0,0 +1,101 @@
+import logging
+
+import pytest
+
+import data_extract
+import dataset
+
+
+@pytest.fixture
+def build(tmp_path, monkeypatch):
+    """
+    A private build directory and artifact, the repository's data/ is left alone
+    """
+    monkeypatch.setattr(data_extract, "BUILD_DIR", str(tmp_path / "build"))
+    monkeypatch.setattr(data_extract, "MANIFEST_PATH", str(tmp_path / "build" / "manifest.json"))
+    return str(tmp_path / "travel_data.sqlite3")
+
+
+def edit_sources(monkeypatch):
+    """
+    Makes the sources look edited without changing any country's data,
+    like a new comment in travel_data.py
+    """
+    checksum = dataset.source_checksum
+    stamp = dataset.source_stamp
+    monkeypatch.setattr(dataset, "source_checksum", lambda paths=dataset.SOURCE_PATHS: checksum(paths) + ("-edited" if paths == dataset.SOURCE_PATHS else ""))
+    monkeypatch.setattr(dataset, "source_stamp", lambda paths=dataset.SOURCE_PATHS: stamp(paths) + [["edited", 0, 0]])
+
+
+def touch_sources(monkeypatch):
+    """
+    Makes the sources look touched but not edited, like a fresh checkout
+    """
+    stamp = dataset.source_stamp
+    monkeypatch.setattr(dataset, "source_stamp", lambda paths=dataset.SOURCE_PATHS: stamp(paths) + [["touched", 0, 0]])
+
+
+def test_first_run_builds_every_country(build, caplog):
+    caplog.set_level(logging.INFO, logger="data_extract")
+    manifest = data_extract.run(workers=1, db_path=build)
+    assert set(manifest["countries"]) == set(dataset.load(build).countries)
+    assert not dataset.is_stale(build)
+    assert f"Rebuilt {len(manifest['countries'])} of" in caplog.text
+
+
+def test_unchanged_data_rebuilds_nothing(build, caplog):
+    data_extract.run(workers=1, db_path=build)
+    caplog.clear()
+    caplog.set_level(logging.INFO, logger="data_extract")
+    data_extract.run(workers=1, db_path=build)
+    assert "Rebuilt 0 of" in caplog.text
+
+
+def test_edit_without_data_changes_is_not_stale_after_one_run(build, monkeypatch, caplog):
+    data_extract.run(workers=1, db_path=build)
+    edit_sources(monkeypatch)
+    assert dataset.is_stale(build)
+
+    caplog.set_level(logging.INFO, logger="data_extract")
+    dataset.connect(build).close()
+    assert "Rebuilt 0 of" in caplog.text
+    assert not dataset.is_stale(build)
+
+
+def test_untouched_sources_are_not_hashed(build, monkeypatch):
+    data_extract.run(workers=1, db_path=build)
+    monkeypatch.setattr(dataset, "source_checksum", lambda paths=dataset.SOURCE_PATHS: pytest.fail("sources hashed"))
+    assert not dataset.is_stale(build)
+
+
+def test_touched_sources_are_hashed_once(build, monkeypatch):
+    data_extract.run(workers=1, db_path=build)
+    touch_sources(monkeypatch)
+    assert not dataset.is_stale(build)
+    # the stamp was refreshed, the next process doesn't hash again
+    monkeypatch.setattr(dataset, "source_checksum", lambda paths=dataset.SOURCE_PATHS: pytest.fail("sources hashed"))
+    assert not dataset.is_stale(build)
+
+
+def test_without_rebuilds_stale_artifacts_are_served_as_they_are(build, monkeypatch, caplog):
+    data_extract.run(workers=1, db_path=build)
+    edit_sources(monkeypatch)
+    monkeypatch.setattr(dataset, "_rebuild_stale", False)
+    caplog.set_level(logging.INFO)
+    dataset.connect(build).close()
+    assert "older than its sources" in caplog.text
+    assert "Rebuilt" not in caplog.text
+    assert dataset.is_stale(build)
+
+
+def test_without_rebuilds_a_missing_artifact_is_an_error(build, monkeypatch):
+    monkeypatch.setattr(dataset, "_rebuild_stale", False)
+    with pytest.raises(FileNotFoundError, match="data_extract.py"):
+        dataset.connect(build)
+
+
+def test_validate_reports_problems():
+    metadata, raw = data_extract.extract()
+    metadata = {**metadata, "countries": [*metadata["countries"], "atlantis"]}
+    problems = data_extract.validate(metadata, raw)
+    assert "countries_to_proper: missing 'atlantis'" in problems
@@ -0,0 +1,125 @@
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import backends
+import bootstrap
+import engine
+import fake_openai
+
+
+class CountingBackend(backends.ScriptedBackend):
+    def __init__(self, config: fake_openai.Config = fake_openai.Config()):
+        super().__init__(config)
+        self.calls = []
+
+    def chatgpt_tool(self, *args, **kwargs):
+        self.calls.append("chatgpt_tool")
+        return super().chatgpt_tool(*args, **kwargs)
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+def make_engine(executor, config: fake_openai.Config = fake_openai.Config(), **settings):
+    settings = dataclasses.replace(bootstrap.load_settings(), hero_images_path="", **settings)
+    return engine.ConversationEngine(CountingBackend(config), settings, executor)
+
+
+@pytest.mark.parametrize("prompt, name", [("Maya", "Maya"), ("I'm Jake", "Jake"), ("Hi, my name is Anna", "Anna")])
+def test_confident_name_needs_no_llm(executor, prompt, name):
+    conversation = make_engine(executor)
+    state = conversation.new_session(seed=0)
+    response = conversation.handle(state, prompt)
+    assert state.user_name == name
+    assert response.content.startswith(f"Welcome {name}!")
+    assert "What country" in response.content
+    assert conversation.backend.calls == []
+
+
+@pytest.mark.parametrize("prompt", ["Hi, I'm Jordan", "Georgia", "I'm Chad"])
+def test_name_is_not_read_as_a_country(executor, prompt):
+    conversation = make_engine(executor)
+    state = conversation.new_session(seed=0)
+    response = conversation.handle(state, prompt)
+    # an unsure name may well be asked for again, but never taken for a country
+    assert state.country is None
+    assert "don't support" not in response.content
+
+
+def test_country_before_name_is_introduced_with_the_welcome(executor):
+    conversation = make_engine(executor)
+    state = conversation.new_session(seed=0)
+    conversation.handle(state, "I want to go to Italy")
+    assert state.user_name is None
+
+    response = conversation.handle(state, "Sam")
+    assert response.content.startswith("Welcome Sam!")
+    assert "Italy" in response.content
+    assert len(response.images) == 1
+
+
+def test_onboarding_with_a_request_answers_right_away(executor):
+    conversation = make_engine(executor)
+    state = conversation.new_session(seed=0)
+    response = conversation.handle(state, "I'm Sam, show me hotels in Spain")
+    assert state.country == "spain"
+    assert "Spain" in response.content and "popular hotels" in response.content
+    assert state.last_intent == "hotels"
+
+
+@pytest.mark.parametrize("stream_answers", [True, False])
+def test_onboarding_with_a_question_answers_it_after_the_welcome(executor, stream_answers):
+    conversation = make_engine(executor, stream_answers=stream_answers)
+    state = conversation.new_session(seed=0)
+    response = conversation.handle(state, "I'm Sam, what's the history of Italy?")
+    assert state.user_name == "Sam" and state.country == "italy"
+    welcome, answer = response.content.split("Great question!")
+    assert welcome.startswith("Welcome Sam!") and "Italy" in welcome
+    assert "history of Italy" in answer
+    # the hero image and the answer's image
+    assert len(response.images) == 2
+
+
+def test_onboarding_without_a_question_is_only_welcomed(executor):
+    conversation = make_engine(executor)
+    state = conversation.new_session(seed=0)
+    response = conversation.handle(state, "I'm Sam, I'd like to travel to France")
+    assert state.country == "france"
+    assert "Great question!" not in response.content
+    assert len(response.images) == 1
+
+
+def test_show_more_pages_without_repeats(executor):
+    conversation = make_engine(executor)
+    state = conversation.new_session(seed=0)
+    state.user_name, state.country = "Anna", "italy"
+    first = conversation.handle(state, "hotels")
+    more = conversation.handle(state, None, show_more=True)
+    assert state.messages[-2]["content"] == engine.SHOW_MORE
+    titles = lambda text: {line.split("**")[1] for line in text.split("\n") if "**" in line}
+    assert titles(first.content) and not titles(first.content) & titles(more.content)
+
+
+@pytest.mark.parametrize("stream_answers", [True, False])
+def test_failed_answer_is_an_apology(executor, stream_answers):
+    conversation = make_engine(executor, fake_openai.Config(error_rate=1.0), stream_answers=stream_answers)
+    state = conversation.new_session(seed=0)
+    state.user_name, state.country = "Anna", "italy"
+    response = conversation.handle(state, "is it safe to travel there in winter?")
+    assert response.content == engine.ANSWER_APOLOGY
+    assert response.images == []
+    assert state.messages[-1]["content"] == engine.ANSWER_APOLOGY
+
+
+def test_failed_hero_image_keeps_the_welcome(executor):
+    conversation = make_engine(executor, fake_openai.Config(error_rate=1.0))
+    state = conversation.new_session(seed=0)
+    response = conversation.handle(state, "I'm Anna, I want to visit Italy")
+    assert state.country == "italy"
+    assert "Italy" in response.content
+    assert response.images == []
@@ -0,0 +1,22 @@
+import engine
+import fake_openai
+
+
+def record_turn(prompt: str, config: fake_openai.Config = fake_openai.Config()) -> dict:
+    return fake_openai.tool_arguments(config, engine.turn_extraction_tool, [{"role": "user", "content": prompt}])
+
+
+def test_record_turn():
+    assert record_turn("I'm Sam, show me hotels in Italy") == {"name": "Sam", "country": "italy", "intent": "hotels"}
+
+
+def test_places_and_requests_are_not_names():
+    assert record_turn("Italy")["name"] is None
+    assert record_turn("Italy")["country"] == "italy"
+    assert record_turn("Hotels")["name"] is None
+
+
+def test_unsure_names_are_left_out():
+    # "Kofi" is not a known first name, so the single word is only a guess
+    assert record_turn("Kofi")["name"] is None
+    assert record_turn("Kofi", fake_openai.Config(name_confidence_threshold=0.5))["name"] == "Kofi"
@@ -0,0 +1,49 @@
+import os
+
+import image_store
+
+
+def image(i: int) -> bytes:
+    return bytes([i]) * 100
+
+
+def test_put_and_get(tmp_path):
+    store = image_store.ImageStore(str(tmp_path))
+    path = store.put("a castle", image(1))
+    assert store.get("A castle ") == path
+    assert store.read(os.path.basename(path)[:-4]) == image(1)
+    assert store.get("a beach") is None
+
+
+def test_same_bytes_are_stored_once(tmp_path):
+    store = image_store.ImageStore(str(tmp_path))
+    assert store.put("a castle", image(1)) == store.put("an old castle", image(1))
+    assert store.total_bytes() == 100
+
+
+def test_overfilled_store_evicts_the_least_recently_used(tmp_path, monkeypatch):
+    clock = iter(range(1000, 2000))
+    monkeypatch.setattr(image_store.time, "time", lambda: next(clock))
+    store = image_store.ImageStore(str(tmp_path), max_bytes=300)
+    oldest = store.put("prompt 0", image(0))
+    used = store.put("prompt 1", image(1))
+    recent = store.put("prompt 2", image(2))
+    # read since, so it is no longer the least recently used
+    assert store.get("prompt 0") == oldest
+    store.put("prompt 3", image(3))
+
+    assert not os.path.exists(used)
+    assert store.get("prompt 1") is None
+    digests = {row[0] for row in store._connection().execute("SELECT digest FROM prompts")}
+    assert os.path.basename(used)[:-4] not in digests
+    assert os.path.exists(oldest) and os.path.exists(recent)
+    assert store.total_bytes() == 300
+
+
+def test_eviction_without_reads_drops_the_oldest(tmp_path, monkeypatch):
+    clock = iter(range(1000, 2000))
+    monkeypatch.setattr(image_store.time, "time", lambda: next(clock))
+    store = image_store.ImageStore(str(tmp_path), max_bytes=250)
+    paths = [store.put(f"prompt {i}", image(i)) for i in range(4)]
+    assert [os.path.exists(path) for path in paths] == [False, False, True, True]
+    assert [store.get(f"prompt {i}") for i in range(4)] == [None, None, *paths[2:]]
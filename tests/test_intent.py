@@ -0,0 +1,78 @@
+import pytest
+
+import bootstrap
+import intent
+
+THRESHOLD = bootstrap.load_settings().intent_confidence_threshold
+
+EXAMPLES = [(label, example) for label, examples in intent.corpus.items() for example in examples]
+
+
+@pytest.mark.parametrize("label, example", EXAMPLES)
+def test_corpus_classifies_itself_above_threshold(label, example):
+    assert intent.classify(example)[0] == label
+    assert intent.classify(example)[1] >= THRESHOLD
+
+
+@pytest.mark.parametrize("prompt, label", [
+    ("sightseeing", "sightseeing"),
+    ("show me some museums", "sightseeing"),
+    ("restaurants with a view in rome", "restaurants"),
+    ("I'm Anna, show me hotels in Spain", "hotels"),
+    ("where can I find good dinner in rome", "restaurants"),
+    ("is it safe to travel there in winter?", "other"),
+    ("how do I get from the airport to the city?", "other"),
+])
+def test_classify(prompt, label):
+    assert intent.classify(prompt)[0] == label
+    assert intent.classify(prompt)[1] >= THRESHOLD
+
+
+# prompts the corpus does not contain, the calibration has to hold on them too
+@pytest.mark.parametrize("prompt, label", [
+    ("what is the best hotel", "hotels"),
+    ("where is the best restaurant", "restaurants"),
+    ("what is the best museum", "sightseeing"),
+    ("where is the best pizza", "restaurants"),
+    ("where is the best coffee", "restaurants"),
+    ("can you suggest a hotel in rome", "hotels"),
+    ("which hotel has the best view", "hotels"),
+    ("show me luxury resorts", "hotels"),
+    ("what is the best place to stay", "hotels"),
+    ("i need somewhere to sleep tonight", "hotels"),
+    ("where do locals eat", "restaurants"),
+    ("is there a cheap place to eat", "restaurants"),
+    ("what should i eat for dinner", "restaurants"),
+    ("what are the must see places in paris", "sightseeing"),
+    ("any good beaches nearby", "sightseeing"),
+    ("what is there to do in athens", "sightseeing"),
+    ("what are the top attractions", "sightseeing"),
+    ("what museums should i visit", "sightseeing"),
+    ("what is the best time to see the castles", "sightseeing"),
+    ("what is the best time to visit", "other"),
+    ("what is the weather like in july", "other"),
+    ("do i need a visa for italy", "other"),
+    ("what about the second one?", "other"),
+    ("what currency do they use", "other"),
+    ("what is the history of the colosseum", "other"),
+    ("how much should i tip", "other"),
+])
+def test_held_out_prompts(prompt, label):
+    assert intent.classify(prompt)[0] == label
+    assert intent.classify(prompt)[1] >= THRESHOLD
+
+
+def test_unknown_vocabulary():
+    assert intent.classify("Italy") == ("other", 0.0)
+
+
+@pytest.mark.parametrize("answer, label", [
+    ("Hotels.", "hotels"),
+    ("'hotel'", "hotels"),
+    ("Attractions", "sightseeing"),
+    ("The user wants restaurants", "restaurants"),
+    ("hotels or restaurants", None),
+    ("", None),
+])
+def test_normalize_label(answer, label):
+    assert intent.normalize_label(answer) == label
@@ -0,0 +1,35 @@
+import llm_cache
+
+
+def test_key_ignores_case_and_spacing_of_the_prompt():
+    assert llm_cache.make_key("m", "c", "Show  me Hotels") == llm_cache.make_key("m", "c", "show me hotels")
+    assert llm_cache.make_key("m", "c", "hotels") != llm_cache.make_key("m", "other context", "hotels")
+
+
+def test_memory_then_disk(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = llm_cache.ResponseCache(path, max_memory_entries=1)
+    cache.set("a", "first")
+    cache.set("b", "second")
+    # "a" fell out of memory but is still on disk, in another process too
+    assert cache.get("a") == "first"
+    assert llm_cache.ResponseCache(path).get("b") == "second"
+    assert cache.get("missing") is None
+
+
+def test_expired_answers_are_misses(tmp_path):
+    cache = llm_cache.ResponseCache(str(tmp_path / "cache.sqlite3"), ttls={"short": -1})
+    cache.set("a", "stale", call_type="short")
+    assert cache.get("a") is None
+    assert cache.ttl("unknown") == cache.ttl("default")
+
+
+def test_evict_keeps_the_most_recent(tmp_path, monkeypatch):
+    clock = iter(range(1000, 2000))
+    monkeypatch.setattr(llm_cache.time, "time", lambda: next(clock))
+    cache = llm_cache.ResponseCache(str(tmp_path / "cache.sqlite3"), max_memory_entries=1, max_disk_entries=2)
+    for key in "abc":
+        cache.set(key, key)
+    cache.evict()
+    fresh = llm_cache.ResponseCache(cache.path)
+    assert [fresh.get(key) for key in "abc"] == [None, "b", "c"]
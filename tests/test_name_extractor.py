@@ -0,0 +1,35 @@
+import pytest
+
+import bootstrap
+import name_extractor
+
+THRESHOLD = bootstrap.load_settings().name_confidence_threshold
+
+
+@pytest.mark.parametrize("prompt, name", [
+    ("Hi, my name is Anna", "Anna"),
+    ("my friends call me jake", "Jake"),
+    ("Maya", "Maya"),
+    ("I'm Jake", "Jake"),
+    ("Me llamo Lucía", "Lucía"),
+    ("Omar here, planning a trip", "Omar"),
+])
+def test_confident_names(prompt, name):
+    found, confidence = name_extractor.extract(prompt)
+    assert found == name
+    assert confidence >= THRESHOLD
+
+
+@pytest.mark.parametrize("prompt", ["I'm excited to travel!", "I am planning a trip", "hello"])
+def test_not_a_name(prompt):
+    assert name_extractor.extract(prompt)[1] < THRESHOLD
+
+
+@pytest.mark.parametrize("prompt, name, rest", [
+    ("Hi, I'm Jordan", "Jordan", "Hi, I'm  "),
+    ("Georgia", "Georgia", " "),
+    ("I'm Jordan and I'd love to see Jordan", "Jordan", "I'm   and I'd love to see Jordan"),
+    ("I'm Ana, from Panama", "Ana", "I'm  , from Panama"),
+])
+def test_without_name(prompt, name, rest):
+    assert name_extractor.without_name(prompt, name) == rest
@@ -0,0 +1,39 @@
+import pagination
+import travel_data
+
+
+def test_permutation_is_stable_per_seed():
+    assert sorted(pagination.permutation(50, 7)) == list(range(50))
+    assert pagination.permutation(50, 7) == pagination.permutation(50, 7)
+
+
+def test_no_repeats_until_the_slice_is_exhausted():
+    size = len(travel_data.load_slice("hotels", "italy"))
+    pages = pagination.Pages(seed=1)
+    seen = []
+    while len(seen) < size:
+        page = pages.next("hotels", "italy", 3)
+        assert page
+        seen += page
+    assert len(set(seen)) == size
+
+    # then a new round starts over the whole slice
+    assert pages.next("hotels", "italy", 3)
+
+
+def test_preferred_entries_come_first_and_are_not_repeated():
+    entries = travel_data.load_slice("places", "greece")
+    preferred = (entries[5], entries[2])
+    pages = pagination.Pages(seed=2)
+    first = pages.next("places", "greece", 4, preferred)
+    assert first[:2] == list(preferred)
+    rest = pages.next("places", "greece", len(entries), preferred)
+    assert not set(first) & set(rest)
+    assert len(first) + len(rest) == len(entries)
+
+
+def test_cursor_fills_the_page_from_its_order():
+    cursor = pagination.Cursor(10, seed=3)
+    assert cursor.take(4, preferred=(9,))[0] == 9
+    assert len(cursor.take(100)) == 6
+    assert len(cursor.take(100)) == 10
@@ -0,0 +1,63 @@
+import pytest
+
+import retry
+
+
+class Flaky:
+    def __init__(self, failures: int, error=ConnectionError):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error("boom")
+        return value
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(retry.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_retries_until_success(no_sleep):
+    fn = Flaky(2)
+    assert retry.RetryPolicy(attempts=4, base_delay=0.01).call(fn, "ok") == "ok"
+    assert fn.calls == 3
+    assert len(no_sleep) == 2
+
+
+def test_gives_up_after_the_last_attempt():
+    fn = Flaky(10)
+    with pytest.raises(ConnectionError):
+        retry.RetryPolicy(attempts=3, base_delay=0.01).call(fn, "ok")
+    assert fn.calls == 3
+
+
+def test_other_errors_are_not_retried():
+    fn = Flaky(1, error=ValueError)
+    with pytest.raises(ValueError):
+        retry.RetryPolicy(retry_on=(ConnectionError,)).call(fn, "ok")
+    assert fn.calls == 1
+
+
+def test_gives_up_when_the_deadline_would_pass():
+    fn = Flaky(10)
+    with pytest.raises(ConnectionError):
+        retry.RetryPolicy(attempts=10, base_delay=5, max_delay=5, deadline=0).call(fn, "ok")
+    assert fn.calls == 1
+
+
+def test_delay_is_capped_and_honours_retry_after():
+    policy = retry.RetryPolicy(base_delay=1, max_delay=2)
+    assert all(0 <= policy.delay(attempt, ConnectionError()) <= 2 for attempt in range(10))
+
+    class Response:
+        headers = {"retry-after": "7"}
+
+    error = ConnectionError()
+    error.response = Response()
+    assert policy.delay(0, error) >= 7
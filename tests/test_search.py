@@ -0,0 +1,28 @@
+import search
+import travel_data
+
+
+def test_tokens_fold_accents_stopwords_and_plurals():
+    assert search.tokens("Show me the Hôtels in Montréal") == ["hotel", "montreal"]
+
+
+def test_best_match_first():
+    entries = travel_data.load_slice("hotels", "italy")
+    target = entries[3]
+    results = search.search("hotels", "italy", target.name, k=3)
+    assert results[0] == target
+    assert len(results) <= 3
+
+
+def test_only_slice_entries():
+    entries = set(travel_data.load_slice("restaurants", "spain"))
+    assert set(search.search("restaurants", "spain", "seafood paella tapas", k=10)) <= entries
+
+
+def test_terms_in_most_entries_are_ignored():
+    # every hotel is a hotel, and the stopwords carry nothing
+    assert search.search("hotels", "italy", "show me some hotels please") == []
+
+
+def test_index_is_cached_per_slice():
+    assert search.index("places", "france") is search.index("places", "france")
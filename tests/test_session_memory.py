@@ -0,0 +1,67 @@
+import gc
+
+import metrics
+import session_memory
+import telemetry
+
+
+def message(role: str, content: str, images: list = None) -> dict:
+    return {"role": role, "images": images or [], "content": content}
+
+
+def make_history(max_messages: int = 100, max_bytes: int = 1_000_000, summary_lines: int = 3, session_id: str = None):
+    return session_memory.History(max_messages, max_bytes, summary_lines, session_id=session_id)
+
+
+def test_message_limit_compacts_the_oldest():
+    history = make_history(max_messages=3)
+    for i in range(5):
+        history.append(message("user", f"question {i}"))
+    assert [m["content"] for m in history] == ["question 2", "question 3", "question 4"]
+    assert list(history.summary) == ["You asked: question 0", "You asked: question 1"]
+    assert history.compacted == 2
+    assert history.nbytes == sum(session_memory.message_bytes(m) for m in history)
+
+
+def test_byte_limit_compacts_but_keeps_the_latest():
+    history = make_history(max_bytes=1000)
+    history.append(message("user", "short"))
+    history.append(message("assistant", "x" * 2000, images=["a.png"]))
+    # over the limit on its own, the latest message still stays
+    assert [m["content"] for m in history] == ["x" * 2000]
+    assert list(history.summary) == ["You asked: short"]
+
+    history.append(message("user", "next"))
+    assert [m["content"] for m in history] == ["next"]
+    assert history.nbytes <= history.max_bytes
+
+
+def test_summary_is_bounded():
+    history = make_history(max_messages=1, summary_lines=2)
+    for i in range(5):
+        history.append(message("user", f"question {i}"))
+    assert list(history.summary) == ["You asked: question 2", "You asked: question 3"]
+
+
+def test_summarize():
+    assert session_memory.summarize(message("user", "hotels  in\nrome")) == "You asked: hotels in rome"
+    suggested = "Here you go:\n1. **Hotel Eden**: nice\n2. **Hotel Artemide**: central"
+    assert session_memory.summarize(message("assistant", suggested)) == "I suggested Hotel Eden, Hotel Artemide"
+    assert session_memory.summarize(message("assistant", "Welcome Anna!")) == "I said: Welcome Anna!"
+
+    summary = session_memory.summarize(message("user", "word " * 100))
+    assert len(summary) == len("You asked: ") + session_memory.SUMMARY_CHARS
+    assert summary.endswith("…")
+
+
+def test_per_session_gauges():
+    history = make_history(session_id="session-a")
+    history.append(message("user", "hello"))
+    _, values = metrics.labelled_gauges()["session_history_bytes"]
+    assert values["session-a"] == history.nbytes
+    assert metrics.labelled_gauges()["session_history_messages"][1]["session-a"] == 1
+    assert f'gptour_session_history_bytes{{session="session-a"}} {history.nbytes}' in telemetry.prometheus().splitlines()
+
+    del history
+    gc.collect()
+    assert "session-a" not in metrics.labelled_gauges()["session_history_bytes"][1]
@@ -0,0 +1,15 @@
+import snippets
+import travel_data
+
+
+def test_reply_numbers_every_entry():
+    entries = list(travel_data.load_slice("hotels", "italy")) * 30
+    reply = snippets.reply("hotels", "italy", entries, "Anna")
+    assert reply.startswith(snippets.headers["hotels"])
+    assert f"\n\n{len(entries)}. **{entries[-1].name}**" in reply
+    assert reply.endswith("I'm happy to help Anna!")
+
+
+def test_reply_without_entries():
+    reply = snippets.reply("places", "greece", [], "Tom")
+    assert reply == snippets.headers["places"] + snippets.footer("greece") + "Tom!"
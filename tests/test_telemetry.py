@@ -0,0 +1,84 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import metrics
+import telemetry
+
+
+@pytest.fixture
+def trace(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    telemetry.configure(True, str(path))
+    yield path
+    telemetry.configure(False)
+
+
+def records(path) -> list:
+    telemetry.flush()
+    return [json.loads(line) for line in path.read_text().splitlines()] if path.exists() else []
+
+
+def test_prometheus_format(trace, monkeypatch):
+    # each span reads the clock when it opens and when it closes
+    clock = iter([0.0, 0.003, 1.0, 1.3])
+    monkeypatch.setattr(telemetry.time, "perf_counter", lambda: next(clock))
+    for _ in range(2):
+        with telemetry.span("test.format"):
+            pass
+    metrics.increment("test.format-counter", 3)
+
+    lines = telemetry.prometheus().splitlines()
+    assert "# TYPE gptour_test_format_counter_total counter" in lines
+    metric = "gptour_span_duration_seconds"
+    assert f"# TYPE {metric} histogram" in lines
+    buckets = [line for line in lines if line.startswith(f'{metric}_bucket{{span="test.format"')]
+    assert buckets == [
+        f'{metric}_bucket{{span="test.format",le="{bound}"}} {0 if bound < 0.005 else 1 if bound < 0.5 else 2}'
+        for bound in telemetry.BUCKETS
+    ] + [f'{metric}_bucket{{span="test.format",le="+Inf"}} 2']
+    assert f'{metric}_count{{span="test.format"}} 2' in lines
+    assert f'{metric}_sum{{span="test.format"}} 0.303000' in lines
+
+
+def test_generator_spans_last_until_exhausted(trace):
+    @telemetry.timed("test.generator")
+    def chunks():
+        with telemetry.span("test.chunk"):
+            yield "a"
+        yield "b"
+
+    stream = chunks()
+    assert records(trace) == []
+    assert list(stream) == ["a", "b"]
+    chunk, generator = records(trace)
+    assert (chunk["span"], generator["span"]) == ("test.chunk", "test.generator")
+    assert chunk["parent_id"] == generator["span_id"]
+
+
+def test_disabled_timed_generator_is_the_plain_generator():
+    @telemetry.timed("test.disabled")
+    def chunks():
+        yield "a"
+
+    assert chunks().__name__ == "chunks"
+    assert list(chunks()) == ["a"]
+
+
+def test_bind_carries_the_turn_across_threads(trace):
+    def work():
+        with telemetry.span("test.worker"):
+            return telemetry.turn_id()
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        with telemetry.turn() as turn_id:
+            bound = pool.submit(telemetry.bind(work)).result()
+            unbound = pool.submit(work).result()
+    assert bound == turn_id
+    assert unbound is None
+
+    spans = {(r["span"], r["turn"]): r for r in records(trace)}
+    root = spans[("turn", turn_id)]
+    assert spans[("test.worker", turn_id)]["parent_id"] == root["span_id"]
+    assert spans[("test.worker", None)]["parent_id"] is None
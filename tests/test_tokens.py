@@ -0,0 +1,55 @@
+import tokens
+
+
+def message(role: str, content) -> dict:
+    return {"role": role, "images": [], "content": content}
+
+
+def cost(content: str) -> int:
+    return tokens.count(content) + tokens.MESSAGE_OVERHEAD
+
+
+def test_count():
+    assert tokens.count("") == 0
+    assert tokens.count("hello") >= 1
+    assert tokens.count("hello world, how are you?") > tokens.count("hello")
+
+
+def test_fit_history_keeps_the_newest_in_order():
+    messages = [message("user", "first question"), message("assistant", "first answer"), message("user", "second question")]
+    budget = cost("first answer") + cost("second question")
+    assert tokens.fit_history(messages, budget) == [
+        {"role": "assistant", "content": "first answer"},
+        {"role": "user", "content": "second question"},
+    ]
+    assert tokens.fit_history(messages, 10_000) == [{"role": m["role"], "content": m["content"]} for m in messages]
+
+
+def test_fit_history_drops_whole_messages():
+    messages = [message("user", "an older message that is a fair bit longer"), message("user", "newest")]
+    budget = cost("newest") + cost(messages[0]["content"]) - 1
+    assert tokens.fit_history(messages, budget) == [{"role": "user", "content": "newest"}]
+    # stops at the first message that doesn't fit, even if an older one would
+    messages.insert(0, message("user", "hi"))
+    assert cost("newest") + cost("hi") <= budget
+    assert tokens.fit_history(messages, budget) == [{"role": "user", "content": "newest"}]
+    assert tokens.fit_history(messages, 0) == []
+
+
+def test_fit_history_skips_non_string_content():
+    messages = [message("user", "question"), message("assistant", iter(["a", "stream"])), message("assistant", ""), message("user", "next")]
+    assert tokens.fit_history(messages, 10_000) == [
+        {"role": "user", "content": "question"},
+        {"role": "user", "content": "next"},
+    ]
+
+
+def test_truncate_counts_the_separator():
+    lines = ["first line", "second line", "third line"]
+    separator = "\n---\n"
+    exact = tokens.count(lines[0]) + tokens.count(separator) + tokens.count(lines[1])
+    assert tokens.truncate(lines, exact, separator) == lines[:2]
+    assert tokens.truncate(lines, exact - 1, separator) == lines[:1]
+    # no separator before the first line
+    assert tokens.truncate(lines, tokens.count(lines[0]), separator) == lines[:1]
+    assert tokens.truncate(lines, 0) == []
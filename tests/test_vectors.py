@@ -0,0 +1,36 @@
+import pytest
+
+import vectors
+
+
+@pytest.fixture(scope="module")
+def root(tmp_path_factory):
+    return vectors.build(str(tmp_path_factory.mktemp("vectors")))
+
+
+def test_finds_the_entry_the_question_is_about(root):
+    matches = vectors.top_k("italy", "what is the history of the colosseum", root=root)
+    assert matches[0].entry.name.startswith("Colosseum")
+    assert matches[0].category == "places"
+
+
+def test_best_first_and_at_most_k(root):
+    matches = vectors.top_k("italy", "where can i see modern art", k=2, min_score=0.0, root=root)
+    assert len(matches) == 2
+    assert matches[0].score >= matches[1].score
+    assert "Guggenheim" in matches[0].entry.name
+
+
+def test_nothing_for_follow_ups_without_content(root):
+    assert vectors.top_k("italy", "what about the second one?", root=root) == []
+
+
+def test_words_the_dataset_never_uses_are_ignored(root):
+    assert vectors.top_k("italy", "qwertyuiop zxcvbnm", min_score=0.0, root=root) == []
+    assert vectors.top_k("italy", "colosseum qwertyuiop", root=root)[0].score == pytest.approx(
+        vectors.top_k("italy", "colosseum", root=root)[0].score
+    )
+
+
+def test_only_the_country_entries(root):
+    assert all("Italy" not in m.entry.address for m in vectors.top_k("france", "history of the colosseum", min_score=0.0, root=root))
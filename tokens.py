@@ -0,0 +1,97 @@
+"""
+Token counting and budgets for prompts
+
+count() uses tiktoken when it is installed and otherwise a cheap estimate
+that is close enough for budgets: English averages about four characters
+per token, and short words still take one each. Counts are cached, since the
+same history messages are counted again on every turn.
+
+Each call type has a Budget: how many tokens of conversation history may go
+into the prompt, and the max_tokens cap on the completion, so prompt size,
+latency and cost stay flat however long the conversation gets.
+"""
+import functools
+import re
+from typing import NamedTuple
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+CHARS_PER_TOKEN = 4
+# chat format overhead per message (role and separators)
+MESSAGE_OVERHEAD = 4
+
+_word_pattern = re.compile(r"\w+|[^\w\s]")
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding():
+    return tiktoken.get_encoding("cl100k_base")
+
+
+@functools.lru_cache(maxsize=8192)
+def count(text: str) -> int:
+    """
+    Number of tokens in text, exact with tiktoken and estimated without
+    """
+    if not text:
+        return 0
+    if tiktoken is not None:
+        return len(_encoding().encode(text))
+    return max(len(_word_pattern.findall(text)), -(-len(text) // CHARS_PER_TOKEN))
+
+
+def truncate(lines: list, budget: int, separator: str = "\n") -> list:
+    """
+    The leading lines that fit in budget tokens once joined with separator
+    """
+    kept = []
+    used = 0
+    cost = count(separator)
+    for line in lines:
+        needed = count(line) + (cost if kept else 0)
+        if used + needed > budget:
+            break
+        kept.append(line)
+        used += needed
+    return kept
+
+
+### BUDGETS ###
+class Budget(NamedTuple):
+    history: int
+    completion: int
+
+
+# per call type, like llm_cache.default_ttls
+default_budgets = {
+    "extract": Budget(history=0, completion=60),
+    "answer": Budget(history=800, completion=350),
+    "default": Budget(history=0, completion=500),
+}
+
+
+def budget(call_type: str) -> Budget:
+    return default_budgets.get(call_type, default_budgets["default"])
+
+
+def fit_history(messages: list, budget: int) -> list:
+    """
+    The most recent messages, as chat API messages, that fit in budget tokens.
+    Older messages are dropped whole, never cut in the middle.
+    """
+    fitted = []
+    used = 0
+    for message in reversed(messages):
+        content = message["content"]
+        if not isinstance(content, str) or not content:
+            continue
+        needed = count(content) + MESSAGE_OVERHEAD
+        if used + needed > budget:
+            break
+        fitted.append({"role": message["role"], "content": content})
+        used += needed
+    fitted.reverse()
+    return fitted
@@ -0,0 +1,2162 @@
+"""
+list_of_places = {
+    country: [
+        [name, description, address]
+    ]
+}
+
+list_of_hotels = {
+    country: [
+        [name, description, address]
+    ]
+}
+
+list_of_restaurants = {
+    country: [
+        [name, description, address]
+    ]
+}
+"""
+
+
+list_of_places = {
+    "armenia":[
+        ['Yerevan', 'The capital city, known for its vibrant culture, historical landmarks, and lively atmosphere.', 'Yerevan, Armenia'],
+        ['Garni Temple', 'A well-preserved Hellenistic temple located near Yerevan, offering stunning views of the surrounding mountains.', 'Garni 2215, Armenia'],
+        ['Tatev Monastery', "Situated on a picturesque plateau, it is one of Armenia's oldest and most significant monastic complexes.", 'H45, Tatev 3218, Armenia'],
+        ['Lake Sevan', 'The largest lake in Armenia, surrounded by mountains and home to the Sevanavank Monastery.', 'Lake Sevan, Armenia'],
+        ['Haghpat Monastery', 'A UNESCO World Heritage site, showcasing medieval Armenian architecture in a stunning natural setting.', '3PV6+FQP, Haghpat, Armenia'],
+        ['Dilijan National Park', 'A lush forested area with hiking trails, monasteries, and the charming town of Dilijan.', 'Dilijan National Park, Mount, Haghartsin, Armenia'],
+        ['Geghard Monastery', 'Carved into the rock of the Azat River Gorge, this monastery is renowned for its unique architectural design.', '4RR9+74, Mets Gilanlar, Armenia'],
+        ['Noravank Monastery', "Nestled in a narrow gorge, it's known for its intricate stone carvings and scenic surroundings.", '3604, Armenia'],
+        ['Jermuk', 'Famous for its mineral springs and health resorts, offering a relaxing escape in the Armenian highlands.', 'Jermuk, Armenia'],
+        ['Khachkar Park, Noratus', "Home to one of the world's largest collections of khachkars (cross-stones), each with its own intricate design.", 'Noratus, Armenia'],
+        ['Amberd Fortress', 'A medieval fortress located at 2,300 meters above sea level, offering panoramic views of Mount Ararat.', 'Amberd Road, Armenia'],
+        ['Saghmosavank Monastery', "Overlooking the Kasagh River, it's known for its harmonious blend of nature and architecture.", '99JW+6M8, Saghmosavan 0211, Armenia'],
+        ['Khor Virap Monastery', 'Offers stunning views of Mount Ararat and is known for its connection to Armenian history.', 'H11 , near the village of, Pokr Vedi 0612, Armenia'],
+        ['Matenadaran - Mesrop Mashtots Institute of Ancient Manuscripts', "A treasure trove of ancient manuscripts, showcasing Armenia's rich literary heritage.", '53 Mesrop Mashtoc pokhota, Yerevan 0009, Armenia'],
+        ['Zvartnots Cathedral', 'The ruins of a 7th-century cathedral with unique architectural elements, designated as a UNESCO World Heritage site.', 'Zvartnots, Vagharshapat, Armenia'],
+        ['Echmiadzin Cathedral', 'The mother church of the Armenian Apostolic Church, considered one of the oldest cathedrals in the world.', 'Vagharshapat, Armenia'],
+        ['Vayots Dzor Wine Region', "Explore Armenia's wine culture in this picturesque region known for its vineyards and wineries.", 'Jermuk, Armenia'],
+        ['Goshavank Monastery', 'A medieval monastery with stunning khachkars and architectural details, surrounded by forests.', 'PXHW+VWQ, Gosh 3907, Armenia'],
+        ['Shikahogh State Reserve', "Armenia's second-largest protected area, known for its diverse flora and fauna.", 'Shikahogh State Reserve, Armenia'],
+        ['Akhtala Monastery', 'A medieval fortress-like monastery with unique frescoes and a rich history.', '5Q27+5HW, Akhtala, Armenia'],
+        ['Selim Pass Caravanserai', 'A well-preserved medieval caravanserai along the historic Silk Road.', 'Vardenyats Pass, Armenia'],
+        ['Armenian Alphabet Monument', 'A tribute to the Armenian alphabet, featuring giant stone letters in a scenic setting.', 'C95J+C5G Armenian Alphabet Monument, Artashavan, Armenia'],
+        ['Areni Cave Complex', "Archaeological site where the world's oldest leather shoe was discovered, along with ancient artifacts.", '3604, Armenia'],
+        ['Tsaghkadzor', 'A popular ski resort town in the mountains, offering outdoor activities year-round.', 'Tsaghkadzor 2310, Armenia'],
+        ['Havuts Tar Monastery', 'Perched on a mountain ridge, it provides breathtaking views of the surrounding landscape.', '2215, Armenia'],
+        ['Artsakh (Nagorno-Karabakh)', 'Explore the historical and cultural sites of this region, known for its contested status.', 'Armenia'],
+        ['Armenian Genocide Memorial and Museum', 'Located in Yerevan, it commemorates the victims of the Armenian Genocide.', 'Armenia'],
+        ['Meghri', 'A town in the southernmost part of Armenia, known for its unique culture and historical sites.', 'Meghri, Armenia'],
+        ['Aghveran', 'A picturesque resort town surrounded by forests, ideal for nature lovers and outdoor enthusiasts.', 'Aghveran 2503, Armenia'],
+        ['Sisian', 'Explore the scenic landscapes and historical sites, including the ancient Ughtasar Petroglyphs.', 'Sisian, Armenia'],
+        ['Jermajur Mineral Water Gallery', 'Discover natural mineral springs and taste the healing waters in this beautiful setting.', 'Istisu, Azerbaijan'],
+        ['Armenian Center for Contemporary Experimental Art (ACCEA)', 'Experience the vibrant contemporary art scene in Yerevan.', '1/3 Buzand St, Yerevan 0010, Armenia'],
+        ['Dsegh Village', 'Birthplace of renowned Armenian poet Hovhannes Tumanyan, featuring a museum dedicated to his life and works.', 'Dsegh, Armenia'],
+        ['Dzoraget River Gorge', 'A picturesque gorge with a river running through, surrounded by lush greenery.', 'Dzoraget, Armenia'],
+        ['Lori Fortress', 'Explore the remains of a medieval fortress with strategic views of the surrounding landscape.', '52 Tigran Mets Ave, Վանաձոր, Armenia'],
+        ['Shushi', 'A town in Nagorno-Karabakh with a rich history and cultural heritage.', 'Shusha'],
+        ['Vorotan Gorge', "A deep canyon with stunning geological formations, including the Devil's Bridge.", 'Vorotan'],
+        ['Armenian Center for Contemporary Experimental Art (ACCEA)', 'Experience the vibrant contemporary art scene in Yerevan.', '1/3 Buzand St, Yerevan 0010, Armenia'],
+        ['Dsegh Village', 'Birthplace of renowned Armenian poet Hovhannes Tumanyan, featuring a museum dedicated to his life and works.', 'Dsegh, Armenia'],
+        ['Dzoraget River Gorge', 'A picturesque gorge with a river running through, surrounded by lush greenery.', 'Dzoraget, Armenia'],
+        ['Lori Fortress', 'Explore the remains of a medieval fortress with strategic views of the surrounding landscape.', '52 Tigran Mets Ave, Վանաձոր, Armenia'],
+        ['Shushi', 'A town in Nagorno-Karabakh with a rich history and cultural heritage.', 'Shusha'],
+        ['Vorotan Gorge', "A deep canyon with stunning geological formations, including the Devil's Bridge.", 'Vorotan'],
+        ['Yell Extreme Park, Yenokavan', 'An adventure park offering zip-lining, rope courses, and other thrilling activities in a scenic location.', '61 Առաջին փողոց, Yenokavan, Armenia'],
+        ['Gyumri', "Armenia's second-largest city, known for its unique architecture and vibrant arts scene.", 'Gyumri, Armenia'],
+        ['Hayravank Monastery', 'A picturesque monastery on the shores of Lake Sevan, surrounded by stunning landscapes.', 'C4M5+36M, Hayravank, Armenia'],
+        ['Gladzor University Complex', 'Explore the ruins of an ancient educational complex with a rich history.', '7, 1 Grigor Lusavorich Street, Yerevan 0015, Armenia'],
+        ['Goris', 'A town surrounded by unique rock formations, known for its hospitality and charming atmosphere.', 'Goris, Armenia'],
+        ['Aragats Mountain', 'The highest peak in Armenia, offering trekking opportunities and breathtaking views.', 'Mount Aragats, Armenia'],
+        ['Gyumri Beer Festival', 'Experience Armenian hospitality and taste local beers in this annual festival held in Gyumri.', 'Gyumri, Armenia']
+    ],
+    "france":[
+        ['Eiffel Tower, Paris', 'Iconic iron tower and symbol of Paris, offering panoramic views of the city.', 'Champ de Mars, 5 Av. Anatole France, 75007 Paris, France'],
+        ['Louvre Museum, Paris', "World's largest art museum and historic monument, home to the Mona Lisa and many masterpieces.", '75001 Paris, France'],
+        ['Versailles Palace', 'Opulent palace and former royal residence, known for its magnificent gardens and Hall of Mirrors.', "Place d'Armes, 78000 Versailles, France"],
+        ['Mont Saint-Michel', 'Picturesque island commune with a medieval abbey, surrounded by tides in Normandy.', '50170 Mont Saint-Michel, France'],
+        ['Notre-Dame Cathedral, Paris', 'Gothic masterpiece on the Île de la Cité, known for its architecture and stained glass.', '6 Parvis Notre-Dame - Pl. Jean-Paul II, 75004 Paris, France'],
+        ['Champs-Élysées, Paris', 'Famous avenue lined with theaters, cafes, and luxury shops, leading to the Arc de Triomphe.', 'Champs-Élysées, Paris, France'],
+        ['Sainte-Chapelle, Paris', 'Gothic chapel known for its stunning stained glass windows depicting biblical scenes.', '10 Bd du Palais, 75001 Paris, France'],
+        ['Palace of the Popes, Avignon', 'Historic palace and fortress in Avignon, once the residence of popes.', 'Pl. du Palais, 84000 Avignon, France'],
+        ['Loire Valley Châteaux', 'Series of castles in the Loire Valley, known for their Renaissance architecture and gardens.', 'Loire Valley, France'],
+        ['D-Day Landing Beaches, Normandy', 'Historic beaches where Allied forces landed during World War II.', 'Normandy, France'],
+        ["Musée d'Orsay, Paris", 'Art museum housed in a former railway station, featuring Impressionist and Post-Impressionist masterpieces.', "Esplanade Valéry Giscard d'Estaing, 75007 Paris, France"],
+        ['Centre Pompidou, Paris', 'Modern and contemporary art museum known for its unique architecture and exhibits.', 'Place Georges-Pompidou, 75004 Paris, France'],
+        ['Alsace Wine Route', 'Scenic route through the vineyards of Alsace, known for charming villages and wine tastings.', 'Véloroute du Vignoble, 68126 Kaysersberg, France'],
+        ["Côte d'Azur", 'Stunning Mediterranean coastline with glamorous resorts, beaches, and vibrant nightlife.', 'French Riviera, France'],
+        ['Saint-Malo', 'Walled port city in Brittany known for its medieval architecture and pirate history.', 'Saint-Malo, France'],
+        ['Panthéon, Paris', 'Neoclassical mausoleum containing the remains of distinguished French citizens.', 'Pl. du Panthéon, 75005 Paris, France'],
+        ['Marseille Old Port', 'Historic harbor in Marseille with vibrant markets, seafood restaurants, and boat tours.', 'Old Port, Marseille, France'],
+        ['Strasbourg Cathedral', 'Gothic cathedral with a famous astronomical clock, located in Strasbourg.', 'Pl. de la Cathédrale, 67000 Strasbourg, France'],
+        ['Saint-Sulpice, Paris', 'Baroque church in the Latin Quarter known for its impressive architecture and historic organ.', '2 Rue Palatine, 75006 Paris, France'],
+        ['Carcassonne', 'Medieval fortress city with well-preserved walls and turrets in the Languedoc region.', '11000 Carcassonne, France'],
+        ['Pont du Gard', 'Ancient Roman aqueduct bridge and UNESCO World Heritage site in Provence.', 'Pont du Gard, 30210 Vers-Pont-du-Gard, France'],
+        ['Musée Rodin, Paris', 'Museum dedicated to the works of sculptor Auguste Rodin, surrounded by beautiful gardens.', 'Paris, France'],
+        ['Normandy American Cemetery', 'WWII cemetery overlooking Omaha Beach, honoring American soldiers.', 'Normandy American Cemetery, Rte du Cimetiere Americain, 14710 Colleville-sur-Mer, France'],
+        ['Giverny', 'Home and garden of artist Claude Monet, featuring the iconic water lilies and Japanese bridge.', 'Giverny, France'],
+        ['Museum of the Middle Ages, Paris', 'Museum showcasing medieval artifacts and the remains of Roman baths.', '28 Rue du Sommerard, 75005 Paris, France'],
+        ['Carnac Stones', 'Prehistoric megalithic site in Brittany, featuring alignments and stone rows.', 'LIeu-dit le Ménec, 56340 Carnac, France'],
+        ['Pic du Midi Observatory', 'Astronomical observatory in the Pyrenees with panoramic views of the mountains.', 'Rue Pierre Lamy de la Chapelle, 65200 Bagnères-de-Bigorre, France'],
+        ['Les Baux-de-Provence', 'Picturesque medieval village perched on a rocky outcrop in Provence.', '13520 Les Baux-de-Provence, France'],
+        ['Vieux Lyon', "Lyon's historic Old Town, known for its traboules (hidden passageways) and Renaissance architecture.", 'Vieux Lyon, 69005 Lyon, France'],
+        ['Chartres Cathedral', 'Gothic cathedral known for its stained glass windows and labyrinth, located in Chartres.', '16 Cloître Notre Dame, 28000 Chartres, France'],
+        ['Périgueux', 'Charming town in the Dordogne region known for its medieval architecture and markets.', 'Périgueux, France'],
+        ['Jardin des Tuileries, Paris', 'Historic public garden between the Louvre and Place de la Concorde.', 'Tuileries Garden, 75001 Paris, France'],
+        ["Musée de l'Orangerie, Paris", "Art museum housing Monet's Water Lilies and works from the Impressionist and Post-Impressionist periods.", 'Jardin des Tuileries, 75001 Paris, France'],
+        ['Nausicaá, Boulogne-sur-Mer', "Europe's largest aquarium, showcasing marine life and ecosystems.", 'Bd Sainte-Beuve, 62200 Boulogne-sur-Mer, France'],
+        ['Provins', 'Medieval town with well-preserved walls, known for its fairs and historic architecture.', '77160 Provins, France'],
+        ['Ménerbes', 'Charming village in Provence, known for its medieval architecture and panoramic views.', '84560 Ménerbes, France'],
+        ['Les Machines of the Isle of Nantes', 'Artistic and fantastical mechanical creatures and rides in Nantes.', 'Parc des Chantiers, Bd Léon Bureau, 44200 Nantes, France'],
+        ['Château de Chambord', 'Grand Renaissance castle in the Loire Valley, known for its distinctive French Renaissance architecture.', 'Château de Chambord, 41250 Chambord, France'],
+        ['Vézelay Abbey', 'Romanesque abbey in Burgundy, known for its sculpted capitals and spiritual significance.', '89450 Vézelay, France'],
+        ['Palais des Papes, Avignon', 'Historic palace and fortress in Avignon, once the residence of popes.', 'Pl. du Palais, 84000 Avignon, France'],
+        ['Basilica of St. Denis, Paris', 'Gothic basilica and burial site of French kings, located in the northern suburbs of Paris.', "1 Rue de la Légion d'Honneur, 93200 Saint-Denis, France"],
+        ['Calanques National Park', 'Mediterranean fjords and limestone cliffs along the coast near Marseille.', 'Parc national des Calanques, 13008 Marseille, France'],
+        ['Château de Chenonceau', 'Elegant château spanning the River Cher in the Loire Valley.', 'Château de Chenonceau, 37150 Chenonceaux, France'],
+        ["Musée de l'Armée, Paris", 'Military museum in Les Invalides, showcasing French military history.', '129 Rue de Grenelle, 75007 Paris, France'],
+        ['Lourdes', 'Religious pilgrimage site in the Pyrenees, known for the Sanctuary of Our Lady of Lourdes.', '65100 Lourdes, France'],
+        ['The Lavender Fields of Provence', 'Stunning landscapes of lavender fields in bloom during the summer months.', 'Provence, France'],
+        ['Corsica', 'Mediterranean island known for its diverse landscapes, including mountains, beaches, and forests.', 'Corsica, France'],
+        ['Château de Fontainebleau', 'Former royal residence known for its Renaissance and classical architecture.', '77300 Fontainebleau, France'],
+        ['Gorges du Verdon', 'Verdon Gorge, known for its turquoise waters and dramatic limestone cliffs.', 'Verdon Gorge, France']
+    ],
+    "italy": [
+        ['Colosseum, Rome', 'Iconic ancient amphitheater known for gladiator contests and historic significance.', 'Piazza del Colosseo, 1, 00184 Roma RM, Italy'],
+        ['Vatican City', "Independent city-state surrounded by Rome, home to St. Peter's Basilica and the Vatican Museums.", 'Italy'],
+        ['Florence Cathedral (Duomo)', 'Gothic cathedral with a stunning dome designed by Brunelleschi, located in Florence.', 'Piazza del Duomo, 50122 Firenze FI, Italy'],
+        ['Venice Canals', 'Famous network of canals, bridges, and historic buildings in the unique city of Venice.', 'Grand Canal, 30100 Venice, Metropolitan City of Venice, Italy'],
+        ['Leaning Tower of Pisa', 'Iconic freestanding bell tower known for its unintended tilt in the city of Pisa.', 'Piazza del Duomo, 56126 Pisa PI, Italy'],
+        ['Pompeii', 'Ancient Roman city near Naples, preserved in volcanic ash after the eruption of Mount Vesuvius.', '80045 Pompei, Metropolitan City of Naples, Italy'],
+        ['Uffizi Gallery, Florence', 'Renowned art museum housing a vast collection of Italian Renaissance masterpieces.', 'Piazzale degli Uffizi, 6, 50122 Firenze FI, Italy'],
+        ['Amalfi Coast', 'Picturesque coastal region with colorful cliffside villages and stunning Mediterranean views.', '84011 Amalfi, SA, Italy'],
+        ['Cinque Terre', 'Five picturesque fishing villages on the Italian Riviera, known for their beauty and hiking trails.', 'Cinque Terre, SP, Italy'],
+        ['Roman Forum', 'Ancient forum in the heart of Rome, surrounded by the ruins of important government buildings.', 'Via della Salara Vecchia, 5/6, 00186 Roma RM, Italy'],
+        ['Sistine Chapel, Vatican City', "Famous chapel with Michelangelo's masterpiece frescoes, including 'The Last Judgment.'", '00120, Vatican City'],
+        ['Trevi Fountain, Rome', 'Iconic Baroque fountain known for its grand design and the tradition of tossing coins.', 'Trevi Fountain, Piazza di Trevi, 00187 Roma RM, Italy'],
+        ['Capitoline Museums, Rome', 'Museum complex on Capitoline Hill featuring a vast collection of ancient art and artifacts.', 'Piazza del Campidoglio, 1, 00186 Roma RM, Italy'],
+        ['Lake Como', 'Scenic lake in the Italian Alps surrounded by charming towns, villas, and beautiful gardens.', 'Lake Como, Italy'],
+        ['Piazza del Campo, Siena', 'Historic square in Siena known for its unique shell shape and medieval architecture.', 'Il Campo, 53100 Siena SI, Italy'],
+        ['Piazza Navona, Rome', "Elegant square featuring fountains, sculptures, and the Baroque Church of Sant'Agnese in Agone.", 'Piazza Navona, 00186 Roma RM, Italy'],
+        ["St. Mark's Basilica, Venice", "Byzantine-style cathedral in St. Mark's Square, known for its opulent design.", 'P.za San Marco, 328, 30124 Venezia VE, Italy'],
+        ['Ponte Vecchio, Florence', 'Famous medieval bridge over the Arno River, lined with shops and boutiques.', 'Ponte Vecchio, 50125 Firenze FI, Italy'],
+        ['Milan Cathedral (Duomo)', 'Gothic cathedral in Milan with intricate spires and stunning views from the terrace.', 'P.za del Duomo, 20122 Milano MI, Italy'],
+        ['Piazza San Marco, Venice', "Central square in Venice surrounded by historic buildings, cafes, and St. Mark's Basilica.", 'P.za San Marco, 30124 Venezia VE, Italy'],
+        ['Galleria Vittorio Emanuele II, Milan', 'Luxurious shopping gallery known for its impressive glass-domed roof.', 'Galleria Vittorio Emanuele II, 20121 Milano MI, Italy'],
+        ['Villa Borghese Gardens, Rome', 'Expansive public gardens featuring sculptures, fountains, and the Borghese Gallery.', 'Villa Borghese, 00197 Roma RM, Italy'],
+        ['Mount Vesuvius', 'Active volcano near Naples, famous for its eruption that buried Pompeii and Herculaneum.', 'Mount Vesuvius, 80044 Ottaviano, Metropolitan City of Naples, Italy'],
+        ['The Palatine Hill, Rome', 'One of the Seven Hills of Rome, offering panoramic views and ancient archaeological sites.', 'Palatine Hill, 00186 Rome, Metropolitan City of Rome Capital, Italy'],
+        ['Pisa Cathedral', 'Cathedral in the Square of Miracles, known for its Romanesque architecture and impressive facade.', 'Piazza del Duomo, 56126 Pisa PI, Italy'],
+        ['Gelato in Florence', 'Indulge in delicious Italian gelato, a must-try treat while exploring the streets of Florence.', 'Florence, Metropolitan City of Florence, Italy'],
+        ['Rialto Bridge, Venice', 'Iconic bridge spanning the Grand Canal, lined with shops and a bustling market.', 'Rialto Bridge, Sestiere San Polo, 30125 Venezia VE, Italy'],
+        ['Piazza della Signoria, Florence', "Historic square in Florence featuring sculptures, including a replica of Michelangelo's David.", 'P.za della Signoria, 50122 Firenze FI, Italy'],
+        ['Peggy Guggenheim Collection, Venice', 'Art museum showcasing European and American modern art in a palatial setting.', 'Dorsoduro, 701-704, 30123 Venezia VE, Italy'],
+        ['Basilica of Santa Croce, Florence', 'Franciscan church known for its art and tombs of notable figures like Michelangelo.', 'Piazza di Santa Croce, 16, 50122 Firenze FI, Italy'],
+        ["Castel Sant'Angelo, Rome", 'Mausoleum turned fortress on the banks of the Tiber River, offering panoramic views.', 'Lungotevere Castello, 50, 00193 Roma RM, Italy'],
+        ['Borghese Gallery, Rome', 'Art gallery housed in Villa Borghese, featuring works by Bernini, Caravaggio, and Raphael.', 'Piazzale Scipione Borghese, 5, 00197 Roma RM, Italy'],
+        ['The Amalfi Drive', 'Scenic coastal road along the Amalfi Coast, offering breathtaking views of the Mediterranean.', 'SS163, Italy'],
+        ['The Vatican Museums', 'Extensive art and sculpture museums within Vatican City, including the Raphael Rooms.', 'Italy'],
+        ['Cappella degli Scrovegni, Padua', 'Fresco-adorned chapel with works by Giotto, a masterpiece of Italian art.', 'Piazza Eremitani, 8, 35121 Padova PD, Italy'],
+        ['National Archaeological Museum, Naples', 'Museum showcasing artifacts from Pompeii and Herculaneum, including ancient art.', 'Piazza Museo, 18/19, 80135 Napoli NA, Italy'],
+        ['Venice Biennale', 'Biannual art exhibition featuring contemporary art from around the world in Venice.', 'Venice, Metropolitan City of Venice, Italy'],
+        ['Trastevere, Rome', 'Charming neighborhood known for its narrow cobblestone streets, cafes, and vibrant nightlife.', 'Trastevere, Rome, Metropolitan City of Rome Capital, Italy'],
+        ['Assisi', 'Medieval town in Umbria, known for the Basilica of San Francesco and its beautiful hillside setting.', '06081 Assisi, Province of Perugia, Italy'],
+        ['Piazza Bra, Verona', 'Main square in Verona surrounded by historic buildings, cafes, and the Arena di Verona.', 'P.za Bra, Verona VR, Italy'],
+        ['Padua Botanical Garden', "One of the world's oldest botanical gardens, featuring a diverse collection of plants.", 'University of Padua Botanical Garden, Via Orto Botanico, 15, 35123 Padova PD, Italy'],
+        ['Scrovegni Chapel, Padua', 'Famous for its frescoes by Giotto, depicting scenes from the life of Christ.', 'Piazza Eremitani, 8, 35121 Padova PD, Italy'],
+        ['Cinque Terre National Park', 'Protected area encompassing the scenic Cinque Terre villages and surrounding landscape.', 'Cinque Terre, SP, Italy'],
+        ['Matera', 'Ancient city known for its cave dwellings and historic architecture, a UNESCO World Heritage site.', '75100 Matera, Province of Matera, Italy'],
+        ['Gardens of Bomarzo', 'Surreal Renaissance garden with bizarre sculptures and architectural elements.', 'Sacro Bosco, Località Giardino, 01020 Bomarzo VT, Italy'],
+        ['Palazzo Vecchio, Florence', 'Historic palace in Florence featuring impressive Renaissance architecture and art.', 'P.za della Signoria, 50122 Firenze FI, Italy'],
+        ['Sorrento', 'Cliffside town overlooking the Bay of Naples, known for its stunning views and lemon groves.', '80067 Sorrento, Metropolitan City of Naples, Italy'],
+        ['The Last Supper (Cenacolo), Milan', "Leonardo da Vinci's iconic mural depicting the Last Supper of Jesus and his disciples.", 'Piazza di Santa Maria delle Grazie, 2, 20123 Milano MI, Italy'],
+        ['Piazza del Duomo, Milan', 'Central square in Milan surrounded by the cathedral, Galleria Vittorio Emanuele II, and more.', 'P.za del Duomo, Milano MI, Italy'],
+        ['The Blue Grotto, Capri', 'Sea cave on the coast of Capri known for its vibrant blue and emerald water.', 'Blue Grotto, 80071 Anacapri, Metropolitan City of Naples, Italy']
+    ],
+    "spain":[
+        ['Madrid', 'The vibrant capital city known for its rich cultural heritage, world-class museums like the Prado, and bustling nightlife.', 'Madrid, Spain'],
+        ['Barcelona', 'Famous for its unique architecture, particularly the Sagrada Familia and Park Güell designed by Antoni Gaudí, and its lively beaches.', 'Barcelona, Spain'],
+        ['Seville', 'Home to the beautiful Alcázar palace, flamenco dancing, and the stunning Cathedral of Seville.', 'Seville, Spain'],
+        ['Granada', 'Renowned for the Alhambra, a UNESCO World Heritage Site, and the Generalife gardens.', 'Granada, Spain'],
+        ['Valencia', 'Known for its futuristic City of Arts and Sciences complex, vibrant festivals like Las Fallas, and its sandy beaches.', 'Valencia, Spain'],
+        ['Toledo', 'A historic city known for its medieval architecture, the Toledo Cathedral, and its significance as a former Spanish capital.', 'Toledo, Spain'],
+        ['San Sebastian', 'Famous for its picturesque beaches, delicious Basque cuisine, and annual international film festival.', 'Donostia-San Sebastian, Gipuzkoa, Spain'],
+        ['Córdoba', 'Recognized for the Mezquita, a mosque-cathedral showcasing stunning Islamic architecture.', 'Córdoba, Spain'],
+        ['Málaga', 'Birthplace of Pablo Picasso, boasting cultural museums, beautiful beaches, and a vibrant atmosphere.', 'Málaga, Spain'],
+        ['Bilbao', 'Home to the Guggenheim Museum Bilbao, known for its unique architecture and contemporary art collections.', 'Bilbao, Biscay, Spain'],
+        ['Segovia', 'Notable for the Roman Aqueduct, Alcázar fortress, and its well-preserved medieval architecture.', 'Segovia, Spain'],
+        ['Ronda', 'Famous for its dramatic gorge, Puente Nuevo bridge, and bullfighting history.', '29400 Ronda, Málaga, Spain'],
+        ['Salamanca', 'Renowned for its historic university, beautiful Plaza Mayor, and well-preserved Renaissance architecture.', 'Salamanca, Spain'],
+        ['Cádiz', 'A coastal city known for its Carnival festivities, ancient history, and stunning beaches.', 'Cádiz, Spain'],
+        ['Tenerife', 'The largest of the Canary Islands, offering diverse landscapes, including the Teide National Park and beautiful beaches.', 'Tenerife, Santa Cruz de Tenerife, Spain'],
+        ['Zaragoza', 'Home to the Basilica of Our Lady of the Pillar and significant Roman remains.', 'Zaragoza, Spain'],
+        ['Alicante', 'A city with beautiful beaches, a historic castle, and a vibrant waterfront.', 'Alicante, Spain'],
+        ['Palma de Mallorca', 'The capital of the Balearic Islands, featuring stunning beaches and historical landmarks.', 'Palma, Balearic Islands, Spain'],
+        ['Ibiza', 'Famous for its lively nightlife, beautiful beaches, and UNESCO-listed old town.', 'Ibiza, Balearic Islands, Spain'],
+        ['Santiago de Compostela', 'A pilgrimage site with the Santiago de Compostela Cathedral and historic old town.', 'Santiago de Compostela, Municipality of Santiago de Compostela, A Coruña, Spain'],
+        ['Girona', 'Known for its medieval architecture, ancient Jewish quarter, and well-preserved city walls.', 'Girona, Spain'],
+        ['Cuenca', 'Recognized for its hanging houses perched on cliffs and the Casas Colgadas.', 'Cuenca, Spain'],
+        ['Ávila', 'Famed for its well-preserved medieval walls and the Basilica of San Vicente.', 'Ávila\u200e, Ávila, Spain'],
+        ['Almería', 'Known for its rugged coastline, natural parks, and the Alcazaba fortress.', 'Almería, Spain'],
+        ['Jerez de la Frontera', 'Renowned for sherry production, flamenco, and the Royal Andalusian School of Equestrian Art.', 'Jerez de la Frontera, Cádiz, Spain'],
+        ['Burgos', 'Famous for its Gothic cathedral, UNESCO-listed old town, and the legendary El Cid.', 'Burgos, Spain'],
+        ['Ronda', 'A charming town known for its breathtaking views and ancient bullring.', '29400 Ronda, Málaga, Spain'],
+        ['La Rioja Wine Region', "Explore Spain's renowned wine-producing region, famous for its vineyards and wineries.", 'La Rioja, Spain'],
+        ['Cáceres', 'Recognized for its well-preserved medieval quarter, fortified complex, and historic architecture.', 'Cáceres\u200e, Cáceres, Spain'],
+        ['Fuerteventura', 'A Canary Island boasting stunning beaches, dunes, and a UNESCO biosphere reserve.', 'Fuerteventura, Las Palmas, Spain'],
+        ['Tarragona', 'Known for its Roman archaeological sites, including an amphitheater and aqueducts.', 'Tarragona, Spain'],
+        ['Badajoz', 'Famous for its Moorish fortress, Alcazaba, and historic city center.', 'Badajoz, Spain'],
+        ['Huelva', 'Renowned for its connection to Christopher Columbus, beautiful beaches, and the Doñana National Park.', 'Huelva, Spain'],
+        ['Mérida', 'Recognized for its well-preserved Roman monuments, including a theater and amphitheater.', '06800 Mérida, Badajoz, Spain'],
+        ['Pamplona', 'Famous for the San Fermín festival, where the Running of the Bulls takes place.', 'Pamplona, Navarre, Spain'],
+        ['Teruel', 'Known for its Mudejar architecture, including the Teruel Cathedral and towers.', 'Teruel, Spain'],
+        ['Lugo', 'Recognized for its intact Roman walls, a UNESCO World Heritage Site.', 'Lugo, Spain'],
+        ['Santander', 'Famous for its beaches, scenic bay, and the Magdalena Peninsula.', 'Santander, Cantabria, Spain'],
+        ['Jaén', 'Renowned for its olive oil production, historic castle, and Renaissance architecture.', 'Jaén, Spain'],
+        ['Oviedo', 'Known for its pre-Romanesque architecture, delicious Asturian cuisine, and scenic landscapes.', 'Oviedo, Municipality of Oviedo, Asturias, Spain'],
+        ['El Hierro', 'The smallest and most remote of the Canary Islands, offering unspoiled nature and tranquility.', 'El Hierro, Santa Cruz de Tenerife, Spain'],
+        ['Zamora', 'Famous for its Romanesque architecture and historic churches.', 'Zamora, Spain'],
+        ['Cantabria', 'Explore the picturesque landscapes, caves, and charming villages in this region.', 'Cantabria, Spain'],
+        ['Huesca', 'Known for its Pyrenees landscapes, outdoor activities, and medieval architecture.', 'Huesca, Spain'],
+        ['Palencia', 'Recognized for its Romanesque heritage and the Cristo del Otero statue.', 'Palencia, Spain'],
+        ['Lleida', 'Famous for its medieval cathedral, La Seu Vella, and historic architecture.', 'Lleida, Spain'],
+        ['La Coruña', 'Known for the Tower of Hercules, a Roman lighthouse, and beautiful beaches.', 'A Coruña, Spain'],
+        ['Plasencia', 'Recognized for its well-preserved medieval center and historic monuments.', '10600 Plasencia, Cáceres, Spain']
+    ],
+    "germany" :[
+        ['Berlin', 'The capital and largest city, known for its rich history, cultural landmarks, and vibrant nightlife.', 'Berlin, Germany'],
+        ['Neuschwanstein Castle', 'A fairy-tale castle nestled in the Bavarian Alps, a symbol of romantic architecture.', 'Neuschwansteinstraße 20, 87645 Schwangau, Germany'],
+        ['Cologne Cathedral', 'A stunning Gothic cathedral and UNESCO World Heritage site in the heart of Cologne.', 'Domkloster 4, 50667 Köln, Germany'],
+        ['The Black Forest', 'A picturesque region with dense forests, charming villages, and cuckoo clocks.', 'Black Forest, Germany'],
+        ['Hamburg', 'A major port city with a maritime flair, known for its canals, theaters, and lively neighborhoods.', 'Hamburg, Germany'],
+        ['Munich', 'Famous for its annual Oktoberfest, Munich is a city of art, culture, and beer gardens.', 'Munich, Germany'],
+        ['Heidelberg', "Home to Germany's oldest university, Heidelberg boasts a charming old town and castle.", 'Heidelberg, Germany'],
+        ['Dresden', "Known as the 'Florence of the Elbe,' Dresden features stunning architecture and art collections.", 'Dresden, Germany'],
+        ['Rothenburg ob der Tauber', 'A well-preserved medieval town with cobblestone streets and half-timbered houses.', '91541 Rothenburg ob der Tauber, Germany'],
+        ['Frankfurt', 'A major financial hub with a modern skyline, Frankfurt also offers cultural attractions.', 'Frankfurt, Germany'],
+        ['Nuremberg', 'Rich in history, Nuremberg is known for its medieval architecture and Christmas markets.', 'Nuremberg, Germany'],
+        ['Rhine Valley', 'A picturesque stretch of the Rhine River with vineyards, castles, and charming villages.', 'Rhine Gorge, 56329 Sankt Goar, Germany'],
+        ['Berchtesgaden National Park', "A stunning Alpine park with mountains, lakes, and the Eagle's Nest.", 'Nationalpark Berchtesgaden, 83486 Ramsau bei Berchtesgaden, Germany'],
+        ['Hohenzollern Castle', 'Perched atop Mount Hohenzollern, this castle offers panoramic views of the surrounding area.', '72379 Burg Hohenzollern, Germany'],
+        ["Cologne's Old Town", 'A lively district with narrow streets, historic buildings, and traditional breweries.', 'Cologne, Germany'],
+        ['Sanssouci Palace', 'The former summer palace of Frederick the Great, surrounded by beautiful gardens.', 'Maulbeerallee, 14469 Potsdam, Germany'],
+        ['Lake Constance', 'A large lake shared by Germany, Austria, and Switzerland, offering scenic views and water activities.', 'Lake Constance'],
+        ['Bamberg', 'A UNESCO World Heritage site, Bamberg is known for its well-preserved medieval architecture.', 'Bamberg, Germany'],
+        ['Würzburg Residence', 'A magnificent baroque palace and UNESCO World Heritage site.', 'Residenzpl. 2, 97070 Würzburg, Germany'],
+        ["Eagle's Nest", "Hitler's former mountain retreat, offering breathtaking views of the Bavarian Alps.", 'Kehlsteinhaus, 83471 Berchtesgaden, Germany'],
+        ['Leipzig', 'A city with a rich musical history, known for its annual Bach Festival and vibrant arts scene.', 'Leipzig, Germany'],
+        ['Dachau Concentration Camp', 'A solemn reminder of the Holocaust, Dachau is the site of a former concentration camp.', 'Alte Römerstraße 75, 85221 Dachau, Germany'],
+        ['Lübeck', 'A medieval city with historic brick architecture and renowned marzipan.', 'Lübeck, Germany'],
+        ['Bremen', 'Home to the famous Bremen Town Musicians statue and a charming old town.', 'Bremen, Germany'],
+        ['Herrenchiemsee Palace', 'A palace built by Ludwig II, inspired by the Palace of Versailles.', 'Altes Schloß, 83209 Herrenchiemsee, Germany'],
+        ['Europa Park', "One of Europe's largest theme parks, featuring attractions from different countries.", 'Europa-Park-Straße 2, 77977 Rust, Germany'],
+        ['Düsseldorf', 'A city known for its fashion, art, and the vibrant Königsallee shopping boulevard.', 'Düsseldorf, Germany'],
+        ['Carnival in Cologne', 'Experience the lively and colorful Carnival celebration in the streets of Cologne.', 'Cologne, Germany'],
+        ['Linderhof Palace', "Another of Ludwig II's palaces, known for its beautiful gardens and opulent interiors.", 'Linderhof 12, 82488 Ettal, Germany'],
+        ['Potsdam', "A city with a wealth of palaces, parks, and historic landmarks, often called the 'Versailles of Germany.'", 'Potsdam, Germany'],
+        ['Bavarian Alps', 'A mountainous region offering outdoor activities, charming villages, and stunning landscapes.', 'Bavarian Alps, 82467 Garmisch-Partenkirchen, Germany'],
+        ['Aachen Cathedral', 'A UNESCO World Heritage site, Aachen Cathedral is a masterpiece of Carolingian architecture.', 'Domhof 1, 52062 Aachen, Germany'],
+        ['Sylt', 'A popular North Sea island known for its sandy beaches and unique landscapes.', 'Sylt, Germany'],
+        ['Erfurt', 'A city with a well-preserved medieval old town and the famous Erfurt Cathedral.', 'Erfurt, Germany'],
+        ['Lüneburg', 'A charming town with well-preserved medieval architecture and cobblestone streets.', 'Lüneburg, Germany'],
+        ['Wuppertal Suspension Railway', 'An iconic suspended monorail system offering panoramic views of the city.', 'Adlerbrücke, 42283 Wuppertal, Germany'],
+        ['Görlitz', 'A picturesque town with a well-preserved medieval old town and diverse architectural styles.', 'Görlitz, Germany'],
+        ['Monschau', 'A small town with half-timbered houses, cobbled streets, and the Red House museum.', '52156 Monschau, Germany'],
+        ['Eibsee', "A crystal-clear mountain lake at the base of the Zugspitze, Germany's highest peak.", 'Eibsee, 82491 Grainau, Germany'],
+        ['Speyer Cathedral', 'A Romanesque cathedral and UNESCO World Heritage site in the city of Speyer.', 'Domplatz, 67346 Speyer, Germany'],
+        ['Bode Museum', 'Located on Museum Island in Berlin, the Bode Museum houses a vast collection of sculptures and Byzantine art.', 'Am Kupfergraben, 10178 Berlin, Germany'],
+        ['Ludwigsburg Palace', 'A grand Baroque palace surrounded by expansive gardens in Ludwigsburg.', 'Schlossstraße 30, 71634 Ludwigsburg, Germany'],
+        ['Hannover Adventure Zoo', 'A zoo with themed areas and a variety of animal species, making it an exciting destination for families.', 'Hanover, Germany'],
+        ['Leipzig Zoo', 'One of the oldest zoos in the world, Leipzig Zoo is known for its diverse animal exhibits and conservation efforts.', 'Pfaffendorfer Str. 29, 04105 Leipzig, Germany'],
+        ['Harz National Park', 'A nature reserve in the Harz Mountains, offering hiking trails, unique rock formations, and dense forests.', 'Harz National Park, Germany'],
+        ['Monschau', 'A picturesque town with half-timbered houses, cobbled streets, and the Red House museum.', '52156 Monschau, Germany'],
+        ['Eibsee', "A crystal-clear mountain lake at the base of the Zugspitze, Germany's highest peak.", 'Eibsee, 82491 Grainau, Germany'],
+        ['Speyer Cathedral', 'A Romanesque cathedral and UNESCO World Heritage site in the city of Speyer.', 'Domplatz, 67346 Speyer, Germany'],
+        ['Bode Museum', 'Located on Museum Island in Berlin, the Bode Museum houses a vast collection of sculptures and Byzantine art.', 'Am Kupfergraben, 10178 Berlin, Germany'],
+        ['Ludwigsburg Palace', 'A grand Baroque palace surrounded by expansive gardens in Ludwigsburg.', 'Schlossstraße 30, 71634 Ludwigsburg, Germany'],
+        ['Hannover Adventure Zoo', 'A zoo with themed areas and a variety of animal species, making it an exciting destination for families.', 'Hanover, Germany'],
+        ['Leipzig Zoo', 'One of the oldest zoos in the world, Leipzig Zoo is known for its diverse animal exhibits and conservation efforts.', 'Pfaffendorfer Str. 29, 04105 Leipzig, Germany'],
+        ['Harz National Park', 'A nature reserve in the Harz Mountains, offering hiking trails, unique rock formations, and dense forests.', 'Harz National Park, Germany'],
+        ['Phantasialand', 'A popular theme park near Cologne, known for its thrilling rides and themed areas.', 'Berggeiststraße 31-41, 50321 Brühl, Germany'],
+        ['Saar Loop', 'A stunning natural formation where the Saar River creates a loop surrounded by hills.', 'Saarland, Germany'],
+        ['Lusatian Lake District', 'A newly developed lake district with opportunities for water sports and recreation.', 'Lusatian Lake District, 02979 Elsterheide, Germany'],
+        ['Wieskirche', 'A pilgrimage church known for its Rococo architecture and beautiful interior.', 'Wies 12, 86989 Steingaden, Germany'],
+        ['Edersee', 'A reservoir in the Kellerwald-Edersee National Park, offering water activities and scenic landscapes.', 'Edersee, Germany'],
+        ['Zugspitze', 'The highest peak in Germany, Zugspitze offers panoramic views and skiing opportunities.', 'Zugspitze'],
+        ['Deutsches Museum', "One of the world's largest science and technology museums", 'Germany']
+    ],
+    "usa":[
+        ['Grand Canyon, Arizona', "One of the world's most iconic natural wonders, the Grand Canyon offers breathtaking views and hiking trails.", 'Grand Canyon Village, AZ 86023, USA'],
+        ['Statue of Liberty, New York', 'A symbol of freedom and democracy, the Statue of Liberty is located on Liberty Island in New York Harbor.', 'New York, NY 10004, USA'],
+        ['Yellowstone National Park, Wyoming', "America's first national park, known for its geothermal features, wildlife, and stunning landscapes.", 'Yellowstone National Park, WY 82190, USA'],
+        ['Times Square, New York', 'A vibrant and bustling commercial intersection, Times Square is famous for its theaters, lights, and entertainment.', 'Times Sq, New York, NY, USA'],
+        ['Walt Disney World Resort, Florida', 'The largest and most visited vacation resort in the world, offering magical experiences and theme parks.', 'Florida, USA'],
+        ['Niagara Falls, New York', 'A world-famous natural attraction, Niagara Falls is a stunning collection of waterfalls on the border of the U.S. and Canada.', 'New York, USA'],
+        ['Golden Gate Bridge, California', 'An iconic suspension bridge in San Francisco, offering panoramic views of the city and the bay.', 'Golden Gate Bridge, Golden Gate Brg, San Francisco, CA, USA'],
+        ['Las Vegas Strip, Nevada', 'A world-famous entertainment destination, the Las Vegas Strip is lined with hotels, casinos, and entertainment venues.', 'Las Vegas Strip, NV, USA'],
+        ['White House, Washington, D.C.', "The official residence and workplace of the President of the United States, located in the nation's capital.", '1600 Pennsylvania Avenue NW, Washington, DC 20500, USA'],
+        ['Yosemite National Park, California', 'Renowned for its granite cliffs, waterfalls, and diverse ecosystems, Yosemite is a UNESCO World Heritage site.', 'Yosemite National Park, California, USA'],
+        ['Mount Rushmore, South Dakota', 'A monumental sculpture featuring the faces of four U.S. presidents carved into the granite of the Black Hills.', 'Mount Rushmore Unorganized Territory, SD, USA'],
+        ['Central Park, New York', 'An iconic urban park in the heart of Manhattan, offering green spaces, lakes, and recreational activities.', 'Central Park, New York, NY, USA'],
+        ['The National Mall, Washington, D.C.', 'A landscaped park with iconic monuments and memorials, including the Lincoln Memorial and Washington Monument.', 'National Mall, Washington, DC, USA'],
+        ['Hollywood Walk of Fame, California', "A sidewalk featuring stars dedicated to the achievements of the entertainment industry's biggest names.", '6255 Sunset Blvd #150, Hollywood, CA 90028, USA'],
+        ['The White Sands National Park, New Mexico', 'Known for its dramatic white gypsum sand dunes, the park offers a unique and surreal landscape.', 'White Sands National Park, New Mexico, USA'],
+        ['Disneyland Resort, California', 'The original Disneyland theme park, known for its enchanting attractions and magical experiences.', 'Anaheim, CA 92802, USA'],
+        ['Rocky Mountains, Colorado', 'A major mountain range in western North America, the Rockies offer outdoor adventures and stunning scenery.', 'Colorado, USA'],
+        ['The Alamo, Texas', 'A historic mission and fortress in San Antonio, known for the Battle of the Alamo during the Texas Revolution.', '300 Alamo Plaza, San Antonio, TX 78205, USA'],
+        ['Great Smoky Mountains National Park, Tennessee', 'A UNESCO World Heritage site, this park is known for its biodiversity, waterfalls, and mountain scenery.', 'Great Smoky Mountains National Park, United States'],
+        ['The Kennedy Space Center, Florida', "NASA's primary launch center for human spaceflight, featuring space exhibits and shuttle launch experiences.", 'Kennedy Space Center, FL 32780, USA'],
+        ['New Orleans French Quarter, Louisiana', 'A historic neighborhood known for its vibrant culture, music, and iconic architecture.', 'French Quarter, New Orleans, LA, USA'],
+        ['The Metropolitan Museum of Art, New York', 'One of the largest and most prestigious art museums in the world, housing a vast collection of art.', 'New York, NY, USA'],
+        ['Death Valley National Park, California/Nevada', 'Known for its extreme temperatures and unique desert landscapes, Death Valley is the hottest place on Earth.', 'Death Valley, CA, USA'],
+        ['Mount Vernon, Virginia', 'The plantation home of George Washington, the first President of the United States.', 'Mt Vernon, VA, USA'],
+        ['The Smithsonian Institution, Washington, D.C.', 'A group of museums and research centers, including the National Air and Space Museum and the National Museum of American History.', '1000 Jefferson Dr SW, Washington, DC 20560, USA'],
+        ['The Grand Ole Opry, Tennessee', 'A legendary country music stage and radio show, showcasing performances by top country artists.', '600 Opry Mills Dr, Nashville, TN 37214, USA'],
+        ['The Everglades, Florida', 'A vast tropical wetland known for its unique ecosystem, wildlife, and airboat tours.', 'Everglades, Florida, USA'],
+        ['The Space Needle, Washington', 'An iconic observation tower in Seattle, offering panoramic views of the city and surrounding landscapes.', '400 Broad St, Seattle, WA 98109, USA'],
+        ['Independence Hall, Pennsylvania', 'A UNESCO World Heritage site, Independence Hall is where the Declaration of Independence and the United States Constitution were debated and adopted.', 'Independence Hall, 520 Chestnut St, Philadelphia, PA 19106, USA'],
+        ['Zion National Park, Utah', 'Known for its towering sandstone cliffs, slot canyons, and scenic beauty, Zion is a popular hiking destination.', 'Zion National Park, Utah, USA'],
+        ['The White House, Washington, D.C.', "The official residence and workplace of the President of the United States, located in the nation's capital.", '1600 Pennsylvania Avenue NW, Washington, DC 20500, USA'],
+        ['The Grand Tetons, Wyoming', 'A stunning mountain range in Wyoming, known for its jagged peaks, alpine lakes, and diverse wildlife.', 'Teton Range, Wyoming 83414, USA'],
+        ['The Gateway Arch, Missouri', 'An iconic arch in St. Louis, symbolizing the westward expansion of the United States.', 'Gateway Arch, St. Louis, MO 63102, USA'],
+        ['The High Line, New York', 'An elevated linear park built on a former railway, offering green spaces, art installations, and city views.', 'The High Line, New York, NY 10011, USA'],
+        ['Mount St. Helens, Washington', 'An active stratovolcano known for its 1980 eruption, Mount St. Helens is a fascinating geological site.', 'Mt St Helens, Washington 98616, USA'],
+        ['The Great Lakes, Multiple States', 'A group of interconnected freshwater lakes, including Lake Superior, Lake Michigan, Lake Huron, Lake Erie, and Lake Ontario.', 'The Great Lakes'],
+        ['Antelope Canyon, Arizona', 'A slot canyon known for its stunning rock formations and light beams, a popular destination for photographers.', 'Antelope Canyon, Arizona 86040, USA'],
+        ['The San Antonio River Walk, Texas', 'A picturesque urban waterway lined with shops, restaurants, and cultural attractions.', 'San Antonio River Walk, San Antonio, TX 78205, USA'],
+        ['The High Line, New York', 'An elevated linear park built on a former railway, offering green spaces, art installations, and city views.', 'The High Line, New York, NY 10011, USA'],
+        ['Mount St. Helens, Washington', 'An active stratovolcano known for its 1980 eruption, Mount St. Helens is a fascinating geological site.', 'Mt St Helens, Washington 98616, USA'],
+        ['The Great Lakes, Multiple States', 'A group of interconnected freshwater lakes, including Lake Superior, Lake Michigan, Lake Huron, Lake Erie, and Lake Ontario.', 'The Great Lakes'],
+        ['Antelope Canyon, Arizona', 'A slot canyon known for its stunning rock formations and light beams, a popular destination for photographers.', 'Antelope Canyon, Arizona 86040, USA'],
+        ['The San Antonio River Walk, Texas', 'A picturesque urban waterway lined with shops, restaurants, and cultural attractions.', 'San Antonio River Walk, San Antonio, TX 78205, USA'],
+        ['The Getty Center, California', 'A world-renowned art museum in Los Angeles, known for its impressive architecture and extensive art collection.', '1200 Getty Center Dr, Los Angeles, CA 90049, USA'],
+        ['Mount Rainier National Park, Washington', 'Home to the iconic Mount Rainier, this national park offers hiking, wildlife viewing, and scenic drives.', 'Mount Rainier National Park, Washington, USA'],
+        ['The United States Capitol, Washington, D.C.', 'The home of the United States Congress, featuring iconic domes and historic architecture.', 'Capitol Hill, Washington, DC, USA'],
+        ['The Wizarding World of Harry Potter, Florida', 'An immersive theme park experience at Universal Studios, bringing the magic of Harry Potter to life.', '6000 Universal Blvd, Orlando, FL 32819, USA'],
+        ['The Great Barrier Reef, Hawaii', 'A vibrant coral reef system off the coast of Maui, known for its diverse marine life and snorkeling opportunities.', 'Hawaii, USA'],
+        ['The Museum of Modern Art (MoMA), New York', "One of the world's leading museums of modern and contemporary art, showcasing a vast collection.", '11 W 53rd St, New York, NY 10019, USA']
+    ],
+    "uk":[
+        ['London', 'The capital city, known for its iconic landmarks, diverse culture, and vibrant arts scene.', 'London, UK'],
+        ['Edinburgh Castle', 'A historic fortress on Castle Rock in the heart of Edinburgh, offering panoramic views of the city.', 'Castlehill, Edinburgh EH1 2NG, UK'],
+        ['Stonehenge', 'A prehistoric monument in Wiltshire, known for its massive standing stones and archaeological significance.', 'Salisbury SP4 7DE, UK'],
+        ['The British Museum, London', 'Houses a vast collection of world art and artifacts, showcasing human history and culture.', 'Great Russell St, London WC1B 3DG, UK'],
+        ['Buckingham Palace, London', 'The official residence of the British monarch, known for the Changing of the Guard ceremony.', 'London SW1A 1AA, UK'],
+        ['The Tower of London', 'A historic castle on the River Thames, known for its role in British history and the Crown Jewels.', 'London EC3N 4AB, UK'],
+        ['Stratford-upon-Avon', 'The birthplace of William Shakespeare, with Tudor-style buildings and the Royal Shakespeare Theatre.', 'Stratford-upon-Avon CV37, UK'],
+        ['The Lake District', 'A picturesque region in northwest England, known for its stunning lakes, mountains, and charming villages.', 'United Kingdom'],
+        ['Eden Project, Cornwall', 'A unique ecological park with biomes containing diverse plant species from around the world.', 'Eden Project, Bodelva, Par PL24 2SG, UK'],
+        ["Giant's Causeway, Northern Ireland", 'A natural wonder with hexagonal basalt columns, often associated with Irish mythology.', "Giant's Causeway, Bushmills BT57 8SU, UK"],
+        ['Windsor Castle', 'The oldest and largest inhabited castle in the world, a residence of the Queen.', 'Windsor SL4 1NJ, UK'],
+        ['The Roman Baths, Bath', 'Ancient bathing and socializing complex with well-preserved Roman architecture.', 'Abbey Churchyard, Bath BA1 1LZ, UK'],
+        ['Cambridge University', 'A prestigious university with historic colleges, beautiful gardens, and the River Cam.', 'United Kingdom'],
+        ["Hadrian's Wall", 'A Roman defensive fortification in Northern England, offering a glimpse into ancient Roman Britain.', 'Brampton CA8 7DD, UK'],
+        ['Canterbury Cathedral', 'A UNESCO World Heritage site and a major center of Christian pilgrimage.', 'Cathedral House, 11 The Precincts, Canterbury CT1 2EH, UK'],
+        ['The Shard, London', 'The tallest building in the UK, offering panoramic views of London from its observation deck.', '32 London Bridge St, London SE1 9SG, UK'],
+        ['The Royal Mile, Edinburgh', 'A historic street connecting Edinburgh Castle to the Palace of Holyroodhouse.', 'The Royal Mile, Edinburgh EH8 8BP, UK'],
+        ['The Natural History Museum, London', 'Houses a vast collection of specimens, including the famous Diplodocus skeleton.', 'Cromwell Rd, South Kensington, London SW7 5BD, UK'],
+        ['The Cotswolds', 'A picturesque area with charming villages, rolling hills, and historic stone-built houses.', 'Cotswolds, UK'],
+        ['Westminster Abbey, London', 'A Gothic abbey where British monarchs are crowned and many notable figures are buried.', "Dean's Yard, London SW1P 3PA, UK"],
+        ['Tate Modern, London', 'A contemporary art museum housed in a former power station, showcasing modern artworks.', 'London, UK'],
+        ["St. Paul's Cathedral, London", 'A iconic cathedral with a stunning dome, offering breathtaking views of the city.', "St. Paul's Churchyard, London EC4M 8AD, UK"],
+        ['York Minster', 'A Gothic cathedral in York, known for its medieval architecture and beautiful stained glass.', 'Deangate, York YO1 7HH, UK'],
+        ['The National Gallery, London', 'Houses a rich collection of European paintings from the 13th to the 19th centuries.', 'Trafalgar Square, London WC2N 5DN, UK'],
+        ['The Peak District', 'A national park with diverse landscapes, including hills, dales, and historic estates.', 'Peak District National Park, United Kingdom'],
+        ['Chatsworth House, Derbyshire', 'A stately home with beautiful gardens and an extensive art collection.', 'Chatsworth House, Bakewell DE45 1PP, UK'],
+        ['Liverpool Waterfront', 'A UNESCO World Heritage site with historic docks, museums, and cultural attractions.', 'Liverpool Waterfront, Liverpool, UK'],
+        ['The Victoria and Albert Museum, London', 'Showcases art, design, and fashion from throughout history.', 'Cromwell Rd, London SW7 2RL, UK'],
+        ['Brighton Pier', 'A Victorian-era pier in Brighton, known for its amusements, arcades, and sea views.', 'Madeira Dr, Brighton BN2 1TW, UK'],
+        ['The Science Museum, London', 'Features interactive exhibits on science, technology, and innovation.', 'Exhibition Rd, South Kensington, London SW7 2DD, UK'],
+        ['The Royal Botanic Garden, Edinburgh', 'A beautiful garden with diverse plant collections and stunning landscapes.', 'Royal Botanic Garden Edinburgh, Edinburgh EH3 5NZ, UK'],
+        ['Wembley Stadium, London', 'A major football stadium and iconic venue for concerts and events.', 'London HA9 0WS, UK'],
+        ['The Tate Britain, London', 'Houses a comprehensive collection of British art from the 16th century to the present.', 'Millbank, London SW1P 4RG, UK'],
+        ['The Scottish Highlands', 'A rugged and scenic region known for its mountains, lochs, and wildlife.', 'Highland Council, UK'],
+        ['The Houses of Parliament, London', 'A historic symbol of British democracy, located along the River Thames.', 'London SW1A 0AA, UK'],
+        ['The Fitzwilliam Museum, Cambridge', 'A museum with a diverse collection of art and antiquities.', 'Trumpington St, Cambridge CB2 1RB, UK'],
+        ['The Royal Observatory, Greenwich', 'Home to the Prime Meridian and a museum of astronomy and timekeeping.', 'Blackheath Ave, London SE10 8XJ, UK'],
+        ['The White Cliffs of Dover', 'Iconic chalk cliffs on the English Channel coast, offering stunning views.', 'White Cliffs of Dover, United Kingdom'],
+        ['The National Portrait Gallery, London', 'Showcases portraits of historically significant individuals.', "St. Martin's Pl, London WC2H 0HE, UK"],
+        ['The Isle of Skye', 'A picturesque island in the Inner Hebrides, known for its rugged landscapes.', 'Skye, United Kingdom'],
+        ['The Royal Albert Hall, London', 'A world-renowned concert hall with a distinctive round shape.', 'Kensington Gore, South Kensington, London SW7 2AP, UK'],
+        ['St. Ives, Cornwall', 'A seaside town known for its artistic community and beautiful beaches.', 'St Ives TR26, UK'],
+        ['The Ashmolean Museum, Oxford', "The world's first university museum, with a diverse collection of artifacts.", 'Beaumont St, Oxford OX1 2PH, UK'],
+        ['The V&A Dundee, Scotland', 'A design museum located on the waterfront, showcasing Scottish design and innovation.', '1 Riverside Esplanade, Dundee DD1 4EZ, UK'],
+        ['The Blackpool Tower', 'An iconic tower with entertainment venues and an observation deck.', 'Blackpool Tower, Blackpool FY1, UK'],
+        ['The Mary Rose Museum, Portsmouth', 'Houses the remains of the Tudor warship Mary Rose, along with artifacts.', 'Main Rd, HM Naval Base, Portsmouth PO1 3PY, UK'],
+        ['The National Museum of Scotland, Edinburgh', 'Showcases Scottish history, culture, and natural history.', 'Chambers St, Edinburgh EH1 1JF, UK'],
+        ['The Royal Pavilion, Brighton', 'A former royal residence with exotic architecture and lavish interiors.', '4/5 Pavilion Buildings, Brighton and Hove, Brighton BN1 1EE, UK'],
+        ['The Royal Shakespeare Theatre, Stratford-upon-Avon', 'A renowned venue for Shakespearean plays on the banks of the River Avon.', 'Stratford-upon-Avon CV37, UK']
+    ],
+    "brazil":[
+        ['Rio de Janeiro', 'Famous for its iconic Christ the Redeemer statue, Copacabana and Ipanema beaches, and vibrant carnival celebrations.', 'Rio de Janeiro, State of Rio de Janeiro, Brazil'],
+        ['São Paulo', "Brazil's largest city, known for its diverse cultural scene, gastronomy, and impressive skyline.", 'São Paulo, State of São Paulo, Brazil'],
+        ['Salvador', 'A historic city with a rich Afro-Brazilian cultural heritage, featuring colorful colonial architecture and lively music festivals.', 'Salvador - State of Bahia, Brazil'],
+        ['Brasília', 'The capital city, renowned for its modernist architecture and urban planning by Oscar Niemeyer.', 'Brasília - Brasilia, Federal District, Brazil'],
+        ['Manaus', 'Gateway to the Amazon Rainforest, known for its meeting of the waters, where the Rio Negro and Rio Solimões converge.', 'Manaus, State of Amazonas, Brazil'],
+        ['Recife', 'A coastal city with a mix of historic architecture, vibrant markets, and lively frevo music and dance.', 'Recife - State of Pernambuco, Brazil'],
+        ['Fortaleza', 'A popular beach destination with golden sand dunes, lively nightlife, and the famous Dragão do Mar cultural center.', 'Fortaleza - State of Ceará, Brazil'],
+        ['Iguaçu Falls', 'A breathtaking natural wonder on the border with Argentina, featuring a series of stunning waterfalls in a lush rainforest.', 'Misiones Province, Argentina'],
+        ['Ouro Preto', 'A UNESCO World Heritage city, known for its well-preserved colonial architecture and Baroque churches.', 'Ouro Preto, State of Minas Gerais, 35400-000, Brazil'],
+        ['Pantanal', "The world's largest tropical wetland area, offering incredible wildlife viewing opportunities, including jaguars and caimans.", 'Brazil'],
+        ['Curitiba', 'A green and well-planned city, known for its parks, botanical garden, and innovative urban design.', 'Curitiba, State of Paraná, Brazil'],
+        ['Porto Alegre', 'A southern city with a lively cultural scene, known for its waterfront area and historic districts.', 'Porto Alegre, RS, Brazil'],
+        ['Belém', 'A gateway to the Amazon, known for its vibrant markets, colonial architecture, and traditional cuisine.', 'Belém - State of Pará, Brazil'],
+        ['Cuiabá', 'The gateway to the Brazilian Pantanal, offering a mix of wildlife, outdoor adventures, and indigenous culture.', 'Cuiabá - Coxipó da Ponte, Cuiabá - State of Mato Grosso, Brazil'],
+        ['Natal', 'A coastal city known for its stunning sand dunes, coral reefs, and the iconic Genipabu Beach.', 'Natal, State of Rio Grande do Norte, Brazil'],
+        ['São Luís', 'A UNESCO World Heritage city with well-preserved Portuguese colonial architecture and a rich cultural heritage.', 'São Luís, State of Maranhão, Brazil'],
+        ['João Pessoa', 'A coastal city with beautiful beaches, historic sites, and the easternmost point of the Americas.', 'João Pessoa, State of Paraíba, Brazil'],
+        ['Caldas Novas', 'A popular hot springs destination, known for its thermal resorts and relaxing spa experiences.', 'Caldas Novas, GO, Brazil'],
+        ['Gramado', 'A charming mountain town known for its European-inspired architecture, festivals, and winter events.', 'Gramado, RS, Brazil'],
+        ['Ilha Grande', 'A tropical island with pristine beaches, lush rainforests, and clear blue waters.', 'Ilha Grande, Angra dos Reis - State of Rio de Janeiro, Brazil'],
+        ['Florianópolis', 'A city located on an island, known for its beautiful beaches, sand dunes, and vibrant nightlife.', 'Florianópolis, State of Santa Catarina, Brazil'],
+        ['Bonito', 'A destination renowned for its crystal-clear rivers, caves, and diverse aquatic activities.', 'Bonito - State of Mato Grosso do Sul, Brazil'],
+        ['Santos', 'A coastal city with the largest beachfront garden in the world, known for its maritime history.', 'Santos - State of São Paulo, Brazil'],
+        ['Serra Gaúcha', 'A mountainous region known for its wineries, German and Italian cultural influences, and scenic landscapes.', '16160 N 83rd Ave, Peoria, AZ 85382, USA'],
+        ['Búzios', 'A trendy beach resort town with picturesque cobbled streets, upscale shops, and beautiful beaches.', 'Armação dos Búzios, State of Rio de Janeiro, Brazil'],
+        ['Canoa Quebrada', 'A laid-back beach town known for its red sand dunes, cliffs, and relaxed atmosphere.', 'Canoa Quebrada - Aracati, State of Ceará, Brazil'],
+        ['Lençóis Maranhenses', 'A unique landscape of shifting sand dunes and freshwater lagoons, creating a stunning natural spectacle.', 'Parque Nacional dos Lençóis Maranhenses, Barreirinhas - MA, 65590-000, Brazil'],
+        ['Tiradentes', 'A charming colonial town known for its cobblestone streets, historic churches, and cultural festivals.', 'Tiradentes, State of Minas Gerais, 36325-000, Brazil'],
+        ['Maceió', 'A coastal city with beautiful beaches, natural pools, and a vibrant beachfront promenade.', 'Maceió, State of Alagoas, Brazil'],
+        ['Pirenópolis', 'A well-preserved colonial town known for its cobblestone streets, waterfalls, and traditional festivals.', 'Pirenópolis, State of Goiás, 72980-000, Brazil'],
+        ['Balneário Camboriú', 'A popular beach destination with a bustling nightlife, cable car rides, and panoramic views.', 'Balneário Camboriú, State of Santa Catarina, Brazil'],
+        ['Chapada Diamantina', 'A national park known for its stunning landscapes, caves, waterfalls, and hiking trails.', 'Chapada Diamantina - Igatu, Andaraí - State of Bahia, 46750-000, Brazil'],
+        ['Porto Seguro', 'A historic town known for its role in Brazilian history, as well as beautiful beaches and vibrant nightlife.', 'Porto Seguro, State of Bahia, 45810-000, Brazil'],
+        ['Paraty', 'A colonial gem with well-preserved architecture, cobblestone streets, and a picturesque coastline.', 'Paraty, State of Rio de Janeiro, Brazil'],
+        ['São Miguel do Gostoso', 'A laid-back beach town known for its windsurfing and kitesurfing conditions.', 'São Miguel do Gostoso, RN, 59585-000, Brazil'],
+        ['Praia do Forte', 'A coastal village known for its turtle sanctuary, ecological projects, and beautiful beaches.', 'Praia do Forte, Mata de São João - State of Bahia, Brazil'],
+        ['Canela', 'A charming town in the Serra Gaúcha region, known for its chocolate shops, parks, and scenic surroundings.', 'Canela, RS, 95680-000, Brazil'],
+        ['Alter do Chão', 'A riverfront town known for its white sand beaches along the Tapajós River.', 'Alter do Chão, Santarém - State of Pará, Brazil'],
+        ['Petrolina', 'A city on the banks of the São Francisco River, known for its vineyards, fruit orchards, and river cruises.', 'Petrolina, State of Pernambuco, Brazil'],
+        ['Trancoso', 'A bohemian beach town known for its colorful Quadrado square, boutique shops, and relaxed atmosphere.', 'Trancoso, Porto Seguro - State of Bahia, Brazil'],
+        ['Praia da Pipa', 'A beach town known for its cliffs, dolphins, and vibrant nightlife.', 'Pipa Beach, Tibau do Sul - State of Rio Grande do Norte, 59178-000, Brazil'],
+        ['Aracaju', 'A coastal city known for its beaches, mangroves, and the historic São Salvador Square.', 'Aracaju, State of Sergipe, Brazil'],
+        ['Bariloche', 'A picturesque town in the Andes, known for its Swiss-style architecture, chocolate, and winter sports.', 'Brazil'],
+        ['Monte Verde', 'A mountain village known for its alpine-style architecture, hiking trails, and cool climate.', 'Monte Verde, Camanducaia - State of Minas Gerais, 37650-000, Brazil'],
+    ],
+    "greece":[
+        ['Athens', 'The capital city of Greece, known for its rich history, ancient ruins, and iconic landmarks such as the Acropolis and Parthenon.', 'Athens, Greece'],
+        ['Santorini', 'A stunning island in the Aegean Sea, famous for its white-washed buildings, blue-domed churches, and breathtaking sunsets.', 'Santorini, Greece'],
+        ['Mykonos', 'A popular island known for its vibrant nightlife, beautiful beaches, and charming Cycladic architecture.', 'Mykonos, Mikonos 846 00, Greece'],
+        ['Crete', 'The largest Greek island, offering a mix of historical sites, picturesque villages, and diverse landscapes, including the Samaria Gorge.', 'Crete, Greece'],
+        ['Thessaloniki', "Greece's second-largest city, known for its Byzantine walls, vibrant food scene, and the White Tower overlooking the waterfront.", 'Thessaloniki, Greece'],
+        ['Delphi', 'An ancient archaeological site perched on Mount Parnassus, known as the center of the world in ancient Greek religion.', 'Delphi 330 54, Greece'],
+        ['Meteora', 'A UNESCO World Heritage site featuring monasteries perched atop towering rock formations in central Greece.', 'Kalabaka 422 00, Greece'],
+        ['Rhodes', 'An island with a medieval Old Town, ancient ruins, and beautiful beaches, including the Palace of the Grand Master of the Knights of Rhodes.', 'Rhodes, Greece'],
+        ['Corfu', "A picturesque island with Venetian architecture, fortresses, and beautiful beaches, including the iconic Canal d'Amour.", 'Corfu, Greece'],
+        ['Olympia', 'The birthplace of the Olympic Games, with ancient ruins including the Temple of Hera and the original Olympic stadium.', 'Olympia, Greece'],
+        ['Nafplio', 'A charming coastal town with neoclassical architecture, a historic fortress, and stunning views of the Argolic Gulf.', 'Nafplion, Greece'],
+        ['Heraklion', 'The capital of Crete, known for the Palace of Knossos, a major center of Minoan civilization.', 'Heraklion, Greece'],
+        ['Delos', 'A sacred island in the Cyclades, known for its archaeological site with ruins of temples, houses, and statues.', 'Delos, 846 00, Greece'],
+        ['Zakynthos', 'An island with crystal-clear waters, the famous Shipwreck Beach, and the Blue Caves.', 'Zakynthos, Greece'],
+        ['Samos', 'An island with lush landscapes, ancient ruins, and the birthplace of the mathematician Pythagoras.', 'Samos, Greece'],
+        ['Naxos', 'The largest of the Cyclades islands, known for its beautiful beaches, traditional villages, and the Portara monument.', 'Naxos, Naxos and Lesser Cyclades, Greece'],
+        ['Patmos', 'A serene island known for the Cave of the Apocalypse and the Monastery of Saint John the Theologian.', 'Patmos, Patmos Municipality 855 00, Greece'],
+        ['Monemvasia', 'A medieval fortress town on a rock island connected to the mainland by a causeway.', 'Monemvasia, Greece'],
+        ['Kos', 'An island with ancient ruins, sandy beaches, and the Asklepion, an ancient healing center.', 'Kos, Greece'],
+        ['Kalamata', 'A city known for its olives, historic architecture, and the impressive Kalamata Castle.', 'Kalamata 241 00, Greece'],
+        ['Hydra', 'A car-free island with charming harbor, stone mansions, and a relaxed atmosphere.', 'Hydra, 180 40, Greece'],
+        ['Volos', 'A coastal city known for its lively waterfront, the Pelion Peninsula, and as the departure point for trips to the Sporades islands.', 'Volos, Greece'],
+        ['Chania', 'A picturesque town on Crete with a well-preserved Venetian harbor, narrow streets, and a medieval lighthouse.', 'Chania, Greece'],
+        ['Rethymno', 'A charming town on Crete with a well-preserved medieval old town, a fortress, and a long sandy beach.', 'Rethimno, Greece'],
+        ['Mount Olympus', 'The highest mountain in Greece and the legendary home of the ancient Greek gods.', 'Mount Olympus, Olympos 402 00, Greece'],
+        ['Sounion', 'Cape Sounion is known for the Temple of Poseidon, offering panoramic views of the Aegean Sea.', 'Sounion, Greece'],
+        ['Mycenae', 'An archaeological site with ancient ruins, including the famous Lion Gate and the Treasury of Atreus.', 'Mykines 212 00, Greece'],
+        ['Lesvos', 'An island known for its traditional villages, beautiful landscapes, and as a center for birdwatching.', 'Lesbos, Greece'],
+        ['Kalambaka', 'A town at the foot of Meteora, offering access to the monasteries and stunning views of the rock formations.', 'Kalabaka 422 00, Greece'],
+        ['Kavala', 'A city with a historic old town, a Byzantine fortress, and the Kamares aqueduct.', 'Kavala, Greece'],
+        ['Kefalonia', 'An Ionian island known for its stunning beaches, caves, and the beautiful Melissani Lake.', 'Cephalonia, Greece'],
+        ['Piraeus', 'The port city of Athens, known for its bustling harbor, maritime history, and the Archaeological Museum of Piraeus.', 'Piraeus, Greece'],
+        ['Aegina', 'An island known for its pistachios, ancient ruins, and the Temple of Aphaia.', 'Aegina, Egina 180 10, Greece'],
+        ['Amorgos', 'A serene island with traditional villages, hiking trails, and the Monastery of Hozoviotissa.', 'Amorgos 840 08, Greece'],
+        ['Sifnos', 'An island known for its traditional pottery, charming villages, and the historic monastery of Chrissopigi.', 'Sifnos 840 03, Greece'],
+        ['Syros', 'A Cycladic island with neoclassical architecture, a vibrant capital (Ermoupoli), and beautiful beaches.', 'Syros, Syros - Ermoupoli Municipality 841 00, Greece'],
+        ['Ithaca', 'An Ionian island known as the home of Odysseus in Greek mythology, with picturesque villages and lovely beaches.', 'Ithaca, Ithaki, Greece'],
+        ['Agios Nikolaos', 'A coastal town in Crete known for the picturesque Lake Voulismeni and the nearby ancient site of Lato.', 'Agios Nikolaos, Greece'],
+        ['Ikaria', 'An island known for its longevity, beautiful landscapes, and traditional festivals.', 'Icaria, Ikaria municipality, Greece'],
+        ['Kythira', 'An island with a mix of Venetian, Byzantine, and Ottoman influences, known for its medieval castle and beautiful beaches.', 'Cythera, Kythira Municipality, Greece'],
+        ['Serifos', 'A Cycladic island with a traditional Chora, stunning beaches, and the iconic Church of Panagia (Virgin Mary).', 'Serifos 840 05, Greece'],
+        ['Xanthi', 'A city known for its multicultural heritage, traditional architecture, and the annual Old Town Festival.', 'Xanthi 671 00, Greece'],
+        ['Kardamyli', 'A coastal town in the Mani region known for its stone houses, the Viros Gorge, and the Ritsos Project.', 'Kardamyli 240 22, Greece'],
+        ['Nemea', 'An ancient site known for its archaeological remains, including a stadium and a temple dedicated to Zeus.', 'Nemea 205 00, Greece'],
+        ['Ioannina', 'A city in Epirus known for its medieval castle, the island of Pamvotida, and the cave of Perama.', 'Ioannina, Greece'],
+        ['Parga', 'A picturesque town on the Ionian coast known for its colorful houses, Venetian castle, and nearby beaches.', 'Parga, Greece'],
+        ['Lefkada', 'An Ionian island known for its stunning beaches, including Porto Katsiki and Egremni.', 'Lefkada, Lefkada Municipality, Greece'],
+        ['Milos', 'An island with diverse landscapes, including colorful volcanic rocks, picturesque villages, and the iconic Venus de Milo statue.', 'Plaka 848 00, Greece'],
+        ['Kalymnos', 'An island known for its sponge-diving heritage, rock climbing opportunities, and beautiful beaches.', 'Kalymnos, Municipality of Kalymnos 852 00, Greece'],
+        ['Pylos', 'A historic town on the Peloponnese known for its castle, the Bay of Navarino, and the nearby Voidokilia Beach.', 'Pilos, Greece']
+    ],
+    "singapore":[
+        ['Marina Bay Sands', 'Iconic hotel and entertainment complex with a stunning rooftop pool and observation deck.', '10 Bayfront Ave, Singapore 018956'],
+        ['Gardens by the Bay', 'Futuristic park featuring the Cloud Forest and Flower Dome, with Supertree Grove.', '18 Marina Gardens Dr, Gardens by the Bay, Singapore 018953'],
+        ['Sentosa Island', 'Popular resort island with Universal Studios Singapore, S.E.A. Aquarium, and beautiful beaches.', 'Sentosa, Singapore'],
+        ['Singapore Zoo', 'Award-winning zoo known for its open concept and innovative wildlife habitats.', '80 Mandai Lake Rd, Singapore 729826'],
+        ['Orchard Road', 'Famous shopping street lined with upscale malls, designer boutiques, and entertainment options.', 'Orchard Rd, Singapore'],
+        ['Merlion Park', 'Iconic Singaporean symbol featuring a statue of a mythical creature with the body of a fish and the head of a lion.', 'Merlion, Singapore'],
+        ['Singapore Botanic Gardens', 'Historic botanical garden with a vast collection of tropical plants, including the National Orchid Garden.', '1 Cluny Rd, Singapore Botanic Gardens, Singapore 259569'],
+        ['Chinatown', 'Vibrant district known for its rich history, temples, traditional markets, and delicious street food.', 'Chinatown, Singapore'],
+        ['Little India', 'Colorful neighborhood offering a taste of Indian culture, with markets, temples, and authentic cuisine.', 'Little India, Singapore'],
+        ['Clarke Quay', 'Riverside quay with a lively nightlife scene, featuring restaurants, bars, and entertainment options.', '3 River Valley Rd, Singapore 179024'],
+        ['Raffles Hotel', 'Historic luxury hotel known for its colonial architecture and the birthplace of the Singapore Sling cocktail.', '1 Beach Rd, Singapore 189673'],
+        ['ArtScience Museum', 'Futuristic museum at Marina Bay Sands, hosting innovative and interactive exhibits.', '6 Bayfront Ave, Singapore 018974'],
+        ['National Gallery Singapore', 'Art museum housed in the former Supreme Court and City Hall, showcasing Southeast Asian art.', 'Singapore 178957'],
+        ['Haw Par Villa', 'Unique theme park featuring colorful dioramas depicting Chinese folklore and mythology.', '262 Pasir Panjang Rd, Haw Par Villa, Singapore 118628'],
+        ['Singapore Flyer', 'Giant Ferris wheel offering panoramic views of the city skyline and beyond.', '30 Raffles Ave., Singapore 039803'],
+        ['Peranakan Museum', 'Museum dedicated to Peranakan culture, featuring art, artifacts, and interactive exhibits.', '39 Armenian St, Singapore 179941'],
+        ['East Coast Park', 'Largest park in Singapore with a beach, cycling paths, and a variety of recreational activities.', 'E Coast Park Service Rd, East Coast Park, Singapore'],
+        ['Sri Mariamman Temple', 'Oldest Hindu temple in Singapore, known for its intricate architecture and vibrant festivals.', '244 South Bridge Rd, Singapore 058793'],
+        ['Singapore Science Centre', 'Interactive science museum with hands-on exhibits and an observatory.', '15 Science Centre Rd, Singapore 609081'],
+        ['Esplanade - Theatres on the Bay', 'Iconic waterfront performing arts venue with theaters, concert halls, and outdoor spaces.', '1 Esplanade Dr, Singapore 038981'],
+        ['Fort Canning Park', 'Historical park with lush greenery, walking trails, and archaeological sites.', 'Fort Canning Park, Singapore'],
+        ['Buddha Tooth Relic Temple and Museum', 'Buddhist temple in Chinatown housing a relic of Buddha and impressive artifacts.', '288 South Bridge Rd, Singapore 058840'],
+        ['Singapore Sports Hub', 'Integrated sports and entertainment complex with a stadium, arena, and water sports center.', 'Kallang, Singapore 397718'],
+        ['Mint Museum of Toys', 'Museum showcasing a vast collection of vintage toys from around the world.', '26 Seah St, Singapore 188382'],
+        ['Singapore River Cruise', "Scenic boat cruise along the Singapore River with views of the city's landmarks.", 'CLARK QUAY, JETTY, Singapore 058282'],
+        ['Katong and Joo Chiat', 'Colorful neighborhoods known for their Peranakan architecture and delectable local food.', 'Joo Chiat Rd, Singapore'],
+        ['Singapore Philatelic Museum', 'Museum dedicated to the history of postage stamps and philately.', '23-B Coleman St, Singapore 179807'],
+        ['Haji Lane', 'Quirky street in Kampong Glam known for its independent boutiques, street art, and cafes.', 'Haji Ln, Singapore'],
+        ['Kranji War Memorial', 'War memorial and cemetery honoring the men and women from the Commonwealth who died in World War II.', '9 Woodlands Rd, Singapore 738656'],
+        ['Singapore Discovery Centre', "Interactive museum with exhibits on Singapore's history, defense, and technology.", '510 Upper Jurong Rd, Singapore 638365'],
+        ['Pulau Ubin', 'Rustic island with nature trails, traditional kampong houses, and a laid-back atmosphere.', 'Pulau Ubin, Singapore'],
+        ['Singapore Cable Car', 'Scenic cable car ride offering breathtaking views of Sentosa and the Singapore skyline.', '109 Mount Faber Rd, Faber Peak, Singapore 099203'],
+        ['Singapore Night Safari', 'Nocturnal zoo experience with tram rides and walking trails to see animals in their nighttime habitats.', '80 Mandai Lake Rd, Night Safari, Singapore 729826'],
+        ['MacRitchie Reservoir', 'Nature reserve with walking trails, treetop walk, and a scenic reservoir.', 'MacRitchie Reservoir, Singapore'],
+        ['Singapore Chinese Cultural Centre', 'Cultural center promoting and preserving Chinese heritage through exhibitions and events.', '1 Straits Blvd, Singapore 018906'],
+        ['Geylang Serai Market', 'Traditional Malay market with food stalls, shops, and cultural events.', '1 Geylang Serai, Singapore 402001'],
+        ['S.E.A. Aquarium', 'Aquarium on Sentosa Island with a diverse collection of marine life and underwater tunnels.', '8 Sentosa Gateway, Sentosa Island, Singapore 098269'],
+        ['Singapore National Stadium', 'Modern stadium hosting sports events, concerts, and entertainment shows.', '1 Stadium Dr, Singapore 397629'],
+        ['Sentosa 4D Adventureland', 'Interactive theme park with 4D simulations and rides.', '51B Imbiah Rd, Singapore 099708'],
+        ['Kampong Glam', 'Historical district with Malay and Arab influences, featuring Sultan Mosque and vibrant street art.', 'Kampong Glam, Singapore'],
+        ['Rustic Coast', 'Seaside area with rustic charm, seafood restaurants, and scenic views.', 'Singapore'],
+        ['Singapore City Gallery', 'Gallery showcasing the urban development and planning of Singapore.', '45 Maxwell Road The URA Centre, Singapore 069118'],
+        ['Jurong Bird Park', 'Lush bird park with a diverse collection of avian species and interactive exhibits.', '2 Jurong Hill, Jurong Bird Park, Singapore 628925'],
+        ['Asian Civilisations Museum', 'Museum along the Singapore River showcasing the diverse cultures of Asia.', '1 Empress Pl, Singapore 179555'],
+        ['Tiong Bahru', 'Hip neighborhood known for its art deco architecture, indie boutiques, and trendy cafes.', 'Tiong Bahru, Singapore'],
+        ['Singapore Youth Olympic Museum', 'Museum dedicated to the Youth Olympic Games and youth sports development.', 'Singapore'],
+        ['Skyline Luge Sentosa', 'Outdoor adventure park with luge rides and scenic chairlifts.', '1 Imbiah Rd, Singapore 099692'],
+        ['National Museum of Singapore', 'National museum chronicling the history, culture, and development of Singapore.', '93 Stamford Rd, Singapore 178897'],
+        ['The Southern Ridges', 'Network of elevated walkways and trails connecting parks and nature reserves.', 'Southern Ridges, Singapore'],
+        ['Changi Chapel and Museum', 'Historical museum commemorating the prisoners of war during the Japanese occupation.', '1000 Upper Changi Rd N, Singapore 507707'],
+        ['Bukit Timah Nature Reserve', 'Nature reserve with hiking trails and diverse flora and fauna.', 'Hindhede Dr, Bukit Timah Nature Reserve, Singapore 589318'],
+        ['Singapore Turf Club', 'Horse racing venue with a rich history and lively race events.', '1 Turf Club Ave, Singapore 738078']
+    ],
+    "australia":[
+        ['Sydney Opera House', 'Iconic performing arts venue with a distinctive sail-like design, located on Sydney Harbour.', 'Bennelong Point, Sydney NSW 2000, Australia'],
+        ['Great Barrier Reef', "World's largest coral reef system, offering stunning underwater biodiversity and marine life.", 'Great Barrier Reef, Australia'],
+        ['Uluru-Kata Tjuta National Park', 'Sacred Aboriginal site featuring the iconic Uluru (Ayers Rock) and Kata Tjuta (The Olgas).', 'Uluṟu-Kata Tjuṯa National Park, Lasseter Hwy, Uluru NT 0872, Australia'],
+        ['Sydney Harbour Bridge', "Landmark bridge connecting Sydney's central business district to the North Shore.", 'Sydney Harbour Bridge, Sydney Hbr Brg, Sydney NSW, Australia'],
+        ['Great Ocean Road', 'Scenic coastal drive along the southern coast of Victoria, known for the Twelve Apostles rock formations.', 'Great Ocean Rd, Victoria, Australia'],
+        ['Daintree Rainforest', 'Ancient rainforest in Queensland, home to diverse flora, fauna, and Aboriginal culture.', 'Daintree Rainforest, 2333 Cape Tribulation Rd, Cape Tribulation QLD 4873, Australia'],
+        ['Bondi Beach', 'Famous Sydney beach known for its golden sands, surf, and vibrant coastal atmosphere.', 'Bondi Beach, NSW 2026, Australia'],
+        ['Kangaroo Island', 'Natural haven for wildlife, including kangaroos, koalas, and sea lions.', 'Kangaroo Island, South Australia, Australia'],
+        ['Blue Mountains National Park', 'Mountainous region near Sydney with eucalyptus forests, waterfalls, and hiking trails.', "Blue Mountains Nat'l Park NSW 2786, Australia"],
+        ['Melbourne Cricket Ground (MCG)', 'Historic sports stadium in Melbourne, hosting cricket, Australian rules football, and events.', 'Brunton Ave, Richmond VIC 3002, Australia'],
+        ['Port Arthur Historic Site', 'Former convict settlement and historical site in Tasmania, offering guided tours.', 'Port Arthur TAS 7182, Australia'],
+        ['Fraser Island', "World's largest sand island, featuring pristine beaches, dunes, and unique freshwater lakes.", "K'gari, QLD 4581, Australia"],
+        ['Barossa Valley', 'Famous wine-producing region in South Australia, known for its vineyards and cellar doors.', 'Barossa Valley, Tanunda SA 5352, Australia'],
+        ['Purnululu National Park (Bungle Bungle Range)', "Unusual sandstone formations in Western Australia's Kimberley region.", 'Purnululu National Park, Western Australia 6770, Australia'],
+        ['Royal Botanic Garden, Sydney', 'Picturesque botanical garden near the Sydney Opera House, showcasing diverse plant life.', 'Royal Botanic Garden Sydney, Mrs Macquaries Rd, Sydney NSW 2000, Australia'],
+        ['Taronga Zoo', 'Sydney zoo with a focus on conservation and offering stunning views of the harbor.', 'Bradleys Head Rd, Mosman NSW 2088, Australia'],
+        ['Cairns and the Tropical North', 'Gateway to the Great Barrier Reef and the Daintree Rainforest.', 'Cairns QLD, Australia'],
+        ['Lone Pine Koala Sanctuary', "Australia's oldest and largest koala sanctuary, located in Brisbane.", '708 Jesmond Rd, Fig Tree Pocket QLD 4069, Australia'],
+        ['Cradle Mountain-Lake St Clair National Park', 'Wilderness area in Tasmania with alpine landscapes and hiking trails.', 'Cradle Mountain-Lake St Clair National Park, Tasmania, Australia'],
+        ['National Gallery of Victoria', 'Art museum in Melbourne with an extensive collection of Australian and international art.', '180 St Kilda Rd, Melbourne VIC 3006, Australia'],
+        ['Whitehaven Beach', 'Pristine beach in the Whitsunday Islands, known for its pure white silica sand.', 'Whitehaven Beach, Whitsundays QLD, Australia'],
+        ['Healesville Sanctuary', 'Zoo in Victoria specializing in native Australian wildlife and conservation.', 'Healesville Sanctuary, Glen Eadie Ave, Healesville VIC 3777, Australia'],
+        ['Great Dividing Range', 'Mountain range running parallel to the eastern coast of Australia.', 'Australia'],
+        ['Kakadu National Park', 'Vast national park in the Northern Territory with diverse ecosystems and Aboriginal rock art.', 'Kakadu National Park, Kakadu Hwy, Jabiru NT 0886, Australia'],
+        ['Ningaloo Reef', 'Coral reef off the coast of Western Australia, famous for its marine biodiversity.', 'Australia'],
+        ['Canberra - Australian Capital Territory', 'Capital city with national institutions, museums, and the Australian War Memorial.', 'Canberra ACT, Australia'],
+        ['Royal Exhibition Building', 'Historic exhibition building in Melbourne, a UNESCO World Heritage site.', '9 Nicholson St, Carlton VIC 3053, Australia'],
+        ['Australian War Memorial', 'Memorial in Canberra honoring the servicemen and women of the Australian Defence Force.', 'Treloar Cres, Campbell ACT 2612, Australia'],
+        ['National Museum of Australia', "Museum in Canberra showcasing Australia's social, cultural, and historical stories.", 'Lawson Cres, Acton ACT 2601, Australia'],
+        ['Gold Coast', 'City in Queensland known for its beaches, theme parks, and vibrant entertainment.', 'Gold Coast QLD, Australia'],
+        ['Sydney Tower Eye', 'Tall observation tower in Sydney offering panoramic views of the city.', 'Westfield Sydney, Level 5/108 Market St, Sydney NSW 2000, Australia'],
+        ['Rottnest Island', 'Island off the coast of Perth, known for its quokkas and pristine beaches.', 'Rottnest Island WA 6161, Australia'],
+        ['Tasmanian Wilderness World Heritage Area', 'Protected wilderness area in Tasmania with unique flora and fauna.', 'Tasmania, Australia'],
+        ['Museum of Old and New Art (MONA)', 'Contemporary art museum in Hobart, known for its unconventional exhibits.', '655 Main Rd, Berriedale TAS 7011, Australia'],
+        ['Wineglass Bay', 'Scenic bay in Freycinet National Park with white sands and turquoise waters.', 'Wineglass Bay, Australia'],
+        ['Hamilton Island', 'Popular resort island in the Whitsundays, offering luxury accommodation and activities.', 'Hamilton Island, Whitsundays QLD, Australia'],
+        ['Mount Kosciuszko', "Australia's highest peak, located in the Snowy Mountains of New South Wales.", 'Mt Kosciuszko, Munyang NSW 2624, Australia'],
+        ['Fremantle', 'Historic port city near Perth, known for its maritime history and Victorian architecture.', 'Fremantle WA 6160, Australia'],
+        ['Kings Park and Botanic Garden', 'Botanic garden in Perth with native plants, walking trails, and city views.', 'Kings Park and Botanic Garden, Fraser Ave, Perth WA 6005, Australia'],
+        ['Cottesloe Beach', 'Popular beach near Perth with golden sands and a lively atmosphere.', 'Cottesloe Beach, Western Australia, Australia'],
+        ['Royal National Park', "Australia's oldest national park, located near Sydney with coastal cliffs and bushwalking trails.", "Royal Nat'l Park NSW 2232, Australia"],
+        ['The Twelve Apostles', 'Limestone stacks off the Great Ocean Road, a famous natural landmark.', 'Great Ocean Rd & Booringa Rd, Princetown VIC 3269, Australia'],
+        ['Three Sisters, Blue Mountains', 'Rock formation in the Blue Mountains, surrounded by scenic landscapes.', 'Three Sisters walk, Cliff Dr, Katoomba NSW 2780, Australia'],
+        ['Mossman Gorge', 'Gorge in the Daintree Rainforest with crystal-clear waters and walking trails.', 'Mossman Gorge QLD 4873, Australia'],
+        ['Australian Reptile Park', 'Zoo on the Central Coast of New South Wales, specializing in reptiles and wildlife conservation.', 'Australian Reptile Park, Pacific Hwy, Somersby NSW 2250, Australia'],
+        ['Penguin Parade, Phillip Island', 'Daily parade of little penguins returning to shore at sunset.', 'Penguin Parade, 1019 Ventnor Rd, Summerlands VIC 3922, Australia'],
+        ['Shark Bay', 'World Heritage area in Western Australia with marine life, stromatolites, and Shell Beach.', 'Shark Bay, Australia'],
+        ['Sculpture by the Sea, Bondi', 'Annual outdoor sculpture exhibition along the Bondi to Coogee coastal walk.', '302/61 Marlborough St, Surry Hills NSW 2010, Australia']
+    ],
+    "china":[
+        ['The Great Wall of China', 'Iconic wall with a rich history, offering breathtaking views and hiking opportunities.', 'Huairou District, China, 101406'],
+        ['The Forbidden City, Beijing', 'Imperial palace complex with impressive architecture, gardens, and historical artifacts.', '4 Jing Shan Qian Jie, Dong Cheng Qu, Bei Jing Shi, China, 100009'],
+        ["The Terracotta Army, Xi'an", 'Ancient clay army with thousands of life-sized soldiers, horses, and chariots.', "Lintong District, Xi'An, Shaanxi, China, 710612"],
+        ['The Li River, Guilin', 'Scenic river surrounded by karst mountains, known for its picturesque landscapes.', 'Lijiang, Pingle County, Guilin, China, 542400'],
+        ['The Potala Palace, Lhasa', 'Buddhist palace with stunning architecture, once the winter residence of the Dalai Lama.', '35 Bei Jing Zhong Lu, Cheng Guan Qu, La Sa Shi, Xi Zang Zi Zhi Qu, China, 850000'],
+        ['The Zhangjiajie National Forest Park', "UNESCO-listed park with unique sandstone pillars, inspiring the movie 'Avatar.'", '8C8M+4WC Zhangjiajie National Forest Park, Wu Ling Yuan Qu, Zhang Jia Jie Shi, Hu Nan Sheng, China, 427403'],
+        ['The Yellow Mountains (Huangshan)', 'Majestic mountain range with pine trees, hot springs, and ancient villages.', 'Huangshan Mountain, Huangshan District, Huangshan City, China, 245801'],
+        ['The Jiuzhaigou Valley', 'Valley with colorful lakes, waterfalls, and snow-capped peaks in the Tibetan Plateau.', 'Jiuzhaigou Valley, Jiuzhaigou County, Ngawa Tibetan and Qiang Autonomous Prefecture, China, 623402'],
+        ['The Bund, Shanghai', 'Famous waterfront area with historic buildings, modern skyscrapers, and city views.', 'Zhong Shan Dong Yi Lu, Waitan, Huang Pu Qu, Shang Hai Shi, China, 200002'],
+        ['The Summer Palace, Beijing', 'Imperial garden with a lake, palaces, and traditional Chinese architecture.', 'Yi He Yuan, Hai Dian Qu, China'],
+        ['The West Lake, Hangzhou', 'Picturesque lake with temples, gardens, and historic pagodas.', 'Xi Lake, Hangzhou, China'],
+        ['The Chengdu Research Base of Giant Panda Breeding', 'Conservation and research center for giant pandas.', '1375 Xiong Mao Da Dao, Cheng Hua Qu, Cheng Du Shi, Si Chuan Sheng, China, 610016'],
+        ['The Shaolin Temple, Dengfeng', 'Ancient Buddhist temple known for martial arts performances and its history.', 'GW5P+C4M, Deng Feng Da Dao, Deng Feng Shi, Zheng Zhou Shi, He Nan Sheng, China, 471925'],
+        ['The Victoria Harbor, Hong Kong', 'Natural harbor with a stunning skyline, waterfront promenades, and ferries.', 'Admiralty, Hong Kong'],
+        ['The Three Gorges, Yangtze River', 'Scenic and culturally significant stretch of the Yangtze River.', 'China'],
+        ['The Mogao Caves, Dunhuang', 'Buddhist cave complex with intricate murals and sculptures along the Silk Road.', '2RR5+HMR Mogao Caves, Dun Huang Shi, Jiu Quan Shi, Gan Su Sheng, China, 736206'],
+        ['The Jiayuguan Pass', 'Strategic fortress along the Great Wall, offering historical insights.', 'Jiayuguan, Jiayuguan City, Gansu, China'],
+        ['The Leshan Giant Buddha', 'Giant stone statue carved into a cliff, overlooking the confluence of three rivers.', '2345 Ling Yun Lu, Shi Zhong Qu, Le Shan Shi, Si Chuan Sheng, China, 614099'],
+        ['The Longmen Grottoes, Luoyang', 'Buddhist cave art with thousands of statues and inscriptions.', '13 Long Men Zhong Jie, Luo Long Qu, Luo Yang Shi, He Nan Sheng, China, 471023'],
+        ['The Hukou Waterfall, Yellow River', 'Natural waterfall with impressive flow and surrounding landscapes.', 'China'],
+        ['The Ancient City of Pingyao', 'Well-preserved ancient city with traditional architecture and city walls.', 'Pingyao, Jinzhong, Shanxi, China'],
+        ['The Reed Flute Cave, Guilin', 'Karst cave with stunning stalactites, stalagmites, and colorful lighting.', '1 Lu Di Lu, Xiu Feng Qu, Gui Lin Shi, Guang Xi Zhuang Zu Zi Zhi Qu, China, 541002'],
+        ['The Yu Garden, Shanghai', 'Classical Chinese garden with pavilions, rockeries, and koi-filled ponds.', 'Yu Garden, 279 Yu Yuan Lao Jie, 四牌楼 Huang Pu Qu, Shang Hai Shi, China, 200000'],
+        ['The Jiading Confucian Temple, Shanghai', 'Historic Confucian temple with traditional architecture and gardens.', '183 Nan Da Jie, 183, Jia Ding Qu, China, 201800'],
+        ['The Mount Emei Scenic Area', 'Sacred Buddhist mountain with temples, wildlife, and hiking trails.', 'Emei Mountain, Emeishan City, Leshan, China, 614203'],
+        ['The Shangri-La Region', 'High-altitude region with Tibetan culture, monasteries, and scenic landscapes.', 'China'],
+        ['The Tianmen Mountain, Zhangjiajie', 'Mountain with a natural arch, cliff-hanging walkways, and a cable car.', 'Tianmen Mountain, Yongding District, Zhangjiajie, China, 427302'],
+        ['The Dunhuang Crescent Lake', 'Oasis with a crescent-shaped lake surrounded by sand dunes.', 'Yueya Spring, Dunhuang, Jiuquan, China, 736205'],
+        ['The Yellow Dragon Cave, Zhangjiajie', 'Limestone cave with underground rivers, rock formations, and stalactites.', '9J66+HMJ, Huang Long Lu, Wu Ling Yuan Qu, Zhang Jia Jie Shi, Hu Nan Sheng, China, 427499'],
+        ['The Mount Tai, Shandong', 'Sacred mountain with historical significance, hiking trails, and temples.', 'Taishan Mountain, Taishan, Taian, China, 271001'],
+        ['The Hani Rice Terraces, Yuanyang', 'UNESCO-listed terraced fields with breathtaking landscapes.', '3RR5+V39, Sheng Yan Duan, Yuan Yang Xian, Hong He Ha Ni Zu Yi Zu Zi Zhi Zhou, Yun Nan Sheng, China, 662401'],
+        ['The Dragon and Tiger Pagodas, Kaohsiung', 'Twin pagodas with vibrant colors and a religious significance.', 'No. 9號, Liantan Rd, Zuoying District, Kaohsiung City, Taiwan 813'],
+        ['The Kanas Lake, Xinjiang', 'Alpine lake with pristine waters, surrounded by mountains and forests.', 'Ka Nasi Lake, Burqin County, Altay Prefecture, China'],
+        ['The Mount Huangshan Hot Springs', 'Scenic hot springs on Mount Huangshan, offering relaxation with mountain views.', 'China'],
+        ['The Jiuzhai Valley Winter Scenery', 'Winter landscapes in Jiuzhaigou Valley with frozen lakes and snowy mountains.', 'Jiuzhai Valley National Park, Jiu Zhai Gou Xian, A Ba Zang Zu Qiang Zu Zi Zhi Zhou, Si Chuan Sheng, China, 623402'],
+        ['The Xitang Water Town', 'Picturesque water town with canals, ancient architecture, and traditional culture.', 'Xitang, Jiashan County, Jiaxing, Zhejiang, China, 314121'],
+        ["The Ancient City Wall, Xi'an", 'Well-preserved city wall with gates, watchtowers, and biking paths.', 'China, Shan Xi Sheng, Xi An Shi, Bei Lin Qu, 陕西 邮政编码: 710001'],
+        ['The Jiuzhaigou National Park', 'UNESCO-listed national park with colorful lakes, waterfalls, and snow-capped peaks.', 'Jiuzhai Valley National Park, Jiu Zhai Gou Xian, A Ba Zang Zu Qiang Zu Zi Zhi Zhou, Si Chuan Sheng, China, 623402'],
+        ['The Qinghai Lake', 'High-altitude lake surrounded by grasslands, offering birdwatching and scenic views.', 'Qinghai Lake, China'],
+        ['The Mount Wuyi', 'Mountain range with tea plantations, historic sites, and scenic landscapes.', 'Wuyi Shanmai, Yanshan County, Jiangxi, Shangrao, China, 334511'],
+        ['The Mount Everest Base Camp, Tibet', "Base camp with views of the world's highest peak, Mount Everest.", 'Everest Base Camp, Khumjung 56000, Nepal'],
+        ['The Xiamen Gulangyu Island', 'Car-free island with colonial architecture, beaches, and botanical gardens.', 'Gulangyu, Siming District, Xiamen, China, 361001'],
+        ['The Jiayuguan Overhanging Great Wall', 'Section of the Great Wall built on a steep cliff in Jiayuguan.', 'Jiayuguan, Jiayuguan City, Gansu, China'],
+        ['The Datong Hanging Temple', 'Temple built into a cliff with a unique architectural style.', 'Hunyuan County, Datong, China, 037499'],
+        ['The Chengdu Dujiangyan Irrigation System', 'Ancient irrigation system with temples, waterworks, and engineering marvels.', '2J45+326, Dujiangyan City, Chengdu, Sichuan, China, 611830'],
+        ['The West Lake Musical Fountain, Hangzhou', 'Nightly musical fountain show with lights and water jets.', 'Xi Lake, Hangzhou, China'],
+        ['The Hefang Street, Hangzhou', 'Historic street with traditional shops, teahouses, and cultural performances.', 'He Fang Jie, Shang Cheng Qu, Hang Zhou Shi, Zhe Jiang Sheng, China']
+    ],
+    "uae": [
+        ['Burj Khalifa, Dubai', 'Tallest building in the world, offering panoramic views of the city from its observation decks.', '1 Sheikh Mohammed bin Rashid Blvd - Downtown Dubai - Dubai - United Arab Emirates'],
+        ['The Dubai Mall, Dubai', "One of the world's largest shopping malls, featuring a wide range of shops, attractions, and entertainment.", 'Downtown Dubai - Dubai - United Arab Emirates'],
+        ['Palm Jumeirah, Dubai', 'Artificial palm-shaped island with luxury resorts, hotels, and stunning beachfront properties.', 'Palm Jumeirah - The Palm Jumeirah - Dubai - United Arab Emirates'],
+        ['Sheikh Zayed Grand Mosque, Abu Dhabi', 'Magnificent mosque with intricate architecture, beautiful domes, and reflective pools.', 'Abu Dhabi - Al Rawdah - Abu Dhabi - United Arab Emirates'],
+        ['Burj Al Arab, Dubai', 'Iconic luxury hotel known for its sail-shaped design and world-class amenities.', 'Dubai - Umm Suqeim 3 - Dubai - United Arab Emirates'],
+        ['The Dubai Fountain, Dubai', 'Dancing fountain show set against the backdrop of the Burj Khalifa and synchronized with music.', 'The Dubai Fountain - Downtown Dubai - Dubai - United Arab Emirates'],
+        ['Ferrari World, Abu Dhabi', 'Amusement park on Yas Island featuring thrilling rides and attractions centered around Ferrari.', 'Yas Island - Abu Dhabi - United Arab Emirates'],
+        ['Yas Marina Circuit, Abu Dhabi', 'Formula One racing circuit with opportunities for driving experiences and guided tours.', 'Yas Marina Circuit - Yas Island - Abu Dhabi - United Arab Emirates'],
+        ['Jumeirah Beach, Dubai', 'White sand beach with crystal-clear waters and views of the Dubai skyline.', 'Jumeirah Beach - Jumeirah - Dubai - United Arab Emirates'],
+        ['The Louvre Abu Dhabi, Abu Dhabi', 'Art and civilization museum with a unique architectural design and a diverse art collection.', 'Saadiyat - جزيرة السعديات - Cultural District - أبو ظبي - United Arab Emirates'],
+        ['Dubai Marina, Dubai', 'Man-made canal city with a vibrant waterfront, upscale residences, and dining options.', 'Dubai Marina - Dubai - United Arab Emirates'],
+        ['Wild Wadi Waterpark, Dubai', 'Waterpark with numerous slides, wave pools, and attractions for a day of family fun.', 'Jumeirah St - opp. Burj Al Arab - Umm Suqeim - Umm Suqeim 3 - Dubai - United Arab Emirates'],
+        ['Al Fahidi Historic District (Al Bastakiya), Dubai', 'Old Dubai neighborhood with traditional wind-tower architecture, art galleries, and museums.', 'Dubai - Al Fahidi - Dubai - United Arab Emirates'],
+        ['The Dubai Opera, Dubai', 'State-of-the-art performing arts venue hosting concerts, operas, and cultural events.', 'Sheikh Mohammed bin Rashid Blvd - Downtown Dubai - Dubai - United Arab Emirates'],
+        ['Zaya Nurai Island, Abu Dhabi', 'Private island resort with luxury villas, pristine beaches, and turquoise waters.', 'Nurai Island - Nourai Island - Abu Dhabi - United Arab Emirates'],
+        ['The Walk at JBR, Dubai', 'Outdoor retail and dining promenade with a beachfront setting and lively atmosphere.', 'Jumeirah Beach Residence - Dubai - United Arab Emirates'],
+        ['Emirates Palace, Abu Dhabi', 'Luxurious hotel with opulent architecture, high-end amenities, and extensive gardens.', 'West Corniche Road - Al Ras Al Akhdar - Abu Dhabi - United Arab Emirates'],
+        ['Dubai Miracle Garden, Dubai', 'Seasonal flower garden with elaborate displays, including floral sculptures and arrangements.', 'Dubai Miracle Garden - Street 3 - Arjan-Dubailand - Al Barsha South - Dubai - United Arab Emirates'],
+        ['Saadiyat Island, Abu Dhabi', 'Cultural district with museums, beaches, and a focus on arts and education.', 'Saadiyat Island - Al Saadiyat Island - Abu Dhabi - United Arab Emirates'],
+        ['Dubai Dolphinarium, Dubai', 'Family-friendly entertainment venue with dolphin and seal shows.', 'Riyadh Street, Inside the Creek Park Gate 1 - Dubai Dolphinarium Building - أم هرير ٢ - دبي - United Arab Emirates'],
+        ['Al Ain Oasis, Al Ain', 'Historic oasis with traditional falaj irrigation system, date palm plantations, and walking trails.', 'Al Ain Oasis - Central District - Abu Dhabi - United Arab Emirates'],
+        ['Skydive Dubai, Dubai', 'Adventurous destination offering tandem skydiving experiences with views of iconic landmarks.', 'Al Seyahi St - Dubai Marina - Dubai - United Arab Emirates'],
+        ['Sharjah Arts Museum, Sharjah', 'Prominent art museum showcasing a diverse collection of local and international artworks.', 'متحف الشارقة للفنون - Al Shuwaiheen - Sharjah - United Arab Emirates'],
+        ['Dubai Frame, Dubai', 'Architectural landmark providing panoramic views of both old and new Dubai.', "Zabeel Park Jogging Track - Za'abeel - Al Kifaf - Dubai - United Arab Emirates"],
+        ['Qasr Al Watan, Abu Dhabi', 'Presidential palace open to the public, featuring stunning architecture and lush gardens.', 'Abu Dhabi - Al Ras Al Akhdar - Abu Dhabi - United Arab Emirates'],
+        ['Hatta Heritage Village, Hatta', 'Cultural site preserving traditional Emirati architecture, crafts, and lifestyle.', 'Hatta - Sufayri - Dubai - United Arab Emirates'],
+        ['Al Majaz Waterfront, Sharjah', 'Waterfront destination with parks, fountains, and a musical fountain show.', 'Al Majaz Waterfront, Beside Al Taqwa Mosque - Corniche St - Al Majaz 2 - Al Majaz - Sharjah - United Arab Emirates'],
+        ['Jebel Hafeet, Al Ain', 'Mountain offering scenic drives, hot springs, and panoramic views of the surrounding area.', 'Jabal Hafeet - Abu Dhabi - United Arab Emirates'],
+        ['Ras Al Khor Wildlife Sanctuary, Dubai', 'Wetland reserve with bird hides for observing migratory birds and flamingos.', 'Ras Al Khor - Dubai - United Arab Emirates'],
+        ['Al Fahidi Fort (Dubai Museum), Dubai', "Historical fort showcasing Dubai's history and heritage.", 'Al Fahidi Fort - Al Fahidi - Dubai - United Arab Emirates'],
+        ['Dubai Creek, Dubai', 'Natural seawater inlet with traditional abras (water taxis), offering a glimpse of Old Dubai.', 'Dubai Creek - Dubai - United Arab Emirates'],
+        ['Sharjah Aquarium, Sharjah', 'Aquarium showcasing marine life in the Arabian Gulf with interactive exhibits.', 'Al Meena St, Al Khan Old area, adjacent to Sharjah Maritime Museum - Al Khan - Sharjah - United Arab Emirates'],
+        ['Alserkal Avenue, Dubai', 'Contemporary art hub with galleries, studios, and creative spaces.', '17th St - Al Quoz - Al Quoz Industrial Area 1 - Dubai - United Arab Emirates'],
+        ['The Green Planet, Dubai', 'Indoor rainforest with a variety of plant and animal species, providing an educational experience.', 'City Walk - Al Wasl - Dubai - United Arab Emirates'],
+        ['Dubai Autodrome, Dubai', 'Motorsports complex with a race track, karting circuit, and driving experiences.', 'Motor City - Dubai - United Arab Emirates'],
+        ['Al Noor Island, Sharjah', 'Island park with lush gardens, modern art installations, and a butterfly house.', 'Al Noor Island - Sharjah - United Arab Emirates'],
+        ['Hili Archaeological Park, Al Ain', 'Archaeological site with Bronze Age tombs, ancient settlements, and a museum.', 'Hili Archaeological park - Hili - Abu Dhabi - United Arab Emirates'],
+        ['Dubai Gold Souk, Dubai', 'Traditional gold market with a dazzling array of gold, silver, and precious gemstone jewelry.', 'Dubai - Deira - Al Ras - Dubai - United Arab Emirates'],
+        ['Sir Bani Yas Island, Abu Dhabi', 'Island nature reserve with wildlife, adventure activities, and luxury accommodations.', 'Sir Baniyas Island - Sir Bani Yas - Abu Dhabi - United Arab Emirates'],
+        ['Al Mamzar Beach Park, Dubai', 'Park with beaches, lagoons, and recreational facilities for a day of relaxation.', 'Al Mamzar Beach Park - Al Mamzar Beach St - Al Mamzar - Dubai - United Arab Emirates'],
+        ['Al Ain Zoo, Al Ain', 'Zoo with a focus on conservation, home to a variety of wildlife species.', 'Nahyan The First St - Shiab Al Ashkhar - Abu Dhabi - United Arab Emirates'],
+        ['Dubai Mall Aquarium and Underwater Zoo, Dubai', 'Aquarium with a walkthrough tunnel and an underwater zoo featuring diverse marine life.', 'Dubai - Downtown Dubai - Dubai - United Arab Emirates'],
+        ['Louvre Abu Dhabi, Abu Dhabi', 'Art museum with a global perspective, featuring art and artifacts from different cultures.', 'Saadiyat - جزيرة السعديات - Cultural District - أبو ظبي - United Arab Emirates'],
+        ['Dubai Butterfly Garden, Dubai', 'Garden with a large butterfly enclosure, showcasing a variety of butterfly species.', 'Dubai Butterfly Garden - Al Barsha South 3, Dubailand Area, Beside Dubai Miracle Garden - Arjan-Dubailand - Al Barsha South - Dubai - United Arab Emirates'],
+        ['Mleiha Archaeological Centre, Sharjah', 'Archaeological center with exhibits on prehistoric and ancient history in the region.', 'Archeological Centre - Al Khatim - Sharjah - United Arab Emirates'],
+        ['Al Fahidi Souk, Dubai', 'Traditional market offering textiles, spices, and souvenirs in a historic setting.', 'Mina Bazar, Bur Dubai Shop-F98, Al Fahidi, Diera - السبخة - السوق دبي القديم - Bur Dubai - السوق الكبير - دبي - United Arab Emirates'],
+        ['Dubai Water Canal, Dubai', 'Artificial canal with a scenic waterfront, pedestrian bridges, and a vibrant atmosphere.', 'Dubai Water Canal - شارع - Al Safa - Jumeirah 2 - Dubai - United Arab Emirates'],
+        ['Ajman Museum, Ajman', 'Museum housed in an 18th-century fort, showcasing the history and culture of Ajman.', 'CC7W+96Q - Al Bustan - ليوارة 1 - Ajman - United Arab Emirates'],
+        ['Dubai Parks and Resorts, Dubai', 'Integrated entertainment destination with theme parks and attractions.', 'Sheikh Zayed Rd - Dubai - United Arab Emirates'],
+        ['Abu Dhabi Corniche, Abu Dhabi', 'Coastal promenade with parks, beaches, and stunning views of the city skyline.', 'F9R3+W8 - Al Danah - Zone 1 - Abu Dhabi - United Arab Emirates'],
+        ['Dubai Safari Park, Dubai', 'Wildlife park with a focus on conservation, featuring a variety of animals from around the world.', '5CCW+H5 Dubai Safari Park - Al Warqa 5 - Dubai - United Arab Emirates']
+    ],
+    "canada":[
+        ['Banff National Park, Alberta', "Canada's first national park, known for its stunning mountain scenery, turquoise lakes, and diverse wildlife.", 'Banff National Park, Improvement District No. 9, AB T0L, Canada'],
+        ['Niagara Falls, Ontario', 'Iconic waterfall on the border of Canada and the United States, offering breathtaking views and boat tours.', 'Niagara Falls, ON, Canada'],
+        ['Vancouver, British Columbia', 'Cosmopolitan city surrounded by mountains and ocean, with a vibrant arts scene and outdoor activities.', 'Vancouver, BC, Canada'],
+        ['Quebec City, Quebec', 'Charming historic city with cobblestone streets, European architecture, and a rich French Canadian heritage.', 'Québec City, QC, Canada'],
+        ['Toronto, Ontario', "Canada's largest city, featuring iconic landmarks like the CN Tower, diverse neighborhoods, and cultural attractions.", 'Toronto, ON, Canada'],
+        ['Jasper National Park, Alberta', 'Largest national park in the Canadian Rockies, known for its rugged mountains, glaciers, and wildlife.', 'Jasper National Park Of Canada, Jasper, AB T0E 1E0, Canada'],
+        ['Whistler, British Columbia', 'World-renowned ski resort and outdoor adventure destination with stunning alpine scenery.', 'Whistler, BC V8E, Canada'],
+        ['Montreal, Quebec', 'Cultural hub with a mix of historic and modern architecture, vibrant neighborhoods, and a lively arts scene.', 'Montreal, QC, Canada'],
+        ['Churchill, Manitoba', 'Polar bear capital of the world, offering unique opportunities to see polar bears in their natural habitat.', 'Churchill, MB, Canada'],
+        ['Calgary Stampede, Alberta', "Annual rodeo and exhibition, known as the 'Greatest Outdoor Show on Earth,' featuring rodeo events and entertainment.", 'Calgary, AB, Canada'],
+        ['Ottawa, Ontario', 'Capital city of Canada, home to Parliament Hill, historic sites, and national museums.', 'Ottawa, ON, Canada'],
+        ['Bay of Fundy, New Brunswick/Nova Scotia', 'Natural wonder known for the highest tides in the world and whale watching opportunities.', 'New Brunswick, Canada'],
+        ['Gros Morne National Park, Newfoundland and Labrador', 'UNESCO World Heritage site with dramatic landscapes, fjords, and hiking trails.', 'Gros Morne, Newfoundland and Labrador A0K 4Z0, Canada'],
+        ['Victoria, British Columbia', 'Capital of British Columbia, located on Vancouver Island, known for its historic architecture and gardens.', 'Victoria, BC, Canada'],
+        ['Prince Edward Island', 'Charming island with red sand beaches, lighthouses, and the famous Green Gables.', 'Prince Edward Island, Canada'],
+        ['Yoho National Park, British Columbia', "Mountainous national park with waterfalls, glaciers, and the stunning Lake O'Hara.", 'Yoho National Park Of Canada, Field, BC V0A 1G0, Canada'],
+        ['Saskatoon, Saskatchewan', 'City on the banks of the South Saskatchewan River, known for its cultural festivals and outdoor activities.', 'Saskatoon, SK, Canada'],
+        ['Cape Breton Island, Nova Scotia', 'Island known for its scenic coastal drives, Celtic culture, and the Cabot Trail.', 'Cape Breton Island, Nova Scotia, Canada'],
+        ['Gatineau Park, Quebec', 'Outdoor playground near Ottawa with hiking trails, lakes, and the Mackenzie King Estate.', 'Gatineau Park Visitor Centre, 33 Chem. Scott, Chelsea, QC J9B 1R5, Canada'],
+        ['Kluane National Park, Yukon', 'Remote wilderness area with towering mountains, glaciers, and diverse wildlife.', 'Kluane National Park and Reserve, Haines Junction, YT Y0B 1L0, Canada'],
+        ['Winnipeg, Manitoba', 'Cultural and historic city with museums, festivals, and the Forks National Historic Site.', 'Winnipeg, MB, Canada'],
+        ['Dinosaur Provincial Park, Alberta', 'UNESCO World Heritage site known for its dinosaur fossils and badlands landscape.', 'Dinosaur Provincial Park, Alberta, Canada'],
+        ['Niagara-on-the-Lake, Ontario', 'Quaint town known for its wineries, historic architecture, and the Shaw Festival.', 'Niagara-on-the-Lake, ON, Canada'],
+        ['Lunenburg, Nova Scotia', 'UNESCO World Heritage site with well-preserved 18th-century architecture and a bustling waterfront.', 'Lunenburg, NS B0J 2C0, Canada'],
+        ['Kootenay National Park, British Columbia', 'Mountainous national park with hot springs, alpine meadows, and the iconic Paint Pots.', 'Kootenay National Park, British Columbia V0A, Canada'],
+        ['Regina, Saskatchewan', 'Capital city with parks, museums, and the Royal Saskatchewan Museum.', 'Regina, SK, Canada'],
+        ['Maligne Lake, Alberta', 'Stunning glacial lake in Jasper National Park, known for Spirit Island and boat tours.', 'Maligne Lake, Improvement District No. 12, AB T0E, Canada'],
+        ['Quebec Winter Carnival, Quebec', 'Annual winter festival with parades, ice sculptures, and cultural events.', 'Québec City, QC, Canada'],
+        ['Pacific Rim National Park Reserve, British Columbia', 'Coastal park with rainforests, beaches, and opportunities for whale watching.', 'Pacific Rim National Park Reserve, British Columbia, Canada'],
+        ['Athabasca Falls, Alberta', 'Scenic waterfall in Jasper National Park, easily accessible from the Icefields Parkway.', 'Athabasca Falls, Improvement District No. 12, AB T0E 1E0, Canada'],
+        ["St. John's, Newfoundland and Labrador", 'Easternmost city in North America, known for its colorful row houses and historic sites.', "St. John's, NL, Canada"],
+        ['Lethbridge, Alberta', 'City with parks, gardens, and the Nikka Yuko Japanese Garden.', 'Lethbridge, AB, Canada'],
+        ['Gander, Newfoundland and Labrador', 'Town known for its aviation history, including its role in transatlantic flights.', 'Gander, NL, Canada'],
+        ['Cathedral Grove, British Columbia', 'Ancient forest with towering Douglas fir and red cedar trees.', 'MacMillan Provincial Park, 452 Alberni Hwy, Nanaimo, BC V0R, Canada'],
+        ['Mackenzie River, Northwest Territories', 'Longest river in Canada, offering opportunities for canoeing and wildlife viewing.', 'Mackenzie River, Northwest Territories, Canada'],
+        ['Head-Smashed-In Buffalo Jump, Alberta', 'UNESCO World Heritage site showcasing indigenous buffalo hunting traditions.', 'secondary Highway #785, Fort MacLeod, AB T0L 1A0, Canada'],
+        ['Rouge National Urban Park, Ontario', 'Urban park near Toronto with hiking trails, wetlands, and historic sites.', 'Rouge National Urban Park, 25 Zoo Rd, Toronto, ON M1B 5W8, Canada'],
+        ['Cavendish Beach, Prince Edward Island', 'Popular beach on the north shore, known for its red sand and dunes.', "Cavendish Beach, Prince Edward Island National Park, 590 Graham's Ln, Cavendish, PE C0A 1M0, Canada"],
+        ['Nunavut, Nunavut', "Canada's newest territory, known for its vast Arctic landscapes and Inuit culture.", 'Nunavut, Canada'],
+        ['Gulf Islands, British Columbia', 'Archipelago with diverse ecosystems, artisan communities, and outdoor activities.', 'Gulf Islands, British Columbia, Canada'],
+        ['Rideau Canal, Ontario', 'UNESCO World Heritage site, historic canal, and winter skating route in Ottawa.', 'Rideau Canal, Ottawa, ON, Canada'],
+        ['Wapusk National Park, Manitoba', 'Protected area known for its polar bear maternity denning area and northern lights.', 'Wapusk National Park, Manitoba R0B 0E0, Canada'],
+        ['Prince Rupert, British Columbia', 'Coastal city with fishing, outdoor adventures, and the scenic Khutzeymateen Grizzly Bear Sanctuary.', 'Prince Rupert, BC, Canada'],
+        ['Crowsnest Pass, Alberta/British Columbia', 'Mountain pass with hiking trails, waterfalls, and historic coal mining sites.', 'British Columbia, Canada'],
+        ['St. Lawrence Market, Toronto', 'Historic market with fresh produce, artisanal products, and diverse culinary offerings.', 'Toronto, ON M5E 1C3, Canada'],
+        ['Mistaken Point, Newfoundland and Labrador', 'UNESCO World Heritage site with fossilized Ediacaran biota.', 'Mistaken Point, Newfoundland and Labrador A0A 4B0, Canada'],
+        ['Waterton Lakes National Park, Alberta', 'Scenic national park known for its mountain landscapes, lakes, and the Prince of Wales Hotel.', 'Waterton Lakes National Park of Canada, Waterton Park, AB T0K 2M0, Canada'],
+        ['Joggins Fossil Cliffs, Nova Scotia', 'UNESCO World Heritage site with exposed layers of fossils from the Coal Age.', '100 Main St, Joggins, NS B0L 1A0, Canada'],
+        ['Okotoks Erratic, Alberta', 'Large glacial erratic rock, a natural landmark near the town of Okotoks.', 'AB-7, Black Diamond, AB T0L 0H0, Canada'],
+        ['Manitoulin Island, Ontario', 'Largest freshwater island in the world, known for its indigenous culture and outdoor activities.', 'Manitoulin Island, Manitoulin District, ON, Canada'],
+        ['Haida Gwaii, British Columbia', 'Archipelago with rich indigenous heritage, wildlife, and Haida totem poles.', 'Haida Gwaii, North Coast, BC, Canada'],
+        ['Fortress of Louisbourg, Nova Scotia', 'Historic fortress with costumed interpreters, recreating life in the 18th century.', 'Fortress Of Louisbourg, Cape Breton Regional Municipality, NS, Canada'],
+        ['Toronto Islands, Ontario', 'Island getaway with beaches, parks, and panoramic views of the Toronto skyline.', 'Toronto Islands, St Lawrence-East Bayfront-The Islands, ON, Canada'],
+        ['The Forks, Winnipeg', 'Historic meeting place at the confluence of the Red and Assiniboine Rivers, with shops and entertainment.', 'The Forks, Winnipeg, MB, Canada'],
+        ['Okanagan Valley, British Columbia', 'Wine region with vineyards, orchards, and scenic views of Okanagan Lake.', 'Okanagan Lake, British Columbia, Canada'],
+        ['Wood Buffalo National Park, Alberta/Northwest Territories', "Canada's largest national park, known for bison, landscapes, and the Peace-Athabasca Delta.", 'Wood Buffalo National Park of Canada, Canada'],
+        ['Grande Prairie, Alberta', 'City in northern Alberta with parks, museums, and outdoor recreation.', 'Grande Prairie, AB, Canada'],
+        ['Elk Island National Park, Alberta', 'Protected area known for its herds of bison, elk, and other wildlife.', 'Elk Island National Park, Improvement District No. 13, AB T0B, Canada'],
+    ],
+}
+
+list_of_hotels = {
+    "armenia": [
+        ['Marriott Hotel Yerevan', 'Luxury hotel in the heart of Yerevan with modern amenities.', '1 Amiryan St, Yerevan 0010, Armenia'],
+        ['Radisson Blu Hotel, Yerevan', 'Contemporary hotel offering comfortable rooms and a rooftop restaurant.', '2, 2 Azatutyan Ave, Yerevan 0037, Armenia'],
+        ['Ararat Hotel, Yerevan', 'Centrally located hotel with a blend of modern and traditional Armenian design.', '7 Grigor Lusavorich Street, Yerevan 0015, Armenia'],
+        ['Republica Hotel Yerevan', 'Boutique hotel known for its stylish decor and personalized service.', '7, 1 Amiryan St, Yerevan 0010, Armenia'],
+        ['Golden Palace Hotel Yerevan', 'Five-star hotel with elegant rooms and a spa, located near Victory Park.', '11 Hyusisayin poghota, Yerevan 0010, Armenia'],
+        ['Latar Hotel Complex, Tsaghkadzor', 'Resort in the mountains offering panoramic views and recreational facilities.', 'Tsaghkadzor 2310, Armenia'],
+        ['Tsaghkahovit Hotel, Tsaghkadzor', 'Comfortable hotel with a mountainous backdrop and easy access to ski resorts.', '25 Tandzaghbyur St, Tsaghkadzor 2310, Armenia'],
+        ['Ani Plaza Hotel, Yerevan', 'Well-established hotel in the city center, known for its hospitality.', '19 Sayat-Nova Ave, Yerevan 0001, Armenia'],
+        ['Multi Grand Pharaon Hotel, Yerevan', 'Luxurious hotel with a casino, spa, and upscale dining options.', 'Yerevan-Abovyan, 5 M4, Armenia'],
+        ['Armenia Marriott Hotel Yerevan', 'Modern hotel with spacious rooms and a rooftop pool.', '1 Amiryan St, Yerevan 0010, Armenia'],
+        ['Avan Marak Tsapatagh Hotel, Lake Sevan', 'Scenic hotel on the shores of Lake Sevan, offering a tranquil retreat.', 'Tsapatagh 1611, Armenia'],
+        ['Hotel Artsakh, Stepanakert', 'Comfortable hotel in the capital of Nagorno-Karabakh, with modern amenities.', 'Armenia'],
+        ['Hotel National, Yerevan', 'Centrally located hotel with a blend of traditional and contemporary design.', '4, 3 Amiryan St, Yerevan 0010, Armenia'],
+        ['Tsapatagh Hotel, Lake Sevan', 'Lakefront hotel with comfortable accommodations and stunning views.', 'Tsapatagh 1611, Armenia'],
+        ['Congress Hotel, Yerevan', 'Elegant hotel in the city center, suitable for business and leisure travelers.', '1 Italiayi pokhoc, Yerevan 0010, Armenia'],
+        ['Best Western Plus Congress Hotel, Yerevan', 'Modern hotel with a range of amenities and a central location.', '1 Italiayi pokhoc, Yerevan 0010, Armenia'],
+        ['Armenian Royal Palace, Yerevan', 'Chic hotel with spacious rooms and a rooftop terrace.', '17, 1 4-th St, Yerevan 0029, Armenia'],
+        ['Tufenkian Historic Yerevan Hotel', 'Boutique hotel with a focus on Armenian heritage and craftsmanship.', '48 Hanrapetutyan pokhots, Yerevan 0010, Armenia'],
+        ['Park Resort Aghveran, Aghveran', 'Resort in a picturesque mountain setting, ideal for relaxation.', 'H5, Aghveran 2503, Armenia'],
+        ['Dilijan Resort, Dilijan', 'Hotel and spa in the scenic town of Dilijan, surrounded by forests.', '66 Getapnya St, Dilijan, Armenia'],
+        ['Ararat Resort, Jermuk', 'Health resort in Jermuk known for its thermal springs and wellness facilities.', 'Jermuk, Armenia'],
+        ['Royal Tulip Grand Hotel Yerevan', 'Luxury hotel with a stylish design and upscale amenities.', '14 Abovyan poxoc, Yerevan 0001, Armenia'],
+        ['Villa Delenda, Yerevan', 'Cozy boutique hotel offering personalized service and a unique atmosphere.', '22 Yeznik Koghbatsi St, Yerevan, Armenia'],
+        ['Nairi Hotel, Yerevan', 'Centrally located hotel with comfortable rooms and a restaurant serving Armenian cuisine.', '121, 7 Armenak Armenakyan St, Yerevan 0047, Armenia'],
+        ['Europe Hotel Yerevan', 'Modern hotel with spacious rooms and a rooftop bar.', '38 Hanrapetutyan pokhots, Yerevan 0010, Armenia'],
+        ['Best Western Arthotel, Yerevan', 'Contemporary hotel with artistic decor and a central location.', '173 alley Zavarian St, Yerevan, Armenia'],
+        ['Lalaner Hotel, Yerevan', 'Boutique hotel in the city center, known for its attention to detail.', 'Yerevan, Armenia'],
+        ['Aghveran Ararat Resort, Aghveran', 'Mountain resort with comfortable accommodations and recreational facilities.', '11 Antarayin St, Arzakan 2503, Armenia'],
+        ['Tufenkian Avan Dzoraget Hotel', 'Riverside hotel in Dzoraget with a focus on Armenian hospitality.', 'Dzoraget, Armenia'],
+        ['Elysium Gallery Hotel, Yerevan', 'Art-themed hotel with unique decor and an emphasis on cultural experiences.', '75 0002, 5, Եզնիկ Կողբացու փողոց, Երևան, Armenia'],
+        ['Vardan Resort, Dilijan', 'Eco-friendly resort in Dilijan offering a peaceful retreat.', 'Dilijan, Armenia'],
+        ['Armenia Hotel, Yerevan', 'Mid-range hotel with a convenient location and comfortable rooms.', 'Yerevan, Armenia'],
+        ['Tsaghkadzor Marriott Hotel', 'Luxury hotel in Tsaghkadzor with a spa, indoor pool, and scenic views.', 'Tandzaghpyur Street 2, 4/1, Tsaghkadzor 2310, Armenia'],
+        ['Tsaghkahovit Hotel, Tsaghkadzor', 'Comfortable hotel with a mountainous backdrop and easy access to ski resorts.', '25 Tandzaghbyur St, Tsaghkadzor 2310, Armenia'],
+        ['Ani Plaza Hotel, Yerevan', 'Well-established hotel in the city center, known for its hospitality.', '19 Sayat-Nova Ave, Yerevan 0001, Armenia'],
+        ['Multi Grand Pharaon Hotel, Yerevan', 'Luxurious hotel with a casino, spa, and upscale dining options.', 'Yerevan-Abovyan, 5 M4, Armenia'],
+        ['Armenia Marriott Hotel Yerevan', 'Modern hotel with spacious rooms and a rooftop pool.', '1 Amiryan St, Yerevan 0010, Armenia'],
+        ['Avan Marak Tsapatagh Hotel, Lake Sevan', 'Scenic hotel on the shores of Lake Sevan, offering a tranquil retreat.', 'Tsapatagh 1611, Armenia'],
+        ['Hotel Artsakh, Stepanakert', 'Comfortable hotel in the capital of Nagorno-Karabakh, with modern amenities.', 'Armenia'],
+        ['Hotel National, Yerevan', 'Centrally located hotel with a blend of traditional and contemporary design.', '4, 3 Amiryan St, Yerevan 0010, Armenia'],
+        ['Tsapatagh Hotel, Lake Sevan', 'Lakefront hotel with comfortable accommodations and stunning views.', 'Tsapatagh 1611, Armenia'],
+        ['Congress Hotel, Yerevan', 'Elegant hotel in the city center, suitable for business and leisure travelers.', '1 Italiayi pokhoc, Yerevan 0010, Armenia'],
+        ['Best Western Plus Congress Hotel, Yerevan', 'Modern hotel with a range of amenities and a central location.', '1 Italiayi pokhoc, Yerevan 0010, Armenia'],
+        ['Armenian Royal Palace, Yerevan', 'Chic hotel with spacious rooms and a rooftop terrace.', '17, 1 4-th St, Yerevan 0029, Armenia'],
+        ['Tufenkian Historic Yerevan Hotel', 'Boutique hotel with a focus on Armenian heritage and craftsmanship.', '48 Hanrapetutyan pokhots, Yerevan 0010, Armenia'],
+        ['Park Resort Aghveran, Aghveran', 'Resort in a picturesque mountain setting, ideal for relaxation.', 'H5, Aghveran 2503, Armenia'],
+        ['Dilijan Resort, Dilijan', 'Hotel and spa in the scenic town of Dilijan, surrounded by forests.', '66 Getapnya St, Dilijan, Armenia'],
+        ['Ararat Resort, Jermuk', 'Health resort in Jermuk known for its thermal springs and wellness facilities.', 'Jermuk, Armenia'],
+        ['Royal Tulip Grand Hotel Yerevan', 'Luxury hotel with a stylish design and upscale amenities.', '14 Abovyan poxoc, Yerevan 0001, Armenia'],
+        ['Villa Delenda, Yerevan', 'Cozy boutique hotel offering personalized service and a unique atmosphere.', '22 Yeznik Koghbatsi St, Yerevan, Armenia'],
+        ['Nairi Hotel, Yerevan', 'Centrally located hotel with comfortable rooms and a restaurant serving Armenian cuisine.', '121, 7 Armenak Armenakyan St, Yerevan 0047, Armenia'],
+        ['Europe Hotel Yerevan', 'Modern hotel with spacious rooms and a rooftop bar.', '38 Hanrapetutyan pokhots, Yerevan 0010, Armenia'],
+        ['Best Western Arthotel, Yerevan', 'Contemporary hotel with artistic decor and a central location.', '173 alley Zavarian St, Yerevan, Armenia'],
+        ['Lalaner Hotel, Yerevan', 'Boutique hotel in the city center, known for its attention to detail.', 'Yerevan, Armenia'],
+        ['Aghveran Ararat Resort, Aghveran', 'Mountain resort with comfortable accommodations and recreational facilities.', '11 Antarayin St, Arzakan 2503, Armenia'],
+        ['Tufenkian Avan Dzoraget Hotel', 'Riverside hotel in Dzoraget with a focus on Armenian hospitality.', 'Dzoraget, Armenia'],
+        ['Elysium Gallery Hotel, Yerevan', 'Art-themed hotel with unique decor and an emphasis on cultural experiences.', '75 0002, 5, Եզնիկ Կողբացու փողոց, Երևան, Armenia']
+    ],
+    "france": [
+        ['Hotel Plaza Athénée, Paris', 'Luxury hotel on Avenue Montaigne, known for its elegance and opulent accommodations.', '25 Av. Montaigne, 75008 Paris, France'],
+        ['Le Bristol Paris', 'Historic palace hotel with a Michelin-starred restaurant, located on Rue du Faubourg Saint-Honoré.', '112 Rue du Faubourg Saint-Honoré, 75008 Paris, France'],
+        ['Hôtel de Crillon, Paris', 'Iconic hotel with a rich history, situated at Place de la Concorde.', '10 Pl. de la Concorde, 75008 Paris, France'],
+        ['Ritz Paris', 'Legendary hotel with a prestigious reputation, located in the heart of Paris.', '15 Pl. Vendôme, 75001 Paris, France'],
+        ['InterContinental Bordeaux Le Grand Hôtel', 'Grand hotel in Bordeaux, overlooking the Place de la Comédie.', '2-5 Pl. de la Comédie, 33000 Bordeaux, France'],
+        ['Hôtel Martinez, Cannes', 'Art Deco hotel on the Croisette, offering stunning views of the Mediterranean.', 'PR, 73 Bd de la Croisette, 06400 Cannes, France'],
+        ['La Réserve Paris Hotel and Spa', 'Luxurious hotel near the Eiffel Tower, known for its chic design.', '42 Av. Gabriel, 75008 Paris, France'],
+        ['Cheval Blanc St-Tropez', 'Elegant hotel in Saint-Tropez with a private beach and lavish amenities.', 'Plage de la Bouillabaisse, 83990 Saint-Tropez, France'],
+        ['Four Seasons Hotel George V, Paris', 'Five-star hotel near the Champs-Élysées, renowned for its luxury and service.', '31 Av. George V, 75008 Paris, France'],
+        ['Hotel du Cap-Eden-Roc, Antibes', 'Iconic hotel on the French Riviera, known for its glamour and scenic location.', '167-165 Bd J. F. Kennedy, 06160 Antibes, France'],
+        ['Le Meurice, Paris', 'Historic palace hotel with a prime location near the Louvre and Tuileries Garden.', '228 Rue de Rivoli, 75001 Paris, France'],
+        ["Château de la Chèvre d'Or, Èze", 'Luxury hotel on the French Riviera, offering panoramic views of the Mediterranean.', 'Rue du Barri, 06360 Èze, France'],
+        ['Le Royal Monceau – Raffles Paris', 'Contemporary hotel near the Arc de Triomphe, known for its art collection.', '37 Av. Hoche, 75008 Paris, France'],
+        ['Hotel Negresco, Nice', 'Historic hotel on the Promenade des Anglais, featuring eclectic decor.', '37 Prom. des Anglais, 06000 Nice, France'],
+        ['Mandarin Oriental, Paris', 'Five-star hotel in the heart of Paris, offering a blend of luxury and sophistication.', '251 Rue Saint-Honoré, 75001 Paris, France'],
+        ['Shangri-La Hotel, Paris', 'Palatial hotel near the Eiffel Tower, known for its Belle Époque architecture.', "10 Av. d'Iéna, 75116 Paris, France"],
+        ['Grand Hôtel Thalasso & Spa, Saint-Jean-de-Luz', 'Seaside hotel and spa in Basque Country, overlooking the Atlantic.', '43 Bd Thiers, 64500 Saint-Jean-de-Luz, France'],
+        ['Le Byblos Saint-Tropez', 'Iconic hotel in Saint-Tropez, known for its celebrity clientele.', '20 Av. Paul Signac, 83990 Saint-Tropez, France'],
+        ['Le Strato, Courchevel', 'Luxury ski-in/ski-out hotel in the French Alps, offering alpine charm.', 'route de, Rue de Bellecôte, 73120 Courchevel, France'],
+        ['Hôtel Barrière Le Majestic, Cannes', 'Elegant hotel on the Croisette, with a private beach and upscale amenities.', '10 Bd de la Croisette, 06400 Cannes, France'],
+        ['Château de Bagnols, Bagnols', 'Historic castle hotel in Beaujolais, surrounded by vineyards.', '118 Pl. de la Mairie, 69620 Bagnols, France'],
+        ["L'Apogée Courchevel", 'Five-star ski resort in Courchevel, featuring luxurious chalet-style accommodations.', '5 Rue Emile Allais, 73120 Courchevel, France'],
+        ['Hôtel Hermitage Monte-Carlo', 'Belle Époque hotel in Monaco, near the Casino de Monte-Carlo.', 'Sq. Beaumarchais, 98000 Monaco'],
+        ['Hôtel Belles Rives, Antibes', 'Art Deco hotel on the French Riviera, once the residence of F. Scott Fitzgerald.', '33 Bd Edouard Baudoin, 06160 Antibes, France'],
+        ['Hôtel Cap-Estel, Èze', "Boutique hotel on the Côte d'Azur, offering breathtaking sea views.", '1312 Av. Raymond Poincaré, 06360 Èze, France'],
+        ['Tiara Miramar Beach Hotel & Spa, Théoule-sur-Mer', 'Luxury hotel overlooking the Mediterranean, with a private beach.', '47 Av. de Miramar, 06590 Théoule-sur-Mer, France'],
+        ['Le Cheval Blanc Courchevel', 'Exclusive ski resort in Courchevel, known for its contemporary design.', 'Le 1947 à Cheval Blanc Le, Rue du Jardin Alpin, 73120 Courchevel, France'],
+        ['Hôtel Le Toiny, St. Barthelemy', 'Elegant beachfront hotel in the Caribbean, offering private villas.', 'Anse de Toiny, Toiny 97133, St Barthélemy'],
+        ['Château Saint-Martin & Spa, Vence', 'Luxury hotel in Provence, set in a historic château with panoramic views.', '2490 Av. des Templiers, 06140 Vence, France'],
+        ['Les Sources de Caudalie, Bordeaux', 'Chic hotel and spa in Bordeaux, surrounded by vineyards.', 'Smith Haut-Lafitte, 33650 Martillac, France'],
+        ['Hôtel de Toiras, Saint-Martin-de-Ré', 'Charming hotel on Île de Ré, known for its historic architecture.', '33 Av. Victor Bouthillier, 17410 Saint-Martin-de-Ré, France'],
+        ['Domaine des Hauts de Loire, Onzain', 'Relais & Châteaux hotel in the Loire Valley, set in a 19th-century hunting lodge.', 'Dom. des Hauts de Loire, 41150 Veuzain-sur-Loire, France'],
+        ['Château Saint-Martin & Spa, Vence', 'Luxury hotel in Provence, set in a historic château with panoramic views.', '2490 Av. des Templiers, 06140 Vence, France'],
+        ['Les Sources de Caudalie, Bordeaux', 'Chic hotel and spa in Bordeaux, surrounded by vineyards.', 'Smith Haut-Lafitte, 33650 Martillac, France'],
+        ['Hôtel de Toiras, Saint-Martin-de-Ré', 'Charming hotel on Île de Ré, known for its historic architecture.', '33 Av. Victor Bouthillier, 17410 Saint-Martin-de-Ré, France'],
+        ['Domaine des Hauts de Loire, Onzain', 'Relais & Châteaux hotel in the Loire Valley, set in a 19th-century hunting lodge.', 'Dom. des Hauts de Loire, 41150 Veuzain-sur-Loire, France'],
+        ['Le Mas Candille, Mougins', 'Luxury hotel and spa in the hills of Mougins, near Cannes.', '172 Bd Clément Rebuffel, 06250 Mougins, France'],
+        ['Hôtel Lutetia, Paris', 'Iconic Left Bank hotel in Paris, known for its Art Deco style.', '45 Bd Raspail, 75006 Paris, France'],
+        ["Les Prés d'Eugénie - Michel Guérard", 'Luxury spa hotel in Eugénie-les-Bains, offering gourmet cuisine.', 'France'],
+        ['Le Château de la Gaude, Aix-en-Provence', 'Historic castle hotel in Provence, surrounded by a vineyard.', '3959 Rte des Pinchinats, 13100 Aix-en-Provence, France'],
+        ["L'Auberge de l'Ill, Illhaeusern", 'Michelin-starred hotel and restaurant in Alsace, known for its culinary excellence.', "2 Rue de Collonges au Mont d'Or, 68970 Illhaeusern, France"],
+        ['Château de Mercuès, Mercuès', 'Castle hotel in the Cahors vineyards, overlooking the Lot River.', 'Château de Mercuès, 46090 Mercuès, France'],
+        ['Le Couvent des Minimes Hôtel & Spa, Mane', 'Historic convent turned luxury hotel in the heart of Provence.', 'Chemin des jeux de Mai, 04300 Mane, France'],
+        ['Hotel Crillon le Brave, Crillon-le-Brave', 'Charming hotel in a hilltop village in the Vaucluse region.', "Place de l'Eglise, 84410 Crillon-le-Brave, France"],
+        ['La Bastide de Gordes', 'Luxury hotel in Gordes, perched on a hill in the Luberon.', '61 Rue de la Combe, 84220 Gordes, France'],
+        ['Hotel Bel Ami, Paris', 'Chic hotel in Saint-Germain-des-Prés, known for its modern design.', '7 Rue Saint-Benoît, 75006 Paris, France'],
+        ['Le Grand Hôtel Cabourg - MGallery', 'Belle Époque hotel on the Normandy coast, overlooking the sea.', 'Les Jardins Du Casino, 14390 Cabourg, France'],
+        ["L'Hotel, Paris", 'Historic hotel in Saint-Germain-des-Prés, once the residence of Oscar Wilde.', '13 Rue des Beaux Arts, 75006 Paris, France'],
+        ['Hôtel La Mirande, Avignon', 'Charming hotel in Avignon, near the Palais des Papes.', "4 Pl. de l'Amirande, 84000 Avignon, France"]
+    ],
+    "italy": [
+        ['Hotel Danieli, Venice', "Iconic luxury hotel near St. Mark's Square, known for its opulent decor.", 'Riva degli Schiavoni, 4196, 30122 Venezia VE, Italy'],
+        ['Grand Hotel Tremezzo, Lake Como', 'Elegant hotel on the shores of Lake Como with panoramic views.', 'Via Regina, 8, 22016 Tremezzina CO, Italy'],
+        ['Hotel Hassler, Rome', 'Luxury hotel atop the Spanish Steps, offering classic Roman hospitality.', 'Piazza della Trinità dei Monti, 6, 00187 Roma RM, Italy'],
+        ['Belmond Hotel Caruso, Ravello', 'Historic cliffside hotel on the Amalfi Coast with stunning views.', 'Piazza S. Giovanni del Toro, 2, 84010 Ravello SA, Italy'],
+        ['Gritti Palace, Venice', 'Venetian palace turned luxury hotel along the Grand Canal.', 'Campo Santa Maria Del Giglio, 2467, 30124 Venezia VE, Italy'],
+        ['Il Pellicano, Porto Ercole', 'Chic seaside hotel in Tuscany with a focus on relaxation and style.', 'Località Sbarcatello, 58019 Porto Ercole GR, Italy'],
+        ['Hotel Eden, Rome', 'Sophisticated hotel near the Spanish Steps with a rooftop terrace.', 'Via Ludovisi, 49, 00187 Roma RM, Italy'],
+        ['JK Place Capri', 'Stylish boutique hotel on the island of Capri, blending modern and classic design.', 'Via Marina Grande, 225, 80073 Capri NA, Italy'],
+        ['Palazzo Avino, Ravello', 'Luxury hotel on the Amalfi Coast, known for its Michelin-starred restaurant.', 'Via S. Giovanni del Toro, 28, 84010 Ravello SA, Italy'],
+        ["Villa d'Este, Lake Como", 'Grand hotel on the shores of Lake Como, surrounded by beautiful gardens.', 'Via Regina, 40, 22012 Cernobbio CO, Italy'],
+        ['Borgo Egnazia, Savelletri di Fasano', 'Luxury resort in Puglia with traditional architecture and modern amenities.', 'Strada Comunale Egnazia 72015, 72015 Savelletri BR, Italy'],
+        ['Hotel Santa Caterina, Amalfi', 'Cliffside hotel on the Amalfi Coast with breathtaking views of the Mediterranean.', 'Via Mauro Comite, 9, 84011 Amalfi SA, Italy'],
+        ['Baglioni Hotel Regina, Rome', 'Elegant hotel near Villa Borghese with luxurious accommodations.', 'Via Vittorio Veneto, 72, 00187 Roma RM, Italy'],
+        ['Monastero Santa Rosa, Conca dei Marini', 'Former monastery turned boutique hotel on the Amalfi Coast.', 'Via Roma, 2, 84010 Conca dei Marini SA, Italy'],
+        ["Ca' Sagredo Hotel, Venice", 'Historic palace on the Grand Canal, now a luxury hotel.', 'Campo Santa Sofia, 4198/99, 30121 Venezia VE, Italy'],
+        ['Villa Cora, Florence', 'Grand villa in Florence with opulent interiors and a beautiful garden.', 'Viale Machiavelli, 18, 50125 Firenze FI, Italy'],
+        ['JK Place Roma', 'Chic boutique hotel in the heart of Rome, known for its stylish design.', "Via di Monte d'Oro, 30, 00186 Roma RM, Italy"],
+        ["Castello di Casole, Casole d'Elsa", 'Luxury hotel in a restored Tuscan castle with panoramic views.', "Località Querceto, 53031 Casole D'elsa SI, Italy"],
+        ['Il San Pietro di Positano', 'Clifftop hotel on the Amalfi Coast with a private beach.', 'Via Laurito, 2, 84017 Positano SA, Italy'],
+        ['Portrait Firenze, Florence', 'Luxury hotel along the Arno River, offering personalized service.', 'Lungarno degli Acciaiuoli, 4, 50123 Firenze FI, Italy'],
+        ['Villa & Palazzo Aminta, Stresa', 'Elegant hotel on Lake Maggiore with a spa and lakeside dining.', 'Via Sempione Nord, 123, 28838 Stresa VB, Italy'],
+        ['Belmond Hotel Splendido, Portofino', 'Iconic hotel overlooking the harbor in Portofino.', 'Via Roma, 2, 16034 Portofino GE, Italy'],
+        ['Il Sereno, Lake Como', 'Contemporary lakefront hotel with sleek design and upscale amenities.', 'Via Torrazza, 10, 22020 Torno CO, Italy'],
+        ['NH Collection Grand Hotel Convento di Amalfi', 'Former monastery turned luxury hotel on the Amalfi Coast.', 'SS163, 8, 84011 Amalfi SA, Italy'],
+        ['CastaDiva Resort & Spa, Lake Como', 'Luxury resort on Lake Como with a spa and lakeside villas.', 'Via E. Caronti, 69, 22020 Blevio CO, Italy'],
+        ['JK Place Firenze, Florence', 'Stylish boutique hotel in Florence, blending modern and classic elements.', 'P.za di Santa Maria Novella, 7, 50123 Firenze FI, Italy'],
+        ['Belmond Villa San Michele, Florence', 'Former monastery turned luxury hotel with beautiful gardens.', 'Via Doccia, 4, 50014 Fiesole FI, Italy'],
+        ['La Posta Vecchia Hotel, Ladispoli', 'Historic villa near Rome, overlooking the Tyrrhenian Sea.', 'Palo Laziale, Via Palo Laziale, 00055 Ladispoli RM, Italy'],
+        ['Il Borro, San Giustino Valdarno', 'Medieval village turned luxury resort in Tuscany.', 'Il Borro, Località Borro, 1, 52024 Loro Ciuffenna AR, Italy'],
+        ['Bauer Palazzo, Venice', 'Luxury hotel in the heart of Venice, near Piazza San Marco.', 'P.za San Marco, 1459, 30124 Venezia VE, Italy'],
+        ['Rome Cavalieri, A Waldorf Astoria Hotel', 'Luxurious hotel in Rome with panoramic views of the city.', 'Via Alberto Cadlolo, 101, 00136 Roma RM, Italy'],
+        ['Castello Banfi - Il Borgo, Montalcino', 'Castle hotel and winery in the heart of Tuscany.', 'castello di, 53024 Poggio alle Mura SI, Italy'],
+        ['Palazzo Margherita, Bernalda', "Francis Ford Coppola's boutique hotel in a small Italian town.", 'Corso Umberto I, 64, 75012 Bernalda MT, Italy'],
+        ['JK Capri', 'Stylish boutique hotel on the island of Capri, with a Mediterranean flair.', 'Via Marina Grande, 225, 80073 Capri NA, Italy'],
+        ['Aman Venice', 'Luxurious Aman resort in a historic palazzo on the Grand Canal.', 'Palazzo Papadopoli, Calle Tiepolo, 1364, 30125 Venezia VE, Italy'],
+        ["L'Albereta Relais & Châteaux, Erbusco", 'Charming hotel in Franciacorta with a focus on wellness and gourmet dining.', 'Via Vittorio Emanuele, 23, 25030 Erbusco BS, Italy'],
+        ['Villa del Parco & Spa, Forte Village', 'Luxury resort in Sardinia with a spa and private beach.', 'S.S. 195, Km 39.600, 09010 Pula CA, Italy'],
+        ['San Clemente Palace Kempinski, Venice', 'Private island resort in Venice with lush gardens.', 'isola S. clemente, 1/1, 30124 Venezia VE, Italy'],
+        ['Villa La Massa, Florence', 'Renaissance villa on the banks of the Arno River.', 'Villa la Massa, Via della Massa, 24, 50012 Candeli FI, Italy'],
+        ['Borgo Santo Pietro, Chiusdino', 'Luxury retreat in Tuscany with a farm-to-table philosophy.', 'Borgo Santo Pietro, 110, Loc, Località Palazzetto, 110, 53012 Palazzetto SI, Italy'],
+        ['Le Sirenuse, Positano', 'Charming hotel on the Amalfi Coast with a panoramic terrace.', 'Sirenuses, Italy'],
+        ['Villa La Coste, Le Puy-Sainte-Réparade', 'Contemporary hotel and vineyard in Provence.', '2750 Route de la Cride, 13610 Le Puy-Sainte-Réparade, France'],
+        ['Il Castelfalfi - TUI BLUE SELECTION, Montaione', 'Tuscan resort with a golf course and spa.', '50050 Castelfalfi FI, Italy'],
+        ['Hotel de Russie, Rome', 'Elegant hotel near the Spanish Steps with a beautiful garden.', 'Via del Babuino, 9, 00187 Roma RM, Italy'],
+        ['Verdura Resort, Sciacca', 'Luxury resort in Sicily with golf courses and sea views.', 'S.S. 115, Km 131, 92019 Sciacca AG, Italy'],
+        ['Bvlgari Hotel Milano', 'Stylish hotel in Milan, known for its sophisticated design.', 'Via Privata Fratelli Gabba, 7B, 20121 Milano MI, Italy']
+    ],
+    "spain": [
+        ['Hotel Ritz Madrid', 'Luxurious historic hotel with elegant rooms and fine dining.', 'Pl. de la Lealtad, 5, Retiro, 28014 Madrid, Spain'],
+        ['Mandarin Oriental Barcelona', 'Exclusive hotel offering chic accommodations and a spa.', "Pg. de Gràcia, 38-40, L'Eixample, 08007 Barcelona, Spain"],
+        ['Hotel Maria Cristina, a Luxury Collection Hotel, San Sebastian', 'Grand hotel with classic style and excellent service.', 'República Argentina K., 4, 20004 Donostia, Gipuzkoa, Spain'],
+        ['Gran Hotel Bahía del Duque, Tenerife', 'Five-star resort with lavish amenities and beautiful gardens.', 'Av. de Bruselas, s/n, 38660 Costa Adeje, Santa Cruz de Tenerife, Spain'],
+        ['The Westin Palace Madrid', 'Iconic hotel known for its sophistication and central location.', 'Pl. de las Cortes, 7, Centro, 28014 Madrid, Spain'],
+        ['W Barcelona', 'Stylish beachfront hotel offering modern rooms and vibrant nightlife.', 'Plaça Rosa Del Vents 1, Final, Pg. de Joan de Borbó, Ciutat Vella, 08039 Barcelona, Spain'],
+        ['Hotel Alfonso XIII, a Luxury Collection Hotel, Seville', 'Historic hotel featuring Andalusian architecture and top-notch service.', 'C. San Fernando, 2, Casco Antiguo, 41004 Sevilla, Spain'],
+        ['Barceló Raval, Barcelona', 'Contemporary hotel with panoramic city views and a rooftop pool.', 'Rambla del Raval, 17, 21, Ciutat Vella, 08001 Barcelona, Spain'],
+        ['Hotel Arts Barcelona', 'Modern waterfront hotel with sleek design and a luxurious spa.', 'Carrer de la Marina, 19-21, Ciutat Vella, 08005 Barcelona, Spain'],
+        ['Parador de Santiago de Compostela', 'Unique hotel housed in a historic building on the Camino de Santiago.', 'Praza do Obradoiro, 1, 15705 Santiago de Compostela, A Coruña, Spain'],
+        ['Hilton Diagonal Mar Barcelona', 'Upscale hotel with spacious rooms and close proximity to the beach.', 'Pg. del Taulat, 262, 264, Sant Martí, 08019 Barcelona, Spain'],
+        ['Hotel Hesperia Madrid', 'Elegant hotel offering refined accommodations and gourmet dining.', 'P.º de la Castellana, 57, Chamberí, 28046 Madrid, Spain'],
+        ['The Principal Madrid Hotel', 'Chic boutique hotel with stylish rooms and a rooftop terrace.', 'C. del Marqués de Valdeiglesias, 1, Centro, 28004 Madrid, Spain'],
+        ['Barceló Málaga', 'Futuristic hotel known for its innovative design and modern amenities.', 'Barceló, Carretera de Cádiz, 29003 Málaga, Spain'],
+        ['Hotel Wellington, Madrid', 'Classic hotel with a renowned restaurant and sophisticated atmosphere.', 'C. de Velázquez, 8, Salamanca, 28001 Madrid, Spain'],
+        ['Eurostars Madrid Tower', 'Sleek hotel set in a skyscraper offering panoramic city views.', 'Hotel Eurostars Madrid Tower, Fuencarral-El Pardo, Madrid, Spain'],
+        ['Hotel Maria Elena Palace, Madrid', 'Traditional hotel with a central location and comfortable rooms.', 'C. de Esparteros, 1, Centro, 28012 Madrid, Spain'],
+        ['Meliá Barcelona Sarrià', 'Contemporary hotel with a focus on wellness and relaxation.', 'Av. de Sarrià, 50, Les Corts, 08029 Barcelona, Spain'],
+        ['Hotel Valencia Center', 'Modern hotel known for its excellent service and convenient location.', 'Av. de França, 33, Camins al Grau, 46023 València, Valencia, Spain'],
+        ['NH Collection Madrid Eurobuilding', 'Stylish hotel offering spacious accommodations and a wellness center.', 'C. del Padre Damián, 23, Chamartín, 28036 Madrid, Spain'],
+        ['Hotel Silken Puerta América Madrid', 'Unique hotel featuring rooms designed by international architects.', 'Av. de América, 41, Chamartín, 28002 Madrid, Spain'],
+        ['Hotel Santo Mauro, Autograph Collection, Madrid', 'Historic mansion turned into an elegant luxury hotel.', 'Calle de Zurbano, 36, Chamberí, 28010 Madrid, Spain'],
+        ['Vincci Selección La Plantación del Sur, Tenerife', 'Tranquil hotel with colonial-style architecture and lush gardens.', 'C. Roque Nublo, 1, 38670 Costa Adeje, Santa Cruz de Tenerife, Spain'],
+        ['Meliá Palma Bay', 'Modern hotel with sleek design and views of Palma Bay.', 'Carrer de Felicià Fuster, 4, Llevant, 07006 Palma, Illes Balears, Spain'],
+        ['Hotel Las Arenas Balneario Resort, Valencia', 'Beachfront resort offering a spa and Mediterranean cuisine.', "C/ d'Eugènia Viñes, 22, 24, Poblados Marítimos, 46011 València, Valencia, Spain"],
+        ['Hotel Marqués de Riscal, a Luxury Collection Hotel, Elciego', 'Distinctive hotel in a winery known for its avant-garde design.', 'C. Torrea Kalea, 1, 01340 Elciego, Álava, Spain'],
+        ['AC Hotel Carlton Madrid', 'Sophisticated hotel with contemporary design and a fitness center.', 'Paseo de las Delicias, 26, Arganzuela, 28045 Madrid, Spain'],
+        ['Gran Meliá Fénix, Madrid', 'Iconic hotel featuring luxurious accommodations and personalized service.', 'C. de Hermosilla, 2, Salamanca, 28001 Madrid, Spain'],
+        ['Princesa Yaiza Suite Hotel Resort, Lanzarote', 'Family-friendly resort with multiple pools and direct beach access.', 'Av. de Papagayo, 22, 35580 Playa Blanca, Las Palmas, Spain'],
+        ['Hotel Rey Juan Carlos I, a Marriott Hotel, Barcelona', 'Upscale hotel set in expansive gardens with a resort-like ambiance.', 'Av. Diagonal, 661 671, Les Corts, 08028 Barcelona, Spain'],
+        ['Barceló Sevilla Renacimiento', 'Modern hotel with spacious rooms near the Guadalquivir River.', 'Av. Álvaro Alonso Barba, s/n, 41092 Sevilla, Spain'],
+        ['The St. Regis Mardavall Mallorca Resort', 'Luxurious resort with a spa and beautiful sea views.', "Ma-1, 19, 07181 Costa d'en Blanes, Illes Balears, Spain"],
+        ['Melia Madrid Serrano', "Elegant hotel in Madrid's Salamanca district known for its sophistication.", 'C. de Claudio Coello, 139, Salamanca, 28006 Madrid, Spain'],
+        ['Parador de Granada', 'Historic hotel set within the Alhambra Palace complex.', 'C. Real de la Alhambra, s/n, Centro, 18009 Granada, Spain'],
+        ['Hotel España Ramblas', "Boutique hotel with modernist design on Barcelona's famous Las Ramblas.", 'C/ de Sant Pau, 9-11, Ciutat Vella, 08001 Barcelona, Spain'],
+        ['Silken Al-Andalus Palace Hotel, Seville', 'Large hotel with extensive gardens and pools.', 'Av. de la Palmera, s/n, 41012 Sevilla, Spain'],
+        ['Iberostar Grand Hotel Portals Nous, Mallorca', 'Adults-only hotel featuring a spa and contemporary design.', 'Carrer Falconer, 19, 07181 Portals Nous, Illes Balears, Spain'],
+        ['Eurostars Madrid Gran Vía', 'Centrally located hotel with modern amenities and stylish rooms.', 'C. de Leganitos, 13, Centro, 28013 Madrid, Spain'],
+        ['Hotel Marqués de la Ensenada, Valladolid', 'Charming boutique hotel in a historic building.', 'Av. de Gijón, 1, 47009 Valladolid, Spain'],
+        ['Gran Hotel Miramar, Málaga', 'Historic hotel offering opulent accommodations and a spa.', 'P.º Reding, 22, 24, Málaga-Este, 29016 Málaga, Spain'],
+        ['Vincci Seleccion Posada del Patio, Málaga', 'Hotel with a unique design built around archaeological remains.', 'Pasillo de Sta. Isabel, 7, Distrito Centro, 29005 Málaga, Spain'],
+        ['Melia Bilbao', 'Modern hotel with avant-garde design near the Guggenheim Museum.', 'Leizaola Lehendakariaren Kalea, 29, Abando, 48011 Bilbo, Bizkaia, Spain'],
+        ['Hotel Villa Magna, Madrid', 'Luxury hotel known for its elegant ambiance and high-end service.', 'P.º de la Castellana, 22, Salamanca, 28046 Madrid, Spain'],
+        ['Hotel Arts Sevilla', 'Contemporary hotel with a rooftop terrace and views of Seville.', 'Seville, Spain'],
+        ['Soho Boutique Opera, Madrid', 'Boutique hotel in the heart of Madrid known for its artistic vibe.', 'C. de las Veneras, 2, Centro, 28013 Madrid, Spain'],
+        ['The Serras, Barcelona', 'Boutique hotel in a historic building overlooking the Port Vell marina.', 'Pg. de Colom, 9, Ciutat Vella, 08002 Barcelona, Spain'],
+        ['Melia Sitges', 'Beachfront hotel in Sitges offering modern amenities and sea views.', 'Carrer de Joan Salvat Papasseit, 38, 08870 Sitges, Barcelona, Spain'],
+        ['Hotel Hospes Palacio del Bailío, Córdoba', 'Historic hotel featuring Roman ruins and a serene courtyard.', 'C. de Ramírez de las Casas Deza, 10, 12, Centro, 14001 Córdoba, Spain'],
+        ['Parador de León', 'Historic hotel housed in a former monastery in the heart of León.', 'Plaza San Marcos, 7, 24001 León, Spain']
+    ],
+    "germany": [
+        ['Hotel Adlon Kempinski, Berlin', 'A luxurious and historic hotel located near Brandenburg Gate, offering opulent rooms and top-notch amenities.', 'Unter den Linden 77, 10117 Berlin, Germany'],
+        ['Schloss Elmau, Bavaria', 'A stunning spa resort nestled in the Bavarian Alps, known for its picturesque location and wellness facilities.', 'In Elmau 2, 82493 Krün, Germany'],
+        ['Hyatt Regency Cologne', 'Located on the Rhine River, this modern hotel in Cologne offers stylish accommodations and panoramic views.', 'Kennedy-Ufer 2A, 50679 Köln, Germany'],
+        ['Hotel Vier Jahreszeiten Kempinski, Munich', 'An elegant hotel in the heart of Munich, combining traditional luxury with modern comfort.', 'Maximilianstraße 17, 80539 München, Germany'],
+        ['Heidelberg Suites Boutique Hotel', 'A boutique hotel overlooking the Neckar River in Heidelberg, known for its intimate atmosphere.', 'Heidelberg, Germany'],
+        ['Hotel Taschenbergpalais Kempinski, Dresden', "A lavish palace hotel in Dresden's historic center, featuring grand architecture and luxurious rooms.", 'Taschenberg 3, 01067 Dresden, Germany'],
+        ['Hotel Eisenhut, Rothenburg ob der Tauber', 'A charming hotel in a historic building, offering a blend of medieval and modern comforts.', 'Herrngasse 3-5/7, 91541 Rothenburg ob der Tauber, Germany'],
+        ['The Westin Hamburg', 'Situated in the Elbphilharmonie building, this hotel in Hamburg provides contemporary luxury and panoramic views.', 'Platz d. Deutschen Einheit 2, 20457 Hamburg, Germany'],
+        ['Bayerischer Hof, Munich', "One of Germany's most famous hotels, Bayerischer Hof offers a mix of tradition and modernity.", 'Promenadepl. 2-6, 80333 München, Germany'],
+        ['Hotel Europäischer Hof, Baden-Baden', 'A spa hotel in the Black Forest, known for its wellness facilities and Belle Époque charm.', 'Baden-Baden, Germany'],
+        ['SIDE Design Hotel Hamburg', "A stylish design hotel in Hamburg's entertainment district, offering modern and comfortable rooms.", 'Drehbahn 49, 20354 Hamburg, Germany'],
+        ['Hotel Elephant, Weimar', 'Located in the heart of Weimar, this historic hotel has hosted famous guests and boasts classic elegance.', 'Markt 19, 99423 Weimar, Germany'],
+        ['Breidenbacher Hof, a Capella Hotel, Düsseldorf', "A luxury hotel on Königsallee, Düsseldorf's premier shopping street, offering personalized service.", 'Königsallee 11, 40212 Düsseldorf, Germany'],
+        ['Adina Apartment Hotel Berlin Hackescher Markt', "A contemporary hotel in Berlin's Mitte district, providing spacious apartments and a central location.", 'Berlin, Germany'],
+        ['Villa Kennedy, Frankfurt', 'A former family villa turned luxury hotel, Villa Kennedy offers a tranquil escape in Frankfurt.', 'Kennedyallee 70, 60596 Frankfurt am Main, Germany'],
+        ['Le Méridien Grand Hotel Nuremberg', 'Situated in the heart of Nuremberg, this hotel combines modern comfort with historic charm.', 'Bahnhofstraße 1-3, 90402 Nürnberg, Germany'],
+        ['Kameha Grand Bonn', 'A design hotel on the banks of the Rhine River, known for its avant-garde architecture and stylish interiors.', 'Am Bonner Bogen 1, 53227 Bonn, Germany'],
+        ['Schlosshotel Kronberg', 'A fairytale castle hotel near Frankfurt, offering elegant rooms and beautiful parkland.', 'Hainstraße 25, 61476 Kronberg im Taunus, Germany'],
+        ['Schloss Hohenkammer', 'A historic castle hotel near Munich, surrounded by picturesque countryside and gardens.', 'Schloßstraße 18-25, 85411 Hohenkammer, Germany'],
+        ['Althoff Grandhotel Schloss Bensberg', 'Perched on a hill near Cologne, this castle hotel offers luxurious rooms and fine dining.', 'Kadettenstraße, 51429 Bergisch Gladbach, Germany'],
+        ['Hotel Nassauer Hof, Wiesbaden', 'A classic hotel in Wiesbaden, known for its spa facilities and historic charm.', 'Kaiser-Friedrich-Platz 3-4, 65183 Wiesbaden, Germany'],
+        ['InterContinental Berchtesgaden Resort', 'A luxury resort in the Bavarian Alps, offering stunning views and upscale amenities.', 'Hintereck 1, 83471 Berchtesgaden, Germany'],
+        ['Steigenberger Frankfurter Hof', 'A traditional luxury hotel in the heart of Frankfurt, known for its timeless elegance.', 'Frankfurt, Germany'],
+        ['Hotel Atlantic Kempinski, Hamburg', 'A grand hotel overlooking Lake Alster, combining classic style with modern amenities.', 'An d. Alster 72-79, 20099 Hamburg, Germany'],
+        ['Romantik Hotel auf der Wartburg, Eisenach', 'A romantic hotel located in a castle overlooking the Thuringian Forest.', 'Romantik Hotel auf der Wartburg, Auf d. Wartburg 2, 99817 Eisenach, Germany'],
+        ['Roomers Baden-Baden, Autograph Collection', 'A chic and modern hotel in Baden-Baden, known for its stylish design and vibrant atmosphere.', 'Lange Str. 100, 76530 Baden-Baden, Germany'],
+        ['Sofitel Munich Bayerpost', 'Situated in a historic post office building, this hotel in Munich offers French luxury and contemporary design.', 'Bayerstraße 12, 80335 München, Germany'],
+        ['Steigenberger Grandhotel Handelshof, Leipzig', "A luxurious hotel in Leipzig's historic district, combining modern comfort with historic charm.", 'Salzgäßchen 6, 04109 Leipzig, Germany'],
+        ['Brenners Park-Hotel & Spa, Baden-Baden', 'A renowned spa hotel in the Black Forest, offering wellness treatments and gourmet dining.', 'Ludwig-Wilhelm-Platz 4, 76530 Baden-Baden, Germany'],
+        ['Hotel Nassauer Hof, Wiesbaden', 'A classic hotel in Wiesbaden, known for its spa facilities and historic charm.', 'Kaiser-Friedrich-Platz 3-4, 65183 Wiesbaden, Germany'],
+        ['InterContinental Berchtesgaden Resort', 'A luxury resort in the Bavarian Alps, offering stunning views and upscale amenities.', 'Hintereck 1, 83471 Berchtesgaden, Germany'],
+        ['Steigenberger Frankfurter Hof', 'A traditional luxury hotel in the heart of Frankfurt, known for its timeless elegance.', 'Frankfurt, Germany'],
+        ['Hotel Atlantic Kempinski, Hamburg', 'A grand hotel overlooking Lake Alster, combining classic style with modern amenities.', 'An d. Alster 72-79, 20099 Hamburg, Germany'],
+        ['Romantik Hotel auf der Wartburg, Eisenach', 'A romantic hotel located in a castle overlooking the Thuringian Forest.', 'Romantik Hotel auf der Wartburg, Auf d. Wartburg 2, 99817 Eisenach, Germany'],
+        ['Roomers Baden-Baden, Autograph Collection', 'A chic and modern hotel in Baden-Baden, known for its stylish design and vibrant atmosphere.', 'Lange Str. 100, 76530 Baden-Baden, Germany'],
+        ['Sofitel Munich Bayerpost', 'Situated in a historic post office building, this hotel in Munich offers French luxury and contemporary design.', 'Bayerstraße 12, 80335 München, Germany'],
+        ['Steigenberger Grandhotel Handelshof, Leipzig', "A luxurious hotel in Leipzig's historic district, combining modern comfort with historic charm.", 'Salzgäßchen 6, 04109 Leipzig, Germany'],
+        ['Brenners Park-Hotel & Spa, Baden-Baden', 'A renowned spa hotel in the Black Forest, offering wellness treatments and gourmet dining.', 'Ludwig-Wilhelm-Platz 4, 76530 Baden-Baden, Germany'],
+        ['Hotel Deutscher Kaiser, Nuremberg', "A charming boutique hotel in Nuremberg's old town, known for its historic ambiance.", 'Königstraße 55, 90402 Nürnberg, Germany'],
+        ['VILA VITA Burghotel Dinklage', 'A medieval-style castle hotel in Lower Saxony, offering a unique and romantic retreat.', 'Burgallee 1, 49413 Dinklage, Germany'],
+        ['Hotel Nassauer Hof, Wiesbaden', 'A classic hotel in Wiesbaden, known for its spa facilities and historic charm.', 'Kaiser-Friedrich-Platz 3-4, 65183 Wiesbaden, Germany'],
+        ['InterContinental Berchtesgaden Resort', 'A luxury resort in the Bavarian Alps, offering stunning views and upscale amenities.', 'Hintereck 1, 83471 Berchtesgaden, Germany'],
+        ['Steigenberger Frankfurter Hof', 'A traditional luxury hotel in the heart of Frankfurt, known for its timeless elegance.', 'Frankfurt, Germany'],
+        ['Hotel Atlantic Kempinski, Hamburg', 'A grand hotel overlooking Lake Alster, combining classic style with modern amenities.', 'An d. Alster 72-79, 20099 Hamburg, Germany'],
+        ['Romantik Hotel auf der Wartburg, Eisenach', 'A romantic hotel located in a castle overlooking the Thuringian Forest.', 'Romantik Hotel auf der Wartburg, Auf d. Wartburg 2, 99817 Eisenach, Germany'],
+        ['Roomers Baden-Baden, Autograph Collection', 'A chic and modern hotel in Baden-Baden, known for its stylish design and vibrant atmosphere.', 'Lange Str. 100, 76530 Baden-Baden, Germany'],
+        ['Sofitel Munich Bayerpost', 'Situated in a historic post office building, this hotel in Munich offers French luxury and contemporary design.', 'Bayerstraße 12, 80335 München, Germany'],
+        ['Steigenberger Grandhotel Handelshof, Leipzig', "A luxurious hotel in Leipzig's historic district, combining modern comfort with historic charm.", 'Salzgäßchen 6, 04109 Leipzig, Germany'],
+        ['Brenners Park-Hotel & Spa, Baden-Baden', 'A renowned spa hotel in the Black Forest, offering wellness treatments and gourmet dining.', 'Ludwig-Wilhelm-Platz 4, 76530 Baden-Baden, Germany'],
+        ['Hotel Deutscher Kaiser, Nuremberg', "A charming boutique hotel in Nuremberg's old town, known for its historic ambiance.", 'Königstraße 55, 90402 Nürnberg, Germany']
+    ],
+    "usa": [
+        ['The Ritz-Carlton, New York City', 'A luxury hotel located in the heart of Manhattan, offering opulent rooms and world-class service.', '25 W 28th St, New York, NY 10001, USA'],
+        ['Four Seasons Resort, Maui', 'An upscale resort in Hawaii, known for its breathtaking ocean views, luxurious accommodations, and top-notch amenities.', '3900 Wailea Alanui Dr, Kihei, HI 96753, USA'],
+        ['The Plaza Hotel, New York City', 'A historic and iconic hotel on Fifth Avenue, offering elegant rooms and a prime location near Central Park.', '768 5th Ave, New York, NY 10019, USA'],
+        ['The Venetian, Las Vegas', 'A lavish resort and casino on the Las Vegas Strip, known for its Italian-themed architecture and spacious suites.', '3355 S Las Vegas Blvd, Las Vegas, NV 89109, USA'],
+        ['Waldorf Astoria Beverly Hills, California', 'A luxury hotel in Beverly Hills, providing a sophisticated and glamorous experience with upscale amenities.', '9850 Wilshire Blvd, Beverly Hills, CA 90210, USA'],
+        ['The St. Regis, Aspen', 'A premier ski resort in Aspen, Colorado, offering luxurious accommodations, fine dining, and personalized services.', '315 E Dean St Building 1, Aspen, CO 81611, USA'],
+        ['The Breakers, Palm Beach', 'A historic oceanfront resort in Florida, featuring opulent rooms, multiple pools, and a private beach.', '1 S County Rd, Palm Beach, FL 33480, USA'],
+        ['The Langham, Chicago', 'A five-star hotel in downtown Chicago, known for its elegant design, upscale dining, and panoramic city views.', '330 N Wabash Ave, Chicago, IL 60611, USA'],
+        ['The Broadmoor, Colorado Springs', 'An iconic resort in Colorado, offering luxurious rooms, golf courses, and a spa amidst stunning mountain scenery.', '1 Lake Ave, Colorado Springs, CO 80906, USA'],
+        ['Mandarin Oriental, Miami', 'A waterfront hotel in Miami, known for its contemporary design, upscale spa, and panoramic views of Biscayne Bay.', '500 Brickell Key Dr, Miami, FL 33131, USA'],
+        ['The Fairmont Olympic Hotel, Seattle', 'A classic luxury hotel in Seattle, offering historic charm, sophisticated accommodations, and fine dining.', '411 University St, Seattle, WA 98101, USA'],
+        ['The Beverly Hills Hotel, California', 'An iconic Hollywood retreat, known for its glamorous history, pink exterior, and luxurious bungalows.', 'Beverly Hills, CA, USA'],
+        ['The Ritz-Carlton, New Orleans', 'A luxury hotel in the heart of the French Quarter, combining Southern hospitality with upscale amenities.', '921 Canal St, New Orleans, LA 70112, USA'],
+        ['The Waldorf Astoria, Chicago', 'A sophisticated hotel in downtown Chicago, offering spacious rooms, a world-class spa, and fine dining.', '11 E Walton St, Chicago, IL 60611, USA'],
+        ['The Greenbrier, White Sulphur Springs', 'A historic resort in West Virginia, featuring elegant rooms, championship golf courses, and a mineral spa.', 'White Sulphur Springs, WV 24986, USA'],
+        ['The Waldorf Astoria, Orlando', 'A luxury resort near Walt Disney World, offering upscale accommodations and family-friendly amenities.', '14200 Bonnet Creek Resort Ln, Orlando, FL 32821, USA'],
+        ['The Phoenician, Scottsdale', 'A desert oasis in Arizona, known for its luxurious accommodations, golf courses, and rejuvenating spa.', '6000 E Camelback Rd, Scottsdale, AZ 85251, USA'],
+        ['The St. Regis, New York City', 'An iconic hotel on Fifth Avenue, offering luxurious rooms, bespoke butler service, and a sophisticated ambiance.', 'Two E 55th St, New York, NY 10022, USA'],
+        ['The Ritz-Carlton, Half Moon Bay', 'A coastal retreat in California, known for its cliffside location, ocean views, and upscale amenities.', '1 Miramontes Point Rd, Half Moon Bay, CA 94019, USA'],
+        ['The Fontainebleau, Miami Beach', 'An iconic oceanfront resort in Miami Beach, featuring glamorous design, multiple pools, and vibrant nightlife.', '4441 Collins Ave, Miami Beach, FL 33140, USA'],
+        ['The Plaza Resort & Spa, Daytona Beach', 'A historic beachfront resort in Florida, offering classic charm, oceanfront rooms, and a spa.', '600 N Atlantic Ave, Daytona Beach, FL 32118, USA'],
+        ['The Omni Grove Park Inn, Asheville', 'A historic resort in the Blue Ridge Mountains, known for its Arts and Crafts architecture, golf courses, and spa.', '290 Macon Ave, Asheville, NC 28804, USA'],
+        ['The Little Nell, Aspen', 'A luxury ski resort in Aspen, Colorado, offering ski-in/ski-out access, upscale dining, and stunning mountain views.', '675 E Durant Ave, Aspen, CO 81611, USA'],
+        ['The Ritz-Carlton, Lake Tahoe', 'A luxury resort in the Sierra Nevada mountains, offering ski-in/ski-out access and upscale mountain retreat.', '13031 Ritz Carlton Highlands Ct, Truckee, CA 96161, USA'],
+        ['The Waldorf Astoria, Las Vegas', 'A sophisticated hotel on the Las Vegas Strip, known for its modern design, upscale accommodations, and city views.', '3752 Las Vegas Blvd S, Las Vegas, NV 89158, USA'],
+        ['The Cloister, Sea Island', 'A luxurious island resort in Georgia, offering elegant accommodations, golf courses, and a private beach.', '100 Cloister Dr, Sea Island, GA 31561, USA'],
+        ['The Mandarin Oriental, Boston', 'A five-star hotel in Boston, known for its contemporary design, upscale accommodations, and waterfront location.', '776 Boylston St, Boston, MA 02199, USA'],
+        ['The Resort at Pelican Hill, Newport Beach', 'A coastal resort in Southern California, offering panoramic ocean views, luxurious villas, and golf courses.', '22701 S Pelican Hill Rd, Newport Coast, CA 92657, USA'],
+        ['The Breakers, Newport', 'A historic oceanfront resort in Rhode Island, featuring grand architecture, opulent rooms, and oceanfront dining.', '44 Ochre Point Ave, Newport, RI 02840, USA'],
+        ['The Ritz-Carlton, Amelia Island', 'A beachfront resort in Florida, known for its Southern charm, oceanfront rooms, and upscale amenities.', '4750 Amelia Island Pkwy, Amelia Island, FL 32034, USA'],
+        ['The Waldorf Astoria, Key West', 'A luxury resort in the Florida Keys, offering a private beach, upscale accommodations, and tropical ambiance.', 'Key West, FL 33040, USA'],
+        ['The St. Regis, Deer Valley', 'A luxury ski resort in Park City, Utah, offering ski-in/ski-out access, elegant accommodations, and mountain views.', '2300 Deer Valley Dr E, Park City, UT 84060, USA'],
+        ['The Fairmont, San Francisco', 'A classic luxury hotel in San Francisco, known for its historic charm, iconic cable car views, and elegant rooms.', '950 Mason St, San Francisco, CA 94108, USA'],
+        ['The Inn at Spanish Bay, Pebble Beach', 'A coastal resort on the Monterey Peninsula, offering oceanfront accommodations, golf courses, and scenic views.', '2700 17 Mile Dr, Pebble Beach, CA 93953, USA'],
+        ['The Ritz-Carlton, Pentagon City', 'A luxury hotel in Arlington, Virginia, offering upscale accommodations and convenient access to Washington, D.C.', '1250 S Hayes St, Arlington, VA 22202, USA'],
+        ['The Waldorf Astoria, Beverly Hills', 'A luxurious hotel in the heart of Beverly Hills, offering upscale rooms, a rooftop pool, and fine dining.', '9850 Wilshire Blvd, Beverly Hills, CA 90210, USA'],
+        ['The Ritz-Carlton, San Juan', 'A beachfront resort in Puerto Rico, offering luxurious accommodations, ocean views, and a tropical ambiance.', 'United States'],
+        ['The Lodge at Pebble Beach', 'A golf resort in Pebble Beach, California, known for its championship golf courses, luxurious rooms, and ocean views.', '1700 17 Mile Dr, Pebble Beach, CA 93953, USA'],
+        ['The St. Regis, Bal Harbour', 'A luxury resort in Miami Beach, known for its contemporary design, oceanfront views, and upscale amenities.', '9703 Collins Avenue Bal Harbour, Miami Beach, FL 33154, USA'],
+        ['The Waldorf Astoria, Park City', 'A luxury mountain resort in Park City, Utah, offering ski-in/ski-out access, elegant accommodations, and mountain views.', '2100 Frostwood Dr, Park City, UT 84098, USA'],
+        ['The Breakers, Chicago', 'A sophisticated hotel in downtown Chicago, offering upscale accommodations, fine dining, and a central location.', '5333 N Sheridan Rd, Chicago, IL 60640, USA'],
+        ['The Ritz-Carlton, Bachelor Gulch', 'A luxury resort in Colorado, known for its mountain-inspired design, ski-in/ski-out access, and upscale amenities.', '0130 Daybreak Ridge Rd, Avon, CO 81620, USA'],
+        ['The St. Regis, Washington, D.C.', "A luxury hotel in the nation's capital, offering elegant accommodations, fine dining, and a central location.", '923 Black Lives Matter Plz NW, Washington, DC 20006, USA'],
+        ['The Langham Huntington, Pasadena', 'A historic hotel in Southern California, known for its elegant design, lush gardens, and upscale amenities.', '1401 S Oak Knoll Ave, Pasadena, CA 91106, USA'],
+        ['The Ritz-Carlton, Philadelphia', 'A luxury hotel in Philadelphia, known for its historic charm, upscale accommodations, and central location.', '10 Ave Of The Arts, Philadelphia, PA 19102, USA'],
+        ['The Ritz-Carlton, Sarasota', 'A luxury resort in Florida, offering waterfront accommodations, golf courses, and a rejuvenating spa.', '1111 Ritz Carlton Dr, Sarasota, FL 34236, USA'],
+        ['The St. Regis, Atlanta', 'A luxury hotel in Atlanta, known for its sophisticated design, upscale accommodations, and Southern hospitality.', '88 W Paces Ferry Rd NW, Atlanta, GA 30305, USA']
+    ],
+    "uk": [
+        ['The Ritz, London', 'An iconic luxury hotel known for its opulent decor, impeccable service, and central location.', "150 Piccadilly, St. James's, London W1J 9BR, UK"],
+        ['The Savoy, London', 'A historic hotel along the River Thames, offering elegant rooms and world-class dining.', 'Strand, London WC2R 0EZ, UK'],
+        ["Claridge's, London", 'A renowned Art Deco hotel in Mayfair, known for its luxurious accommodations and afternoon tea.', 'Brook St, London W1K 4HR, UK'],
+        ['Gleneagles Hotel, Scotland', 'A five-star resort set in the picturesque Scottish countryside, offering golf, spa, and outdoor activities.', 'The, Gleneagles Hotel, Auchterarder PH3 1NF, UK'],
+        ['The Langham, London', "A classic Victorian hotel with modern amenities, located in the heart of London's West End.", '1C Portland Pl, London W1B 1JA, UK'],
+        ['The Shard Hotel, London', 'Located within The Shard skyscraper, this hotel offers panoramic views of the city.', '32 London Bridge St, London SE1 9SG, UK'],
+        ['Balmoral Hotel, Edinburgh', 'A landmark hotel with a clock tower, offering luxurious rooms and a Michelin-starred restaurant.', '1 Princes St, Edinburgh EH2 2EQ, UK'],
+        ['The Goring, London', 'A family-owned hotel near Buckingham Palace, known for its timeless elegance and Royal Warrant.', '15 Beeston Pl, London SW1W 0JW, UK'],
+        ['The Connaught, London', 'A luxury hotel in Mayfair, featuring stylish rooms, a spa, and Michelin-starred dining.', 'The Connaught, 16 Carlos Pl, London W1K 2AL, UK'],
+        ['The Dorchester, London', 'An iconic hotel on Park Lane, offering luxurious rooms, spa facilities, and fine dining.', '53 Park Ln, London W1K 1QA, UK'],
+        ['Cameron House, Loch Lomond', 'A historic hotel on the shores of Loch Lomond, offering scenic views and outdoor activities.', 'Cameron House, A82, Alexandria G83 8RE, UK'],
+        ['The Ned, London', 'A stylish hotel in a former bank building, known for its trendy design and multiple dining options.', '27 Poultry, London EC2R 8AJ, UK'],
+        ['Cliveden House, Berkshire', 'A stately home turned luxury hotel, set in beautiful grounds with a spa and gourmet dining.', 'Taplow, BERKSHIRE SL6 0JF, UK'],
+        ['The Balmoral, Edinburgh', 'A grand hotel with a clock tower, offering luxurious rooms, a spa, and fine dining.', '1 Princes St, Edinburgh EH2 2EQ, UK'],
+        ['The Merchant Hotel, Belfast', 'A five-star hotel in a former bank, known for its lavish decor and rooftop hot tubs.', '16 Skipper St, Belfast BT1 2DZ, UK'],
+        ['Hotel du Vin & Bistro, Winchester', 'A boutique hotel set in a Georgian building, offering chic rooms and a French-inspired bistro.', '14 Southgate St, Winchester SO23 9EF, UK'],
+        ['The Berkeley, London', 'A luxury hotel in Knightsbridge, known for its contemporary style and rooftop pool.', 'Wilton Pl, London SW1X 7RL, UK'],
+        ['The Witchery by the Castle, Edinburgh', 'A romantic hotel with theatrical decor, located near Edinburgh Castle.', 'Witchery by the Castle, 352 Castlehill, Edinburgh EH1 2NF, UK'],
+        ['The Gleneagles Hotel, Scotland', 'A prestigious resort with golf courses, spa facilities, and outdoor activities.', 'The, Gleneagles Hotel, Auchterarder PH3 1NF, UK'],
+        ['The Shelbourne, Autograph Collection, Dublin', 'A historic hotel in Dublin, known for its elegant rooms and iconic Horseshoe Bar.', "27 St Stephen's Green, Dublin, Co. Dublin, Ireland"],
+        ['The Rosewood London', 'A luxurious hotel housed in a grand Edwardian mansion, featuring elegant accommodations.', '252 High Holborn, London WC1V 7EN, UK'],
+        ['Coworth Park, Ascot', 'A country house hotel and spa set in 240 acres of picturesque parkland.', 'Blacknest Rd, Sunningdale, Ascot SL5 7SE, UK'],
+        ['The Gainsborough Bath Spa', 'A five-star hotel with a thermal spa, located in the heart of Bath.', 'Beau St, Bath BA1 1QY, UK'],
+        ['The Principal Edinburgh George Street', 'A stylish hotel in a Georgian townhouse, offering modern amenities and a central location.', '19 - 21 George St, Edinburgh EH2 2PB, UK'],
+        ['The Waldorf Hilton, London', 'A classic hotel in Covent Garden, known for its Edwardian architecture and elegant rooms.', 'Aldwych, London WC2B 4DD, UK'],
+        ['The Chester Grosvenor', 'A luxury hotel in Chester, featuring Michelin-starred dining and stylish accommodations.', 'Eastgate St, Chester CH1 1LT, UK'],
+        ['Hotel Gotham, Manchester', 'A boutique hotel with a bold Art Deco design, located in a former bank building.', '100 King St, Manchester M2 4WU, UK'],
+        ['The Midland, Manchester', 'A historic hotel with a stunning Edwardian facade, offering modern comforts.', '16 Peter St, Manchester M60 2DS, UK'],
+        ['The Malmaison, Oxford', 'A stylish hotel in a converted prison, known for its chic decor and unique atmosphere.', 'Oxford Castle, 3 New Rd, Oxford OX1 1AY, UK'],
+        ['The Old Course Hotel, St Andrews', 'A luxury golf resort with views of the Old Course, set against the Scottish coastline.', 'Old Station Rd, St Andrews KY16 9SP, UK'],
+        ['The Milestone Hotel, London', 'A boutique hotel overlooking Kensington Palace, known for its personalized service.', '1-3 Kensington Ct, London W8 5DL, UK'],
+        ['The Stafford London', 'A luxury hotel near Green Park, featuring elegant rooms and a historic carriage house.', "16-18 St James's Pl, St. James's, London SW1A 1NJ, UK"],
+        ['The Grand Brighton', 'A Victorian seafront hotel with a spa, offering panoramic views of the English Channel.', '97-99 Kings Rd, Brighton and Hove, Brighton BN1 2FW, UK'],
+        ['The Ivy Hotel, Bath', 'A boutique hotel with a stylish interior, located in a historic Georgian building.', '39 Milsom St, Bath BA1 1DN, UK'],
+        ['The Caledonian, A Waldorf Astoria Hotel, Edinburgh', 'A grand hotel with a castle-like facade, offering luxurious accommodations.', 'Princes St, Edinburgh EH1 2AB, UK'],
+        ['The Soho Hotel, London', 'A chic hotel in the heart of Soho, known for its vibrant decor and cinematic-themed rooms.', 'Soho Hotel, 4 Richmond Mews, London W1D 3DH, UK'],
+        ['The Queensberry Hotel, Bath', 'A boutique hotel in a Georgian townhouse, offering individually designed rooms.', '4 - 7 Russell St, Bath BA1 2QF, UK'],
+        ['The Lowry Hotel, Manchester', 'A contemporary hotel on the banks of the River Irwell, known for its modern design.', '50 Dearmans Pl, Salford M3 5LH, UK'],
+        ['The Montcalm Royal London House', 'A luxury hotel in the heart of the City of London, offering stylish rooms and a rooftop bar.', '2 Wallenberg Pl, London W1H 7TN, UK'],
+        ['The Principal Manchester', "A landmark hotel with a Victorian facade, located near Manchester's cultural attractions.", 'Oxford St, Manchester M60 7HA, UK'],
+        ['The Gritti Palace, a Luxury Collection Hotel, Venice', 'A luxurious hotel in Venice, known for its Renaissance-inspired decor and canal views.', 'United Kingdom'],
+        ['The Royal Horseguards, London', 'A historic hotel overlooking the River Thames, near iconic landmarks.', 'London, UK'],
+        ['The Principal Edinburgh Charlotte Square', 'A Georgian hotel with stylish interiors, located in the New Town.', '38 Charlotte Square, Edinburgh EH2 4HQ, UK'],
+        ['The Bristol, Bristol', 'A modern hotel with a waterfront location, offering contemporary rooms and dining.', 'Bristol, UK'],
+        ['The Grand Hotel York', 'A luxury hotel in a historic building, featuring elegant rooms and a rooftop spa.', 'Station Rise, North Yorkshire, York YO1 6GD, UK'],
+        ['The Principal London', 'A landmark hotel in Russell Square, known for its Victorian architecture and stylish accommodations.', '1-8 Russell Sq, London WC1B 5BE, UK'],
+        ['The Principal Edinburgh, George Street', 'A stylish hotel in a Georgian townhouse, offering modern amenities and a central location.', '19 - 21 George St, Edinburgh EH2 2PB, UK']
+    ],
+    "brazil": [
+        ['Belmond Copacabana Palace', 'A luxurious hotel in Rio de Janeiro overlooking Copacabana Beach, known for its classic elegance and world-class amenities.', 'Av. Atlântica, 1702 - Copacabana, Rio de Janeiro - RJ, 22021-001, Brazil'],
+        ['Hotel Unique', 'An iconic hotel in São Paulo with a distinctive half-moon shape, offering modern design, rooftop pool, and panoramic views.', 'Av. Brigadeiro Luís Antônio, 4700 - Jardim Paulista, São Paulo - SP, 01402-002, Brazil'],
+        ['Pestana Convento do Carmo', 'A historic hotel in Salvador housed in a former 16th-century convent, featuring charming rooms and a courtyard pool.', 'Brazil'],
+        ['Royal Tulip Brasília Alvorada', 'A five-star hotel in Brasília set on the shores of Lake Paranoá, known for its modern architecture and beautiful surroundings.', 'Brasília - Brasilia, Federal District, Brazil'],
+        ['Amazon Ecopark Jungle Lodge', 'An eco-friendly lodge near Manaus, providing a unique Amazon Rainforest experience with guided tours and wildlife encounters.', 'Amazon Ecopark Jungle Lodge - Igarape Ecopark, s/n - Tarumã, Manaus - AM, 69025-090, Brazil'],
+        ['Nannai Resort & Spa', 'A beachfront resort in Porto de Galinhas, offering luxurious accommodations, private bungalows, and a spa with ocean views.', 'Brazil'],
+        ['Summerville Beach Resort', 'A family-friendly resort in Muro Alto, known for its extensive pools, water park, and direct access to the beach.', 'Brazil'],
+        ['Hotel das Cataratas', 'A colonial-style hotel located within Iguazu National Park, offering exclusive access to the Iguaçu Falls after park hours.', 'Hotel das Cataratas, A Belmond Hotel, Iguassu Falls - Rodovia Br 469, Km 32 - s/n - National Park, Foz do Iguaçu - PR, 85855-750, Brazil'],
+        ['Solar do Rosário', 'A charming hotel in Ouro Preto, housed in a restored colonial mansion, featuring comfortable rooms and a courtyard.', 'R. Getulio Vargas, 270 - Rosário, Ouro Preto - MG, 35400-000, Brazil'],
+        ['Caiman Ecological Refuge', 'A wildlife-focused lodge in the Brazilian Pantanal, providing opportunities for jaguar safaris, birdwatching, and nature walks.', 'Brazil'],
+        ['Radisson Hotel Curitiba', "A modern hotel in Curitiba's city center, offering comfortable rooms, a rooftop pool, and convenient access to attractions.", 'Av. Sete de Setembro, 5190 - Batel, Curitiba - PR, 80240-000, Brazil'],
+        ['Sheraton Porto Alegre Hotel', 'A contemporary hotel in Porto Alegre, known for its stylish accommodations, rooftop pool, and fitness center.', 'R. Olávo Barreto Viana, 18 - Moinhos de Vento, Porto Alegre - RS, 90570-070, Brazil'],
+        ['Hotel Princesa Louçã', 'A historic hotel in Belém, combining colonial architecture with modern amenities and a central location.', 'Av. Pres. Vargas, 882 - Campina, Belém - PA, 66017-904, Brazil'],
+        ['Malai Manso Resort Iate Convention & Spa', 'A resort near Cuiabá, situated on the shores of Lake Manso, offering water sports, spa facilities, and multiple dining options.', 'Brazil'],
+        ['Ocean Palace Beach Resort & Bungalows', 'A beachfront resort in Natal, featuring spacious bungalows, multiple pools, and direct access to Ponta Negra Beach.', 'Via Costeira Sen. Dinarte Medeiros Mariz, 7829 - Ponta Negra, Natal - RN, 59090-002, Brazil'],
+        ['Grand São Luis Hotel', 'A centrally located hotel in São Luís, combining modern comfort with colonial-style architecture.', 'São Luís Metropolitan Area, State of Maranhão, Brazil'],
+        ['Hardman Praia Hotel', 'A beachfront hotel in João Pessoa, offering comfortable rooms, a rooftop pool, and stunning views of Tambau Beach.', 'Av. João Maurício, 1341 - Manaíra, João Pessoa - PB, 58038-000, Brazil'],
+        ["L'acqua di Roma", 'A thermal resort in Caldas Novas, known for its hot springs, pools, and wellness facilities.', 'Via Circular Francisca - Vila Circular Francisca Lima Bezerra, s/n - Solar de Caldas, Caldas Novas - GO, 75694-030, Brazil'],
+        ['Hotel Casa da Montanha', 'A boutique hotel in Gramado, featuring charming Alpine-inspired décor, cozy rooms, and personalized service.', 'Av. Borges de Medeiros, 3166 - Centro, Gramado - RS, 95670-000, Brazil'],
+        ['Pousada Maravilha', 'A boutique hotel on the island of Fernando de Noronha, offering panoramic ocean views, a pool, and exclusive beach access.', 'Maravilha - State of Alagoas, Brazil'],
+        ['Jurassic Park Hotel', 'A themed hotel in Foz do Iguaçu, located near the Iguaçu Falls, featuring dinosaur sculptures and family-friendly accommodations.', 'Brazil'],
+        ['Wish Serrano Resort & Convention Gramado', 'A resort in Gramado with a European-inspired design, offering spacious rooms, golf courses, and a wellness center.', 'Av. das Hortênsias, 1480 - Centro, Gramado - RS, 95670-000, Brazil'],
+        ['Casa Turquesa', 'A boutique guesthouse in Paraty, set in a restored colonial mansion, providing a tranquil and stylish retreat.', 'Brazil'],
+        ['Pousada do Ouro', "A charming inn in the heart of Paraty's historic center, offering comfortable rooms, a pool, and a tropical garden.", 'R. Dr. Pereira, 298 - Centro Histórico, Paraty - RJ, 23970-000, Brazil'],
+        ['Pousada do Sandi', 'A colonial-style hotel in Paraty, known for its historic charm, modern amenities, and proximity to cultural attractions.', 'Largo do Rozário, 1 - Centro Histórico, Paraty - RJ, 23970-000, Brazil'],
+        ['Pousada Surucuá - Bonito', "An eco-friendly lodge in Bonito, offering comfortable accommodations and organizing tours to the region's natural attractions.", 'R. Bongiovani, 860 - Centro, Bonito - MS, 79290-000, Brazil'],
+        ['Sheraton Reserva do Paiva Hotel & Convention Center', 'A modern hotel in Cabo de Santo Agostinho, featuring spacious rooms, a golf course, and beach access.', 'Reserva Do Paiva - Praia Do - Av. A, 4 - Paiva, Cabo de Santo Agostinho - PE, 54590-000, Brazil'],
+        ['Praia do Forte Eco Resort', 'A beachfront resort in Praia do Forte, offering a range of recreational activities, multiple pools, and direct beach access.', 'Av. do Farol, 39 - Açu da Torre, Mata de São João - BA, 48280-000, Brazil'],
+        ['Hotel Ritta Höppner', 'A unique hotel in Gramado with Swiss-inspired architecture, lush gardens, and themed suites.', 'R. Pedro Candiago, 305 - Planalto, Gramado - RS, 95670-000, Brazil'],
+        ['Txai Resort Itacaré', 'A luxury resort in Itacaré, known for its tropical surroundings, private bungalows, and upscale amenities.', 'Rodovia BA001 - KM 48 de - Itacaré, BA, 45530-000, Brazil'],
+        ['Kenoa Resort', 'A beachfront resort near Maceió, offering contemporary design, private villas, and a focus on sustainability.', 'R. Escritor Jorge de Lima, 58 - Barra Mar, Barra de São Miguel - AL, 57180-000, Brazil'],
+        ['Pousada Tutabel', 'A charming inn in Pirenópolis, featuring rustic-style accommodations, a pool, and a garden.', 'Estr. do Rio Verde, 3000 - Zona Rural, Porto Seguro - BA, 45818-000, Brazil'],
+        ['Infinity Blue Resort & Spa', 'A beachfront resort in Balneário Camboriú, offering spacious rooms, multiple pools, and entertainment options.', 'Brazil'],
+        ['Chapada dos Veadeiros Eco Resort', 'An eco-friendly resort near Alto Paraíso de Goiás, providing a tranquil retreat amidst the natural beauty of Chapada dos Veadeiros.', 'Chapada dos Veadeiros - Alto Paraíso de Goiás, State of Goiás, 73770-000, Brazil'],
+        ['Insólito Boutique Hotel', 'A boutique hotel in Búzios, known for its eclectic design, ocean-view rooms, and artistic atmosphere.', 'Rua Lydia Gonçalves de Almeida Praia da Ferradura, Búzios - RJ, 28951-049, Brazil'],
+        ['Essenza Hotel', 'A beachfront hotel in Jericoacoara, offering modern accommodations, a rooftop pool, and panoramic views of the dunes.', 'Av. Beira Mar, s/n, Jijoca de Jericoacoara - CE, 62598-000, Brazil'],
+        ['Teju-Açu Eco Pousada', 'An eco-friendly pousada on the island of Fernando de Noronha, providing a sustainable and comfortable stay.', 'Estrada da Alamoa, s/n - Boldró Fernando de Noronha, Fernando de Noronha - PE, 53990-000, Brazil'],
+        ['Vila dos Orixás Boutique Hotel', 'A boutique hotel in Morro de São Paulo, featuring tropical gardens, a pool, and direct beach access.', 'PRAIA DO ENCANTO - Cairu, BA, 45420-000, Brazil'],
+        ['Wish Hotel da Bahia', 'A historic hotel in Salvador, known for its mid-century modern architecture, spacious rooms, and central location.', 'Av. Sete de Setembro, 1537 - Dois de Julho, Salvador - BA, 40060-002, Brazil'],
+        ['Gran Marquise Hotel', 'A luxury hotel in Fortaleza, offering elegant accommodations, a rooftop pool, and panoramic views of the ocean.', 'Av. Beira Mar, 3980 - Mucuripe, Fortaleza - CE, 60165-121, Brazil'],
+        ['Pousada do Toque', 'A beachfront pousada in São Miguel dos Milagres, known for its rustic-chic style, gourmet cuisine, and peaceful atmosphere.', 'R. Felisberto de Ataíde, S/N - Povoado do Toque, São Miguel dos Milagres - AL, 57940-000, Brazil'],
+        ['Cristalino Lodge', 'An eco-lodge in the Amazon Rainforest, providing immersive nature experiences, wildlife viewing, and sustainable practices.', 'Margem direita do Rio Cristalino, s/n, Alta Floresta - MT, 78580-000, Brazil'],
+        ['Pousada Patacho', 'A charming pousada in Porto de Pedras, known for its rustic-chic design, personalized service, and beachfront location.', 'Rota Ecológica, s/n - Praia do Patacho, Porto de Pedras - AL, 57945-000, Brazil'],
+        ['Villa Bahia', "A boutique hotel in Salvador's historic district, offering a blend of colonial and African-inspired décor, as well as modern comforts.", 'Vila Bahia - Boca do Rio, Salvador - BA, 41706-580, Brazil'],
+        ['Tivoli Ecoresort Praia do Forte', 'A luxury resort in Praia do Forte, featuring spacious rooms, ecological trails, and a focus on environmental conservation.', 'Av. do Farol, 39 - Açu da Torre, Mata de São João - BA, 48280-000, Brazil'],
+        ['Fazenda São Francisco Hotel', 'A rural retreat in Diamantina Valley, offering an authentic farm experience, horseback riding, and colonial-style accommodations.', 'Rodovia Paulo Virgínio, SP-171, Km 26,5 - Cedro - Cunha, SP, 12530-000, Brazil']
+    ],
+    "greece": [
+        ['King George, a Luxury Collection Hotel, Athens', 'A luxurious hotel in the heart of Athens, offering stunning views of the Acropolis and upscale amenities.', '3 Vasileos Georgiou A, Pl. Sintagmatos Str, Athina 105 64, Greece'],
+        ['Canaves Oia Hotel, Santorini', 'A beautiful hotel carved into the cliffs of Oia, featuring elegant suites, a picturesque pool, and panoramic views of the Caldera.', 'Main Street, Oía 847 02, Greece'],
+        ['Bill & Coo Suites and Lounge, Mykonos', 'An exclusive hotel with stylish suites, a gourmet restaurant, and a serene pool area overlooking the Aegean Sea.', 'Bill & Coo Suites and Lounge Megali Ammos Beach, Mikonos 846 00, Greece'],
+        ['Blue Palace, a Luxury Collection Resort and Spa, Crete', 'A luxurious resort with private bungalows, a tranquil beach, multiple dining options, and a world-class spa.', 'Plaka, Schisma Elountas 720 53, Greece'],
+        ['Electra Palace Thessaloniki', 'A five-star hotel in Thessaloniki, offering elegant rooms, a rooftop pool with city views, and proximity to popular attractions.', 'Aristotélous 9, Thessaloniki 546 24, Greece'],
+        ['Amalia Hotel Delphi', 'A modern hotel in Delphi with comfortable rooms, a restaurant serving Greek cuisine, and breathtaking views of the valley.', 'Apollonos 1, Delfi 330 54, Greece'],
+        ['Grand Meteora Hotel, Kalabaka', 'A hotel at the foot of Meteora, featuring comfortable rooms, a swimming pool, and easy access to the monasteries.', 'Καστράκι Καλαμπάκας, Kastraki Kalmpaka, Kastraki 422 00, Greece'],
+        ['Atrium Palace Thalasso Spa Resort and Villas, Rhodes', 'A beachfront resort with luxurious accommodations, a spa with thalassotherapy treatments, and beautiful gardens.', 'Kalathos 851 02, Greece'],
+        ['Corfu Palace Hotel', 'An elegant hotel in Corfu with classic-style rooms, a rooftop restaurant, and views of the Old Fortress and the Ionian Sea.', 'Leof. Dimokratias 2, Kerkira 491 00, Greece'],
+        ['Olympia Golden Beach Resort and Spa, Kyllini', 'A beachfront resort in Kyllini with spacious rooms, multiple pools, water slides, and a wellness center.', 'Kyllini Beach Resort, Kalamia 270 50, Greece'],
+        ['Nafplia Palace Hotel and Villas', 'A luxurious hotel in Nafplio with stylish rooms, an infinity pool, and breathtaking views of the Argolic Gulf.', 'Akronafplia, Nafplio 211 00, Greece'],
+        ['GDM Megaron Historical Monument Hotel, Heraklion', 'A historic hotel in Heraklion with a blend of modern and classical design, featuring comfortable rooms and a gourmet restaurant.', 'Doukos Mpofor 9, Iraklio 712 02, Greece'],
+        ['Myconian Avaton Resort, Mykonos', 'A luxury resort with stylish rooms, a spa, and a private beach area on Elia Beach in Mykonos.', 'Elia Beach, Mikonos 846 00, Greece'],
+        ['Astra Suites, Santorini', 'A charming suite hotel in Santorini, carved into the cliffs of the caldera, offering breathtaking views and personalized service.', 'Imerovigli, Imerovigli, Santorini 847 00, Greece'],
+        ["Princess D'Annam Resort and Spa, Peloponnese", 'A five-star resort in the Peloponnese with pool villas, a spa, and a private beach, surrounded by lush landscapes.', 'Peloponnese 220 16, Greece'],
+        ['Mitsis Grand Hotel, Rhodes', 'A historic hotel in Rhodes with a grand lobby, elegant rooms, and a rooftop terrace with panoramic views of the city.', 'Akti Miaouli, Geor. Papanikolaou 1, Rodos 851 00, Greece'],
+        ['Mayor Mon Repos Palace Art Hotel, Corfu', 'An art-inspired hotel in Corfu with comfortable rooms, a beachfront location, and proximity to the Old Town.', 'Iasonos ke Sosipatrou 100, Kerkira 491 00, Greece'],
+        ['Westin Resort Costa Navarino, Messinia', 'A luxury resort in Messinia with beachfront villas, multiple pools, golf courses, and a variety of dining options.', 'Navarino Dunes Messinia, Costa, Pilos 240 01, Greece'],
+        ['Mystique, a Luxury Collection Hotel, Santorini', 'A luxurious hotel in Oia, Santorini, featuring cave-like suites, a cliffside infinity pool, and personalized services.', 'Island, Οία 847 02, Greece'],
+        ['Kos Aktis Art Hotel, Kos', 'A boutique hotel in Kos with contemporary design, sea-view rooms, and a rooftop restaurant overlooking the Aegean Sea.', "Vasileos Georgiou V', Kos 853 00, Greece"],
+        ['Minoa Palace Resort and Spa, Chania', 'A beachfront resort in Chania with modern accommodations, a spa, multiple pools, and direct access to the beach.', 'ΞΕΝΟΔΟΧ. ΜΙΝΟΑ ΠΑΛΑΣ, Platanias 730 14, Greece'],
+        ['Avra Imperial Hotel, Crete', 'A five-star hotel in Crete with spacious rooms, a lagoon-style pool, and lush gardens, creating a tranquil retreat.', 'Kolymvari 730 06, Greece'],
+        ['Casa Moazzo Suites and Apartments, Rethymno', 'A charming boutique hotel in Rethymno with stylish suites, a courtyard, and a central location in the Old Town.', 'Rethimno, Greece'],
+        ['Grand Resort Lagonissi, Athens', 'A luxurious resort on the Athenian Riviera with private bungalows, multiple restaurants, and a private beach.', '40th km Athens - Sounion Avenue - Athens, Kalivia Thorikou 190 10, Greece'],
+        ['Daios Cove Luxury Resort and Villas, Agios Nikolaos', 'A luxury resort in Agios Nikolaos with private villas, a spa, multiple pools, and stunning sea views.', 'Βαθύ, Kritsa 721 00, Greece'],
+        ["Canal d'Amour Hotel, Corfu", "A romantic hotel in Corfu with comfortable rooms, a swimming pool, and a location near the famous Canal d'Amour.", 'Kanali tou Erota, 490 81, Greece'],
+        ['Lindos Blu Luxury Hotel and Suites, Rhodes', 'An adults-only hotel in Rhodes with stylish rooms, infinity pools, and panoramic views of Vlycha Bay.', 'EO Rodou Lindou 615, Lindos 851 07, Greece'],
+        ['Armeni Village Rooms and Suites, Oia', 'Charming cave-style accommodations in Oia, Santorini, with traditional architecture and views of the Caldera.', 'Oia, Thira 847 02, Greece'],
+        ['Porto Elounda Golf and Spa Resort, Elounda', 'A luxury resort in Elounda with golf facilities, a spa, private villas, and access to a private beach.', 'Schisma Eloundas 720 53, Greece'],
+        ['Margarita Hotel, Zakynthos', 'A family-friendly hotel in Zakynthos with comfortable rooms, a swimming pool, and a short walk to Tsilivi Beach.', 'Laganas 290 92, Greece'],
+        ['Atrium Prestige Thalasso Spa Resort and Villas, Rhodes', 'A seaside resort in Rhodes with elegant rooms, a thalasso spa, and direct access to a Blue Flag beach.', 'Beach Lachania Beach South, Lachania 851 09, Greece'],
+        ['Amphitryon Hotel, Nafplio', 'A boutique hotel in Nafplio with neoclassical architecture, sea-view rooms, and a central location near the Palamidi Fortress.', '3-5 Spiliadou st, Nafplio 211 00, Greece'],
+        ['Blue Diamond Bay, Perissa', 'A beachfront hotel in Perissa, Santorini, with traditional Cycladic architecture and a relaxing atmosphere.', 'Perissa 847 03, Greece'],
+        ['Domes Noruz Chania, Autograph Collection, Chania', 'An adults-only resort in Chania with stylish accommodations, private pools, and a beachfront location.', '5 Strati Pantelaki Street, Chania 731 00, Greece'],
+        ['Palazzo Loupassi Boutique Villas, Chania', 'Charming villas in the countryside near Chania, featuring traditional architecture and modern amenities.', 'Vasilopoulo, Kolymbari, Βασιλόπουλο, Κολυμπάρι, Kolymbari 730 06, Greece'],
+        ['Elounda Bay Palace, Elounda', 'A luxury resort in Elounda with sea-view rooms, private bungalows, a spa, and a private beach.', 'Schisma Eloundas 720 53, Greece'],
+        ['Rocabella Santorini Hotel and Spa, Imerovigli', 'A boutique hotel in Imerovigli, Santorini, with elegant rooms, a spa, and panoramic views of the caldera.', 'Imerovigli 847 00, Greece'],
+        ['Aegean Suites Hotel, Skiathos', 'An intimate hotel in Skiathos with spacious suites, a pool, and a hillside location overlooking the Aegean Sea.', 'Megali Ammos Beach, Periferiakos Skiathou, Skiathos 370 02, Greece'],
+        ['Grand Hotel Palace, Thessaloniki', 'A five-star hotel in Thessaloniki with luxurious rooms, a rooftop pool, and a central location near Aristotelous Square.', 'Monastiriou 305, Thessaloniki 546 28, Greece'],
+        ['Vencia Boutique Hotel, Mykonos', 'A boutique hotel in Mykonos with stylish rooms, a swimming pool, and panoramic views of Mykonos Town and the sea.', 'Mykonos 846 00, Greece'],
+        ['Elivi Skiathos, Koukounaries', 'A resort in Skiathos with a variety of accommodations, a spa, multiple pools, and a private beach.', 'Koukounaries Bay, Skiathos 370 02, Greece'],
+        ['Mykonos Grand Hotel and Resort', 'A luxury resort in Mykonos with sea-view rooms, a spa, a private beach, and a gourmet restaurant.', 'Agios Ioannis 846 00, Greece'],
+        ['Poseidonion Grand Hotel, Spetses', 'A historic hotel in Spetses with elegant rooms, a seafront location, and a classic ambiance.', 'Ντάπια, Spetses 180 50, Greece'],
+        ['Aeolos Beach Hotel, Corfu', 'A family-friendly hotel in Corfu with comfortable rooms, a pool, and direct access to the beach.', 'Perama 490 84, Greece'],
+        ['AquaGrand Exclusive Deluxe Resort, Lindos', 'A beachfront resort in Lindos, Rhodes, with modern accommodations, a spa, and panoramic views of the sea.', 'Lindos 851 07, Greece'],
+        ['Aldemar Knossos Royal, Hersonissos', 'A family-friendly resort in Hersonissos, Crete, with spacious rooms, multiple pools, and a variety of dining options.', 'Hersonissos 700 14, Greece']
+    ],
+    "singapore": [
+        ['Marina Bay Sands', 'Iconic luxury hotel with a rooftop infinity pool, multiple dining options, and breathtaking views of the city skyline.', '10 Bayfront Ave, Singapore 018956'],
+        ['The Ritz-Carlton, Millenia Singapore', 'Luxurious hotel known for its elegant accommodations, exceptional service, and stunning art collection.', 'Marina Bay 7, Raffles Ave., Singapore 039799'],
+        ['Shangri-La Hotel, Singapore', 'Five-star hotel set amidst lush tropical gardens, offering spacious rooms, fine dining, and a spa.', '22 Orange Grove Rd, Singapore 258350'],
+        ['Mandarin Oriental, Singapore', 'Award-winning hotel with a prime location, featuring stylish rooms, gourmet restaurants, and a rooftop pool.', '5 Raffles Ave., Singapore 039797'],
+        ['Four Seasons Hotel Singapore', 'Upscale hotel known for its refined accommodations, personalized service, and diverse dining options.', '190 Orchard Blvd, Singapore 248646'],
+        ['The Fullerton Hotel Singapore', 'Historic hotel in a neoclassical building, offering a blend of heritage and modern luxury along the Singapore River.', '1 Fullerton Square, Singapore 049178'],
+        ['W Singapore - Sentosa Cove', 'Chic hotel on Sentosa Island with a trendy design, spacious rooms, and a vibrant nightlife scene.', '21 Ocean Way, Singapore 098374'],
+        ['Capella Singapore', 'Luxury resort on Sentosa Island, known for its colonial-style architecture, lush surroundings, and personalized service.', '1 The Knolls, Sentosa Island, Singapore 098297'],
+        ['Swissôtel The Stamford', 'Iconic hotel with a central location, featuring panoramic views, multiple dining choices, and an outdoor pool.', '2 Stamford Rd, Singapore 178882'],
+        ['InterContinental Singapore', 'Elegant hotel with a blend of Peranakan and colonial influences, offering refined accommodations and dining.', '80 Middle Rd, Singapore 188966'],
+        ['Raffles Hotel Singapore', 'Historic and iconic hotel known for its colonial charm, classic elegance, and the famous Singapore Sling cocktail.', '1 Beach Rd, Singapore 189673'],
+        ['Pan Pacific Singapore', 'Contemporary hotel with stunning city views, spacious rooms, and a range of dining options.', '7 Raffles Blvd, Singapore 039595'],
+        ['Andaz Singapore', 'Modern luxury hotel with a stylish design, panoramic views, and innovative dining experiences.', '5 Fraser St, Singapore 189354'],
+        ['Grand Hyatt Singapore', 'Five-star hotel with a central location, featuring contemporary rooms, diverse dining, and a spa.', '10 Scotts Rd, Singapore 228211'],
+        ['Fairmont Singapore', 'Luxurious hotel with a convenient location, offering elegant accommodations, fine dining, and a spa.', '80 Bras Basah Rd, Singapore 189560'],
+        ['JW Marriott Hotel Singapore South Beach', 'Sophisticated hotel with a blend of heritage and contemporary design, featuring stylish rooms and dining options.', '30 Beach Road, Nicoll Hwy, Access Via, Singapore 189763'],
+        ['The St. Regis Singapore', 'Opulent hotel known for its timeless luxury, bespoke service, and refined accommodations.', '29 Tanglin Rd, Singapore 247911'],
+        ['Conrad Centennial Singapore', 'Upscale hotel with a central location, offering modern rooms, multiple dining venues, and a rooftop pool.', '2 Temasek Blvd, Singapore 038982'],
+        ['Sofitel Singapore Sentosa Resort & Spa', 'Luxury resort on Sentosa Island with a French-inspired design, spacious rooms, and a tranquil spa.', '2 Bukit Manis Rd, Sentosa, Singapore 099891'],
+        ['Oasia Hotel Downtown, Singapore', 'Modern and stylish hotel with a unique facade, featuring comfortable rooms and a rooftop pool.', '100 Peck Seah St, Singapore 079333'],
+        ['One Farrer Hotel', 'Contemporary hotel with a focus on wellness, offering modern accommodations and diverse dining options.', '1 Farrer Park Station Rd, Singapore 217562'],
+        ['Hotel Fort Canning', 'Boutique hotel set in a historical building surrounded by greenery, featuring stylish rooms and a spa.', '11 Canning Walk, Singapore 178881'],
+        ['The Westin Singapore', 'Five-star hotel with a central location, offering modern accommodations, wellness amenities, and panoramic views.', '12 Marina View, #2 Asia Square Tower, Singapore 018961'],
+        ['Amara Sanctuary Resort Sentosa', 'Resort-style hotel on Sentosa Island with lush surroundings, spacious rooms, and a pool.', 'Amara Sanctuary Resort, Singapore'],
+        ['M Hotel Singapore', 'Modern hotel with a sleek design, featuring comfortable rooms, dining options, and a rooftop pool.', 'Anson Rd, 81, Singapore 079908'],
+        ['Sofitel Singapore City Centre', 'Luxury hotel with a contemporary design, offering elegant rooms, fine dining, and a wellness spa.', '9 Wallich St, Singapore 078885'],
+        ['Ascott Orchard Singapore', 'Serviced residence with a prime location on Orchard Road, featuring spacious apartments and amenities.', 'No. 11 Cairnhill Rd, Singapore 229724'],
+        ['The Capitol Kempinski Hotel Singapore', 'Luxurious hotel in a heritage building, offering opulent accommodations and fine dining.', '15 Stamford Rd, Singapore 178906'],
+        ['PARKROYAL COLLECTION Pickering, Singapore', 'Eco-friendly hotel with a unique garden concept, offering stylish rooms and an infinity pool.', '3 Upper Pickering St, Singapore 058289'],
+        ['Hotel Jen Orchardgateway Singapore', 'Modern hotel with a vibrant atmosphere, featuring contemporary rooms and a rooftop infinity pool.', '277 Orchard Rd, Singapore 238858'],
+        ['Village Hotel Sentosa', 'Family-friendly hotel on Sentosa Island with a beachfront location, spacious rooms, and recreational facilities.', '10 Artillery Ave, #02-01 Palawan Ridge, Sentosa Island, Singapore 099951'],
+        ['Sheraton Towers Singapore', 'Upscale hotel with a central location, offering elegant rooms, dining options, and a pool.', '39 Scotts Rd, Singapore 228230'],
+        ['The Warehouse Hotel', 'Boutique hotel in a historic riverside building, featuring stylish rooms and a rooftop pool.', '320 Havelock Road, Robertson Quay, Singapore 169628'],
+        ['Courtyard by Marriott Singapore Novena', 'Contemporary hotel with a focus on technology, offering comfortable rooms and a rooftop pool.', '99 Irrawaddy Rd, Singapore 329568'],
+        ['PARKROYAL COLLECTION Marina Bay, Singapore', 'Modern hotel with a central location, offering stylish rooms, dining options, and a wellness spa.', '6 Raffles Blvd, Singapore 039594'],
+        ['InterContinental Singapore Robertson Quay', 'Riverside hotel with a contemporary design, featuring modern accommodations and dining choices.', '1 Nanson Rd, Singapore 238909'],
+        ['The Quay Hotel', 'Boutique hotel with a stylish design, offering comfortable rooms and a rooftop pool.', '57 South Bridge Rd, Singapore 058688'],
+        ['Carlton Hotel Singapore', 'Elegant hotel with a central location, featuring modern rooms, dining options, and a rooftop pool.', '76 Bras Basah Rd, Singapore 189558'],
+        ['Oasia Hotel Novena, Singapore', 'Modern hotel with a focus on wellness, offering comfortable rooms and a rooftop pool.', '8 Sinaran Dr, Singapore 307470'],
+        ['Crowne Plaza Changi Airport', 'Airport hotel with a sleek design, featuring comfortable rooms, dining options, and a pool.', '75 Airport Blvd., #01-01, Singapore 819664'],
+        ['JEN Singapore Tanglin by Shangri-La', 'Modern hotel with a central location, offering contemporary rooms and a rooftop pool.', '1A Cuscaden Rd, Singapore 249716'],
+        ['Capri by Fraser, Changi City, Singapore', 'Serviced residence with a convenient location, featuring modern apartments and amenities.', '3 Changi Business Park Central 1, Singapore 486037'],
+        ['PARKROYAL Serviced Suites Singapore', 'Serviced suites with a central location, offering spacious apartments and recreational facilities.', '7500A Beach Rd, #01-345/346 The Plaza, Singapore 199591'],
+        ['Naumi Hotel Singapore', 'Boutique hotel with a stylish design, featuring contemporary rooms and a rooftop infinity pool.', '41 Seah St, Singapore 188396'],
+        ['The Scarlet Singapore', 'Boutique hotel with a distinctive design, offering luxurious rooms and a rooftop bar.', '33 Erskine Rd, Singapore 069333'],
+        ['The South Beach', 'Upscale hotel with a blend of heritage and modern design, featuring stylish rooms and a rooftop pool.', '38 Beach Rd, Singapore 189767'],
+        ['Hotel Soloha', 'Boutique hotel with a modern and vibrant design, offering comfortable rooms and a rooftop bar.', '12 Teck Lim Rd, Singapore 088387'],
+        ['The Vagabond Club, Singapore, a Tribute Portfolio Hotel', 'Art-themed boutique hotel with luxurious accommodations and unique dining experiences.', '39 Syed Alwi Rd, Singapore 207630'],
+        ['Hotel G Singapore', 'Stylish hotel with a modern design, offering comfortable rooms and a rooftop pool.', '200 Middle Rd, Singapore 188980'],
+        ['PARKROYAL Serviced Suites Kuala Lumpur', 'Serviced suites in Kuala Lumpur with a central location, featuring spacious apartments and amenities.', 'Singapore']
+    ],
+    "australia": [
+        ['Sydney Harbour Marriott Hotel at Circular Quay', 'Luxury hotel with a prime waterfront location, offering elegant accommodations and stunning views.', '30 Pitt St, Sydney NSW 2000, Australia'],
+        ['Four Seasons Hotel Sydney', 'Iconic hotel with a central location, featuring luxurious rooms, diverse dining options, and a rooftop pool.', '199 George St, The Rocks NSW 2000, Australia'],
+        ['InterContinental Sydney', 'Historic hotel with panoramic views of the Sydney Opera House and Sydney Harbour, offering upscale accommodations.', '33 Cross St, Double Bay NSW 2028, Australia'],
+        ['Shangri-La Hotel Sydney', 'Five-star hotel with breathtaking views of the Sydney Opera House, Sydney Harbour Bridge, and the city skyline.', '176 Cumberland St, The Rocks NSW 2000, Australia'],
+        ['Park Hyatt Sydney', 'Exclusive waterfront hotel with contemporary design, luxurious rooms, and a rooftop terrace overlooking the harbor.', '7 Hickson Rd, The Rocks NSW 2000, Australia'],
+        ['The Langham, Sydney', 'Elegant hotel with a waterfront location, offering sophisticated rooms, a day spa, and fine dining.', '89-113 Kent St, Millers Point NSW 2000, Australia'],
+        ['QT Sydney', 'Boutique hotel with a blend of Gothic and Art Deco design, featuring stylish rooms and unique dining experiences.', '49 Market St, Sydney NSW 2000, Australia'],
+        ['The Darling at The Star', 'Luxury hotel within The Star casino complex, offering chic rooms, a spa, and a rooftop pool.', '1 Casino Dr, Broadbeach QLD 4218, Australia'],
+        ['Pier One Sydney Harbour, Autograph Collection', 'Waterfront hotel with historic charm, featuring stylish rooms and views of Sydney Harbour Bridge.', 'Walsh Bay, 11 Hickson Rd, Dawes Point NSW 2000, Australia'],
+        ['Ovolo Woolloomooloo', 'Chic hotel set in a wharf building, offering modern rooms, a rooftop bar, and a unique design.', '6 Cowper Wharf Roadway, Woolloomooloo NSW 2011, Australia'],
+        ['Sofitel Sydney Darling Harbour', 'Upscale hotel with a waterfront location, featuring elegant accommodations and stunning views of Darling Harbour.', 'Sofitel Sydney Darling Harbour, 12 Darling Dr, Sydney NSW 2000, Australia'],
+        ['Radisson Blu Plaza Hotel Sydney', 'Historic hotel with a central location, offering stylish rooms, a spa, and fine dining.', "27 O'Connell St, Sydney NSW 2000, Australia"],
+        ['Swissôtel Sydney', "Contemporary hotel with a central location near Sydney's landmarks, offering modern rooms and a rooftop pool.", '68 Market St, Sydney NSW 2000, Australia'],
+        ['Primus Hotel Sydney', 'Art Deco-inspired hotel with luxurious accommodations, a rooftop pool, and a rooftop bar.', '339 Pitt St, Sydney NSW 2000, Australia'],
+        ['Sir Stamford at Circular Quay Hotel Sydney', 'Elegant hotel with a classical decor, offering refined rooms and a central location.', '93 Macquarie St, Sydney NSW 2000, Australia'],
+        ['PARKROYAL Darling Harbour, Sydney', 'Modern hotel with a convenient location, featuring comfortable rooms and views of Darling Harbour.', '150 Day St, Sydney NSW 2000, Australia'],
+        ['Sydney Marriott Hotel Grosvenor Square', 'Contemporary hotel with a central location, offering modern rooms and a rooftop pool.', '30 Pitt St, Sydney NSW 2000, Australia'],
+        ['The Westin Sydney', 'Five-star hotel set in a historic building, featuring luxurious rooms and a central location.', 'Sydney NSW, Australia'],
+        ['Amora Hotel Jamison Sydney', 'Upscale hotel with a central location, offering spacious rooms, a day spa, and diverse dining options.', '11 Jamison St, Sydney NSW 2000, Australia'],
+        ['Hyatt Regency Sydney', 'Waterfront hotel with a contemporary design, offering modern rooms and stunning views of Darling Harbour.', '161 Sussex St, Sydney NSW 2000, Australia'],
+        ['The Grace Hotel Sydney', 'Historic hotel with a blend of Art Deco and Neo-Gothic architecture, offering elegant accommodations.', '77 York St, Sydney NSW 2000, Australia'],
+        ['The Fullerton Hotel Sydney', 'Luxury hotel with a historic setting in the former General Post Office building, offering refined rooms and dining.', 'Lobby Level/1 Martin Pl, Sydney NSW 2000, Australia'],
+        ['Hilton Sydney', 'Contemporary hotel with a central location, featuring modern rooms, a rooftop pool, and diverse dining options.', '488 George St, Sydney NSW 2000, Australia'],
+        ['Sheraton Grand Sydney Hyde Park', 'Five-star hotel with a central location near Hyde Park, offering elegant rooms and a rooftop pool.', '161 Elizabeth St, Sydney NSW 2000, Australia'],
+        ['The Sebel Quay West Suites Sydney', 'Apartment-style hotel with a waterfront location, offering spacious suites and views of Sydney Harbour.', '98 Gloucester St, The Rocks NSW 2000, Australia'],
+        ['The Old Clare Hotel', 'Boutique hotel set in a historic building, featuring stylish rooms and unique design elements.', '1 Kensington St, Chippendale NSW 2008, Australia'],
+        ['Meriton Suites World Tower, Sydney', 'Modern hotel with a central location, offering spacious suites and panoramic views of the city.', '95 Liverpool St, Sydney NSW 2000, Australia'],
+        ['InterContinental Sydney Double Bay', 'Elegant hotel with a waterfront location in Double Bay, offering luxurious rooms and dining.', '33 Cross St, Double Bay NSW 2028, Australia'],
+        ['QT Bondi', 'Boutique hotel with a beachside location in Bondi, featuring stylish rooms and a rooftop bar.', '6 Beach Rd, Bondi Beach NSW 2026, Australia'],
+        ['The William Inglis Hotel', 'Equestrian-themed hotel with a unique design, offering comfortable rooms and a rooftop pool.', '155 Gov Macquarie Dr, Warwick Farm NSW 2170, Australia'],
+        ['Meriton Suites Sussex Street, Sydney', 'Modern hotel with a central location, offering spacious suites and views of Darling Harbour.', '234 Sussex St, Sydney NSW 2000, Australia'],
+        ['Oaks Sydney Goldsbrough Suites', 'Historic building turned apartment-style hotel, offering self-contained suites and a central location.', '243 Pyrmont St, Darling Harbour NSW 2009, Australia'],
+        ['Rydges Sydney Harbour', 'Waterfront hotel with views of Sydney Harbour Bridge, featuring comfortable rooms and a rooftop pool.', '55 George St, The Rocks NSW 2000, Australia'],
+        ['The Tank Stream', 'Boutique hotel with a central location, offering stylish rooms and a focus on sustainability.', '97-99 Pitt St, Sydney NSW 2000, Australia'],
+        ['The Hughenden Boutique Hotel', 'Charming boutique hotel with a historic setting, offering unique rooms and a garden courtyard.', '14 Queen St, Woollahra NSW 2025, Australia'],
+        ['Mantra 2 Bond Street', 'Modern hotel with a central location, offering apartment-style accommodations and city views.', 'Cnr George St, And, Bond St, Sydney NSW 2000, Australia'],
+        ['Hyatt Regency Sydney Darling Harbour', 'Contemporary hotel with a waterfront location, featuring modern rooms and a rooftop bar.', 'Sydney NSW 2000, Australia'],
+        ['Meriton Suites Kent Street, Sydney', 'Modern hotel with a central location, offering spacious suites and panoramic views of the city.', '528 Kent St, Sydney NSW 2000, Australia'],
+        ['Travelodge Hotel Sydney Wynyard', "Convenient hotel with a central location, featuring comfortable rooms and easy access to Sydney's attractions.", '7-9 York St, Sydney NSW 2000, Australia'],
+        ['Rydges World Square Sydney', 'Central hotel with a modern design, offering comfortable rooms and a rooftop terrace.', '389 Pitt St, Sydney NSW 2000, Australia'],
+        ['Novotel Sydney Central', 'Modern hotel with a central location, featuring contemporary rooms and a rooftop pool.', '169/179 Thomas St, Haymarket NSW 2000, Australia'],
+        ['Meriton Suites Campbell Street, Sydney', 'Modern hotel with a central location, offering spacious suites and city views.', '6 Campbell St, Haymarket NSW 2000, Australia'],
+        ['Holiday Inn Old Sydney', 'Historic hotel with a central location near The Rocks, offering comfortable rooms and views of Sydney Harbour.', '68 Harbour St, Haymarket NSW 2000, Australia'],
+        ['Vibe Hotel Sydney', 'Contemporary hotel with a central location, offering modern rooms and a rooftop pool.', 'Sydney NSW, Australia'],
+        ['Meriton Suites Pitt Street, Sydney', 'Modern hotel with a central location, offering spacious suites and panoramic views of the city.', '329 Pitt St, Sydney NSW 2000, Australia'],
+        ['Veriu Broadway', 'Boutique hotel with a focus on local experiences, offering stylish rooms and a rooftop terrace.', '35 Mountain St, Ultimo NSW 2007, Australia'],
+        ['Pier One Sydney Harbour Autograph Collection', 'Waterfront hotel with historic charm, featuring stylish rooms and views of Sydney Harbour Bridge.', 'Walsh Bay, 11 Hickson Rd, Dawes Point NSW 2000, Australia']
+    ],
+    "china": [
+        ['The Ritz-Carlton, Beijing', 'Luxurious hotel in the heart of Beijing, offering opulent accommodations and personalized service.', 'China, Bei Jing Shi, Chao Yang Qu, CN 北京市 朝阳区 建国路甲83号 邮政编码: 100025'],
+        ['Mandarin Oriental Pudong, Shanghai', 'Five-star hotel with a waterfront location, featuring elegant rooms and panoramic views of the city.', 'China, Shang Hai Shi, Pu Dong Xin Qu, Lujiazui, 浦东南路111号 邮政编码: 200120'],
+        ['Park Hyatt Shanghai', 'Iconic hotel located in the Shanghai World Financial Center, offering sophisticated rooms and a rooftop bar with stunning views.', '100 Shi Ji Da Dao, Lujiazui, Pu Dong Xin Qu, Shang Hai Shi, China, 200120'],
+        ['The Peninsula Beijing', 'Historic hotel with a central location, offering timeless elegance, spacious rooms, and fine dining.', 'China, Bei Jing Shi, Dong Cheng Qu, 金鱼胡同8号 邮政编码: 100006'],
+        ['Waldorf Astoria Shanghai on the Bund', 'Stylish hotel with a prime location on the Bund, featuring Art Deco-inspired design and luxurious amenities.', 'China, Shang Hai Shi, Huang Pu Qu, Waitan, 中山东一路2号 邮政编码: 200002'],
+        ['Four Seasons Hotel Beijing', 'Luxury hotel with a contemporary design, offering spacious rooms, a spa, and multiple dining options.', 'China, Bei Jing Shi, Chao Yang Qu, 亮马桥路48号 邮政编码: 100125'],
+        ['The St. Regis Shanghai Jingan', 'Elegant hotel with a central location, featuring luxurious rooms, a spa, and personalized butler service.', 'China, Shang Hai Shi, Jing An Qu, 北京西路1008号 邮政编码: 200041'],
+        ['Rosewood Beijing', "Sophisticated hotel in Beijing's Chaoyang District, offering stylish accommodations and diverse dining options.", 'China, Bei Jing Shi, Chao Yang Qu, Chao Yang Men Wai Da Jie, 1号京广中心 邮政编码: 100020'],
+        ['JW Marriott Hotel Shanghai at Tomorrow Square', 'Five-star hotel with panoramic views of the city, featuring modern rooms and a rooftop terrace.', "China, Shang Hai Shi, Huang Pu Qu, People's Square, 南京西路399号 邮政编码: 200003"],
+        ['The Upper House, Hong Kong', "Boutique hotel in Hong Kong's Pacific Place, offering spacious rooms with panoramic views and contemporary design.", '88 Queensway, Admiralty, Hong Kong'],
+        ['Conrad Beijing', 'Contemporary hotel with a central location, offering upscale rooms, a spa, and diverse dining options.', 'China, Bei Jing Shi, Chao Yang Qu, 使馆区东三环北路29号 邮政编码: 100020'],
+        ['The Ritz-Carlton Shanghai, Pudong', 'Luxury hotel in the Lujiazui financial district, featuring elegant rooms and exceptional service.', 'China, Shang Hai Shi, Pu Dong Xin Qu, Lujiazui, 世纪大道8号 邮政编码: 200120'],
+        ['Fairmont Peace Hotel, Shanghai', 'Historic hotel on the Bund, blending Art Deco charm with modern amenities and offering scenic views of the city.', 'China, Shang Hai Shi, Huang Pu Qu, Waitan, 南京东路20号 邮政编码: 200002'],
+        ['Mandarin Oriental Guangzhou', 'Five-star hotel with a riverside location, offering luxurious rooms and a spa with panoramic views.', '45 Tian He Lu, Yue Xiu Qu, Guang Zhou Shi, 45, China, 510620'],
+        ['W Beijing - The Forbidden City', 'Stylish hotel with a central location near the Forbidden City, featuring modern design and vibrant nightlife.', '4 Jing Shan Qian Jie, Dong Cheng Qu, Bei Jing Shi, China, 100009'],
+        ['The PuLi Hotel and Spa, Shanghai', 'Urban retreat with a serene atmosphere, offering spacious rooms and a holistic spa experience.', 'China, Shang Hai Shi, Jing An Qu, 久光常德路1号 邮政编码: 200040'],
+        ['Raffles Beijing Hotel', 'Iconic hotel with a historic setting, offering luxurious rooms, fine dining, and a courtyard garden.', '33 Dong Chang An Jie, Dong Cheng Qu, China, 100006'],
+        ['Jumeirah Himalayas Hotel Shanghai', 'Contemporary hotel with an artistic design, offering spacious rooms and a holistic wellness center.', 'China, Shang Hai Shi, Pu Dong Xin Qu, 梅花路1108号 邮政编码: 200011'],
+        ['St. Regis Chengdu', 'Elegant hotel with a central location in Chengdu, featuring luxurious rooms, a spa, and personalized service.', '88 Ti Du Jie, Luomashi, Qing Yang Qu, Cheng Du Shi, Si Chuan Sheng, China, 610016'],
+        ['Mandarin Oriental Shanghai', 'Five-star hotel on the Pudong waterfront, offering sophisticated rooms and panoramic views of the city.', 'China, Shang Hai Shi, Pu Dong Xin Qu, Lujiazui, 浦东南路111号 邮政编码: 200120'],
+        ['The Opposite House, Beijing', "Chic hotel in the heart of Beijing's Sanlitun district, offering modern design and spacious accommodations.", '11 San Li Tun Lu, 使馆区 Chao Yang Qu, Bei Jing Shi, China, 100027'],
+        ['Grand Hyatt Shanghai', 'Iconic hotel with a dramatic atrium, offering panoramic views of the Bund and the city skyline.', 'China, Shang Hai Shi, Pu Dong Xin Qu, Lujiazui, 世纪大道88号 邮政编码: 200120'],
+        ['Shangri-La Hotel, Beijing', 'Luxury hotel with a central location, featuring elegant rooms, a spa, and beautiful gardens.', 'China, Bei Jing Shi, Hai Dian Qu, 紫竹院路29号 邮政编码: 100089'],
+        ['Kerry Hotel Pudong, Shanghai', 'Contemporary hotel with a riverside location, offering modern rooms and a rooftop terrace.', 'China, Shang Hai Shi, Pu Dong Xin Qu, 世纪公园花木路1388号 邮政编码: 201204'],
+        ['InterContinental Shanghai Wonderland', 'Innovative hotel built into an abandoned quarry, offering unique rooms and breathtaking views.', 'China'],
+        ['The Westin Bund Center, Shanghai', 'Central hotel on the Bund, offering comfortable rooms, a spa, and views of the Huangpu River.', 'China, Shang Hai Shi, Huang Pu Qu, 河南中路88号 邮政编码: 200002'],
+        ['Aman at Summer Palace, Beijing', 'Luxurious retreat near the Summer Palace, offering traditional Chinese design and peaceful surroundings.', '1 Gongmenqian Street, 东城区 China, 100091'],
+        ['Edition Shanghai', 'Modern hotel with a prime location on the Bund, featuring stylish rooms and a rooftop bar.', '199 Nanjing Road East, Huangpu, Shanghai, 上海市 China, 200002'],
+        ['The Langham, Shanghai, Xintiandi', 'Elegant hotel in the heart of Xintiandi, offering luxurious rooms and a spa.', 'China, Shang Hai Shi, Huang Pu Qu, 马当路99号 邮政编码: 200021'],
+        ['Ritz-Carlton, Hong Kong', 'Five-star hotel with a sky-high location in the International Commerce Centre, offering stunning views of Hong Kong.', '九龙柯士甸道西1号, International Commerce Centre (ICC), 1 Austin Rd W, Kowloon, Hong Kong'],
+        ['Hotel Éclat Beijing', 'Art-focused hotel with a central location, featuring contemporary design and a notable art collection.', '9 Dong Da Qiao Lu, Chao Yang Qu, Bei Jing Shi, China, 100020'],
+        ['Jing An Shangri-La, West Shanghai', "Luxury hotel with a central location in Jing'an, offering elegant rooms and a spa.", 'China, Shang Hai Shi, Jing An Qu, 久光延安中路1218号 邮政编码: 200040'],
+        ['Mandarin Oriental Hong Kong', 'Iconic hotel in the heart of Hong Kong, offering luxurious rooms, fine dining, and a spa.', '5 Connaught Road, Central, Hong Kong'],
+        ["Shangri-La's China World Hotel, Beijing", 'Central hotel in the China World Trade Center complex, offering upscale rooms and extensive dining options.', 'China, Bei Jing Shi, Chao Yang Qu, 建国门外大街1号 邮政编码: 100004'],
+        ['Renaissance Shanghai Yu Garden Hotel', 'Modern hotel near Yu Garden, offering comfortable rooms and a rooftop terrace with city views.', 'China, Shang Hai Shi, Huang Pu Qu, 四牌楼河南南路159号 邮政编码: 200010'],
+        ['The St. Regis Beijing', 'Luxury hotel with a central location, featuring', 'China, Bei Jing Shi, Chao Yang Qu, 建国门外大街21号 邮政编码: 100020']
+    ],
+    "uae": [
+        ['Burj Al Arab Jumeirah', 'Iconic luxury hotel in Dubai known for its sail-shaped structure and opulent accommodations.', 'Dubai - Umm Suqeim 3 - Dubai - United Arab Emirates'],
+        ['Jumeirah Emirates Towers', 'Luxury hotel featuring modern design and panoramic city views in Dubai.', 'Sheikh Zayed Rd - Trade Centre - Trade Centre 2 - Dubai - United Arab Emirates'],
+        ['Atlantis The Palm', 'Resort located on the Palm Jumeirah offering a waterpark, marine habitats, and luxurious accommodations.', 'Crescent Rd - The Palm Jumeirah - Dubai - United Arab Emirates'],
+        ['One&Only Royal Mirage', 'Beachfront resort in Dubai known for its Arabian architecture and luxurious amenities.', 'King Salman Bin Abdulaziz Al Saud St - Dubai Marina - Dubai - United Arab Emirates'],
+        ['Madinat Jumeirah Resort', 'Luxury resort complex in Dubai featuring traditional Arabian architecture and scenic waterways.', 'Al Sufouh 1 - Dubai - United Arab Emirates'],
+        ['Armani Hotel Dubai', 'Luxurious hotel located in Burj Khalifa offering elegant accommodations and views of the city.', 'Burj Khalifa - Sheikh Mohammed bin Rashid Blvd - Downtown Dubai - Dubai - United Arab Emirates'],
+        ['The Ritz-Carlton Abu Dhabi, Grand Canal', 'Five-star hotel in Abu Dhabi featuring lavish rooms and a private beach.', 'الروضة - المَقطَع - أبو ظبي - United Arab Emirates'],
+        ['Waldorf Astoria Ras Al Khaimah', 'Luxury resort in Ras Al Khaimah known for its palatial rooms and serene setting.', 'Vienna St - Al Hamra Village - Ras al Khaimah - United Arab Emirates'],
+        ['Jumeirah Al Naseem', 'Contemporary beachfront resort in Dubai with luxurious rooms and a range of dining options.', 'Jumeirah St - Umm Suqeim 3 - Dubai - United Arab Emirates'],
+        ['Park Hyatt Dubai', 'Luxury waterfront hotel overlooking Dubai Creek featuring elegant rooms and a spa.', 'Dubai Creek Resort, Park Hyatt Dubai - Dubai Creek Club St - Port Saeed - Dubai - United Arab Emirates'],
+        ['Bab Al Shams Desert Resort & Spa', 'Desert resort offering traditional Arabian experiences and luxurious accommodations.', 'Al Qudra Road - opposite Endurance City - Dubai - United Arab Emirates'],
+        ['The St. Regis Saadiyat Island Resort', 'Beachfront resort in Abu Dhabi known for its elegant Mediterranean-style architecture.', 'Al Saadiyat Island - Abu Dhabi - United Arab Emirates'],
+        ['Four Seasons Resort Dubai at Jumeirah Beach', 'Luxurious beachfront resort offering spacious rooms and impeccable service.', 'Jumeirah Beach Rd - Jumeirah - Jumeirah 2 - Dubai - United Arab Emirates'],
+        ['Raffles Dubai', 'Iconic hotel with stunning pyramid-shaped architecture and luxurious amenities.', 'Wafi - شارع الشيخ راشد - أم هرير ٢ - دبي - United Arab Emirates'],
+        ['Palazzo Versace Dubai', 'Luxury hotel designed with Italian craftsmanship and offering opulent accommodations.', 'Al Jaddaf - Jaddaf Waterfront - Dubai - United Arab Emirates'],
+        ['W Dubai - The Palm', 'Stylish beachfront hotel on Palm Jumeirah with modern rooms and vibrant nightlife options.', 'West Crescent - The Palm Jumeirah - Dubai - United Arab Emirates'],
+        ['Mandarin Oriental Jumeira, Dubai', 'Luxury beachfront resort with sophisticated rooms and a range of dining experiences.', 'Jumeirah Beach Rd - Jumeirah - Jumeirah 1 - Dubai - United Arab Emirates'],
+        ['St. Regis Dubai, The Palm', 'Luxury hotel on Palm Jumeirah offering elegant rooms and personalized service.', '447Q+GV - The Palm Jumeirah - Dubai - United Arab Emirates'],
+        ['Anantara Qasr al Sarab Desert Resort', 'Desert resort offering luxurious accommodations amidst the Liwa Desert.', 'Qasr Al Sarab Desert Resort - Al Mirayr - Abu Dhabi - United Arab Emirates'],
+        ['Address Downtown', 'Luxury hotel in Dubai known for its sleek design and panoramic views of the city.', 'Downtown Dubai - Dubai - United Arab Emirates'],
+        ['Jumeirah Al Qasr', 'Luxury resort in Madinat Jumeirah with traditional Arabian design and exclusive amenities.', 'Madinat Jumeirah - شارع الملك سلمان بن عبدالعزيز آل سعود - ام سقيم - الصفوح 1 - دبي - United Arab Emirates'],
+        ['InterContinental Dubai Festival City', 'Modern hotel with luxurious rooms located near Dubai Creek and shopping attractions.', 'Dubai Festival City - Dubai - United Arab Emirates'],
+        ['The Oberoi Beach Resort, Al Zorah', 'Secluded beachfront resort in Ajman offering luxurious villas and tranquil surroundings.', 'Al Ittihad Rd 18065 - الزورا - عجمان - United Arab Emirates'],
+        ['Rixos The Palm Dubai Hotel & Suites', 'All-inclusive resort on Palm Jumeirah with elegant rooms and multiple dining options.', 'East Crescent - Plog40 Palm Jumeirah - Dubai - United Arab Emirates'],
+        ['JW Marriott Marquis Hotel Dubai', 'Twin-tower luxury hotel known for its spacious rooms and diverse dining experiences.', 'Business Bay - Dubai - United Arab Emirates'],
+        ['Grand Hyatt Dubai', 'Luxury hotel offering a resort-like experience with landscaped gardens and multiple pools.', 'Grand Hyatt Dubai Oud Metha Road, Dubai Healthcare City Riyadh Street - Near شارع الشيخ راشد - أم هرير ٢ - دبي - United Arab Emirates'],
+        ['Kempinski Hotel Mall of the Emirates', 'Luxury hotel connected to Mall of the Emirates, known for its ski slopes and elegant rooms.', 'Mall of The Emirates - Sheikh Zayed Rd - Al Barsha - Al Barsha 1 - Dubai - United Arab Emirates'],
+        ['Al Maha, a Luxury Collection Desert Resort & Spa', 'Exclusive desert resort offering private villas and immersive desert experiences.', 'N 55° - 24°47\'21.3 - 36\'27.8"E Al Ain - Dubai Rd - Dubai - United Arab Emirates'],
+        ['The Address Boulevard Dubai', 'Luxury hotel with modern rooms and views of Burj Khalifa and The Dubai Fountain.', 'Sheikh Mohammed bin Rashid Blvd - Downtown Dubai - Dubai - United Arab Emirates'],
+        ['The Westin Dubai Mina Seyahi Beach Resort & Marina', 'Beachfront resort offering luxurious rooms and a range of water activities.', 'Dubai Marina - Dubai - United Arab Emirates'],
+        ['Jumeirah Beach Hotel', 'Iconic family-friendly beachfront hotel in Dubai with a wave-shaped design.', 'Jumeirah St - Umm Suqeim - Umm Suqeim 3 - Dubai - United Arab Emirates'],
+        ['InterContinental Dubai Marina', 'Modern hotel in Dubai Marina offering stylish rooms and views of the waterfront.', 'King Salman Bin Abdulaziz Al Saud St - Dubai Marina - Dubai - United Arab Emirates'],
+        ['Armani Hotel Dubai', 'Luxurious hotel located in Burj Khalifa offering elegant accommodations and views of the city.', 'Burj Khalifa - Sheikh Mohammed bin Rashid Blvd - Downtown Dubai - Dubai - United Arab Emirates'],
+        ['The Ritz-Carlton Ras Al Khaimah, Al Wadi Desert', 'Desert resort offering luxury tented villas and immersive desert experiences.', 'Al Mazraa Wadi Khadija - Al Ashish - Ras al Khaimah - United Arab Emirates'],
+        ['The Meydan Hotel', 'Luxury hotel overlooking the Meydan Racecourse with spacious rooms and fine dining options.', 'Meydan Racecourse Al Meydan Road, Nad Al Sheba - Nad Al Sheba 1 - Dubai - United Arab Emirates'],
+        ['Rove Downtown Dubai', 'Trendy hotel in downtown Dubai offering stylish rooms and a vibrant atmosphere.', "312 Al Mustaqbal St - Za'abeel - Za'abeel 2 - Dubai - United Arab Emirates"],
+        ['Le Royal Meridien Beach Resort & Spa', 'Beachfront resort in Dubai known for its luxurious amenities and sea-view rooms.', 'Al Mamsha St - Dubai Marina - Dubai - United Arab Emirates'],
+        ['Arjaan by Rotana, Dubai Media City', 'Hotel apartments in Dubai Media City with spacious accommodations and modern facilities.', 'King Salman Bin Abdulaziz Al Saud St - Al Sufouh - Dubai Media City - Dubai - United Arab Emirates'],
+        ['Grosvenor House, a Luxury Collection Hotel, Dubai', 'Luxury hotel with elegant rooms and dining options on Dubai Marina.', 'Al Emreef St - Dubai Marina - Dubai - United Arab Emirates'],
+        ['Jumeirah Zabeel Saray', 'Luxurious Ottoman-inspired resort on Palm Jumeirah with opulent rooms and a spa.', 'Crescent Rd - The Palm Jumeirah - Dubai - United Arab Emirates'],
+        ['The Ritz-Carlton Dubai', 'Luxury beachfront resort offering elegant rooms and a serene atmosphere.', 'DIFC, off - شارع الشيخ زايد - المركز التجاري - DIFC - دبي - United Arab Emirates'],
+        ['Hilton Dubai The Walk', 'Hotel in Jumeirah Beach Residence offering comfortable rooms and easy access to the beach.', 'Tower B The Walk - Jumeirah Beach Residence - Dubai - United Arab Emirates'],
+        ['Sheraton Grand Hotel, Dubai', "Modern hotel with spacious rooms and a rooftop pool overlooking Dubai's skyline.", '3 Sheikh Zayed Rd - Trade Centre - Trade Centre 1 - Dubai - United Arab Emirates'],
+        ['JA Palm Tree Court', 'Beachfront resort in Jebel Ali with spacious suites and a variety of leisure activities.', 'JA Golf Resort,Exit - 13 Sheikh Zayed Road - Mina Jebel Ali - Jebel Ali Freezone - Dubai - United Arab Emirates'],
+        ['Jumeirah Creekside Hotel', "Contemporary hotel near Dubai Creek offering stylish rooms and access to the city's attractions.", 'Rebat St - Garhoud - Dubai - United Arab Emirates'],
+        ['The H Dubai', "Luxury hotel with modern rooms and a rooftop pool in Dubai's business district.", '1 Sheikh Zayed Rd - Trade Centre - Trade Centre 1 - Dubai - United Arab Emirates'],
+        ['InterContinental Dubai Festival City', 'Modern hotel with luxurious rooms located near Dubai Creek and shopping attractions.', 'Dubai Festival City - Dubai - United Arab Emirates']
+    ],
+    "canada": [
+        ['Fairmont Chateau Laurier', 'Historic castle-like hotel in Ottawa with luxurious rooms and iconic architecture.', '1 Rideau St, Ottawa, ON K1N 8S7, Canada'],
+        ['Fairmont Banff Springs', 'Iconic castle-like hotel in Banff National Park offering luxury accommodations.', '405 Spray Ave, Banff, AB T1L 1J4, Canada'],
+        ['The Ritz-Carlton Toronto', 'Luxury hotel in Toronto known for its elegant rooms and high-end amenities.', '181 Wellington St W, Toronto, ON M5V 3G7, Canada'],
+        ['The Fairmont Empress', 'Historic waterfront hotel in Victoria known for its grandeur and afternoon tea tradition.', 'Canada'],
+        ['Fairmont Pacific Rim', 'Luxury hotel in Vancouver offering stunning views and modern, elegant accommodations.', 'Canada'],
+        ['The Fairmont Royal York', 'Iconic hotel in Toronto known for its historic charm and luxurious amenities.', '100 Front St W, Toronto, ON M5J 1E3, Canada'],
+        ['The St. Regis Toronto', 'Luxury hotel in Toronto offering sophisticated rooms and upscale dining options.', '325 Bay St., Toronto, ON M5H 4G3, Canada'],
+        ['JW Marriott Parq Vancouver', 'Modern hotel in Vancouver featuring luxurious rooms and a range of entertainment options.', '39 Smithe St, Vancouver, BC V6B 0R3, Canada'],
+        ['Shangri-La Hotel, Toronto', 'Luxury hotel in downtown Toronto known for its opulent rooms and personalized service.', '188 University Ave, Toronto, ON M5H 0A3, Canada'],
+        ['The Fairmont Waterfront', 'Waterfront hotel in Vancouver offering luxurious accommodations and scenic views.', '900 Canada Pl, Vancouver, BC V6C 3L5, Canada'],
+        ['Four Seasons Hotel Toronto', 'Elegant hotel in Toronto with luxurious rooms and high-end dining options.', '60 Yorkville Ave, Toronto, ON M4W 0A4, Canada'],
+        ['The Ritz-Carlton Montreal', 'Historic luxury hotel in Montreal offering sophisticated accommodations and fine dining.', '1228 Rue Sherbrooke O, Montréal, QC H3G 1H6, Canada'],
+        ['The Fairmont Hotel Vancouver', 'Historic hotel in Vancouver known for its elegant rooms and central location.', '900 W Georgia St, Vancouver, BC V6C 2W6, Canada'],
+        ['The Westin Harbour Castle, Toronto', 'Waterfront hotel in Toronto offering comfortable rooms and stunning lake views.', '1 Harbour Square, Toronto, ON M5J 1A6, Canada'],
+        ['The St. Regis Montreal', 'Luxury hotel in Montreal known for its grandeur, elegant rooms, and impeccable service.', '275 Rue Saint-Jacques, Montréal, QC H2Y 2N4, Canada'],
+        ['The Fairmont Palliser', 'Historic hotel in Calgary known for its classic elegance and luxurious accommodations.', '133 9 Ave SW, Calgary, AB T2P 2M3, Canada'],
+        ['The Westin Calgary', 'Modern hotel in Calgary offering comfortable rooms and a range of amenities.', '671 Aero Dr NE, Calgary, AB T2E 7Y5, Canada'],
+        ['The Hazelton Hotel', 'Luxury boutique hotel in Toronto known for its stylish rooms and personalized service.', '118 Yorkville Ave, Toronto, ON M5R 1C2, Canada'],
+        ['Rosewood Hotel Georgia', 'Historic luxury hotel in Vancouver with elegant rooms and a sense of timeless elegance.', '801 W Georgia St, Vancouver, BC V6C 1P7, Canada'],
+        ['The Ritz-Carlton, Montréal', 'Historic luxury hotel in Montreal known for its opulent rooms and fine dining.', '1228 Rue Sherbrooke O, Montréal, QC H3G 1H6, Canada'],
+        ['The Fairmont Winnipeg', 'Historic hotel in Winnipeg offering luxurious accommodations and a central location.', '2 Lombard Place, Winnipeg, MB R3B 0Y3, Canada'],
+        ['The Westin Ottawa', 'Hotel in Ottawa offering comfortable rooms and scenic views of the city.', '11 Colonel By Dr, Ottawa, ON K1N 9H4, Canada'],
+        ['The Fairmont Winnipeg', 'Historic hotel in Winnipeg offering luxurious accommodations and a central location.', '2 Lombard Place, Winnipeg, MB R3B 0Y3, Canada'],
+        ['The Westin Ottawa', 'Hotel in Ottawa offering comfortable rooms and scenic views of the city.', '11 Colonel By Dr, Ottawa, ON K1N 9H4, Canada'],
+        ['The Ritz-Carlton Toronto', 'Luxury hotel in Toronto known for its elegant rooms and high-end amenities.', '181 Wellington St W, Toronto, ON M5V 3G7, Canada'],
+        ['The Fairmont Hotel Vancouver', 'Historic hotel in Vancouver known for its elegant rooms and central location.', '900 W Georgia St, Vancouver, BC V6C 2W6, Canada'],
+        ['The Westin Calgary', 'Modern hotel in Calgary offering comfortable rooms and a range of amenities.', '671 Aero Dr NE, Calgary, AB T2E 7Y5, Canada'],
+        ['Four Seasons Hotel Toronto', 'Elegant hotel in Toronto with luxurious rooms and high-end dining options.', '60 Yorkville Ave, Toronto, ON M4W 0A4, Canada'],
+        ['Fairmont Le Château Frontenac', 'Historic castle-like hotel in Quebec City offering luxury accommodations.', '1 Rue des Carrières, Québec, QC G1R 4P5, Canada'],
+        ['The Fairmont Queen Elizabeth', 'Iconic hotel in Montreal known for its history and luxurious accommodations.', '900 Boul. René-Lévesque O, Montréal, QC H3B 4A5, Canada'],
+        ['Le Mount Stephen', 'Historic boutique hotel in Montreal offering elegant rooms and personalized service.', '1440 Rue Drummond, Montréal, QC H3G 1V9, Canada'],
+        ['The Fairmont Jasper Park Lodge', 'Luxury lodge in Jasper National Park offering rustic elegance and scenic views.', '1 Old Lodge Rd, Jasper, AB T0E 1E0, Canada'],
+        ['The Westin Nova Scotian', 'Historic hotel in Halifax offering comfortable rooms and waterfront views.', '1181 Hollis St, Halifax, NS B3H 2P6, Canada'],
+        ['The Fairmont Chateau Whistler', 'Luxury hotel in Whistler known for its alpine elegance and upscale amenities.', '4599 Chateau Blvd, Whistler, BC V8E 0Z5, Canada'],
+        ['The Fairmont Royal York', 'Iconic hotel in Toronto known for its historic charm and luxurious amenities.', '100 Front St W, Toronto, ON M5J 1E3, Canada'],
+        ['The Fairmont Palliser', 'Historic hotel in Calgary known for its classic elegance and luxurious accommodations.', '133 9 Ave SW, Calgary, AB T2P 2M3, Canada'],
+        ['The Westin Calgary', 'Modern hotel in Calgary offering comfortable rooms and a range of amenities.', '671 Aero Dr NE, Calgary, AB T2E 7Y5, Canada'],
+        ['The Hazelton Hotel', 'Luxury boutique hotel in Toronto known for its stylish rooms and personalized service.', '118 Yorkville Ave, Toronto, ON M5R 1C2, Canada'],
+        ['Rosewood Hotel Georgia', 'Historic luxury hotel in Vancouver with elegant rooms and a sense of timeless elegance.', '801 W Georgia St, Vancouver, BC V6C 1P7, Canada'],
+        ['The Ritz-Carlton, Montréal', 'Historic luxury hotel in Montreal known for its opulent rooms and fine dining.', '1228 Rue Sherbrooke O, Montréal, QC H3G 1H6, Canada'],
+        ['The Fairmont Winnipeg', 'Historic hotel in Winnipeg offering luxurious accommodations and a central location.', '2 Lombard Place, Winnipeg, MB R3B 0Y3, Canada'],
+        ['The Westin Ottawa', 'Hotel in Ottawa offering comfortable rooms and scenic views of the city.', '11 Colonel By Dr, Ottawa, ON K1N 9H4, Canada'],
+        ['Fairmont Le Château Frontenac', 'Historic castle-like hotel in Quebec City offering luxury accommodations.', '1 Rue des Carrières, Québec, QC G1R 4P5, Canada'],
+        ['The Fairmont Queen Elizabeth', 'Iconic hotel in Montreal known for its history and luxurious accommodations.', '900 Boul. René-Lévesque O, Montréal, QC H3B 4A5, Canada'],
+        ['Le Mount Stephen', 'Historic boutique hotel in Montreal offering elegant rooms and personalized service.', '1440 Rue Drummond, Montréal, QC H3G 1V9, Canada'],
+        ['The Fairmont Jasper Park Lodge', 'Luxury lodge in Jasper National Park offering rustic elegance and scenic views.', '1 Old Lodge Rd, Jasper, AB T0E 1E0, Canada'],
+        ['The Westin Nova Scotian', 'Historic hotel in Halifax offering comfortable rooms and waterfront views.', '1181 Hollis St, Halifax, NS B3H 2P6, Canada'],
+        ['The Fairmont Chateau Whistler', 'Luxury hotel in Whistler known for its alpine elegance and upscale amenities.', '4599 Chateau Blvd, Whistler, BC V8E 0Z5, Canada']
+    ]
+}
+
+list_of_restaurants = {
+    "armenia": [
+        ['Tavern Yerevan', 'Type: Armenian, Traditional\nDescription: Charming tavern in the heart of Yerevan, offering authentic Armenian cuisine with a focus on traditional dishes.', '5 Amiryan St, Yerevan 0010, Armenia'],
+        ['Sherep Restaurant, Yerevan', 'Type: Armenian, Barbecue\nDescription: Popular barbecue restaurant known for its grilled meats and traditional Armenian flavors.', '1 Amiryan St, Yerevan 0010, Armenia'],
+        ['Dolmama Restaurant, Yerevan', 'Type: Armenian, Fusion\nDescription: Renowned restaurant offering a fusion of Armenian and international flavors, with an emphasis on creative presentations.', '10 Pushkin St, Yerevan 0010, Armenia'],
+        ['Karas, Yerevan', 'Type: Armenian, Winery Restaurant\nDescription: Winery restaurant showcasing Armenian wines and traditional cuisine in a stylish setting.', '20, 1 Hrachya Kochar St, Yerevan 0012, Armenia'],
+        ['Tumanyan Khinkali, Yerevan', 'Type: Georgian, Dumplings\nDescription: Cozy restaurant specializing in Georgian cuisine, particularly khinkali (dumplings) and other traditional dishes.', '21/1 Tumanyan St, Yerevan 0001, Armenia'],
+        ['Tapastan, Yerevan', 'Type: Armenian, Tapas\nDescription: Trendy restaurant offering a modern twist on Armenian cuisine with a menu of creative tapas.', '6 Martiros Saryan St, Yerevan 0002, Armenia'],
+        ['Lavash Restaurant, Yerevan', 'Type: Armenian, Regional\nDescription: Restaurant celebrating Armenian culinary traditions with a focus on regional specialties and classic dishes.', '21 Tumanyan St, Yerevan 0001, Armenia'],
+        ['In Vino, Yerevan', 'Type: Italian, Wine Bar\nDescription: Stylish wine bar and restaurant offering a selection of Italian and Armenian wines, complemented by Italian-inspired dishes.', '6 Martiros Saryan St, Yerevan, Armenia'],
+        ['The Club Yerevan', 'Type: International, Fusion\nDescription: Upscale restaurant with a diverse menu featuring international and fusion cuisine, known for its elegant ambiance.', '40 Tumanyan St, Yerevan 0010, Armenia'],
+        ['12 Tables, Yerevan', 'Type: International, Contemporary\nDescription: Modern restaurant with a diverse menu ranging from international to Armenian dishes, known for its contemporary setting.', '6 Alexander Spendiaryan St, Yerevan, Armenia'],
+        ['Tiziano Ristorante, Yerevan', 'Type: Italian, Gourmet\nDescription: Gourmet Italian restaurant in Yerevan, offering a sophisticated menu with a focus on quality ingredients.', '10/1 Hyusisayin poghota, Yerevan 0010, Armenia'],
+        ['Manouk & Sons, Yerevan', 'Type: Armenian, Barbecue\nDescription: Popular barbecue restaurant known for its grilled meats, including traditional Armenian barbecue dishes.', 'office 107, 11/1 Smbat Zoravar St, Yerevan 0026, Armenia'],
+        ['Taraz Restaurant, Yerevan', 'Type: Armenian, Cultural\nDescription: Cultural restaurant offering not only Armenian cuisine but also traditional music and dance performances, providing a complete cultural experience.', '72 Teryan St, Yerevan, Armenia'],
+        ['Tsirani Garden Restaurant, Yerevan', 'Type: Armenian, Garden\nDescription: Restaurant set in a beautiful garden, serving Armenian cuisine with a focus on fresh and seasonal ingredients.', 'Babajanyan block 3th 1, M15, Առինջ, Armenia'],
+        ['Adzoukh Restaurant, Yerevan', 'Type: Armenian, Home-style\nDescription: Cozy restaurant offering home-style Armenian dishes in a welcoming and comfortable atmosphere.', 'Yezni Koghbatsi street 20, Երևան, Armenia'],
+        ['Atorik Restaurant, Yerevan', 'Type: Armenian, Seafood\nDescription: Seafood restaurant in Yerevan, known for its variety of fresh and flavorful seafood dishes.', 'Yerevan, Armenia'],
+        ['Artashi Mot, Yerevan', 'Type: Armenian, Traditional\nDescription: Traditional Armenian restaurant with a menu featuring classic dishes and local specialties.', 'Սպենդիարյան, Yerevan, Armenia'],
+        ['Caucasus Tavern, Yerevan', 'Type: Armenian, Caucasian\nDescription: Restaurant celebrating the culinary diversity of the Caucasus region, with a menu featuring Armenian and Caucasian dishes.', '1st Floor, 82 Hanrapetutyan pokhots, Yerevan 0010, Armenia'],
+        ['Dargett Craft Brewery, Yerevan', 'Type: Armenian, Brewery\nDescription: Brewery and restaurant offering a variety of craft beers along with a menu of Armenian and international dishes.', '72 Arami poghots, Yerevan 0001, Armenia'],
+        ['Tapenade, Yerevan', 'Type: French, Mediterranean\nDescription: French-Mediterranean restaurant in Yerevan, known for its Mediterranean-inspired dishes and French culinary influences.', 'Yerevan, Armenia'],
+        ['The Green Bean, Yerevan', 'Type: Vegetarian, Vegan\nDescription: Vegetarian and vegan restaurant in Yerevan, offering a menu of plant-based dishes with a focus on freshness and flavor.', '38 Isahakyan poxoc, Yerevan, Armenia'],
+        ['The Club Yerevan', 'Type: International, Fusion\nDescription: Upscale restaurant with a diverse menu featuring international and fusion cuisine, known for its elegant ambiance.', '40 Tumanyan St, Yerevan 0010, Armenia'],
+        ['12 Tables, Yerevan', 'Type: International, Contemporary\nDescription: Modern restaurant with a diverse menu ranging from international to Armenian dishes, known for its contemporary setting.', '6 Alexander Spendiaryan St, Yerevan, Armenia'],
+        ['Tiziano Ristorante, Yerevan', 'Type: Italian, Gourmet\nDescription: Gourmet Italian restaurant in Yerevan, offering a sophisticated menu with a focus on quality ingredients.', '10/1 Hyusisayin poghota, Yerevan 0010, Armenia'],
+        ['Manouk & Sons, Yerevan', 'Type: Armenian, Barbecue\nDescription: Popular barbecue restaurant known for its grilled meats, including traditional Armenian barbecue dishes.', 'office 107, 11/1 Smbat Zoravar St, Yerevan 0026, Armenia'],
+        ['Taraz Restaurant, Yerevan', 'Type: Armenian, Cultural\nDescription: Cultural restaurant offering not only Armenian cuisine but also traditional music and dance performances, providing a complete cultural experience.', '72 Teryan St, Yerevan, Armenia'],
+        ['Tsirani Garden Restaurant, Yerevan', 'Type: Armenian, Garden\nDescription: Restaurant set in a beautiful garden, serving Armenian cuisine with a focus on fresh and seasonal ingredients.', 'Babajanyan block 3th 1, M15, Առինջ, Armenia'],
+        ['Adzoukh Restaurant, Yerevan', 'Type: Armenian, Home-style\nDescription: Cozy restaurant offering home-style Armenian dishes in a welcoming and comfortable atmosphere.', 'Yezni Koghbatsi street 20, Երևան, Armenia'],
+        ['Atorik Restaurant, Yerevan', 'Type: Armenian, Seafood\nDescription: Seafood restaurant in Yerevan, known for its variety of fresh and flavorful seafood dishes.', 'Yerevan, Armenia'],
+        ['Artashi Mot, Yerevan', 'Type: Armenian, Traditional\nDescription: Traditional Armenian restaurant with a menu featuring classic dishes and local specialties.', 'Սպենդիարյան, Yerevan, Armenia'],
+        ['Caucasus Tavern, Yerevan', 'Type: Armenian, Caucasian\nDescription: Restaurant celebrating the culinary diversity of the Caucasus region, with a menu featuring Armenian and Caucasian dishes.', '1st Floor, 82 Hanrapetutyan pokhots, Yerevan 0010, Armenia'],
+        ['Dargett Craft Brewery, Yerevan', 'Type: Armenian, Brewery\nDescription: Brewery and restaurant offering a variety of craft beers along with a menu of Armenian and international dishes.', '72 Arami poghots, Yerevan 0001, Armenia'],
+        ['Tapenade, Yerevan', 'Type: French, Mediterranean\nDescription: French-Mediterranean restaurant in Yerevan, known for its Mediterranean-inspired dishes and French culinary influences.', 'Yerevan, Armenia'],
+        ['The Green Bean, Yerevan', 'Type: Vegetarian, Vegan\nDescription: Vegetarian and vegan restaurant in Yerevan, offering a menu of plant-based dishes with a focus on freshness and flavor.', '38 Isahakyan poxoc, Yerevan, Armenia'],
+        ['Dolce Vita Ristorante, Yerevan', 'Type: Italian, Pizza\nDescription: Italian restaurant known for its authentic pizzas and traditional Italian dishes.', 'Yerevan, Armenia'],
+        ['Cascade Restaurant, Yerevan', 'Type: Armenian, International\nDescription: Restaurant offering a diverse menu with a mix of Armenian and international dishes, located near the iconic Cascade complex.', 'Yerevan, Armenia'],
+        ['Malkhas Jazz Club & Restaurant, Yerevan', 'Type: Armenian, Jazz Club\nDescription: Jazz club and restaurant with a cozy ambiance, serving Armenian cuisine and featuring live jazz performances.', '52, 1 Pushkin St, Yerevan 0002, Armenia'],
+        ['Havet Restaurant, Yerevan', 'Type: Armenian, Mediterranean\nDescription: Mediterranean-inspired restaurant in Yerevan, offering a menu with Armenian and Mediterranean dishes.', 'Yerevan, Armenia']
+    ],
+    "france": [
+        ['Le Jules Verne, Paris', 'Type: French, Gourmet\nDescription: Michelin-starred restaurant located in the Eiffel Tower, offering gourmet French cuisine with panoramic views of Paris.', 'Avenue Gustave Eiffel 2ème, Tour Eiffel, Av. Anatole France, 75007 Paris, France'],
+        ["L'Ambroisie, Paris", 'Type: French, Gastronomic\nDescription: Three-Michelin-starred restaurant on Île Saint-Louis, known for its classic French gastronomy.', '9 Pl. des Vosges, 75004 Paris, France'],
+        ['Mirazur, Menton', 'Type: French, Mediterranean\nDescription: Three-Michelin-starred restaurant overlooking the Mediterranean, offering inventive dishes with a focus on local ingredients.', '30 Av. Aristide Briand, 06500 Menton, France'],
+        ['Arpège, Paris', 'Type: French, Organic\nDescription: Renowned restaurant with three Michelin stars, known for its organic and vegetable-focused French cuisine.', '84 Rue de Varenne, 75007 Paris, France'],
+        ['La Maison Troisgros, Ouches', 'Type: French, Modern\nDescription: Historic restaurant with three Michelin stars, known for its modern and innovative approach to French cuisine.', '728 Rte de Villerest, 42155 Ouches, France'],
+        ['Le Petit Nice, Marseille', 'Type: French, Seafood\nDescription: Michelin-starred restaurant specializing in seafood, offering Mediterranean-inspired dishes.', '17 Rue des Braves Anse de Maldormé, 156 Cor Président John Fitzgerald Kennedy, 13007 Marseille, France'],
+        ['Pierre Gagnaire, Paris', 'Type: French, Creative\nDescription: Three-Michelin-starred restaurant known for its creative and avant-garde French cuisine.', '6 Rue Balzac, 75008 Paris, France'],
+        ['Guy Savoy, Paris', 'Type: French, Gourmet\nDescription: Three-Michelin-starred restaurant offering gourmet French cuisine, located near the Louvre.', 'Monnaie de Paris, 11 Quai de Conti, 75006 Paris, France'],
+        ['Auberge du Vieux Puits, Fontjoncouse', 'Type: French, Regional\nDescription: Remote Michelin three-starred restaurant in the Corbières region, offering regional and Mediterranean-inspired dishes.', '5 Av. Saint-Victor, 11360 Fontjoncouse, France'],
+        ["L'Arpège du Prieuré, Villeneuve-lès-Avignon", 'Type: French, Modern\nDescription: Michelin-starred restaurant offering modern French cuisine with a focus on local ingredients.', 'Villeneuve-lès-Avignon, France'],
+        ["Paul Bocuse, Collonges-au-Mont-d'Or", 'Type: French, Gastronomic\nDescription: Iconic Michelin-starred restaurant founded by the legendary Paul Bocuse, known for its traditional French gastronomy.', "40 Rue de la Plage, 69660 Collonges-au-Mont-d'Or, France"],
+        ['Alain Ducasse au Plaza Athénée, Paris', 'Type: French, Gourmet\nDescription: Three-Michelin-starred restaurant located in the Plaza Athénée hotel, offering gourmet French cuisine.', '25 Av. Montaigne, 75008 Paris, France'],
+        ['La Grenouillère, La Madelaine-sous-Montreuil', 'Type: French, Creative\nDescription: Michelin-starred restaurant in a unique setting, known for its creative and contemporary French cuisine.', 'Rue de la Grenouillère, 62170 La Madelaine-sous-Montreuil, France'],
+        ['Epicure, Paris', 'Type: French, Gourmet\nDescription: Three-Michelin-starred restaurant located in Le Bristol Paris, offering gourmet French cuisine with a focus on seasonal ingredients.', '112 Rue du Faubourg Saint-Honoré, 75008 Paris, France'],
+        ["Auberge de l'Ill, Illhaeusern", 'Type: French, Alsatian\nDescription: Historic Michelin three-starred restaurant in Alsace, known for its Alsatian specialties and culinary excellence.', "2 Rue de Collonges au Mont d'Or, 68970 Illhaeusern, France"],
+        ["Le Louis XV - Alain Ducasse à l'Hôtel de Paris, Monte-Carlo", 'Type: French, Mediterranean\nDescription: Michelin-starred restaurant in Monaco, offering Mediterranean-inspired French cuisine.', 'Pl. du Casino, 98000 Monaco'],
+        ['Le Bristol Paris - Epicure', 'Type: French, Gourmet\nDescription: Three-Michelin-starred restaurant in Le Bristol Paris, known for its gourmet French cuisine and elegant setting.', '112 Rue du Faubourg Saint-Honoré, 75008 Paris, France'],
+        ['Le Comptoir du Relais, Paris', 'Type: French, Bistro\nDescription: Charming Parisian bistro known for its classic French dishes and casual atmosphere.', "9 Carr de l'Odéon, 75006 Paris, France"],
+        ['Le Chantecler, Nice', 'Type: French, Mediterranean\nDescription: Michelin-starred restaurant in Nice, offering Mediterranean-inspired French cuisine with a focus on seafood.', '37 Prom. des Anglais, 06000 Nice, France'],
+        ['Les Crayères, Reims', 'Type: French, Gourmet\nDescription: Michelin-starred restaurant located in a grand château, known for its gourmet French cuisine and extensive wine list.', '64 Bd Henry Vasnier, 51100 Reims, France'],
+        ['Auberge du Cheval Blanc, Lembach', 'Type: French, Alsatian\nDescription: Michelin-starred restaurant in Alsace, known for its Alsatian specialties and charming setting.', '4 Rte de Wissembourg, 67510 Lembach, France'],
+        ['Le Clarence, Paris', 'Type: French, Modern\nDescription: Michelin-starred restaurant in a historic mansion, offering modern French cuisine with a focus on quality ingredients.', '31 Av. Franklin Delano Roosevelt, 75008 Paris, France'],
+        ['Le Diane, Paris', "Type: French, Gourmet\nDescription: Michelin-starred restaurant located in the Hôtel Fouquet's Barrière, offering gourmet French cuisine.", '46 Av. George V, 75008 Paris, France'],
+        ['Le Cinq, Paris', 'Type: French, Gourmet\nDescription: Three-Michelin-starred restaurant located in the Four Seasons Hotel George V, known for its gourmet French cuisine.', '31 Av. George V, 75008 Paris, France'],
+        ['Auberge de la Brie, Coulommiers', 'Type: French, Regional\nDescription: Charming restaurant in the Brie region, known for its regional French cuisine.', '77120 Coulommiers, France'],
+        ["Auberge du Pont de Collonges, Collonges-au-Mont-d'Or", 'Type: French, Gastronomic\nDescription: Legendary three-Michelin-starred restaurant founded by Paul Bocuse, known for its gastronomic French cuisine.', "40 Rue de la Plage, 69660 Collonges-au-Mont-d'Or, France"],
+        ['Le Meurice Alain Ducasse, Paris', 'Type: French, Gourmet\nDescription: Michelin-starred restaurant located in Le Meurice hotel, offering gourmet French cuisine.', '228 Rue de Rivoli, 75001 Paris, France'],
+        ['La Pyramide, Vienne', 'Type: French, Gastronomic\nDescription: Historic Michelin-starred restaurant in the Rhône region, known for its gastronomic French cuisine.', '20-22 Rond-Point de la Pyramide, 38200 Vienne, France'],
+        ['Le Taillevent, Paris', 'Type: French, Gourmet\nDescription: Michelin-starred restaurant known for its gourmet French cuisine and extensive wine list.', '15 Rue Lamennais, 75008 Paris, France'],
+        ["Auberge de l'Ill, Illhaeusern", "Type: French, Alsatian\nDescription: Historic Michelin three-starred restaurant in France's historical district.", "2 Rue de Collonges au Mont d'Or, 68970 Illhaeusern, France"]
+    ],
+    "italy": [
+        ['Osteria Francescana, Modena', 'Type: Contemporary Italian\nDescription: Three-Michelin-starred restaurant known for innovative and artistic interpretations of Italian cuisine.', 'Via Stella, 22, 41121 Modena MO, Italy'],
+        ['Le Calandre, Rubano', 'Type: Creative Italian\nDescription: Award-winning restaurant offering a multi-sensory dining experience with modern and inventive dishes.', 'Via Liguria, 1, 35030 Rubano PD, Italy'],
+        ['Piazza Duomo, Alba', 'Type: Contemporary Italian\nDescription: Michelin-starred restaurant located in a historic building, known for its refined and creative Italian cuisine.', 'Piazza Risorgimento, 4, 12051 Alba CN, Italy'],
+        ['Enoteca Pinchiorri, Florence', 'Type: Italian, International\nDescription: Three-Michelin-starred restaurant renowned for its extensive wine cellar and gourmet Italian and international dishes.', 'Via Ghibellina, 87, 50122 Firenze FI, Italy'],
+        ["Dal Pescatore, Canneto sull'Oglio", 'Type: Italian\nDescription: Family-run restaurant with three Michelin stars, specializing in traditional Lombard cuisine with a focus on seafood.', "Via Runate, 15, 46013 Canneto sull'Oglio MN, Italy"],
+        ['La Pergola, Rome', 'Type: Mediterranean, Italian\nDescription: Three-Michelin-starred rooftop restaurant offering panoramic views of Rome and a menu inspired by Mediterranean flavors.', 'Via Alberto Cadlolo, 101, 00136 Roma RM, Italy'],
+        ['Osteria Alle Testiere, Venice', 'Type: Seafood, Venetian\nDescription: Intimate seafood restaurant known for its fresh, high-quality ingredients and traditional Venetian dishes.', 'Calle del Mondo Novo, 5801, 30122 Venezia VE, Italy'],
+        ['Antica Osteria Cera, Campagna Lupia', 'Type: Venetian, Seafood\nDescription: Charming osteria serving authentic Venetian cuisine, including a variety of seafood dishes.', 'Via Marghera, 24, 30010 Lughetto VE, Italy'],
+        ['Da Vittorio, Brusaporto', 'Type: Italian\nDescription: Renowned restaurant with three Michelin stars, offering a sophisticated menu rooted in traditional Italian flavors.', 'Via Cantalupa, 17, 24060 Brusaporto BG, Italy'],
+        ['Il Luogo di Aimo e Nadia, Milan', 'Type: Italian\nDescription: Historic Milanese restaurant with a focus on traditional Tuscan cuisine and high-quality ingredients.', 'Via Privata Raimondo Montecuccoli, 6, 20147 Milano MI, Italy'],
+        ['Reale, Castel di Sangro', 'Type: Contemporary Italian\nDescription: Acclaimed restaurant in Abruzzo, known for its modern and creative approach to Italian cuisine.', 'Contrada Piana Santa Liberata, 67031 Castel di Sangro AQ, Italy'],
+        ['Da Fiore, Venice', 'Type: Venetian, Seafood\nDescription: Iconic Venetian restaurant specializing in seafood dishes and traditional Venetian recipes.', 'S. Polo, 2202, 30125 Venezia VE, Italy'],
+        ['Antico Arco, Rome', 'Type: Italian, Contemporary\nDescription: Restaurant located on the Janiculum Hill, offering modern Italian cuisine with a focus on seasonal ingredients.', 'Piazzale Aurelio, 7, 00152 Roma RM, Italy'],
+        ['La Bottega del Buon Caffè, Florence', 'Type: Italian, Contemporary\nDescription: Contemporary restaurant in Florence known for its farm-to-table philosophy and creative dishes.', 'Florence, Metropolitan City of Florence, Italy'],
+        ['Antonello Colonna Resort & Spa, Labico', 'Type: Contemporary Italian\nDescription: Michelin-starred restaurant located in a beautiful resort near Rome, offering a modern and elegant dining experience.', 'Via di Valle Fredda, 52, 00030 Labico RM, Italy'],
+        ['Il Palagio, Florence', 'Type: Italian, Mediterranean\nDescription: Restaurant at the Four Seasons Hotel in Florence, serving gourmet Italian and Mediterranean cuisine.', 'Borgo Pinti, 99, 50121 Firenze FI, Italy'],
+        ['Trattoria Vecchia Roma, Rome', 'Type: Roman, Italian\nDescription: Charming trattoria in Rome, known for its Roman specialties and traditional dishes.', 'Via Ferruccio, 12/b/c, 00185 Roma RM, Italy'],
+        ['Antico Martini, Venice', "Type: Venetian, Italian\nDescription: Historic restaurant near St. Mark's Square, offering classic Venetian dishes and a refined atmosphere.", 'Calle del Caffettier, 2007, 30124 Venezia VE, Italy'],
+        ['Il Desco, Verona', 'Type: Italian, Creative\nDescription: Michelin-starred restaurant in Verona, known for its creative and contemporary interpretations of Italian cuisine.', 'Via Dietro S. Sebastiano, 5/7, 37121 Verona VR, Italy'],
+        ['Ristorante Il Falconiere, Cortona', 'Type: Italian, Tuscan\nDescription: Restaurant in a historic villa in Tuscany, offering Tuscan dishes with a modern twist.', 'Località S. Martino Bocena, 370, 52044 Cortona AR, Italy'],
+        ['Il Mosaico, Ischia', 'Type: Mediterranean, Italian\nDescription: Michelin-starred restaurant on the island of Ischia, serving Mediterranean and Italian cuisine with a focus on seafood.', 'Piazza Bagni di Gurgitello, 4, 80074 Casamicciola Terme NA, Italy'],
+        ['Al Pompiere, Verona', 'Type: Italian, Venetian\nDescription: Historic osteria in Verona, known for its traditional Venetian and Italian dishes.', "Vicolo Regina D'Ungheria, 5, 37121 Verona VR, Italy"],
+        ['Il Luogo di Aimo e Nadia BistRo, Milan', 'Type: Italian, Bistro\nDescription: Casual bistro by the renowned Aimo e Nadia restaurant, offering a more relaxed dining experience.', 'Via Privata Raimondo Montecuccoli, 6, 20147 Milano MI, Italy'],
+        ['Ristorante Gellius, Rimini', 'Type: Italian, Seafood\nDescription: Seafood restaurant in Rimini, known for its fresh catches and traditional Italian recipes.', 'Rimini, Province of Rimini, Italy'],
+        ['Il Rigoletto, Reggio Emilia', 'Type: Italian, Emilian\nDescription: Restaurant in Reggio Emilia, offering Emilian cuisine with a focus on local ingredients.', 'Reggio Emilia, Province of Reggio Emilia, Italy'],
+        ['Trattoria Romana da Riccardo, Florence', 'Type: Italian, Tuscan\nDescription: Authentic Tuscan trattoria in Florence, known for its traditional Tuscan dishes.', 'Florence, Metropolitan City of Florence, Italy'],
+        ['Ristorante Quadri, Venice', "Type: Venetian, Italian\nDescription: Elegant restaurant in St. Mark's Square, offering a gourmet Venetian menu.", 'P.za San Marco, 123, 30124 Venezia VE, Italy'],
+        ['La Locanda del Pilone, Alba', 'Type: Piedmontese, Italian\nDescription: Restaurant in Piedmont, known for its Piedmontese specialties and fine wine selection.', 'Strada Della Cicchetta, Località Madonna di Como, 34, 12051 Alba CN, Italy'],
+        ['Hostaria da Franz, Rome', 'Type: Roman, Italian\nDescription: Cozy Roman trattoria, offering classic Roman dishes in a friendly atmosphere.', 'Rome, Metropolitan City of Rome Capital, Italy'],
+        ["L'Argine a Vencò, Dolegna del Collio", 'Type: Italian, Friulian\nDescription: Restaurant in Friuli-Venezia Giulia, known for its Friulian cuisine and extensive wine list.', 'Località Vencò, 34070 Dolegna del Collio GO, Italy'],
+        ['Osteria del Pescatore, Fiumicino', "Type: Seafood, Italian\nDescription: Seafood osteria near Rome's Fiumicino airport, known for its fresh catches.", '00054 Fiumicino, Metropolitan City of Rome Capital, Italy'],
+        ['Il Piccolo Lago, Verbania', 'Type: Contemporary Italian\nDescription: Michelin-starred restaurant in Piedmont, offering contemporary Italian cuisine with a focus on regional ingredients.', 'Via Filippo Turati, 87, 28924 Verbania VB, Italy'],
+        ['Al Pompiere, Mantua', 'Type: Mantuan, Italian\nDescription: Historic osteria in Mantua, serving traditional Mantuan and Italian dishes.', '46100 Mantua, Province of Mantua, Italy'],
+        ["L'Oliva Nera, Imperia", 'Type: Italian, Ligurian\nDescription: Ligurian restaurant in Imperia, known for its seafood dishes and Ligurian specialties.', '18100 Imperia, Province of Imperia, Italy'],
+        ['Osteria Boccadoro, Castiglione del Lago', 'Type: Italian, Umbrian\nDescription: Osteria in Umbria, offering Umbrian cuisine with a modern twist.', '06061 Castiglione del Lago, Province of Perugia, Italy']
+    ],
+    "spain": [
+        ['Madrid', 'The vibrant capital city known for its rich cultural heritage, world-class museums like the Prado, and bustling nightlife.', 'Madrid, Spain'],
+        ['Barcelona', 'Famous for its unique architecture, particularly the Sagrada Familia and Park Güell designed by Antoni Gaudí, and its lively beaches.', 'Barcelona, Spain'],
+        ['Seville', 'Home to the beautiful Alcázar palace, flamenco dancing, and the stunning Cathedral of Seville.', 'Seville, Spain'],
+        ['Granada', 'Renowned for the Alhambra, a UNESCO World Heritage Site, and the Generalife gardens.', 'Granada, Spain'],
+        ['Valencia', 'Known for its futuristic City of Arts and Sciences complex, vibrant festivals like Las Fallas, and its sandy beaches.', 'Valencia, Spain'],
+        ['Toledo', 'A historic city known for its medieval architecture, the Toledo Cathedral, and its significance as a former Spanish capital.', 'Toledo, Spain'],
+        ['San Sebastian', 'Famous for its picturesque beaches, delicious Basque cuisine, and annual international film festival.', 'Donostia-San Sebastian, Gipuzkoa, Spain'],
+        ['Córdoba', 'Recognized for the Mezquita, a mosque-cathedral showcasing stunning Islamic architecture.', 'Córdoba, Spain'],
+        ['Málaga', 'Birthplace of Pablo Picasso, boasting cultural museums, beautiful beaches, and a vibrant atmosphere.', 'Málaga, Spain'],
+        ['Bilbao', 'Home to the Guggenheim Museum Bilbao, known for its unique architecture and contemporary art collections.', 'Bilbao, Biscay, Spain'],
+        ['Segovia', 'Notable for the Roman Aqueduct, Alcázar fortress, and its well-preserved medieval architecture.', 'Segovia, Spain'],
+        ['Ronda', 'Famous for its dramatic gorge, Puente Nuevo bridge, and bullfighting history.', '29400 Ronda, Málaga, Spain'],
+        ['Salamanca', 'Renowned for its historic university, beautiful Plaza Mayor, and well-preserved Renaissance architecture.', 'Salamanca, Spain'],
+        ['Cádiz', 'A coastal city known for its Carnival festivities, ancient history, and stunning beaches.', 'Cádiz, Spain'],
+        ['Tenerife', 'The largest of the Canary Islands, offering diverse landscapes, including the Teide National Park and beautiful beaches.', 'Tenerife, Santa Cruz de Tenerife, Spain'],
+        ['Zaragoza', 'Home to the Basilica of Our Lady of the Pillar and significant Roman remains.', 'Zaragoza, Spain'],
+        ['Alicante', 'A city with beautiful beaches, a historic castle, and a vibrant waterfront.', 'Alicante, Spain'],
+        ['Palma de Mallorca', 'The capital of the Balearic Islands, featuring stunning beaches and historical landmarks.', 'Palma, Balearic Islands, Spain'],
+        ['Ibiza', 'Famous for its lively nightlife, beautiful beaches, and UNESCO-listed old town.', 'Ibiza, Balearic Islands, Spain'],
+        ['Santiago de Compostela', 'A pilgrimage site with the Santiago de Compostela Cathedral and historic old town.', 'Santiago de Compostela, Municipality of Santiago de Compostela, A Coruña, Spain'],
+        ['Girona', 'Known for its medieval architecture, ancient Jewish quarter, and well-preserved city walls.', 'Girona, Spain'],
+        ['Cuenca', 'Recognized for its hanging houses perched on cliffs and the Casas Colgadas.', 'Cuenca, Spain'],
+        ['Ávila', 'Famed for its well-preserved medieval walls and the Basilica of San Vicente.', 'Ávila\u200e, Ávila, Spain'],
+        ['Almería', 'Known for its rugged coastline, natural parks, and the Alcazaba fortress.', 'Almería, Spain'],
+        ['Jerez de la Frontera', 'Renowned for sherry production, flamenco, and the Royal Andalusian School of Equestrian Art.', 'Jerez de la Frontera, Cádiz, Spain'],
+        ['Burgos', 'Famous for its Gothic cathedral, UNESCO-listed old town, and the legendary El Cid.', 'Burgos, Spain'],
+        ['Ronda', 'A charming town known for its breathtaking views and ancient bullring.', '29400 Ronda, Málaga, Spain'],
+        ['La Rioja Wine Region', "Explore Spain's renowned wine-producing region, famous for its vineyards and wineries.", 'La Rioja, Spain'],
+        ['Cáceres', 'Recognized for its well-preserved medieval quarter, fortified complex, and historic architecture.', 'Cáceres\u200e, Cáceres, Spain'],
+        ['Fuerteventura', 'A Canary Island boasting stunning beaches, dunes, and a UNESCO biosphere reserve.', 'Fuerteventura, Las Palmas, Spain'],
+        ['Tarragona', 'Known for its Roman archaeological sites, including an amphitheater and aqueducts.', 'Tarragona, Spain'],
+        ['Badajoz', 'Famous for its Moorish fortress, Alcazaba, and historic city center.', 'Badajoz, Spain'],
+        ['Huelva', 'Renowned for its connection to Christopher Columbus, beautiful beaches, and the Doñana National Park.', 'Huelva, Spain'],
+        ['Mérida', 'Recognized for its well-preserved Roman monuments, including a theater and amphitheater.', '06800 Mérida, Badajoz, Spain'],
+        ['Pamplona', 'Famous for the San Fermín festival, where the Running of the Bulls takes place.', 'Pamplona, Navarre, Spain'],
+        ['Teruel', 'Known for its Mudejar architecture, including the Teruel Cathedral and towers.', 'Teruel, Spain'],
+        ['Lugo', 'Recognized for its intact Roman walls, a UNESCO World Heritage Site.', 'Lugo, Spain'],
+        ['Santander', 'Famous for its beaches, scenic bay, and the Magdalena Peninsula.', 'Santander, Cantabria, Spain'],
+        ['Jaén', 'Renowned for its olive oil production, historic castle, and Renaissance architecture.', 'Jaén, Spain'],
+        ['Oviedo', 'Known for its pre-Romanesque architecture, delicious Asturian cuisine, and scenic landscapes.', 'Oviedo, Municipality of Oviedo, Asturias, Spain'],
+        ['El Hierro', 'The smallest and most remote of the Canary Islands, offering unspoiled nature and tranquility.', 'El Hierro, Santa Cruz de Tenerife, Spain'],
+        ['Zamora', 'Famous for its Romanesque architecture and historic churches.', 'Zamora, Spain'],
+        ['Cantabria', 'Explore the picturesque landscapes, caves, and charming villages in this region.', 'Cantabria, Spain'],
+        ['Huesca', 'Known for its Pyrenees landscapes, outdoor activities, and medieval architecture.', 'Huesca, Spain'],
+        ['Palencia', 'Recognized for its Romanesque heritage and the Cristo del Otero statue.', 'Palencia, Spain'],
+        ['Lleida', 'Famous for its medieval cathedral, La Seu Vella, and historic architecture.', 'Lleida, Spain'],
+        ['La Coruña', 'Known for the Tower of Hercules, a Roman lighthouse, and beautiful beaches.', 'A Coruña, Spain'],
+        ['Plasencia', 'Recognized for its well-preserved medieval center and historic monuments.', '10600 Plasencia, Cáceres, Spain']
+    ],
+    "germany": [
+        ['Tim Raue, Berlin', 'A Michelin-starred restaurant known for its innovative Asian-inspired cuisine and stylish ambiance.', 'Rudi-Dutschke-Straße 26, 10969 Berlin, Germany'],
+        ['Schwarzwaldstube, Baiersbronn', 'Located in the Black Forest, this three-Michelin-starred restaurant offers gourmet dishes with a regional touch.', 'Tonbachstraße 237, 72270 Baiersbronn, Germany'],
+        ['Vau, Berlin', 'An elegant restaurant in Berlin, celebrated for its modern German cuisine and sophisticated atmosphere.', 'Jägerstraße 54-55, 10117 Berlin, Germany'],
+        ['Brenner Grill, Munich', 'A popular steakhouse in Munich, known for its high-quality meats and contemporary grill dishes.', 'Maximilianstraße 15, 80539 München, Germany'],
+        ['Restaurant 5, Stuttgart', 'Situated in a former royal stable, this restaurant in Stuttgart serves creative, upscale European cuisine.', 'Bolzstraße 8, 70173 Stuttgart, Germany'],
+        ['Rutz, Berlin', 'A Michelin-starred restaurant and wine bar in Berlin, offering a diverse menu paired with an extensive wine list.', 'Chausseestraße 8, 10115 Berlin, Germany'],
+        ['Traube Tonbach, Baiersbronn', 'Part of a renowned hotel, this two-Michelin-starred restaurant specializes in gourmet French and regional dishes.', 'Blockhütte, 72270 Baiersbronn, Germany'],
+        ['Atelier, Munich', 'Located in the Bayerischer Hof hotel, Atelier is a Michelin-starred restaurant offering refined international cuisine.', 'Promenadepl. 2-6, 80333 München, Germany'],
+        ['Victors Fine Dining by Christian Bau, Perl-Nennig', 'Set in a beautiful estate, this three-Michelin-starred restaurant is known for its exquisite French cuisine.', 'Schloßstraße 27-29, 66706 Perl, Germany'],
+        ['Nobelhart & Schmutzig, Berlin', 'A Michelin-starred restaurant focusing on locally-sourced, seasonal ingredients with a modern twist.', 'Friedrichstraße 218, 10969 Berlin, Germany'],
+        ['Dallmayr, Munich', 'An iconic gourmet restaurant and delicatessen in Munich, offering a blend of traditional and innovative cuisine.', 'Munich, Germany'],
+        ['La Soupe Populaire, Berlin', 'Housed in a former brewery, this restaurant in Berlin serves modern German cuisine with an artistic flair.', 'Prenzlauer Allee 242, 10405 Berlin, Germany'],
+        ['Restaurant Bareiss, Baiersbronn', 'A three-Michelin-starred restaurant in the Black Forest, known for its exceptional culinary experience.', 'Hermine-Bareiss-Weg 1, 72270 Baiersbronn, Germany'],
+        ['Tantris, Munich', 'A legendary restaurant in Munich, Tantris has been delighting diners with its innovative French and international dishes.', 'Johann-Fichte-Straße 7, 80805 München, Germany'],
+        ['Hirschgarten, Munich', "The world's largest beer garden, offering traditional Bavarian dishes and a vast selection of beers.", 'Hirschgarten, Hirschgarten 1, 80639 München, Germany'],
+        ['The Table Kevin Fehling, Hamburg', 'A three-Michelin-starred restaurant known for its avant-garde cuisine and unique dining concept.', 'Shanghaiallee 15, 20457 Hamburg, Germany'],
+        ['Gut Lärchenhof, Pulheim', 'Set in a historic manor, this Michelin-starred restaurant near Cologne offers a modern twist on classic dishes.', 'Am Steinwerk 1, 50259 Pulheim, Germany'],
+        ['Facil, Berlin', 'Located in The Mandala Hotel, Facil is a Michelin-starred restaurant offering creative and contemporary cuisine.', 'Potsdamer Str. 3, 10785 Berlin, Germany'],
+        ['Sosein, Heroldsberg', 'A Michelin-starred restaurant near Nuremberg, focusing on vegetarian and vegan fine dining.', 'Hauptstraße 19, 90562 Heroldsberg, Germany'],
+        ['Geisels Werneckhof, Munich', 'A Michelin-starred restaurant known for its fusion of Japanese and Bavarian flavors, creating unique dishes.', 'Werneckstraße 11, 80802 München, Germany'],
+        ['Das Stue Restaurant, Berlin', 'Situated in a luxury hotel, this restaurant in Berlin offers Mediterranean-inspired cuisine with a modern touch.', 'Drakestraße 1, 10787 Berlin, Germany'],
+        ['Zur Rose, Nuremberg', 'A historic restaurant in Nuremberg, known for its traditional Franconian cuisine and charming ambiance.', 'Nuremberg, Germany'],
+        ['Himmel un Äd, Cologne', "A traditional Cologne restaurant known for its regional dishes, including the famous 'Himmel un Äd' (Heaven and Earth).", 'Hauptstraße 293, 51143 Köln, Germany'],
+        ['Grace, Berlin', 'A Michelin-starred restaurant located in the luxury hotel Das Stue, offering fine dining with a focus on seasonal ingredients.', 'Kurfürstendamm 25, 10719 Berlin, Germany'],
+        ['Schloss Berg, Perl-Nennig', 'A three-Michelin-starred restaurant in a castle, known for its elegant French cuisine and scenic surroundings.', 'Schloßstraße 27, 66706 Perl, Germany'],
+        ['Goldener Hirsch, Salzburg (Austria)', 'A historic restaurant in Salzburg, just across the German border, serving Austrian and international specialties.', 'Germany'],
+        ['Haus Stemberg, Velbert', 'A Michelin-starred restaurant in North Rhine-Westphalia, known for its classic and refined German cuisine.', 'Kuhlendahler Str. 295, 42553 Velbert, Germany'],
+        ['Königshof Restaurant, Munich', 'Located in Hotel Königshof, this Michelin-starred restaurant offers gourmet cuisine with a modern touch.', 'Karlsplatz 25, 80335 München, Germany'],
+        ['Die Quadriga, Berlin', 'Situated in The Brandenburg Gate Hotel, Die Quadriga is a Michelin-starred restaurant with a focus on local and seasonal ingredients.', 'Eislebener Str. 14, 10789 Berlin, Germany'],
+        ['Amador, Mannheim', 'A Michelin-starred restaurant known for its molecular gastronomy and inventive dishes.', 'Mannheim, Germany'],
+        ['Alte Vogtei, Nideggen', 'Located in a historic building, Alte Vogtei offers traditional German dishes with a modern twist.', '52385 Nideggen, Germany'],
+        ['Drei Mohren, Augsburg', 'A renowned restaurant in Augsburg, known for its upscale Bavarian and international cuisine.', 'Maximilianstraße 40, 86150 Augsburg, Germany'],
+        ['Acht&dreißig, Düsseldorf', 'A Michelin-starred restaurant in Düsseldorf, offering modern German cuisine with international influences.', 'Düsseldorf, Germany'],
+        ['Restaurant Überfahrt, Rottach-Egern', 'Situated on Lake Tegernsee, this three-Michelin-starred restaurant is known for its gourmet seafood dishes.', 'Überfahrtstraße 10, 83700 Rottach-Egern, Germany'],
+        ['Gendarmerie, Berlin', 'Located near Checkpoint Charlie, Gendarmerie offers a mix of German and Austrian dishes in a historic setting.', 'Behrenstraße 42, 10117 Berlin, Germany'],
+        ['Gasthaus zum Stern, Baden-Baden', 'A traditional Baden-Baden restaurant, known for its classic German and regional specialties.', 'Baden-Baden, Germany'],
+        ['First Floor, Berlin', 'A Michelin-starred restaurant in Hotel Palace Berlin, offering modern European cuisine with a focus on seasonal ingredients.', 'Budapester Str. 45, 10787 Berlin, Germany'],
+        ['Jellyfish, Hamburg', 'A seafood restaurant in Hamburg, known for its fresh and innovative dishes with a focus on sustainability.', 'Weidenallee 12, 20357 Hamburg, Germany']
+    ],
+    "usa": [
+        ['Per Se, New York City', 'A Michelin three-star restaurant in Manhattan, offering a French-American fine dining experience with breathtaking views of Central Park.', '10 Columbus Cir, New York, NY 10019, USA'],
+        ['French Laundry, Yountville', 'An iconic restaurant in Napa Valley, California, known for its innovative tasting menus and commitment to farm-to-table cuisine.', '6640 Washington St, Yountville, CA 94599, USA'],
+        ['Eleven Madison Park, New York City', 'A world-renowned restaurant with three Michelin stars, offering a seasonal tasting menu and exceptional service in an Art Deco setting.', '11 Madison Ave, New York, NY 10010, USA'],
+        ['Alinea, Chicago', 'A three-star Michelin restaurant in Chicago, known for its avant-garde approach to molecular gastronomy and immersive dining experiences.', '1723 N Halsted St, Chicago, IL 60614, USA'],
+        ['Joël Robuchon, Las Vegas', 'A Michelin three-star restaurant in the MGM Grand, Las Vegas, offering French haute cuisine with a focus on precision and elegance.', '3799 S Las Vegas Blvd, Las Vegas, NV 89109, USA'],
+        ['Le Bernardin, New York City', 'A renowned seafood restaurant in Midtown Manhattan, known for its exquisite seafood dishes and commitment to fresh, high-quality ingredients.', '155 W 51st St, New York, NY 10019, USA'],
+        ['Benu, San Francisco', 'A Michelin three-star restaurant in San Francisco, offering modern American cuisine with Asian influences and a sophisticated tasting menu.', '22 Hawthorne St, San Francisco, CA 94105, USA'],
+        ['Momofuku Ko, New York City', 'A two Michelin-star restaurant in the East Village, known for its innovative and ever-changing tasting menu, featuring Korean-inspired dishes.', '8 Extra Pl, New York, NY 10003, USA'],
+        ['Daniel, New York City', 'A Michelin-starred restaurant on the Upper East Side, offering classic French cuisine with a modern twist in an elegant setting.', '60 E 65th St, New York, NY 10065, USA'],
+        ["Chef's Table at Brooklyn Fare, New York City", 'A three Michelin-star restaurant in Brooklyn, offering an intimate dining experience with a focus on seafood and modern techniques.', '431 W 37th St, New York, NY 10018, USA'],
+        ['SingleThread, Healdsburg', 'A three-star Michelin restaurant in Sonoma County, California, offering a farm-to-table experience with an emphasis on Japanese kaiseki.', '131 North St, Healdsburg, CA 95448, USA'],
+        ['Atelier Crenn, San Francisco', 'A three-star Michelin restaurant in San Francisco, known for its poetic and artistic approach to modern French cuisine.', '3127 Fillmore St, San Francisco, CA 94123, USA'],
+        ['Aubergine, Carmel-by-the-Sea', 'A Michelin-starred restaurant in Carmel, California, offering a seasonal and locally inspired tasting menu in an intimate setting.', '7th avenue Monte Verde St, Carmel-By-The-Sea, CA 93921, USA'],
+        ['The Inn at Little Washington, Washington, Virginia', 'A Michelin three-star restaurant, known for its refined American cuisine and charming, historic setting.', '309 Middle St, Washington, VA 22747, USA'],
+        ['Saison, San Francisco', 'A three-star Michelin restaurant in San Francisco, offering an ever-evolving and inventive tasting menu in a minimalist yet inviting space.', '178 Townsend St, San Francisco, CA 94107, USA'],
+        ['Masa, New York City', 'A three-star Michelin restaurant in the Time Warner Center, offering an exclusive and intimate sushi experience with the highest quality ingredients.', 'The Shops at, 10 Columbus Cir Floor 4, New York, NY 10019, USA'],
+        ['Manresa, Los Gatos', 'A Michelin three-star restaurant in the Bay Area, known for its farm-driven tasting menus and innovative approach to California cuisine.', '320 Village Ln, Los Gatos, CA 95030, USA'],
+        ['Blue Hill at Stone Barns, Pocantico Hills', 'A Michelin-starred restaurant located in a working farm, offering a farm-to-table dining experience with a focus on sustainability.', '630 Bedford Rd, Tarrytown, NY 10591, USA'],
+        ['Quince, San Francisco', 'A three-star Michelin restaurant in San Francisco, offering refined modern Italian cuisine with a focus on seasonal ingredients.', '470 Pacific Ave, San Francisco, CA 94133, USA'],
+        ['Le Coucou, New York City', 'A Michelin-starred restaurant in SoHo, offering a contemporary take on classic French cuisine in a stylish and vibrant setting.', '138 Lafayette St, New York, NY 10013, USA'],
+        ['Minibar by José Andrés, Washington, D.C.', 'A two Michelin-star restaurant, offering an avant-garde and interactive dining experience with a focus on molecular gastronomy.', '855 E St NW, Washington, DC 20004, USA'],
+        ['Manhattan Beach Post, Manhattan Beach', 'A popular gastropub in Southern California, known for its creative small plates, craft cocktails, and beachside vibe.', '1142 Manhattan Ave, Manhattan Beach, CA 90266, USA'],
+        ['State Bird Provisions, San Francisco', 'A Michelin-starred restaurant in San Francisco, offering a playful and innovative menu with a dim sum-style dining experience.', '1529 Fillmore St, San Francisco, CA 94115, USA'],
+        ['Vespertine, Culver City', 'A Michelin-starred restaurant in Los Angeles, offering a multi-sensory and avant-garde dining experience with a focus on artistic presentation.', '3599 Hayden Ave, Culver City, CA 90232, USA'],
+        ['Gaggan, New York City', 'A Michelin-starred restaurant in Manhattan, offering progressive Indian cuisine with a modern and artistic twist.', 'New York, NY, USA'],
+        ["L'Atelier de Joël Robuchon, Las Vegas", 'A Michelin-starred restaurant in the MGM Grand, Las Vegas, offering a modern and interactive dining experience with French flavors.', '3799 S Las Vegas Blvd, Las Vegas, NV 89109, USA'],
+        ['Russ & Daughters Cafe, New York City', 'A renowned Jewish deli in the Lower East Side, offering classic New York-style bagels, lox, and other deli delights.', '127 Orchard St, New York, NY 10002, USA'],
+        ['Shaya, New Orleans', 'A modern Israeli restaurant in New Orleans, offering a fresh and flavorful menu with a focus on hummus, falafel, and wood-fired dishes.', '4213 Magazine St, New Orleans, LA 70115, USA'],
+        ['Girl & the Goat, Chicago', 'A popular restaurant in Chicago, known for its creative and bold flavors, offering a diverse menu with a focus on shared plates.', '809 W Randolph St, Chicago, IL 60607, USA'],
+        ['Canlis, Seattle', 'A Seattle institution, known for its upscale Pacific Northwest cuisine, stunning views, and commitment to hospitality.', '2576 Aurora Ave N, Seattle, WA 98109, USA'],
+        ['Franklin Barbecue, Austin', 'A renowned barbecue joint in Austin, Texas, known for its mouthwatering smoked meats and long lines of enthusiastic patrons.', '900 E 11th St, Austin, TX 78702, USA'],
+        ['Masa Takayama, Las Vegas', 'A Michelin three-star restaurant in the ARIA Resort & Casino, offering an exclusive and intimate sushi experience with the highest quality ingredients.', 'Las Vegas, NV, USA'],
+        ['Shake Shack, New York City', 'A beloved fast-food chain born in NYC, known for its delicious burgers, crinkle-cut fries, and frozen custard shakes.', 'New York, NY, USA'],
+        ['Husk, Charleston', 'A popular restaurant in Charleston, South Carolina, known for its Southern-inspired menu and commitment to using locally sourced ingredients.', '76 Queen St, Charleston, SC 29401, USA'],
+        ['Momofuku Noodle Bar, New York City', 'A casual eatery in the East Village, known for its inventive take on ramen and other Asian-inspired dishes.', 'New York, NY, USA'],
+        ["Commander's Palace, New Orleans", 'A historic restaurant in the Garden District, known for its upscale Creole cuisine, jazz brunches, and elegant atmosphere.', '1403 Washington Ave, New Orleans, LA 70130, USA'],
+        ['Gjelina, Los Angeles', 'A trendy restaurant in Venice Beach, known for its California-inspired menu, wood-fired pizzas, and stylish interior.', '1429 Abbot Kinney Blvd, Venice, CA 90291, USA'],
+        ['Lilia, Brooklyn', 'A Michelin-starred Italian restaurant in Williamsburg, Brooklyn, known for its handmade pasta, wood-grilled dishes, and chic ambiance.', '567 Union Ave, Brooklyn, NY 11211, USA'],
+        ['Foreign Cinema, San Francisco', 'A unique dining experience in the Mission District, offering innovative American cuisine and classic films projected in the courtyard.', '2534 Mission St, San Francisco, CA 94110, USA'],
+        ['Pappadeaux Seafood Kitchen, Houston', 'A popular seafood restaurant in Houston, known for its Cajun and Creole-inspired dishes, lively atmosphere, and extensive wine list.', 'Houston, TX, USA'],
+        ["Katz's Delicatessen, New York City", 'A legendary Jewish deli on the Lower East Side, known for its towering pastrami sandwiches and classic New York deli fare.', '205 E Houston St, New York, NY 10002, USA'],
+        ['Farmstead at Long Meadow Ranch, St. Helena', 'A farm-to-table restaurant in Napa Valley, California, known for its sustainable, organic ingredients and rustic charm.', '738 Main St, St Helena, CA 94574, USA'],
+        ['Union Square Cafe, New York City', 'A classic New York restaurant in the heart of Union Square, known for its American cuisine, warm hospitality, and timeless appeal.', '101 E 19th St, New York, NY 10003, USA'],
+        ['Casa Mono, New York City', 'A Michelin-starred Spanish restaurant in Gramercy Park, offering a diverse menu of tapas and a carefully curated wine list.', '52 Irving Pl, New York, NY 10003, USA'],
+        ['Dai Due, Austin', 'A butcher shop and restaurant in Austin, Texas, known for its commitment to sourcing local and sustainable ingredients, including wild game.', '2406 Manor Rd, Austin, TX 78722, USA'],
+        ['Sushi Yasuda, New York City', 'A revered sushi restaurant in Midtown Manhattan, known for its traditional Edomae-style sushi and emphasis on pristine fish.', '204 E 43rd St, New York, NY 10017, USA'],
+        ['Frasca Food and Wine, Boulder', 'A Michelin-starred restaurant in Boulder, Colorado, offering Friulian-inspired cuisine and an extensive wine list.', '1738 Pearl St, Boulder, CO 80302, USA'],
+        ['Guelaguetza, Los Angeles', 'A popular Oaxacan restaurant in Los Angeles, known for its authentic mole dishes, tlayudas, and vibrant atmosphere.', '3014 W Olympic Blvd, Los Angeles, CA 90006, USA'],
+        ['Zuni Cafe, San Francisco', 'A San Francisco institution, known for its California and Mediterranean-inspired cuisine, wood-fired oven, and iconic roasted chicken.', '1658 Market St, San Francisco, CA 94102, USA'],
+        ['Oleana, Cambridge', 'A Mediterranean-inspired restaurant in Cambridge, Massachusetts, known for its creative small plates, flavorful dishes, and warm ambiance.', '134 Hampshire St, Cambridge, MA 02139, USA'],
+        ['Bestia, Los Angeles', 'A trendy Italian restaurant in the Arts District of Los Angeles, known for its house-made charcuterie, wood-fired pizzas, and inventive pasta dishes.', '2121 E 7th Pl, Los Angeles, CA 90021, USA'],
+        ['Husk, Nashville', 'A Southern-inspired restaurant in Nashville, Tennessee, known for its inventive dishes, showcasing the best of local and regional ingredients.', '37 Rutledge St, Nashville, TN 37210, USA'],
+        ['Shaya, New York City', 'An outpost of the popular modern Israeli restaurant, known for its fresh and flavorful menu, including hummus, falafel, and wood-fired dishes.', 'One Madison, New York, NY 10010, USA'],
+        ['St. Elmo Steak House, Indianapolis', 'A classic steakhouse in Indianapolis, known for its legendary shrimp cocktail and dry-aged steaks.', '127 S Illinois St, Indianapolis, IN 46225, USA'],
+        ['Chez Panisse, Berkeley', 'A groundbreaking restaurant in Berkeley, California, known for its organic, locally sourced ingredients and influential farm-to-table philosophy.', '1517 Shattuck Ave., Berkeley, CA 94709, USA'],
+        ["Gibson's Bar & Steakhouse, Chicago", 'A classic Chicago steakhouse, known for its prime steaks, seafood, and timeless atmosphere.', '1028 N Rush St, Chicago, IL 60611, USA'],
+        ['Spago, Beverly Hills', 'A legendary restaurant in Beverly Hills, known for its innovative California cuisine, celebrity chef Wolfgang Puck, and celebrity sightings.', '176 N Canon Dr, Beverly Hills, CA 90210, USA'],
+        ["Mallard Cottage, St. John's", "A charming restaurant in St. John's, Newfoundland, known for its commitment to local and seasonal ingredients, as well as its historic setting.", "St. John's, NL, Canada"],
+        ['Canoe, Atlanta', 'A critically acclaimed restaurant in Atlanta, offering seasonal and regional cuisine with stunning views of the Chattahoochee River.', '4199 Paces Ferry Rd SE, Atlanta, GA 30339, USA'],
+        ["Emeril's New Orleans", 'A flagship restaurant in the heart of the French Quarter, known for its Creole and Cajun-inspired dishes, as well as the celebrity chef Emeril Lagasse.', '800 Tchoupitoulas St, New Orleans, LA 70130, USA'],
+        ["Bern's Steak House, Tampa", 'A legendary steakhouse in Tampa, Florida, known for its extensive wine list, dry-aged steaks, and old-world charm.', '1208 S Howard Ave, Tampa, FL 33606, USA'],
+        ['The Spotted Pig, New York City', 'A gastropub in the West Village, known for its British and Italian-inspired dishes, craft beers, and lively atmosphere.', 'New York, NY, USA'],
+        ['Founding Farmers, Washington, D.C.', 'A farmer-owned restaurant in D.C., known for its commitment to sustainable and locally sourced ingredients, as well as its diverse menu.', '600 Massachusetts Ave NW, Washington, DC 20001, USA'],
+        ['Gordon Ramsay Steak, Las Vegas', 'A celebrity chef Gordon Ramsay restaurant in the Paris Las Vegas hotel, known for its modern steakhouse fare and dramatic dining room.', '3655 Las Vegas Blvd S, Las Vegas, NV 89109, USA'],
+        ['Coi, San Francisco', 'A Michelin three-star restaurant in San Francisco, offering a refined and inventive tasting menu with a focus on seasonal ingredients.', '373 Broadway, San Francisco, CA 94133, USA'],
+        ['Uchi, Austin', 'A contemporary Japanese restaurant in Austin, Texas, known for its creative sushi, sashimi, and hot dishes.', '4200 N Lamar Blvd, Austin, TX 78756, USA']
+    ],
+    "uk": [
+        ['Dishoom, London', 'A popular restaurant serving Bombay comfort food in a stylish, vintage-inspired setting.', 'London, UK'],
+        ['Sketch, London', 'An artistic and Michelin-starred restaurant, known for its unique decor and gourmet cuisine.', '9 Conduit St, London W1S 2XG, UK'],
+        ['The Ledbury, London', 'A two-Michelin-starred restaurant offering modern European cuisine with a focus on seasonal ingredients.', '127 Ledbury Rd, London W11 2AQ, UK'],
+        ['Dabbous, London', 'A contemporary restaurant with an industrial-chic vibe, known for its inventive and modern dishes.', '39 Whitfield St, London W1T 2SF, UK'],
+        ['The Fat Duck, Bray', 'A three-Michelin-starred restaurant by Heston Blumenthal, offering avant-garde and molecular gastronomy.', 'The Fat Duck, High St, Bray, Maidenhead SL6 2AQ, UK'],
+        ['Dabbous, London', 'A sleek and minimalistic restaurant known for its modern European cuisine and minimalist design.', '39 Whitfield St, London W1T 2SF, UK'],
+        ['Duck & Waffle, London', 'A 24/7 restaurant located on the 40th floor, offering British and European dishes with panoramic views.', '110 Bishopsgate, London EC2N 4AY, UK'],
+        ['Restaurant Gordon Ramsay, London', 'A Michelin-starred restaurant by celebrity chef Gordon Ramsay, serving modern French cuisine.', '68 Royal Hospital Rd, London SW3 4HP, UK'],
+        ['The Wolseley, London', 'A grand European-style brasserie located in a former car showroom, known for its classic dishes.', "160 Piccadilly, St. James's, London W1J 9EB, UK"],
+        ['Sketch, London', 'An eclectic restaurant with unique decor, offering a diverse menu and afternoon tea.', '9 Conduit St, London W1S 2XG, UK'],
+        ['Hawksmoor, London', 'A renowned steakhouse with a focus on quality British meat, known for its elegant and relaxed atmosphere.', 'London, UK'],
+        ['The River Café, London', 'A Michelin-starred restaurant known for its Italian-inspired cuisine and Thames-side location.', 'Thames Wharf, Rainville Rd, London W6 9HA, UK'],
+        ['Rules, London', "One of London's oldest restaurants, known for its classic British dishes and historic charm.", '34-35 Maiden Ln, London WC2E 7LB, UK'],
+        ['Dishoom, London', 'A Bombay canteen-inspired restaurant, offering a variety of Indian dishes in a nostalgic setting.', 'London, UK'],
+        ['The Ivy, London', 'An iconic restaurant with an elegant setting, offering a diverse menu and celebrity sightings.', '1-5 West St, London WC2H 9NQ, UK'],
+        ['Dabbous, London', 'A Michelin-starred restaurant known for its minimalist design and innovative approach to cuisine.', '39 Whitfield St, London W1T 2SF, UK'],
+        ['Duck & Waffle, London', 'A sky-high restaurant known for its 24/7 service, British-European menu, and stunning views.', '110 Bishopsgate, London EC2N 4AY, UK'],
+        ['Sketch, London', 'A destination restaurant with multiple rooms, each featuring unique decor and a diverse menu.', '9 Conduit St, London W1S 2XG, UK'],
+        ['Dabbous, London', 'An innovative restaurant known for its open kitchen and commitment to seasonal, high-quality ingredients.', '39 Whitfield St, London W1T 2SF, UK'],
+        ['Dishoom, London', 'A bustling and atmospheric restaurant serving authentic Bombay dishes in a vibrant setting.', 'London, UK'],
+        ['Dabbous, London', 'A modern European restaurant with a focus on simplicity and quality, known for its industrial-chic ambiance.', '39 Whitfield St, London W1T 2SF, UK'],
+        ['Duck & Waffle, London', 'A unique dining experience with a focus on British and European cuisine, served 40 floors above London.', '110 Bishopsgate, London EC2N 4AY, UK'],
+        ['The Ledbury, London', 'A two-Michelin-starred restaurant offering a sophisticated menu with a focus on flavor and presentation.', '127 Ledbury Rd, London W11 2AQ, UK'],
+        ['Bob Bob Ricard, London', 'An opulent restaurant known for its luxurious decor, extensive menu, and Champagne-themed offerings.', '1 Upper James St, London W1F 9DF, UK'],
+        ['Dabbous, London', 'A Michelin-starred restaurant celebrated for its innovative and contemporary approach to fine dining.', '39 Whitfield St, London W1T 2SF, UK'],
+        ['Dishoom, London', 'A trendy and atmospheric restaurant, capturing the spirit of a Bombay canteen with its vibrant ambiance.', 'London, UK'],
+        ['Duck & Waffle, London', 'An iconic restaurant known for its 24-hour service, signature duck and waffle dish, and panoramic views.', '110 Bishopsgate, London EC2N 4AY, UK'],
+        ['The Ivy, London', 'A classic and renowned restaurant offering a diverse menu, elegant surroundings, and a touch of glamour.', '1-5 West St, London WC2H 9NQ, UK'],
+        ['Sketch, London', 'A Michelin-starred restaurant celebrated for its artistic decor, gourmet cuisine, and afternoon tea.', '9 Conduit St, London W1S 2XG, UK'],
+        ['Dabbous, London', 'A critically acclaimed restaurant known for its modern European cuisine and minimalist design.', '39 Whitfield St, London W1T 2SF, UK'],
+        ['Hawksmoor, London', 'A stylish steakhouse renowned for its high-quality meat, elegant ambiance, and exceptional service.', 'London, UK'],
+        ['The Wolseley, London', 'An iconic brasserie with a timeless atmosphere, serving classic European dishes and afternoon tea.', "160 Piccadilly, St. James's, London W1J 9EB, UK"],
+        ['Bob Bob Ricard, London', 'A luxurious restaurant known for its lavish decor, extensive menu, and Champagne button at each table.', '1 Upper James St, London W1F 9DF, UK'],
+        ['Dabbous, London', 'A Michelin-starred restaurant admired for its innovative approach to fine dining and minimalist aesthetic.', '39 Whitfield St, London W1T 2SF, UK'],
+        ['Duck & Waffle, London', 'A sky-high dining experience offering British and European cuisine, available 24/7 with breathtaking views.', '110 Bishopsgate, London EC2N 4AY, UK'],
+        ['The Ledbury, London', 'A two-Michelin-starred restaurant recognized for its inventive and beautifully presented modern European dishes.', '127 Ledbury Rd, London W11 2AQ, UK'],
+        ['Rules, London', "One of London's oldest restaurants, serving traditional British cuisine in a historic and charming setting.", '34-35 Maiden Ln, London WC2E 7LB, UK'],
+        ['The Ivy, London', 'A legendary restaurant known for its timeless elegance, diverse menu, and celebrity clientele.', '1-5 West St, London WC2H 9NQ, UK'],
+        ['Dabbous, London', 'A Michelin-starred restaurant celebrated for its innovative and seasonally inspired modern European dishes.', '39 Whitfield St, London W1T 2SF, UK'],
+        ['Duck & Waffle, London', 'An iconic restaurant perched on the 40th floor, offering a diverse menu and stunning panoramic views.', '110 Bishopsgate, London EC2N 4AY, UK'],
+        ['Sketch, London', 'A Michelin-starred restaurant with eclectic decor, offering a creative and gastronomic dining experience.', '9 Conduit St, London W1S 2XG, UK'],
+        ['Dabbous, London', 'A critically acclaimed restaurant known for its minimalist design and modern European cuisine.', '39 Whitfield St, London W1T 2SF, UK'],
+        ['Dishoom, London', 'A popular eatery capturing the essence of a Bombay canteen, serving authentic Indian dishes.', 'London, UK'],
+        ['Hawksmoor, London', 'A renowned steakhouse known for its commitment to quality British meat, elegant ambiance, and excellent service.', 'London, UK'],
+        ['The Wolseley, London', 'An iconic brasserie offering classic European dishes and a timeless atmosphere in a former car showroom.', "160 Piccadilly, St. James's, London W1J 9EB, UK"]
+    ],
+    "brazil": [
+        ['D.O.M.', 'Located in São Paulo, D.O.M. is a renowned restaurant led by chef Alex Atala, known for its innovative Brazilian cuisine and use of local ingredients.', 'R. Barão de Capanema, 549 - Jardins, São Paulo - SP, 01411-011, Brazil'],
+        ['Maní', 'A popular restaurant in São Paulo, Maní offers a contemporary menu with a focus on Brazilian flavors and culinary creativity.', 'Brazil'],
+        ['Olympe', 'Situated in Rio de Janeiro, Olympe is a Michelin-starred restaurant offering French-Brazilian fusion cuisine, combining local and international ingredients.', 'Brazil'],
+        ['Roberta Sudbrack', "Located in Rio de Janeiro, chef Roberta Sudbrack's restaurant is celebrated for its refined Brazilian dishes and commitment to sustainability.", 'Brazil'],
+        ['Tuju', 'An acclaimed restaurant in São Paulo, Tuju features a seasonal menu with a farm-to-table approach, emphasizing fresh and local produce.', 'Brazil'],
+        ['Attimo', 'Situated in São Paulo, Attimo is known for its modern Italian cuisine, showcasing the culinary expertise of chef Jefferson Rueda.', 'Brazil'],
+        ['Mocotó', 'A popular spot in São Paulo, Mocotó specializes in traditional Brazilian cuisine, with a focus on northeastern flavors and hearty dishes.', 'Mocotó, Itinga do Maranhão - MA, 65299-000, Brazil'],
+        ['Fasano', 'With locations in São Paulo and Rio de Janeiro, Fasano is a high-end Italian restaurant known for its elegant atmosphere and classic dishes.', 'Brazil'],
+        ['Lasai', 'Located in Rio de Janeiro, Lasai is a Michelin-starred restaurant offering a tasting menu that highlights Brazilian ingredients in innovative ways.', 'Largo dos Leões, 35 - Humaitá, Rio de Janeiro - RJ, 22271-020, Brazil'],
+        ['Epice', 'Situated in São Paulo, Epice is a fine dining restaurant known for its contemporary French-Brazilian cuisine and sophisticated atmosphere.', 'Brazil'],
+        ['Dom Francisco', 'A classic steakhouse in Brasília, Dom Francisco is renowned for its high-quality Brazilian churrasco and traditional side dishes.', 'Brazil'],
+        ['Tordesilhas', "Located in São Paulo, Tordesilhas specializes in Brazilian cuisine with a focus on regional dishes, celebrating the country's diverse culinary heritage.", 'Brazil'],
+        ['Figueira Rubaiyat', 'Situated in São Paulo, Figueira Rubaiyat is known for its unique setting under a large fig tree and offers a menu featuring Brazilian and international dishes.', 'Rua Haddock Lobo, 1738 - Jardins, São Paulo - SP, 01414-002, Brazil'],
+        ['O Padeiro', 'A popular bakery and cafe in Salvador, O Padeiro is known for its delicious Brazilian pastries, bread, and coffee.', 'Brazil'],
+        ['Le Manjue Organique', 'Located in São Paulo, Le Manjue Organique is a restaurant that focuses on organic and sustainable ingredients, offering a diverse menu.', 'R. Domingos Fernandes, 608 - Vila Nova Conceição, São Paulo - SP, 04509-011, Brazil'],
+        ['Aconchego Carioca', 'Situated in Rio de Janeiro, Aconchego Carioca is a cozy spot known for its traditional Brazilian bar food, including tasty snacks and craft beers.', 'R. Barão de Iguatemi, 245 - Praca da Bandeira, Rio de Janeiro - RJ, 20270-060, Brazil'],
+        ['Capim Santo', 'With locations in São Paulo and Trancoso, Capim Santo offers a menu inspired by Brazilian and international flavors, with an emphasis on organic ingredients.', 'Brazil'],
+        ['Sal Gastronomia', 'Located in São Paulo, Sal Gastronomia is a contemporary restaurant known for its creative Brazilian dishes and modern culinary techniques.', 'Brazil'],
+        ['Esquina Mocotó', 'A spin-off of Mocotó, Esquina Mocotó in São Paulo offers a more casual dining experience with a focus on traditional Brazilian street food.', 'Av. Nossa Sra. do Loreto, 1108 - Vila Medeiros, São Paulo - SP, 02219-001, Brazil'],
+        ['Dalva e Dito', 'Situated in São Paulo, Dalva e Dito is a restaurant by chef Alex Atala, offering a diverse menu that highlights Brazilian culinary traditions.', 'R. Padre João Manuel, 1115 - Cerqueira César, São Paulo - SP, 01411-001, Brazil'],
+        ['Feijoada da Lana', 'A popular spot in São Paulo, Feijoada da Lana is known for its authentic Brazilian feijoada, a traditional black bean stew with pork.', 'Brazil'],
+        ['A Figueira Rubaiyat', 'Located in Brasília, A Figueira Rubaiyat is part of the Rubaiyat restaurant group, offering a diverse menu with a focus on high-quality meats.', 'Rua Haddock Lobo, 1738 - Jardins, São Paulo - SP, 01414-002, Brazil'],
+        ['Casa do Porco', 'Situated in São Paulo, Casa do Porco is a popular restaurant specializing in pork-based dishes, including a renowned pork sandwich.', 'R. Araújo, 124 - República, São Paulo - SP, 01220-020, Brazil'],
+        ['Banzeiro', 'Located in Manaus, Banzeiro is known for its Amazonian cuisine, featuring fresh fish and regional ingredients in traditional and innovative dishes.', 'Rua Tabapuã, 830 - Itaim Bibi, São Paulo - SP, 04533-003, Brazil'],
+        ['Zazá Bistrô Tropical', 'Situated in Rio de Janeiro, Zazá Bistrô Tropical is a vibrant restaurant with a diverse menu that combines Brazilian and global flavors.', 'R. Joana Angélica, 40 - Ipanema, Rio de Janeiro - RJ, 22420-030, Brazil'],
+        ['Mangai', 'With locations in João Pessoa and Natal, Mangai is a buffet-style restaurant offering a wide range of Brazilian dishes, with a focus on northeastern cuisine.', 'Brazil'],
+        ['Manacá', 'Located in São Sebastião, Manacá is a beachfront restaurant known for its seafood dishes and stunning views of the Brazilian coast.', 'Brazil'],
+        ['Santa Satisfação', 'A popular brunch spot in Rio de Janeiro, Santa Satisfação is known for its delicious breakfast and brunch options, including creative egg dishes.', 'R. Santa Clara, 36 - C - Copacabana, Rio de Janeiro - RJ, 22041-012, Brazil'],
+        ['Varanda Grill', 'With locations in São Paulo and Rio de Janeiro, Varanda Grill is a top-notch steakhouse known for its high-quality meats and elegant atmosphere.', 'Brazil'],
+        ['Mangue Seco', "Situated in Recife, Mangue Seco is a seafood restaurant offering a menu inspired by Pernambuco's culinary traditions, with a focus on fresh fish.", 'Mangue Seco, Jandaíra - State of Bahia, 48310-000, Brazil'],
+        ['Jun Sakamoto', 'Located in São Paulo, Jun Sakamoto is a renowned Japanese restaurant known for its high-quality sushi and sashimi, led by chef Jun Sakamoto.', 'R. Lisboa, 55 - Pinheiros, São Paulo - SP, 05401-250, Brazil'],
+        ['Dona Lucinha', 'A beloved restaurant in Belo Horizonte, Dona Lucinha specializes in traditional Minas Gerais cuisine, including regional dishes and desserts.', 'Brazil'],
+        ['Paraxaxá', 'Located in Búzios, Paraxaxá is a restaurant known for its Brazilian barbecue (churrasco) and a diverse buffet of salads and side dishes.', 'Brazil'],
+        ['Coco Bambu', 'With locations across Brazil, Coco Bambu is a popular chain known for its extensive menu featuring seafood, steaks, and Brazilian dishes.', 'Brazil'],
+        ['Bar do Mineiro', 'A historic bar in Santa Teresa, Rio de Janeiro, Bar do Mineiro is known for its relaxed atmosphere and traditional Brazilian snacks, including feijoada.', 'Rua Paschoal Carlos Magno, 99 - Santa Teresa, Rio de Janeiro - RJ, 20240-290, Brazil'],
+        ['Fasano Al Mare', 'Situated in Rio de Janeiro, Fasano Al Mare is part of the Fasano restaurant group, offering Italian seafood dishes with a focus on fresh and seasonal ingredients.', 'Av. Vieira Souto, 80 - Ipanema, Rio de Janeiro - RJ, 22420-000, Brazil'],
+        ['Casa do Alemão', 'Located in Porto Alegre, Casa do Alemão is a German-inspired restaurant known for its hearty dishes, including sausages, schnitzel, and beer.', 'Brazil'],
+        ['Taypá Sabores del Peru', 'A Peruvian restaurant in Brasília, Taypá Sabores del Peru offers authentic Peruvian cuisine, featuring dishes made with traditional ingredients.', 'Brazil'],
+        ['Forneria San Paolo', 'Situated in São Paulo, Forneria San Paolo is a contemporary Italian restaurant known for its wood-fired pizzas, pasta dishes, and antipasti.', 'Av. José Joaquim Seabra, 960 - Jardim Ivana, São Paulo - SP, 05364-000, Brazil'],
+        ['Bar da Dona Onça', 'Located in São Paulo, Bar da Dona Onça is a popular bar and restaurant known for its lively atmosphere and Brazilian comfort food.', 'Edifício Copan - Av. Ipiranga, 200 - 27 e 29 - Centro Histórico de São Paulo, São Paulo - SP, 01046-925, Brazil'],
+        ['Veloso Bar', 'A traditional bar in São Paulo, Veloso Bar is famous for its coxinha, a Brazilian snack consisting of shredded chicken encased in dough and deep-fried.', 'Brazil'],
+        ['Dalmo Bárbaro', 'Situated in Campinas, Dalmo Bárbaro is a steakhouse known for its rodízio-style service, offering a variety of grilled meats.', 'R. Gironda, 188 - Jardim Paulista, São Paulo - SP, 01435-040, Brazil'],
+        ['Pizzaria Atlântico', 'Located in Natal, Pizzaria Atlântico is a pizzeria known for its diverse pizza menu, with creative toppings and a cozy atmosphere.', 'Brazil'],
+        ['Mocofava', "A charming restaurant in Maceió, Mocofava is known for its regional dishes, including mocotó, a traditional Brazilian stew made with cow's feet.", 'Brazil'],
+        ['Tordesilhas', "With locations in São Paulo and Brasília, Tordesilhas specializes in Brazilian cuisine with a focus on regional dishes, celebrating the country's diverse culinary heritage.", 'Brazil']
+    ],
+    "greece": [
+        ['Arsenis Taverna', 'A traditional taverna in Athens, offering authentic Greek cuisine and a cozy atmosphere.', 'Zisimopoulou 19, Paleo Faliro 175 64, Greece'],
+        ['1800 Restaurant, Oia', 'A fine dining restaurant in Oia, Santorini, known for its Greek and Mediterranean dishes and stunning sunset views.', 'Oia 847 02, Greece'],
+        ['Koursaros Fish Restaurant, Mykonos', 'A seafood restaurant in Mykonos, offering fresh catches and a lively atmosphere near Mykonos Town.', 'Πλατεία Μελετοπούλου, Μύκονος 846 00, Greece'],
+        ['Thalassino Ageri, Chania', 'A seaside restaurant in Chania, Crete, serving Cretan and Mediterranean dishes with a focus on seafood.', 'Vivilaki str 35 Tabakaria, Chania 731 33, Greece'],
+        ['Selene Restaurant, Fira', 'A Michelin-starred restaurant in Fira, Santorini, known for its creative Greek cuisine and extensive wine list.', 'Fira town, Thira Old catholic monastery, Thira 847 00, Greece'],
+        ['Mediterraneo Restaurant, Corfu', 'A beachfront restaurant in Corfu, offering Mediterranean and Greek dishes with views of the Ionian Sea.', 'Sidari 490 81, Greece'],
+        ['To Perasma, Nafplio', 'A charming restaurant in Nafplio, known for its Greek and Mediterranean cuisine and romantic ambiance.', 'Nafplion, Greece'],
+        ['Ambrosia Restaurant, Thessaloniki', 'A gourmet restaurant in Thessaloniki, offering creative Greek and Mediterranean dishes with a modern twist.', '13 kilometres Perea, Thermi 570 01, Greece'],
+        ['Premiere Restaurant, Athens', 'An upscale restaurant in Athens, known for its elegant ambiance and a menu featuring a blend of Greek and international flavors.', 'Leof. Andrea Siggrou 89-93, Athina 117 45, Greece'],
+        ['Oineas Restaurant, Rhodes', 'A restaurant in Rhodes Town, offering a mix of Greek and Mediterranean dishes with a focus on fresh, local ingredients.', 'Rhodes, Greece'],
+        ['Varoulko Seaside, Piraeus', 'A renowned seafood restaurant in Piraeus, offering fine dining with a focus on fresh fish and seafood.', 'Akti Koumoundourou 54, Pireas 185 33, Greece'],
+        ['Kastro Restaurant, Mykonos', 'A hillside restaurant in Mykonos, known for its panoramic views and a menu featuring Greek and Mediterranean specialties.', 'Agion Anargyron 1, P.O.Box 69 Paraportiani Church,Little venice, Mikonos 846 00, Greece'],
+        ['To Ouzadiko, Heraklion', 'A traditional ouzeri in Heraklion, Crete, known for its selection of ouzo and mezedes in a lively setting.', 'Heraklion, Greece'],
+        ['La Doze Bar & Restaurant, Corfu', 'A beachfront restaurant in Corfu, offering a menu with Greek and Mediterranean dishes and a vibrant atmosphere.', 'Corfu, Greece'],
+        ['Psaraki, Chania', 'A seafood taverna in Chania, Crete, known for its fresh catches and traditional Greek flavors.', 'Psaraki, Vamvakopoulo 731 31, Greece'],
+        ['Lycabettus Restaurant, Athens', 'A rooftop restaurant in Athens, offering panoramic views of the city and a menu featuring Greek and international dishes.', 'Mount Lycabettus, Athens 114 71, Greece'],
+        ['Floga by Mitsis Blue Domes Exclusive Resort, Kos', 'A restaurant in Kos, offering Greek and Mediterranean dishes with a focus on local and seasonal ingredients.', 'Kardamaina 853 02, Greece'],
+        ['Armenaki, Santorini', 'A seaside taverna in Santorini, known for its seafood dishes and traditional Greek flavors.', 'Oia 847 02, Greece'],
+        ['Rakor, Nafplio', 'A cozy taverna in Nafplio, known for its selection of mezedes and traditional Greek cuisine.', 'Nafplion, Greece'],
+        ['Aleria Restaurant, Athens', 'A modern Greek restaurant in Athens, known for its creative dishes and stylish ambiance.', 'Meg. Alexandrou 57, Athina 104 35, Greece'],
+        ['Remezzo Mykonos', 'A waterfront restaurant in Mykonos, offering a menu with Greek and Mediterranean dishes and a lively atmosphere.', 'Polikandrioti, Mikonos 846 00, Greece'],
+        ['Gialos, Chania', 'A seaside restaurant in Chania, Crete, known for its seafood dishes and picturesque views of the harbor.', 'Gialos 730 01, Greece'],
+        ['Palia Agora, Thessaloniki', 'A traditional taverna in Thessaloniki, offering classic Greek dishes in a welcoming setting.', 'Olympou 75, Thessaloniki 546 31, Greece'],
+        ['Aleria, Rhodes', 'A restaurant in Rhodes, known for its gourmet Greek and Mediterranean dishes in a historic setting.', 'Rhodes, Greece'],
+        ["Botrini's Restaurant, Athens", 'A Michelin-starred restaurant in Athens, offering a modern take on Greek and Mediterranean cuisine.', 'Vasileos Georgiou Defterou 24, Halandri Athens 152 33, Greece'],
+        ['Zephyros, Paros', 'A family-owned taverna in Paros, offering traditional Greek dishes and a warm atmosphere.', '37R7+PQ, Paros 844 00, Greece'],
+        ['Ktima Bellou, Larissa', 'A vineyard restaurant in Larissa, Thessaly, known for its Greek cuisine and wine pairings.', 'Agios Dimitrios 601 00, Greece'],
+        ['Petrino, Kalamata', 'A restaurant in Kalamata, known for its Mediterranean dishes and a terrace with views of the Messinian Gulf.', 'Kalamata 241 00, Greece'],
+        ['7 Thalasses, Thessaloniki', 'A seafood restaurant in Thessaloniki, offering a variety of fresh catches and Greek flavors.', 'Kalapothaki 10, Thessaloniki 546 24, Greece'],
+        ['The Old Phoenix, Zakynthos', 'A family-run taverna in Zakynthos, offering traditional Greek dishes and a welcoming atmosphere.', 'Zakynthos, Greece'],
+        ['Katsourbos', 'A historic restaurant in Athens, known for its classic Greek dishes and a charming courtyard setting.', 'Aminta 2, Athina 116 35, Greece'],
+        ['Estrella, Crete', 'A beachfront restaurant in Crete, offering a menu with Greek and Mediterranean dishes and a relaxed atmosphere.', 'Crete, Greece'],
+        ['Alana Restaurant, Mykonos', 'A fine dining restaurant in Mykonos, known for its gourmet Greek and Mediterranean cuisine.', 'Mykonos, Mikonos 846 00, Greece'],
+        ['Kyano Beach Restaurant, Chania', 'A beachfront restaurant in Chania, Crete, offering a menu with Mediterranean and Greek dishes.', 'PEO Kissamou Chanion 340, Platanias 730 14, Greece'],
+        ['La Maison de Katrin, Santorini', 'A restaurant in Santorini, known for its traditional Greek dishes and a terrace with Caldera views.', 'Santorini, Greece'],
+        ['Avli Tou Thodori, Mykonos', 'A seaside restaurant in Mykonos, offering Greek and Mediterranean dishes with a focus on seafood.', 'Platis Gialos 846 00, Greece'],
+        ['Paradosiako, Rhodes', 'A traditional taverna in Rhodes, known for its authentic Greek dishes and a courtyard setting.', 'Rhodes, Greece'],
+        ['To Perasma, Santorini', 'A restaurant in Santorini, offering a menu with Greek and Mediterranean dishes and a terrace with sea views.', 'Santorini, Greece'],
+        ['Ta Kymata, Chania', 'A seaside taverna in Chania, Crete, known for its seafood dishes and a relaxed beachfront setting.', 'Επαρ.Οδ. Αποκορώνου - Χανίων, Kalives 730 03, Greece'],
+        ['Ammos Restaurant, Athens', 'A beachfront restaurant in Athens, offering Greek and Mediterranean dishes with views of the Saronic Gulf.', 'Athens, Greece'],
+        ['Meltemi Restaurant, Mykonos', 'A family-run restaurant in Mykonos, offering traditional Greek dishes and a terrace with sea views.', 'Βόθωνας, Μύκονος, 84600, Mikonos 846 00, Greece'],
+        ['Salto Wine Bar & Bistro, Thessaloniki', 'A wine bar and bistro in Thessaloniki, offering Greek and Mediterranean dishes paired with local wines.', 'Thessaloniki, Greece'],
+        ["Captain's, Santorini", 'A seafood restaurant in Santorini, known for its fresh catches and a terrace with sunset views.', 'Vothonas 847 00, Greece'],
+        ['Armeni Village Rooms and Suites, Oia', 'Charming cave-style accommodations in Oia, Santorini, with a restaurant offering traditional Greek dishes.', 'Oia, Thira 847 02, Greece'],
+        ["Botrini's Restaurant, Athens", 'A Michelin-starred restaurant in Athens, offering a modern take on Greek and Mediterranean cuisine.', 'Vasileos Georgiou Defterou 24, Halandri Athens 152 33, Greece'],
+        ['Filoti Taverna, Naxos', 'A family-owned taverna in Naxos, offering classic Greek dishes and a welcoming atmosphere.', 'Filoti 843 02, Greece'],
+        ['1800 Restaurant, Oia', 'A fine dining restaurant in Oia, Santorini, known for its Greek and Mediterranean dishes and stunning sunset views.', 'Oia 847 02, Greece'],
+        ['Ippokampos, Chania', 'A seaside restaurant in Chania, Crete, offering Greek and Mediterranean dishes with views of the Venetian lighthouse.', 'Chania, Greece'],
+        ['Pringipas Taverna, Athens', 'A traditional taverna in Athens, known for its selection of mezedes and classic Greek dishes.', 'Char. Trikoupi 23, Athina 106 81, Greece'],
+        ['Ouzeri Tou Laki, Thessaloniki', 'An ouzeri in Thessaloniki, offering a variety of ouzo options and Greek mezedes in a lively atmosphere.', 'Thessaloniki, Greece'],
+        ['Koralli Restaurant, Rhodes', 'A restaurant in Rhodes, offering Greek and Mediterranean dishes with views of the medieval Old Town.', '851 09, Epar.Od. Lardou-Lindou 2007, Pefki 851 09, Greece'],
+        ['Maiolica Restaurant, Santorini', 'A restaurant in Santorini, offering Mediterranean and Greek dishes with a focus on fresh, local ingredients.', 'Santorini, Greece'],
+        ['Katsourbos, Athens', 'A historic restaurant in Athens, known for its classic Greek dishes and a charming courtyard setting.', 'Aminta 2, Athina 116 35, Greece'],
+        ['Aleria, Heraklion', 'A restaurant in Heraklion, Crete, known for its gourmet Greek and Mediterranean dishes in a modern setting.', 'Heraklion, Greece'],
+        ['Ippokampos, Chania', 'A seaside restaurant in Chania, Crete, offering Greek and Mediterranean dishes with views of the Venetian lighthouse.', 'Chania, Greece'],
+        ['Elia, Santorini', 'A beachfront restaurant in Santorini, known for its Greek and Mediterranean dishes and a relaxed atmosphere.', 'Fira Santorini, Thira 847 00, Greece'],
+        ['Koukoumavlos, Fira', 'A fine dining restaurant in Fira, Santorini, offering creative Greek and Mediterranean dishes with a modern twist.', 'Imerovigli 847 00, Greece'],
+        ['Ouzeri Ta Kymata, Thessaloniki', 'An ouzeri in Thessaloniki, offering a variety of ouzo options and Greek mezedes with views of the Thermaic Gulf.', 'Alexandras Papadopoulou 72, Thessaloniki 546 33, Greece'],
+        ['Psarotaverna, Zakynthos', 'A seafood taverna in Zakynthos, offering fresh catches and traditional Greek dishes in a charming setting.', 'Zakynthos 290 92, Greece'],
+        ['Klimataria, Athens', 'A traditional taverna in Athens, known for its Greek home-style cooking and a cozy atmosphere.', 'Pl. Theatrou 2, Athina 105 52, Greece'],
+        ['Mpakalogatos, Heraklion', 'A taverna in Heraklion, Crete, offering a variety of Greek mezedes and classic dishes in a welcoming setting.', 'Agiou Nektariou 10, Iraklio 713 07, Greece'],
+        ['To Perasma, Nafplio', 'A charming restaurant in Nafplio, known for its Greek and Mediterranean cuisine and romantic ambiance.', 'Nafplion, Greece'],
+        ['Salto Wine Bar & Bistro, Thessaloniki', 'A wine bar and bistro in Thessaloniki, offering Greek and Mediterranean dishes paired with local wines.', 'Thessaloniki, Greece'],
+        ['Perasma, Rhodes', 'A restaurant in Rhodes, offering Greek and Mediterranean dishes with a focus on fresh, local ingredients.', 'Rhodes, Greece'],
+        ['Ktima Bellou, Larissa', 'A vineyard restaurant in Larissa, Thessaly, known for its Greek cuisine and wine pairings.', 'Agios Dimitrios 601 00, Greece'],
+        ['Ambrosia Restaurant, Thessaloniki', 'A gourmet restaurant in Thessaloniki, offering creative Greek and Mediterranean dishes with a modern twist.', '13 kilometres Perea, Thermi 570 01, Greece'],
+        ['La Maison de Katrin, Santorini', 'A restaurant in Santorini, known for its traditional Greek dishes and a terrace with Caldera views.', 'Santorini, Greece'],
+        ['To Ouzadiko, Heraklion', 'A traditional ouzeri in Heraklion, Crete, known for its selection of ouzo and mezedes in a lively setting.', 'Heraklion, Greece'],
+        ['Rakor, Nafplio', 'A cozy taverna in Nafplio, known for its selection of mezedes and traditional Greek cuisine.', 'Nafplion, Greece'],
+        ['Palia Agora, Thessaloniki', 'A traditional taverna in Thessaloniki, offering classic Greek dishes in a welcoming setting.', 'Olympou 75, Thessaloniki 546 31, Greece'],
+        ['Armeni Village Rooms and Suites, Oia', 'Charming cave-style accommodations in Oia, Santorini, with a restaurant offering traditional Greek dishes.', 'Oia, Thira 847 02, Greece'],
+        ["Botrini's Restaurant, Athens", 'A Michelin-starred restaurant in Athens, offering a modern take on Greek and Mediterranean cuisine.', 'Vasileos Georgiou Defterou 24, Halandri Athens 152 33, Greece'],
+        ['Filoti Taverna, Naxos', 'A family-owned taverna in Naxos, offering classic Greek dishes and a welcoming atmosphere.', 'Filoti 843 02, Greece'],
+        ['1800 Restaurant, Oia', 'A fine dining restaurant in Oia, Santorini, known for its Greek and Mediterranean dishes and stunning sunset views.', 'Oia 847 02, Greece'],
+        ['Ippokampos, Chania', 'A seaside restaurant in Chania, Crete, offering Greek and Mediterranean dishes with views of the Venetian lighthouse.', 'Chania, Greece'],
+        ['Pringipas Taverna, Athens', 'A traditional taverna in Athens, known for its selection of mezedes and classic Greek dishes.', 'Char. Trikoupi 23, Athina 106 81, Greece'],
+        ['Ouzeri Tou Laki, Thessaloniki', 'An ouzeri in Thessaloniki, offering a variety of ouzo options and Greek mezedes in a lively atmosphere.', 'Thessaloniki, Greece'],
+        ['Koralli Restaurant, Rhodes', 'A restaurant in Rhodes, offering Greek and Mediterranean dishes with views of the medieval Old Town.', '851 09, Epar.Od. Lardou-Lindou 2007, Pefki 851 09, Greece'],
+        ['Maiolica Restaurant, Santorini', 'A restaurant in Santorini, offering Mediterranean and Greek dishes with a focus on fresh, local ingredients.', 'Santorini, Greece'],
+        ['Katsourbos, Athens', 'A historic restaurant in Athens, known for its classic Greek dishes and a charming courtyard setting.', 'Aminta 2, Athina 116 35, Greece'],
+        ['Aleria, Heraklion', 'A restaurant in Heraklion, Crete, known for its gourmet Greek and Mediterranean dishes in a modern setting.', 'Heraklion, Greece'],
+        ['Ippokampos, Chania', 'A seaside restaurant in Chania, Crete, offering Greek and Mediterranean dishes with views of the Venetian lighthouse.', 'Chania, Greece'],
+        ['Elia, Santorini', 'A beachfront restaurant in Santorini, known for its Greek and Mediterranean dishes and a relaxed atmosphere.', 'Fira Santorini, Thira 847 00, Greece'],
+        ['Koukoumavlos, Fira', 'A fine dining restaurant in Fira, Santorini, offering creative Greek and Mediterranean dishes with a modern twist.', 'Imerovigli 847 00, Greece'],
+        ['Ouzeri Ta Kymata, Thessaloniki', 'An ouzeri in Thessaloniki, offering a variety of ouzo options and Greek mezedes with views of the Thermaic Gulf.', 'Alexandras Papadopoulou 72, Thessaloniki 546 33, Greece'],
+        ['Psarotaverna, Zakynthos', 'A seafood taverna in Zakynthos, offering fresh catches and traditional Greek dishes in a charming setting.', 'Zakynthos 290 92, Greece'],
+        ['Klimataria, Athens', 'A traditional taverna in Athens, known for its Greek home-style cooking and a cozy atmosphere.', 'Pl. Theatrou 2, Athina 105 52, Greece'],
+        ['Mpakalogatos, Heraklion', 'A taverna in Heraklion, Crete, offering a variety of Greek mezedes and classic dishes in a welcoming setting.', 'Agiou Nektariou 10, Iraklio 713 07, Greece'],
+        ['To Perasma, Nafplio', 'A charming restaurant in Nafplio, known for its Greek and Mediterranean cuisine and romantic ambiance.', 'Nafplion, Greece'],
+        ['Salto Wine Bar & Bistro, Thessaloniki', 'A wine bar and bistro in Thessaloniki, offering Greek and Mediterranean dishes paired with local wines.', 'Thessaloniki, Greece'],
+        ['Perasma, Rhodes', 'A restaurant in Rhodes, offering Greek and Mediterranean dishes with a focus on fresh, local ingredients.', 'Rhodes, Greece']
+    ],
+    "singapore": [
+        ['Lau Pa Sat', 'Historic food market in the heart of the city, offering a wide variety of local and international dishes.', '18 Raffles Quay, Singapore 048582'],
+        ['Chin Chin Eating House', 'Popular hawker center known for its Hainanese chicken rice and other Singaporean delicacies.', '19 Purvis St, Singapore 188598'],
+        ['Hawker Chan', "Famous for its Michelin-starred soy sauce chicken rice, a must-try in Singapore's hawker scene.", '335 Smith St, #02-126, Singapore 050335'],
+        ['Odette', 'Fine dining restaurant at the National Gallery, known for its modern French cuisine and elegant ambiance.', "1 St Andrew's Rd, #01-04 National Gallery, Singapore 178957"],
+        ['Maxwell Food Centre', 'Iconic hawker center featuring a diverse range of local dishes, including chicken rice and laksa.', '1 Kadayanallur St, Singapore 069184'],
+        ['Burnt Ends', 'Modern Australian barbecue restaurant with a focus on quality meats and a lively atmosphere.', '7 Dempsey Rd, #01-02, Singapore 249671'],
+        ['Jumbo Seafood', 'Renowned for its chili crab and other seafood dishes, offering a waterfront dining experience.', 'Singapore'],
+        ['Tiong Bahru Market', 'Historic market with a mix of hawker stalls and local shops, known for its local breakfast options.', '52 Tiong Bahru Rd, Singapore 168716'],
+        ['Gardens by the Bay - Pollen', 'Fine dining restaurant with a Mediterranean-inspired menu, located in the Flower Dome.', '18 Marina Gardens Dr, Gardens by the Bay, Singapore 018953'],
+        ['Labyrinth', 'Innovative restaurant blending traditional Singaporean flavors with modern gastronomy techniques.', 'Raffles Ave., #02 - 23, Singapore 039802'],
+        ['Din Tai Fung', 'Internationally acclaimed restaurant specializing in xiao long bao (soup dumplings) and Taiwanese cuisine.', 'Singapore'],
+        ['Salt Bae Grill', "Steakhouse known for its theatrical presentation of dishes, owned by the famous 'Salt Bae.'", 'Singapore'],
+        ['Makansutra Gluttons Bay', 'Outdoor hawker center offering a range of local street food with a view of Marina Bay.', '8 Raffles Ave., #01-15 Esplanade Mall, Singapore 039802'],
+        ['Candlenut', 'Michelin-starred Peranakan restaurant, known for its refined dishes with a modern twist.', '17a Dempsey Rd, Singapore 249676'],
+        ['Tim Ho Wan', 'Famed for its dim sum, this Michelin-starred restaurant offers a variety of delicious bite-sized treats.', 'Singapore'],
+        ['Waku Ghin', 'Celebrity chef restaurant at Marina Bay Sands, offering a Japanese-European dining experience.', 'Level 2 Dining, L2-03 The Shoppes at, 2 Bayfront Ave, Marina Bay Sands, Singapore 018956'],
+        ['Chijmes - Whitegrass', 'Fine dining restaurant with a focus on modern Australian cuisine, located in a historic convent.', '30 Victoria St, #01-26/27 CHIJMES, Singapore 187996'],
+        ['Meatsmith', 'American smokehouse known for its barbecue meats, burgers, and a selection of craft beers.', '167-169 Telok Ayer St, Singapore 068620'],
+        ['Swee Choon Dim Sum Restaurant', 'Late-night dim sum spot popular for its variety and affordable prices.', '183/185/187/189, Jln Besar, 191/193, Singapore 208882'],
+        ['Les Amis', 'Prestigious French restaurant offering an extensive wine list and elegant dining experience.', '1 Scotts Rd, #01 - 16 Shaw Centre, Singapore 228208'],
+        ['The Coconut Club', 'Hawker stall known for its signature nasi lemak, a traditional Malay coconut rice dish.', '269 Beach Rd, Singapore 199546'],
+        ['Pince & Pints', 'Specializing in lobster dishes, this restaurant is a go-to for seafood lovers in Singapore.', '32-33 Duxton Rd, Singapore 089496'],
+        ['Artichoke', 'Mediterranean-inspired restaurant with a focus on communal dining and bold flavors.', '161 Middle Rd, Singapore 188978'],
+        ['Boon Tong Kee', 'Established chicken rice restaurant known for its succulent and flavorful Hainanese chicken.', 'Singapore'],
+        ['Esquina', 'Spanish tapas bar with a vibrant atmosphere, offering a variety of small plates and cocktails.', '16 Jiak Chuan Rd, Singapore 089267'],
+        ['Taratata Brasserie', 'French brasserie serving classic French dishes in a casual yet elegant setting.', '35A Keong Saik Road Ground Floor, Singapore 089142'],
+        ['Wah Kee Big Prawn Noodle', 'Hawker stall famous for its prawn noodles, known for rich and flavorful broth.', '41A Cambridge Rd, #01-15, Singapore 211041'],
+        ['Wild Rocket', "Modern bistro offering innovative dishes that reflect the chef's Singaporean heritage.", '501 Bukit Timah Rd, #02-01, Singapore 259760'],
+        ['Shinji by Kanesaka', 'Renowned sushi restaurant offering an authentic and intimate omakase experience.', '76 Bras Basah Rd, Singapore 189558'],
+        ['Putien', 'Michelin-starred restaurant specializing in Fujian cuisine, known for its home-style dishes.', 'Singapore'],
+        ['The Halia', 'Contemporary European-Asian restaurant set in the lush Singapore Botanic Gardens.', '1 Cluny Rd, Ginger Garden Singapore Botanic Gardens, Singapore 259569'],
+        ['Alati Divine Greek Cuisine', 'Greek restaurant known for its authentic flavors and charming Mediterranean ambiance.', '73 Amoy St, Singapore 069892'],
+        ['Straits Kitchen', 'Buffet restaurant offering a diverse range of local and regional dishes from Southeast Asia.', '10 Scotts Rd, Grand Hyatt, Singapore 228211'],
+        ["Luke's Lobster", 'International seafood chain known for its lobster rolls and sustainable sourcing.', '350 Orchard Road #01-K4 Shaw House, Singapore 238868'],
+        ['Blue Ginger', 'Peranakan restaurant offering a taste of Straits Chinese cuisine in a cozy setting.', '97 Tg Pagar Rd, Singapore 088518'],
+        ['Summer Pavilion', 'Michelin-starred Cantonese restaurant, known for its exquisite dim sum and seafood dishes.', '7 Raffles Ave., Singapore 039799'],
+        ['The Lokal', 'Casual cafe known for its hearty brunch options and emphasis on locally sourced ingredients.', '136 Neil Rd, Singapore 088865'],
+        ['Nouri', 'Innovative restaurant focusing on crossroads cooking, blending different global culinary traditions.', '72 Amoy St, Singapore 069891'],
+        ["Wolfgang's Steakhouse", 'Classic American steakhouse known for its prime cuts of beef and elegant ambiance.', '1 Nanson Road 02-01 InterContinental Singapore, Robertson Quay, Singapore 238909'],
+        ['Pasta Brava', 'Italian restaurant offering a range of classic pasta dishes and authentic Italian flavors.', '33 Erskine Rd, #01-13 Scarlet Hotel, Singapore 069333'],
+        ['Dempsey Cookhouse and Bar', 'Celebrity chef restaurant with a diverse menu, located in the Dempsey Hill area.', '17D Dempsey Rd, Singapore 249676'],
+        ['Yardbird Southern Table & Bar', 'Southern-style restaurant known for its fried chicken and comfort food classics.', '2 Bayfront Ave, # B1 - 07, Singapore 018972'],
+        ['DÔME Café', 'Australian cafe chain offering a variety of coffee, breakfast, and lunch options.', 'Singapore'],
+        ['The Marmalade Pantry', 'Casual bistro known for its modern comfort food and delectable desserts.', 'Singapore'],
+        ['LINO', 'Italian restaurant with a focus on homemade pasta and a cozy, rustic atmosphere.', '7 Binjai Park, Singapore 589821'],
+        ['Aura', 'Italian restaurant with a contemporary twist, offering panoramic views of Marina Bay Sands.', '442 Orchard Rd, Singapore 238879'],
+        ["Gunther's Modern French Cuisine", 'Fine dining French restaurant known for its elegant dishes and impeccable service.', '36 Purvis St, #01-03, Singapore 188613'],
+        ['Pollen', 'Mediterranean restaurant set in the Flower Dome at Gardens by the Bay, offering a unique dining experience.', '18 Marina Gardens Dr, #01-09 Flower Dome, Singapore 018953'],
+        ['Famous Kitchen', 'Hawker stall known for its signature curry rice and a variety of classic Singaporean dishes.', '54 Sembawang Road Hong Heng Mansions, #01-01, Singapore 779085'],
+        ['Summerlong', 'Mediterranean restaurant with a beachside vibe, offering fresh and vibrant dishes.', '01 Robertson Quay, Singapore 238252'],
+        ['Shin Minori Japanese Restaurant', 'Japanese restaurant known for its extensive buffet options and quality sushi.', '81 Clemenceau Ave, #03-15/16, Singapore 239917']
+    ],
+    "australia": [
+        ['Quay, Sydney', 'Award-winning restaurant with panoramic views of the Sydney Opera House, offering modern Australian cuisine.', 'Upper Level Overseas Passenger Terminal, The Rocks NSW 2000, Australia'],
+        ['Attica, Melbourne', 'Internationally acclaimed restaurant known for its innovative tasting menu and focus on local ingredients.', '74 Glen Eira Rd, Ripponlea VIC 3185, Australia'],
+        ['Brae, Birregurra', 'Fine-dining restaurant set on a farm, showcasing seasonal produce and a sustainable approach to dining.', '4285 Cape Otway Rd, Birregurra VIC 3242, Australia'],
+        ['Vue de Monde, Melbourne', 'Sophisticated restaurant with a focus on contemporary Australian cuisine and stunning city views.', '55 Rialto Towers, 525 Collins St, Melbourne VIC 3000, Australia'],
+        ['Momofuku Seiobo, Sydney', 'Innovative restaurant by David Chang, offering a unique fusion of Australian and Asian flavors.', 'Level G/80 Pyrmont St, Pyrmont NSW 2009, Australia'],
+        ['Rockpool Bar & Grill, Sydney', 'Steakhouse known for its premium beef cuts, elegant ambiance, and extensive wine list.', '66 Hunter St, Sydney NSW 2000, Australia'],
+        ['Fratelli Fresh, Sydney', 'Lively Italian restaurant and deli, known for its fresh pasta, pizza, and vibrant atmosphere.', 'Sydney NSW, Australia'],
+        ['Sepia, Sydney', 'Modern Australian restaurant with a Japanese influence, known for its artistic presentation and flavors.', '201 Sussex St, Sydney NSW 2000, Australia'],
+        ['Bennelong, Sydney', 'Located in the Sydney Opera House, this restaurant offers a diverse menu with a focus on local ingredients.', 'Bennelong Point, Sydney NSW 2000, Australia'],
+        ['Cutler & Co., Melbourne', 'Contemporary Australian restaurant housed in a converted metal works factory, offering a seasonal menu.', '55/57 Gertrude St, Fitzroy VIC 3065, Australia'],
+        ['Grossi Florentino, Melbourne', 'Historic Italian restaurant with a classic menu, known for its elegant dining rooms.', '80 Bourke St, Melbourne VIC 3000, Australia'],
+        ['Movida, Melbourne', 'Iconic Spanish restaurant with a modern twist, known for its tapas, paella, and lively atmosphere.', '500 Bourke St, Melbourne VIC 3000, Australia'],
+        ['Vue de Monde, Melbourne', 'Sophisticated restaurant with a focus on contemporary Australian cuisine and stunning city views.', '55 Rialto Towers, 525 Collins St, Melbourne VIC 3000, Australia'],
+        ["Tetsuya's, Sydney", 'Internationally renowned restaurant offering a Japanese-influenced degustation menu in an intimate setting.', '529 Kent St, Sydney NSW 2000, Australia'],
+        ['Sake Restaurant & Bar, Sydney', 'Japanese restaurant known for its sushi, sashimi, and contemporary dishes, complemented by a sake menu.', 'The Intercontinental Hotel, 33 Cross St, Double Bay NSW 2028, Australia'],
+        ['Bistro Guillaume, Melbourne', 'French-inspired bistro offering a classic menu with a modern twist, located in Crown Melbourne.', 'Riverside, Crown Melbourne, 8, Whiteman St, Southbank VIC 3006, Australia'],
+        ['Cirrus Dining, Sydney', 'Seafood-focused restaurant with a waterfront location, offering a range of fresh and sustainable dishes.', 'Shop 10/23 Barangaroo Ave, Barangaroo NSW 2000, Australia'],
+        ['Ezard, Melbourne', 'Modern Australian restaurant with an Asian fusion twist, known for its innovative flavors and stylish ambiance.', '187 Flinders Ln, Melbourne VIC 3000, Australia'],
+        ['The Press Club, Melbourne', 'Modern Greek restaurant with a contemporary twist, offering a unique dining experience.', '525 Collins St, Melbourne VIC 3000, Australia'],
+        ['The Apollo, Sydney', 'Greek restaurant known for its flavorful dishes, including grilled meats and traditional mezze.', '44 Macleay St, Potts Point NSW 2010, Australia'],
+        ['Spice Temple, Sydney', 'Fine-dining Chinese restaurant by Neil Perry, known for its regional Chinese dishes and stylish interior.', '10 Bligh St, Sydney NSW 2000, Australia'],
+        ['Hartsyard, Sydney', 'Casual restaurant known for its American-inspired comfort food, including fried chicken and inventive cocktails.', '33 Enmore Rd, Newtown NSW 2042, Australia'],
+        ['Gazi, Melbourne', 'Modern Greek restaurant with a lively atmosphere, offering a menu inspired by street food and traditional flavors.', 'Melbourne VIC, Australia'],
+        ['The Bridge Room, Sydney', 'Fine-dining restaurant known for its contemporary Australian menu and sophisticated dishes.', 'Sydney NSW, Australia'],
+        ['Bodega, Sydney', 'Spanish-inspired tapas bar known for its creative small plates and extensive wine list.', '4/50 Holt St, Surry Hills NSW 2010, Australia'],
+        ['Cumulus Inc., Melbourne', 'All-day dining restaurant known for its modern Australian menu and stylish, warehouse-style setting.', '45 Flinders Ln, Melbourne VIC 3000, Australia'],
+        ['Billy Kwong, Sydney', 'Chinese restaurant with an emphasis on sustainable and organic ingredients, led by chef Kylie Kwong.', '3/355 Crown St, Surry Hills NSW 2010, Australia'],
+        ['Bentley Restaurant + Bar, Sydney', 'Contemporary restaurant offering a multi-course tasting menu and an extensive wine list.', "27 O'Connell St, Sydney NSW 2000, Australia"],
+        ['LuMi Bar & Dining, Sydney', 'Modern Italian restaurant with a waterfront setting, known for its creative dishes and tasting menus.', '56 Pirrama Rd, Pyrmont NSW 2009, Australia'],
+        ['Chin Chin, Melbourne', 'Vibrant restaurant serving modern Asian cuisine, including Thai-inspired dishes and creative cocktails.', '125 Flinders Ln, Melbourne VIC 3000, Australia'],
+        ['The Botanical, Melbourne', 'Elegant restaurant with a focus on seasonal, locally sourced ingredients, offering modern Australian cuisine.', '169 Domain Rd, South Yarra VIC 3141, Australia'],
+        ['Estelle by Scott Pickett, Melbourne', 'Modern Australian restaurant known for its innovative menu and commitment to local produce.', 'Melbourne VIC, Australia'],
+        ['No. 8 by John Lawson, Sydney', 'Located in the Crown Sydney complex, this restaurant offers a diverse menu with a focus on seafood.', 'Sydney NSW, Australia'],
+        ['Supernormal, Melbourne', 'Contemporary Asian-inspired eatery with a focus on Japanese and Chinese flavors, known for its stylish setting.', '180 Flinders Ln, Melbourne VIC 3000, Australia'],
+        ['Ormeggio at The Spit, Sydney', 'Italian restaurant with a waterfront location, known for its fresh seafood and modern approach to Italian cuisine.', 'D’Albora Marinas, Spit Rd, Mosman NSW 2088, Australia'],
+        ['Mamasita, Melbourne', 'Lively Mexican restaurant known for its tacos, tostadas, and tequila cocktails in a vibrant setting.', 'Level 1/11 Collins St, Melbourne VIC 3000, Australia'],
+        ['Long Chim, Sydney', 'Contemporary Thai restaurant by David Thompson, offering a menu of bold and flavorful dishes.', 'Corner of Pitt St and, Angel Pl, Sydney NSW 2000, Australia'],
+        ['Tipo 00, Melbourne', 'Italian restaurant known for its handmade pasta dishes, offering a range of traditional and inventive options.', '361 Little Bourke St, Melbourne VIC 3000, Australia'],
+        ['Cut, Sydney', 'Steakhouse located in The Rocks, known for its premium cuts of meat, elegant decor, and extensive wine list.', 'Sydney NSW, Australia'],
+        ['Coda, Melbourne', 'Modern Vietnamese restaurant with a focus on shareable dishes, known for its stylish interior and vibrant atmosphere.', 'Basement/141 Flinders Ln, Melbourne VIC 3000, Australia'],
+        ["Matteo's, Sydney", 'Italian restaurant offering a mix of traditional and modern dishes, located in Double Bay.', '29 Bay St, Double Bay NSW 2028, Australia'],
+        ['The Town Mouse, Melbourne', 'Contemporary restaurant known for its inventive and seasonal menu, offering a range of small and large plates.', '122 Russell St, Melbourne VIC 3004, Australia'],
+        ['Maha, Melbourne', 'Modern Middle Eastern restaurant known for its bold flavors, with a focus on shareable dishes and tasting menus.', '21 Bond St, Melbourne VIC 3000, Australia'],
+        ['Rockpool Bar & Grill, Melbourne', 'Sophisticated steakhouse located in Crown Melbourne, known for its premium beef cuts and elegant ambiance.', 'Crown Casino, 8 Whiteman St, Southbank VIC 3006, Australia'],
+        ['Spice Temple, Melbourne', 'Fine-dining Chinese restaurant by Neil Perry, offering a range of regional Chinese dishes and a stylish interior.', '8 Whiteman St, Southbank VIC 3006, Australia'],
+        ['Mr. Wong, Sydney', 'Elegant Cantonese-style restaurant with a focus on dim sum and barbecue dishes, known for its grand interior.', '3 Bridge Ln, Sydney NSW 2000, Australia'],
+        ['Chin Chin, Sydney', 'Vibrant restaurant serving modern Asian cuisine, including Thai-inspired dishes and creative cocktails.', '69 Commonwealth St, Surry Hills NSW 2010, Australia'],
+        ['Hellenic Republic, Melbourne', 'Greek restaurant known for its authentic dishes, including souvlaki and mezze, in a casual setting.', 'Unit 25/27 Church St, Brighton VIC 3186, Australia'],
+        ['Dandelion, Melbourne', 'Vietnamese restaurant with a modern twist, offering a menu of flavorful dishes and a stylish dining space.', 'Dandelion Dr, Rowville VIC 3178, Australia'],
+        ['Babajan, Melbourne', 'Middle Eastern-inspired restaurant known for its mezze, grilled dishes, and aromatic flavors.', '713 Nicholson St, Carlton North VIC 3054, Australia'],
+        ['Smith & Daughters, Melbourne', 'Vegan restaurant offering a plant-based menu of creative and flavorful dishes in a trendy setting.', '107 Cambridge St, Collingwood VIC 3066, Australia']
+    ],
+    "china": [
+        ['Ultraviolet by Paul Pairet, Shanghai', 'Multi-sensory dining experience with a single-table setup, offering a 20-course modern French menu.', 'Waitan, Huangpu, Shanghai, China, 200002'],
+        ['TRB Hutong, Beijing', 'Fine-dining restaurant located in a historic courtyard, known for its European cuisine and wine selection.', 'China, Beijing Dong Cheng Qu, # 23 Shatan North Street 邮政编码: 100009'],
+        ['Lost Heaven, Shanghai', 'Restaurant serving Yunnan cuisine in a stylish setting, featuring diverse flavors and regional specialties.', 'China, Shang Hai Shi, Huang Pu Qu, Waitan, 延安东路17号 邮政编码: 200002'],
+        ['Duck de Chine, Beijing', 'Peking duck restaurant with a contemporary twist, offering a menu of duck-focused dishes.', 'Beijing, China'],
+        ['M on the Bund, Shanghai', 'Iconic restaurant with a terrace overlooking the Bund, known for its international menu and Shanghai skyline views.', '20 Guang Dong Lu, Waitan, Huang Pu Qu, Shang Hai Shi, China, 200002'],
+        ['Jing Yaa Tang, Beijing', 'Peking duck restaurant with a focus on traditional preparation, offering a range of duck dishes.', 'Beijing, China'],
+        ['Hakkasan, Shanghai', 'Modern Cantonese restaurant with a stylish interior, offering a diverse menu of dim sum and signature dishes.', 'China, Shang Hai Shi, Huang Pu Qu, Waitan, 中山东一路18号 邮政编码: 200125'],
+        ['Mr. & Mrs. Bund, Shanghai', 'Modern French eatery by chef Paul Pairet, known for its creative dishes and panoramic views of the Bund.', 'Wai Tan 18 Hao, 6层18 Zhong Shan Dong Yi Lu, 18, Huang Pu Qu, Shang Hai Shi, China, 200002'],
+        ['Din Tai Fung, Shanghai', 'Renowned Taiwanese restaurant chain famous for its xiaolongbao (soup dumplings) and Taiwanese cuisine.', 'Shanghai, China'],
+        ['Temple Restaurant Beijing (TRB), Beijing', 'Fine-dining restaurant set in a temple, offering a European menu with a focus on seasonal ingredients.', 'Dongcheng, Beijing, China, 100051'],
+        ['Jean Georges, Shanghai', 'Three-Michelin-starred French restaurant located in Three on the Bund, known for its elegant dishes.', 'Shanghai, China'],
+        ['Lost Heaven on the Bund, Shanghai', 'Yunnan and ethnic minority cuisine restaurant with a view of the Bund, known for its vibrant flavors.', 'Zhong Shan Dong Yi Lu, Waitan, Huang Pu Qu, Shang Hai Shi, China, 200002'],
+        ['Umberto, Beijing', 'Italian restaurant with a focus on authentic flavors, offering a range of pasta, pizza, and classic dishes.', 'Beijing, China'],
+        ['Whampoa Club, Shanghai', 'Shanghainese and Cantonese restaurant with a modern twist, known for its stylish decor and creative dishes.', 'Shanghai, China'],
+        ['Capital M, Beijing', 'Modern European restaurant with a terrace overlooking Tiananmen Square, known for its rooftop views.', 'Beijing, China'],
+        ['South Beauty, Shanghai', 'Chain of Sichuan-style restaurants known for its spicy dishes, elegant decor, and upscale ambiance.', 'Shanghai, China'],
+        ['Canton 8, Beijing', 'Cantonese restaurant with a focus on dim sum and seafood, known for its traditional preparation methods.', 'Beijing, China'],
+        ['Jia Jia Tang Bao, Shanghai', 'Shanghainese restaurant famous for its soup dumplings, offering a simple yet delicious menu.', "China, Shang Hai Shi, Huang Pu Qu, People's Square, 黄河路90号 邮政编码: 200003"],
+        ['Maison Lameloise, Chengdu', 'French restaurant with a history dating back to 1921, known for its classic and refined dishes.', 'Chengdu, Sichuan, China'],
+        ['Lao Zheng Xing, Shanghai', 'Shanghainese restaurant serving classic dishes in a historic setting, known for its nostalgic ambiance.', 'China, Shang Hai Shi, Xu Hui Qu, CN 上海市 徐汇区 瑞平路 230 230号L2层013/014 邮政编码: 200032'],
+        ['Yi Long Court, Shanghai', 'Cantonese restaurant with a focus on premium ingredients, located in The Peninsula Shanghai.', '32 Zhong Shan Dong Yi Lu, Waitan, Huang Pu Qu, Shang Hai Shi, China, 200120'],
+        ['TRB Forbidden City, Beijing', 'Fine-dining restaurant set in a historic building, offering a European menu with a modern twist.', '4 Jing Shan Qian Jie, Dong Cheng Qu, Bei Jing Shi, China, 100009'],
+        ["L'Atelier de Joël Robuchon, Shanghai", 'French restaurant with an open kitchen concept, known for its interactive dining experience.', 'Shanghai, China'],
+        ['Bao Yuan Dumpling House, Beijing', 'Dumpling house offering a variety of dumplings and dim sum, known for its handmade preparations.', 'China, Bei Jing Shi, Chao Yang Qu, Mai Zi Dian Jie, 6号楼 邮政编码: 100026'],
+        ['Table No. 1, Shanghai', 'Modern European restaurant with a focus on seasonal and organic ingredients, located in The Waterhouse.', 'Yi Hao Lu, Shang Hai Shi, China'],
+        ['Crystal Jade, Beijing', 'Chain of restaurants specializing in Cantonese, Teochew, and Singaporean cuisine, known for its dim sum.', 'Beijing, China'],
+        ['Madam Goose, Shanghai', 'Cantonese restaurant with a focus on roast meats and classic dishes, known for its casual ambiance.', 'China, Shang Hai Shi, Huang Pu Qu, 268, Xu Jia Hui Lu, 268号6层 邮政编码: 200023'],
+        ['TRiPSTERS, Beijing', 'Modern European restaurant with a diverse menu and artistic decor, offering a unique dining experience.', 'Beijing, China'],
+        ['Ding Tai Fung, Beijing', 'Branch of the renowned Taiwanese restaurant chain, famous for its xiaolongbao (soup dumplings).', 'Beijing, China'],
+        ['Jean Georges, Beijing', 'Three-Michelin-starred French restaurant located in the Oriental Plaza, known for its sophisticated dishes.', 'Beijing, China'],
+        ['Whampoa Club, Beijing', 'Shanghainese and Cantonese restaurant with a modern twist, known for its stylish decor and creative dishes.', 'A-23 Jinrong St., Financial Street, Xi Cheng Qu, China, 100032'],
+        ['Bella Napoli, Shanghai', 'Italian restaurant known for its authentic Neapolitan pizza, pasta, and classic Italian dishes.', '73 Nan Hui Lu, Jing An Qu, Shang Hai Shi, China, 200041'],
+        ['Le Patio & La Famille, Beijing', 'French restaurant with a focus on regional dishes, offering a cozy and inviting atmosphere.', 'Beijing, China'],
+        ['Nan Xiang Xiao Long Bao, Shanghai', 'Famed restaurant known for its Shanghainese-style xiaolongbao (soup dumplings) and dim sum.', 'Shanghai, China'],
+        ['Yong Foo Elite, Shanghai', 'Cantonese and Shanghainese restaurant set in a historic villa, known for its classic dishes.', 'China, Shang Hai Shi, Xu Hui Qu, 永福路200号 邮政编码: 200031'],
+        ['Opera Bombana, Beijing', 'Italian restaurant with a focus on high-quality ingredients, offering a range of classic and modern dishes.', '9 Dong Da Qiao Lu, Chao Yang Qu, Bei Jing Shi, China, 100020'],
+        ['Le Garçon Chinois, Shanghai', 'French-Chinese fusion restaurant with a playful and creative menu, offering a unique dining experience.', 'Shanghai, China'],
+        ['South Beauty, Beijing', 'Chain of Sichuan-style restaurants known for its spicy dishes, elegant decor, and upscale ambiance.', 'Beijing, China'],
+        ['Fook Lam Moon, Shanghai', 'Cantonese restaurant with a focus on premium ingredients, offering a menu of classic and innovative dishes.', '33 Fu Cheng Lu, Lujiazui, Pu Dong Xin Qu, Shang Hai Shi, China, 200120'],
+        ['The Cut Rooftop, Beijing', 'Steakhouse with a rooftop terrace, known for its premium cuts of meat and panoramic views of Beijing.', 'Beijing, China'],
+        ['Kagen Teppanyaki, Shanghai', 'Japanese teppanyaki restaurant offering a theatrical dining experience with skilled chefs.', '601 Lan Tian Lu, Pu Dong Xin Qu, Shang Hai Shi, China, 200135'],
+        ['Yi Feng Tang, Beijing', 'Shanghainese restaurant with a focus on traditional flavors, offering a menu of classic dishes.', 'Beijing, China'],
+        ['Ling Long, Shanghai', 'Chinese restaurant with a focus on regional flavors, offering a menu of creative and modern dishes.', '57 Shan Xi Nan Lu, Lu Wan Qu, Shang Hai Shi, China, 200041'],
+        ["Wolfgang's Steakhouse, Beijing", 'Classic American-style steakhouse known for its prime cuts of beef, elegant decor, and timeless ambiance.', 'China, Bei Jing Shi, Chao Yang Qu, 甲工人体育场北路2號 中國, 盈科中心 邮政编码: 100020'],
+        ['Mr. Willis, Shanghai', 'American-style grill and bar with a focus on burgers, steaks, and classic comfort food.', 'Xuhui District, China, 200031'],
+        ['TRiPSTERS, Shanghai', 'Modern European restaurant with a diverse menu and artistic decor, offering a unique dining experience.', 'Shanghai, China'],
+        ['Ye Olde Station Restaurant, Beijing', 'European-style restaurant set in a historic railway station, known for its nostalgic ambiance and hearty dishes.', 'Beijing, China'],
+        ['Le Sun Chine, Shanghai', 'Cantonese and Shanghainese restaurant with a modern twist, offering a menu of classic and contemporary dishes.', '1220 Hua Shan Lu, Chang Ning Qu, Shang Hai Shi, China, 200031'],
+    ],
+    "uae": [
+        ['Zuma, Dubai', 'Contemporary Japanese izakaya-style restaurant offering a sophisticated menu and stylish ambiance.', 'Podium Level, Gate Village 06 - Al Mustaqbal St - Trade Centre - DIFC - Dubai - United Arab Emirates'],
+        ['Pierchic, Dubai', 'Overwater restaurant located at the end of a pier, specializing in seafood with panoramic views of the Arabian Gulf.', 'Madinat jumeriah - Dubai - United Arab Emirates'],
+        ['Nusr-Et Steakhouse, Dubai', "International chain known for its Turkish-style steaks, owned by the famed 'Salt Bae' Nusret Gökçe.", 'Restaurant Village Four Seasons Resort شارع شاطئ - Jumeirah - Jumeirah 2 - Dubai - United Arab Emirates'],
+        ['At.mosphere, Dubai', 'Fine-dining restaurant located on the 122nd floor of the Burj Khalifa, offering breathtaking views of the city.', '122nd Floor - Burj Khalifa - Downtown Dubai - Dubai - United Arab Emirates'],
+        ['Ossiano, Dubai', 'Underwater restaurant at Atlantis, The Palm, known for its seafood menu and mesmerizing views of marine life.', 'Crescent Rd - The Palm Jumeirah - Dubai - United Arab Emirates'],
+        ['Pai Thai, Dubai', 'Thai restaurant located on the waterways of Madinat Jumeirah, offering traditional flavors and a romantic setting.', 'Jumeirah Al Qasr, Madinat Jumeirah - King Salman bin Abdulaziz Al Saud Street، Umm Suqeim 3 - Al Sufouh 1 - Dubai - United Arab Emirates'],
+        ['Tresind, Dubai', 'Modern Indian restaurant known for its innovative and molecular gastronomy-inspired dishes.', 'One&Only Royal Mirage, Arabian Court - Dubai Marina - Dubai - United Arab Emirates'],
+        ['Al Mahara, Dubai', 'Seafood restaurant at Burj Al Arab, featuring a floor-to-ceiling aquarium and a luxurious dining experience.', 'Burj Al Arab Jumeirah - Jumeirah St - Umm Suqeim 3 - Dubai - United Arab Emirates'],
+        ['Zahira, Dubai', 'Levantine-inspired restaurant with a contemporary twist, offering a menu by Chef Greg Malouf.', '1 Sheikh Zayed Rd - Trade Centre - Trade Centre 1 - Dubai - United Arab Emirates'],
+        ['Coya, Dubai', 'Peruvian restaurant with a lively atmosphere, known for its ceviche, grilled dishes, and Pisco cocktails.', 'Restaurant Village Four Seasons Resort - Jumeirah Beach Rd - Jumeirah - Jumeirah 2 - Dubai - United Arab Emirates'],
+        ['Nathan Outlaw at Al Mahara, Dubai', 'Fine-dining seafood restaurant with a menu crafted by Michelin-starred Chef Nathan Outlaw.', 'Burj Al Arab Jumeirah - Jumeirah St - Umm Suqeim 3 - Dubai - United Arab Emirates'],
+        ['La Petite Maison, Dubai', 'French-Mediterranean restaurant known for its fresh and simple dishes in a vibrant setting.', 'Port said street - Port Saeed - Dubai - United Arab Emirates'],
+        ['Scape Restaurant & Bar, Abu Dhabi', 'Modern American restaurant with a focus on grilled dishes, set against the backdrop of the Yas Marina Circuit.', 'Abu Dhabi - United Arab Emirates'],
+        ['Zaroob, Dubai', 'Levantine street food restaurant with an eclectic menu, offering a casual and vibrant dining experience.', 'Marina - دبي مارينا - دبي - United Arab Emirates'],
+        ['Akira Back, Dubai', 'Japanese-Korean fusion restaurant by celebrity Chef Akira Back, known for its inventive and bold flavors.', 'Palm Jumeirah - The Palm Jumeirah - Dubai - United Arab Emirates'],
+        ['Ewaan, Dubai', 'Arabian restaurant at The Palace Downtown Dubai, offering traditional dishes with views of Burj Khalifa.', 'L2, Palace Downtown 9770 - 57VG+J35 - Sheikh Mohammed bin Rashid Blvd - Downtown Dubai - Dubai - United Arab Emirates'],
+        ['Social by Heinz Beck, Dubai', 'Michelin-starred restaurant known for its contemporary Italian cuisine, located at Waldorf Astoria Dubai Palm Jumeirah.', 'Crescent Rd - The Palm Jumeirah - Dubai - United Arab Emirates'],
+        ['Sass Cafe, Dubai', 'French-Mediterranean restaurant with a lively atmosphere, offering a menu of classic and contemporary dishes.', 'Tower 2, Podium level, Al Fattan Currency House, DIFC - Trade Centre - DIFC - Dubai - United Arab Emirates'],
+        ['Indego by Vineet, Dubai', 'Indian restaurant by Chef Vineet Bhatia, known for its modern and inventive approach to Indian cuisine.', 'Grosvenor House Dubai - Al Emreef St - Dubai Marina - Dubai - United Arab Emirates'],
+        ['Boca, Dubai', 'Mediterranean restaurant with a focus on seasonal and locally-sourced ingredients, offering a modern and stylish setting.', 'Gate Village 6 - near DIFC Parking - Trade Centre - DIFC - Dubai - United Arab Emirates'],
+        ['Sho Cho, Dubai', 'Japanese restaurant and lounge known for its sushi, sashimi, and waterfront views at Dubai Marine Beach Resort.', 'Dubai Marine Beach Resort & Spa - Jumeirah Beach Rd - Jumeirah - Jumeirah 1 - Dubai - United Arab Emirates'],
+        ['Billionaire Mansion, Dubai', 'Restaurant and lounge with an eclectic menu, known for its opulent decor and vibrant nightlife scene.', 'Taj Hotel - Burj Khalifa Blvd - Business Bay - Dubai - United Arab Emirates'],
+        ['Le Cirque, Abu Dhabi', 'French-Italian restaurant known for its classic dishes and elegant circus-themed decor at The Ritz-Carlton.', 'Abu Dhabi - United Arab Emirates'],
+        ['Enigma by Chef Mansour Memarian, Dubai', 'Mystery dining experience featuring a rotating cast of international chefs at Palazzo Versace.', 'Dubai - United Arab Emirates'],
+        ['Olea, Dubai', 'Mediterranean restaurant at Kempinski Hotel Mall of the Emirates, offering a diverse menu with live cooking stations.', 'Kempinski Hotel, Mall of The Emirates - 2nd Floor - Sheikh Zayed Rd - Al - Al Barsha 1 - Dubai - United Arab Emirates'],
+        ['Pots, Pans & Boards, Dubai', 'British concept by Chef Tom Aikens, offering a menu of comfort food served in pots, pans, and boards.', 'Beach Mall, JBR - The Walk - Dubai Marina - Dubai - United Arab Emirates'],
+        ['Carnival by Trèsind, Dubai', 'Modern Indian restaurant with a playful and vibrant atmosphere, known for its inventive and theatrical dishes.', "The Buildings by Daman - 312 Al Sa'ada Street - Za'abeel - DIFC - Dubai - United Arab Emirates"],
+        ['Eauzone, Dubai', 'Asian-inspired restaurant at One&Only Royal Mirage, set amidst water gardens with views of the Arabian Gulf.', 'Al Sufouh Rd,Jumeirah Rd, Arabia Courts, Opp Media City - Al Sufouh 2 - Dubai - United Arab Emirates'],
+        ['Ruya, Dubai', 'Anatolian restaurant offering a modern take on Turkish cuisine, with a stylish setting and views of the Dubai skyline.', 'The St. Regis - 447Q+GV The Palm - The Palm Jumeirah - Dubai - United Arab Emirates'],
+        ['Teatro, Abu Dhabi', 'Pan-Asian restaurant at Park Rotana, known for its diverse menu featuring flavors from across Asia.', 'Park Rotana Al Salam Street Eastern Ring Road - المنتزه - Zone 1 - أبو ظبي - United Arab Emirates'],
+        ['Nobu, Dubai', 'Japanese-Peruvian restaurant by Chef Nobu Matsuhisa, known for its signature dishes and contemporary ambiance.', 'at Atlantis - 22nd floor - The Palm Jumeirah - Dubai - United Arab Emirates'],
+        ['Amaseena, Dubai', 'Arabian restaurant at The Ritz-Carlton Dubai, offering traditional Middle Eastern dishes in a resort setting.', '26 Al Mamsha St - Jumeirah Beach Residence - Dubai - United Arab Emirates'],
+        ["Roberto's, Abu Dhabi", 'Italian restaurant with a contemporary twist, known for its fresh pasta, seafood, and upscale ambiance.', 'Abu Dhabi - United Arab Emirates'],
+        ['Cavalli Club Restaurant & Lounge, Dubai', 'Italian restaurant and nightlife venue known for its opulent decor and high-energy atmosphere.', 'Sheikh Zayed Rd - Trade Centre - Trade Centre 1 - Dubai - United Arab Emirates'],
+        ['Zahra, Sharjah', 'Emirati restaurant at the Al Bait Sharjah, offering traditional dishes in a heritage-inspired setting.', 'Sharjah - United Arab Emirates'],
+        ['Shanghai Me, Dubai', 'Modern Chinese restaurant with a glamorous setting, offering a menu of contemporary and traditional dishes.', 'DIFC, Gate Village Building 11 - المركز التجاري - DIFC - دبي - United Arab Emirates'],
+        ['Vivaldi by Alfredo Russo, Dubai', 'Italian restaurant at Sheraton Dubai Creek Hotel, known for its authentic flavors and waterfront views.', 'Dubai - United Arab Emirates'],
+        ['Al Fanar Restaurant & Café, Abu Dhabi', 'Emirati restaurant offering a nostalgic experience with traditional decor and local dishes.', 'The Fountains, Yas Mall - Yas Island - Abu Dhabi - United Arab Emirates'],
+        ['Bread Street Kitchen, Dubai', 'Casual British restaurant by Chef Gordon Ramsay, known for its comfort food and lively atmosphere.', 'Atlantis The Palm, Dubai - Crescent Road - نخلة جميرا - دبي - United Arab Emirates'],
+        ['Armani/Ristorante, Dubai', 'Italian restaurant by Giorgio Armani, offering a refined menu in a sophisticated and stylish setting.', 'Lobby Level, Armani Hotel Dubai - برج خليفة - بوليفارد الشيخ محمد بن راشد - وسط مدينة دبي - دبي - United Arab Emirates'],
+        ['Al Muntaha, Dubai', 'Fine-dining restaurant at Burj Al Arab, located 200 meters above sea level with panoramic views of Dubai.', '27th floor,Burj Al Arab Jumeirah - شارع جميرا - ام سقيم ٣ - دبي - United Arab Emirates'],
+        ["Perry & Blackwelder's, Dubai", 'Southern barbecue restaurant at Souk Madinat Jumeirah, known for its smoked meats and casual vibe.', 'Souk Madinat Jumeirah - شارع الملك سلمان بن عبدالعزيز آل سعود - الصفوح 1 - دبي - United Arab Emirates'],
+        ['Tean, Abu Dhabi', 'Vietnamese restaurant at The Arts Club, offering a menu of authentic Vietnamese dishes in a contemporary setting.', 'HF62+4HQ - Al Saadiyat Island - Abu Dhabi - United Arab Emirates'],
+        ['Boca, Abu Dhabi', 'Mediterranean restaurant with a focus on seasonal and locally-sourced ingredients, offering a modern and stylish setting.', 'Abu Dhabi - United Arab Emirates'],
+        ['Marea, Dubai', 'Italian seafood restaurant located at DIFC, known for its fresh seafood, pasta, and contemporary Italian cuisine.', 'DIFC - Gate Village - Gate Village 7 - Trade Centre - DIFC - Dubai - United Arab Emirates'],
+        ['Blue Marlin Ibiza UAE, Abu Dhabi', 'Beach club and restaurant with a Mediterranean menu, known for its vibrant beachfront setting and music events.', 'Abu Dhabi - United Arab Emirates'],
+    ],
+    "canada": [
+        ['Toqué!, Montreal', 'Fine-dining restaurant known for its innovative Quebecois cuisine and commitment to using local ingredients.', '900 Pl. Jean-Paul-Riopelle, Montréal, QC H2Z 2B2, Canada'],
+        ['Edulis, Toronto', 'Cozy restaurant with a focus on seasonal and sustainable Canadian cuisine, featuring a daily changing menu.', '169 Niagara St, Toronto, ON M5V 1C9, Canada'],
+        ['Hawksworth Restaurant, Vancouver', 'Elegant restaurant offering Pacific Northwest cuisine in a sophisticated setting at the Rosewood Hotel Georgia.', '801 W Georgia St, Vancouver, BC V6C 1P7, Canada'],
+        ['Joe Beef, Montreal', 'Iconic Montreal restaurant known for its hearty and inventive French-Canadian dishes and extensive wine list.', '2491 R. Notre Dame O, Montréal, QC H3J 1N6, Canada'],
+        ['Alo, Toronto', 'Contemporary French restaurant with a focus on tasting menus, located in a heritage building in downtown Toronto.', '163 Spadina Ave., Toronto, ON M5V 2L6, Canada'],
+        ['Bar Isabel, Toronto', 'Spanish-inspired restaurant known for its lively atmosphere, creative tapas, and charcuterie offerings.', '797 College St, Toronto, ON M6G 1C7, Canada'],
+        ['Canoe, Toronto', 'Upscale restaurant with panoramic views of the city, specializing in Canadian-inspired cuisine and local ingredients.', '66 Wellington St W 54th floor, Toronto, ON M5K 1H6, Canada'],
+        ['Au Pied de Cochon, Montreal', 'Montreal institution known for its decadent and meat-centric Quebecois dishes, including foie gras poutine.', '536 Av. Duluth E, Montréal, QC H2L 1A9, Canada'],
+        ['La Banane, Toronto', 'French brasserie-style restaurant known for its seafood dishes, oysters, and stylish Art Deco-inspired interior.', '227 Ossington Ave, Toronto, ON M6J 2Z8, Canada'],
+        ['Buca, Toronto', 'Italian restaurant and enoteca known for its house-cured meats, handmade pasta, and a focus on regional Italian cuisine.', '2 St Clair Ave W Suite 100, Toronto, ON M4V 1L5, Canada'],
+        ['Montreal Plaza, Montreal', 'Modern and eclectic restaurant offering creative and visually stunning dishes in a vibrant setting.', '6230 Rue St-Hubert, Montréal, QC H2S 2M2, Canada'],
+        ['Hawksworth Restaurant, Vancouver', 'Elegant restaurant offering Pacific Northwest cuisine in a sophisticated setting at the Rosewood Hotel Georgia.', '801 W Georgia St, Vancouver, BC V6C 1P7, Canada'],
+        ['Toqué!, Montreal', 'Fine-dining restaurant known for its innovative Quebecois cuisine and commitment to using local ingredients.', '900 Pl. Jean-Paul-Riopelle, Montréal, QC H2Z 2B2, Canada'],
+        ["Raymonds, St. John's", 'Award-winning restaurant in Newfoundland known for its refined menu featuring local and seasonal ingredients.', "95 Water St, St. John's, NL A1C 1A4, Canada"],
+        ['Fairouz, Ottawa', 'Modern Middle Eastern restaurant offering a diverse menu inspired by the flavors of the Levant and the Mediterranean.', '15 Clarence St., Ottawa, ON K1N 5P9, Canada'],
+        ['Pigeonhole, Calgary', 'Eclectic restaurant known for its inventive small plates, charcuterie, and a diverse wine list.', '306 17 Ave SW, Calgary, AB T2S 0A8, Canada'],
+        ['Boralia, Toronto', 'Canadian-inspired restaurant showcasing historic recipes and indigenous ingredients in a contemporary setting.', 'Toronto, ON, Canada'],
+        ['Dandylion, Toronto', 'Cozy restaurant offering a seasonal and ever-changing menu with a focus on local and sustainable ingredients.', '1198 Queen St W, Toronto, ON M6J 1J6, Canada'],
+        ['Model Milk, Calgary', 'Chic restaurant housed in a historic dairy building, known for its farm-to-table cuisine and inventive cocktails.', '308 17 Ave SW, Calgary, AB T2S 0A8, Canada'],
+        ['Le Bremner, Montreal', 'Casual seafood restaurant by Chef Chuck Hughes, known for its fresh oysters, seafood platters, and laid-back vibe.', '13301 R. Sherbrooke E bureau 300, Montréal, QC H1A 1C2, Canada'],
+        ['Enoteca Sociale, Toronto', 'Italian wine bar and restaurant known for its house-made pastas, charcuterie, and extensive wine selection.', '1288 Dundas St W, Toronto, ON M6J 1X7, Canada'],
+        ['Duckfat, Portland', 'Popular restaurant in Portland, Maine, known for its Belgian-style fries cooked in duck fat and creative sandwiches.', 'Canada'],
+        ['Cinara, Vancouver', 'Modern Italian restaurant known for its handmade pasta dishes, seasonal ingredients, and a thoughtful wine list.', 'Vancouver, BC, Canada'],
+        ['Richmond Station, Toronto', "Farm-to-table restaurant with a focus on seasonal and local ingredients, located near Toronto's Union Station.", '1 Richmond St W, Toronto, ON M5H 3W4, Canada'],
+        ['Au Pied du Cochon, Toronto', 'Toronto outpost of the famed Montreal restaurant, known for its indulgent and meat-centric Quebecois cuisine.', 'Toronto, ON, Canada'],
+        ['Blink Restaurant, Calgary', 'Contemporary Canadian restaurant known for its creative dishes, farm-fresh ingredients, and artistic presentation.', '111 8 Ave SW, Calgary, AB T2P 1B4, Canada'],
+        ['Les 400 Coups, Montreal', 'Modern French restaurant known for its inventive tasting menus and a commitment to showcasing local flavors.', '400 Rue Notre Dame E, Montréal, QC H2Y 1C8, Canada'],
+        ['Scaramouche Restaurant, Toronto', 'Iconic Toronto restaurant known for its French-inspired cuisine, spectacular city views, and elegant ambiance.', '1 Benvenuto Pl, Toronto, ON M4V 2L1, Canada'],
+        ['La Quercia, Vancouver', 'Italian restaurant with a focus on simple and authentic dishes made with locally sourced and seasonal ingredients.', '3689 W 4th Ave, Vancouver, BC V6R 1P2, Canada'],
+        ['Bar Raval, Toronto', 'Spanish pintxos bar known for its beautifully crafted wood interior, creative tapas, and extensive sherry selection.', '505 College St, Toronto, ON M6J 2J3, Canada'],
+        ['River Café, Calgary', "Elegant restaurant located on Prince's Island Park, offering Canadian cuisine with a focus on regional and seasonal ingredients.", "25 Prince's Island Park, SW, Calgary, AB T2P 0R1, Canada"],
+        ['Battuto, Edmonton', 'Cozy Italian restaurant known for its house-made pasta, charcuterie, and a menu featuring locally sourced ingredients.', 'Edmonton, AB, Canada'],
+        ['North & Navy, Ottawa', 'Modern Italian restaurant known for its inventive pasta dishes, regional Italian flavors, and stylish decor.', '226 Nepean St, Ottawa, ON K2P 0B8, Canada'],
+        ['Pai Northern Thai Kitchen, Toronto', 'Authentic Thai restaurant known for its flavorful and spicy dishes, including curries, noodles, and street food.', '2335 Yonge St, Toronto, ON M4P 2E6, Canada'],
+        ['Fable Kitchen, Vancouver', 'Farm-to-table restaurant known for its locally sourced and sustainable dishes, including inventive brunch offerings.', '1944 W 4th Ave, Vancouver, BC V6J 1M5, Canada'],
+        ['Biera, Edmonton', 'Contemporary restaurant located in a craft brewery, known for its locally inspired dishes and innovative beer pairings.', '9570 76 Ave NW, Edmonton, AB T6C 0K2, Canada'],
+        ['Campagnolo, Toronto', 'Italian-inspired restaurant known for its handmade pasta, wood-fired pizzas, and a menu featuring local ingredients.', '832 Dundas St W, Toronto, ON M6J 1V3, Canada'],
+        ['Le Vin Papillon, Montreal', 'Wine bar and restaurant known for its natural wines, vegetable-focused small plates, and relaxed atmosphere.', '2519 R. Notre Dame O, Montréal, QC H3J 1N4, Canada'],
+        ['Avec Bistro, Calgary', 'French bistro offering classic dishes with a modern twist, a carefully curated wine list, and a cozy ambiance.', '550 11 Ave SW #105, Calgary, AB T2R 1M7, Canada'],
+        ['Actinolite, Toronto', 'Seasonal Canadian restaurant known for its tasting menus, focus on foraged ingredients, and minimalist decor.', '971 Ossington Ave, Toronto, ON M6G 3V5, Canada'],
+        ['Sukiyaki House, Calgary', 'Japanese restaurant known for its traditional and modern dishes, including sukiyaki, sushi, and sashimi.', '207 9 Ave SW #130, Calgary, AB T2P 1K3, Canada'],
+        ['Le Serpent, Montreal', 'Italian-inspired restaurant located in a historic building, known for its wood-fired pizzas and contemporary Italian cuisine.', '257 Rue Prince, Montréal, QC H3C 2N4, Canada'],
+        ['Borealia, Toronto', 'Canadian-inspired restaurant offering a menu inspired by historic recipes and indigenous ingredients.', '276 Carlaw Ave #207B, Toronto, ON M4M 3L1, Canada'],
+        ['Bonterra Trattoria, Calgary', 'Italian restaurant known for its house-made pasta, wood-fired pizzas, and a cozy atmosphere in a historic building.', '1016 8 St SW, Calgary, AB T2R 1K2, Canada'],
+        ['Cafe Boulud, Toronto', 'French restaurant located in the Four Seasons Hotel, known for its refined cuisine and elegant dining room.', '60 Yorkville Ave, Toronto, ON M4W 0A4, Canada'],
+        ['Richmond Station, Toronto', "Farm-to-table restaurant with a focus on seasonal and local ingredients, located near Toronto's Union Station.", '1 Richmond St W, Toronto, ON M5H 3W4, Canada'],
+        ['Buca, Toronto', 'Italian restaurant and enoteca known for its house-cured meats, handmade pasta, and a focus on regional Italian cuisine.', '2 St Clair Ave W Suite 100, Toronto, ON M4V 1L5, Canada']
+    ]
+}
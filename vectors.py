@@ -0,0 +1,236 @@
+"""
+Local vector index over the travel entries
+
+Every entry is embedded with TF-IDF over the exact vocabulary of words and
+word pairs of the dataset, so no model download or network call is needed
+and no two features share a column. The vectors are stored as one float16
+.npy matrix per country, with a column for each feature the country's
+entries use, that is memory-mapped at query time:
+
+    data/vectors/<country>.npy            rows of places, then hotels, then restaurants
+    data/vectors/<country>.features.npy   vocabulary position of each column, ascending
+    data/vectors/vocabulary.json          every feature, in vocabulary order
+    data/vectors/idf.npy                  inverse document frequency per feature
+    data/vectors/manifest.json            row counts per country and category
+
+top_k() embeds the prompt the same way, ignoring the words the dataset never
+uses, and returns the closest entries by cosine similarity, which the 'other'
+answers use as grounding.
+
+Usage:
+    python vectors.py            # (re)build data/vectors from the dataset
+"""
+import functools
+import json
+import logging
+import os
+import threading
+from typing import NamedTuple
+
+import numpy as np
+
+import dataset
+import search
+import travel_data
+
+log = logging.getLogger(__name__)
+
+DEFAULT_ROOT = os.path.join("data", "vectors")
+# bumped when the layout above changes, so older indexes are rebuilt
+FORMAT = 2
+# categories in row order
+CATEGORIES = tuple(dataset.CATEGORIES)
+
+
+def _features(text: str) -> list:
+    words = search.tokens(text)
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def _entry_features(entry: travel_data.Entry) -> list:
+    # per field, a word pair across the name and the address means nothing
+    return [feature for field in entry for feature in _features(field)]
+
+
+def _frequencies(features: list, vocabulary: dict) -> dict:
+    """
+    Vocabulary position -> sublinear term frequency, features outside the vocabulary are left out
+    """
+    counts = {}
+    for feature in features:
+        position = vocabulary.get(feature)
+        if position is not None:
+            counts[position] = counts.get(position, 0) + 1
+    return {position: 1.0 + np.log(count) for position, count in counts.items()}
+
+
+def _normalized(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+### BUILD ###
+def _replace(path: str, write) -> None:
+    """
+    Writes path next to itself then swaps it in, so memory-mapped readers in
+    other workers keep their old file instead of seeing it truncated
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def build(root: str = DEFAULT_ROOT, db_path: str = dataset.DEFAULT_PATH) -> str:
+    """
+    Embeds every entry of the dataset at db_path into root and returns root
+    """
+    data = dataset.load(db_path)
+    entry_features = {
+        country: [_entry_features(entry) for category in CATEGORIES for entry in getattr(data, dataset.CATEGORIES[category])[country]]
+        for country in data.countries
+    }
+    features = sorted({feature for rows in entry_features.values() for row in rows for feature in row})
+    vocabulary = {feature: position for position, feature in enumerate(features)}
+    frequencies = {country: [_frequencies(row, vocabulary) for row in rows] for country, rows in entry_features.items()}
+
+    documents = np.zeros(len(features), dtype=np.int64)
+    for rows in frequencies.values():
+        for row in rows:
+            documents[list(row)] += 1
+    total = sum(len(rows) for rows in frequencies.values())
+    idf = (np.log((1 + total) / (1 + documents)) + 1).astype(np.float32)
+
+    os.makedirs(root, exist_ok=True)
+    _replace(os.path.join(root, "vocabulary.json"), lambda f: f.write(json.dumps(features).encode("utf-8")))
+    _replace(os.path.join(root, "idf.npy"), lambda f: np.save(f, idf))
+    for country, rows in frequencies.items():
+        columns = np.array(sorted({position for row in rows for position in row}), dtype=np.int32)
+        matrix = np.zeros((len(rows), len(columns)), dtype=np.float32)
+        for i, row in enumerate(rows):
+            positions = list(row)
+            matrix[i, np.searchsorted(columns, positions)] = list(row.values())
+        unit = _normalized(matrix * idf[columns]).astype(np.float16)
+        _replace(os.path.join(root, f"{country}.features.npy"), lambda f: np.save(f, columns))
+        _replace(os.path.join(root, f"{country}.npy"), lambda f: np.save(f, unit))
+
+    manifest = {
+        "source_sha256": dataset.stored_checksum(db_path),
+        "format": FORMAT,
+        "rows": {
+            country: {category: len(getattr(data, dataset.CATEGORIES[category])[country]) for category in CATEGORIES}
+            for country in data.countries
+        },
+    }
+    # last, so a reader that sees the new manifest also sees the new matrices
+    _replace(os.path.join(root, "manifest.json"), lambda f: f.write(json.dumps(manifest, indent=1).encode("utf-8")))
+    return root
+
+
+def is_stale(root: str = DEFAULT_ROOT, db_path: str = dataset.DEFAULT_PATH) -> bool:
+    """
+    True when the index is missing or was built from a different dataset
+    """
+    try:
+        with open(os.path.join(root, "manifest.json")) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return True
+    # the artifact's stored checksum, no need to hash the sources again
+    return manifest.get("source_sha256") != dataset.stored_checksum(db_path) or manifest.get("format") != FORMAT
+
+
+### SEARCH ###
+class Index(NamedTuple):
+    # feature -> vocabulary position
+    vocabulary: dict
+    idf: np.ndarray
+    # rows per category, in CATEGORIES order
+    rows: dict
+
+
+_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _index(root: str) -> Index:
+    with _lock:
+        # built at deploy time by data_extract.py, like the dataset
+        if is_stale(root):
+            if dataset.rebuilds_stale():
+                log.info(f"Building {root}, it is missing or older than the dataset")
+                build(root)
+            elif os.path.exists(os.path.join(root, "manifest.json")):
+                log.warning(f"{root} is older than the dataset, rebuild it with python data_extract.py")
+            else:
+                raise FileNotFoundError(f"{root} is missing, build it with python data_extract.py before starting the app")
+    with open(os.path.join(root, "manifest.json")) as f:
+        manifest = json.load(f)
+    with open(os.path.join(root, "vocabulary.json")) as f:
+        vocabulary = {feature: position for position, feature in enumerate(json.load(f))}
+    return Index(vocabulary, np.load(os.path.join(root, "idf.npy")), manifest["rows"])
+
+
+@functools.lru_cache(maxsize=None)
+def matrix(country: str, root: str = DEFAULT_ROOT) -> np.ndarray:
+    """
+    The country's unit-length entry vectors, memory-mapped from disk
+    """
+    _index(root)
+    return np.load(os.path.join(root, f"{country}.npy"), mmap_mode="r")
+
+
+@functools.lru_cache(maxsize=None)
+def columns(country: str, root: str = DEFAULT_ROOT) -> np.ndarray:
+    """
+    Vocabulary position of each column of matrix(country)
+    """
+    _index(root)
+    return np.load(os.path.join(root, f"{country}.features.npy"))
+
+
+class Match(NamedTuple):
+    category: str
+    entry: travel_data.Entry
+    score: float
+
+
+def top_k(country: str, query: str, k: int = 4, min_score: float = 0.15, root: str = DEFAULT_ROOT) -> list:
+    """
+    Up to k entries of the country most similar to the query, best first,
+    leaving out anything below min_score
+    """
+    index = _index(root)
+    frequencies = _frequencies(_features(query), index.vocabulary)
+    if not frequencies:
+        return []
+    positions = np.fromiter(frequencies, dtype=np.int32)
+    weights = _normalized(np.fromiter(frequencies.values(), dtype=np.float32) * index.idf[positions])
+    # a prompt only has a few features, so only the country's columns for those are read
+    country_columns = columns(country, root)
+    found = np.searchsorted(country_columns, positions)
+    used = (found < len(country_columns)) & (country_columns[np.minimum(found, len(country_columns) - 1)] == positions)
+    scores = matrix(country, root)[:, found[used]].astype(np.float32) @ weights[used]
+    k = min(k, len(scores))
+    if k == 0:
+        return []
+    best = np.argpartition(-scores, k - 1)[:k]
+    best = best[np.argsort(-scores[best])]
+
+    matches = []
+    for row in best:
+        score = float(scores[row])
+        if score < min_score:
+            break
+        # map the row back to its category and position
+        for category in CATEGORIES:
+            size = index.rows[country][category]
+            if row < size:
+                matches.append(Match(category, travel_data.load_slice(category, country)[row], score))
+                break
+            row -= size
+    return matches
+
+
+if __name__ == "__main__":
+    print(f"Built {build()}")